@@ -0,0 +1,179 @@
+# backend/src/__tests__/test_candidate_resolver.py
+"""
+Unit tests for candidate identity resolution (email/phone normalisation,
+in-process index) and its use by DatabaseService.
+"""
+
+import unittest
+from unittest.mock import patch, MagicMock
+import os
+import sys
+import threading
+from pathlib import Path
+
+# Add parent directories to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.services.candidate_resolver import CandidateResolver, normalize_email, normalize_phone
+from src.services.database_service import DatabaseService, get_db_service
+
+
+def _client_with_candidates(rows):
+    client = MagicMock()
+    client.table.return_value.select.return_value.range.return_value.execute.return_value.data = rows
+    return client
+
+
+class TestNormalisation(unittest.TestCase):
+    """Test suite for email/phone normalisation."""
+
+    def test_vietnamese_phone_prefixes_fold_to_national_form(self):
+        for raw in ("0912 345 678", "+84 912 345 678", "+84 (0) 912.345.678", "0084912345678", "84912345678"):
+            self.assertEqual(normalize_phone(raw), "0912345678", raw)
+
+    def test_foreign_phone_keeps_country_code(self):
+        self.assertEqual(normalize_phone("+1 (415) 555-0100"), "14155550100")
+
+    def test_missing_values(self):
+        for raw in (None, "", "N/A", "123"):
+            self.assertIsNone(normalize_phone(raw))
+        for raw in (None, "N/A", "not an email"):
+            self.assertIsNone(normalize_email(raw))
+        self.assertEqual(normalize_email("  An.Nguyen@Example.COM "), "an.nguyen@example.com")
+
+
+class TestCandidateResolver(unittest.TestCase):
+    """Test suite for CandidateResolver."""
+
+    def setUp(self):
+        self.resolver = CandidateResolver()
+        self.resolver.warm(_client_with_candidates([
+            {"candidate_id": "cv_an.pdf", "email": "an@example.com", "phone": "0912345678"},
+            {"candidate_id": "cv_binh.pdf", "email": None, "phone": "+84 987 654 321"},
+        ]))
+
+    def test_same_email_resolves_to_existing_candidate(self):
+        resolved = self.resolver.resolve("cv_an_2024.pdf", {"email": "AN@example.com", "phone": "N/A"})
+        self.assertEqual(resolved, "cv_an.pdf")
+        self.assertEqual(self.resolver.get_stats()["merged"], 1)
+
+    def test_phone_in_other_format_resolves(self):
+        self.assertEqual(self.resolver.resolve("cv_other.pdf", {"phone": "0987.654.321"}), "cv_binh.pdf")
+
+    def test_unknown_person_keeps_proposed_id(self):
+        self.assertEqual(self.resolver.resolve("cv_chi.pdf", {"email": "chi@example.com"}), "cv_chi.pdf")
+
+    def test_taken_id_of_different_person_gets_suffix(self):
+        resolved = self.resolver.resolve("cv_an.pdf", {"email": "someone.else@example.com"})
+        self.assertTrue(resolved.startswith("cv_an.pdf_"))
+        self.assertEqual(self.resolver.resolve("cv_an.pdf", {"email": "someone.else@example.com"}), resolved)
+
+    def test_register_then_duplicate_merges(self):
+        self.assertTrue(self.resolver.register("cv_dung.pdf", "dung@example.com", None))
+        self.assertFalse(self.resolver.register("cv_dung.pdf", "dung@example.com", None))
+        self.assertEqual(self.resolver.resolve("cv_dung_v2.pdf", {"email": "dung@example.com"}), "cv_dung.pdf")
+
+        self.resolver.discard("cv_dung.pdf")
+        self.assertEqual(self.resolver.resolve("cv_dung_v2.pdf", {"email": "dung@example.com"}), "cv_dung_v2.pdf")
+
+    def test_warm_reads_all_pages(self):
+        client = MagicMock()
+        pages = [[{"candidate_id": f"C{i}", "email": f"c{i}@example.com"} for i in range(2)],
+                 [{"candidate_id": "C2", "email": "c2@example.com"}]]
+        client.table.return_value.select.return_value.range.return_value.execute.side_effect = [
+            MagicMock(data=page) for page in pages
+        ]
+        resolver = CandidateResolver(page_size=2)
+
+        self.assertEqual(resolver.warm(client), 3)
+        client.table.return_value.select.return_value.range.assert_any_call(2, 3)
+
+
+    def test_stale_index_refreshes_in_the_background(self):
+        resolver = CandidateResolver(refresh_seconds=0)
+        resolver.ensure_warm(_client_with_candidates([{"candidate_id": "cv_an.pdf", "email": "an@example.com"}]))
+        self.assertIsNone(resolver._warm_thread)
+
+        reading = threading.Event()
+        release = threading.Event()
+
+        def slow_page():
+            reading.set()
+            release.wait(5)
+            return MagicMock(data=[{"candidate_id": "cv_an.pdf", "email": "an@example.com"},
+                                   {"candidate_id": "cv_binh.pdf", "email": "binh@example.com"}])
+
+        client = MagicMock()
+        client.table.return_value.select.return_value.range.return_value.execute.side_effect = slow_page
+        resolver.ensure_warm(client)
+        self.assertTrue(reading.wait(5))
+        # The caller was not held by the table scan and resolves against the current index
+        self.assertEqual(resolver.resolve("cv_an_v2.pdf", {"email": "an@example.com"}), "cv_an.pdf")
+        resolver.ensure_warm(client)
+        self.assertTrue(resolver.register("cv_chi.pdf", "chi@example.com", None))
+
+        release.set()
+        resolver._warm_thread.join(5)
+        self.assertEqual(client.table.return_value.select.return_value.range.return_value.execute.call_count, 1)
+        self.assertEqual(resolver.resolve("x.pdf", {"email": "binh@example.com"}), "cv_binh.pdf")
+        # Registered while the refresh was reading: kept
+        self.assertEqual(resolver.resolve("y.pdf", {"email": "chi@example.com"}), "cv_chi.pdf")
+
+
+class TestDatabaseServiceDeduplication(unittest.TestCase):
+    """DatabaseService merges duplicate CVs without per-save existence queries."""
+
+    def setUp(self):
+        DatabaseService._instance = None
+        patcher = patch.dict(os.environ, {"SUPABASE_URL": "http://localhost:54321", "SUPABASE_KEY": "dummy-key"})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(setattr, DatabaseService, '_instance', None)
+
+    def _analysis(self, candidate_id, email, phone):
+        return {
+            "candidate_id": candidate_id,
+            "source_type": "cv_parsing",
+            "raw_data": {"personalInfo": {"email": email}},
+            "summary": {"name": "Nguyen Van An", "email": email, "phone": phone}
+        }
+
+    @patch('src.services.database_service.create_client')
+    def test_duplicate_cv_merges_into_existing_candidate(self, mock_create_client):
+        client = _client_with_candidates([])
+        mock_create_client.return_value = client
+        db_service = get_db_service()
+
+        first = db_service.save_analysis(**self._analysis("cv_an.pdf", "an@example.com", "0912345678"))
+        second = db_service.save_analysis(**self._analysis("cv_an_final.pdf", "An@Example.com", "+84912345678"))
+
+        self.assertEqual(first["candidate_id"], "cv_an.pdf")
+        self.assertEqual(second["candidate_id"], "cv_an.pdf")
+        # One warm-up read, no existence SELECT per save, one candidate created
+        client.table.return_value.select.return_value.eq.assert_not_called()
+        self.assertEqual(client.table.return_value.select.call_count, 1)
+        self.assertEqual(client.table.return_value.upsert.call_count, 1)
+
+    @patch('src.services.database_service.create_client')
+    def test_batch_creates_new_candidates_in_one_write(self, mock_create_client):
+        client = _client_with_candidates([])
+        mock_create_client.return_value = client
+        db_service = get_db_service()
+
+        result = db_service.save_analyses_batch([
+            self._analysis("cv_an.pdf", "an@example.com", None),
+            self._analysis("cv_an_copy.pdf", None, None),
+            self._analysis("cv_an_again.pdf", "an@example.com", None),
+            self._analysis("cv_binh.pdf", "binh@example.com", None),
+        ])
+
+        self.assertEqual(result["count"], 4)
+        self.assertEqual(client.table.return_value.upsert.call_count, 1)
+        created = client.table.return_value.upsert.call_args[0][0]
+        self.assertEqual([row["candidate_id"] for row in created], ["cv_an.pdf", "cv_an_copy.pdf", "cv_binh.pdf"])
+        screening_rows = client.table.return_value.insert.call_args_list[0][0][0]
+        self.assertEqual(screening_rows[2]["candidate_id"], "cv_an.pdf")
+
+
+if __name__ == '__main__':
+    unittest.main()
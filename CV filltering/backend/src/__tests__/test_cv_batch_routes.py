@@ -0,0 +1,166 @@
+# backend/src/__tests__/test_cv_batch_routes.py
+"""
+Integration tests for the bulk CV ingestion endpoint /api/parse-cv/batch.
+"""
+
+import unittest
+from unittest.mock import patch, MagicMock
+import io
+import os
+import sys
+import json
+import shutil
+import zipfile
+import tempfile
+from pathlib import Path
+
+# Add parent directories to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.app import create_app
+from src.routes import cv_parsing_routes
+from src.services.parse_cache import ParseResultCache
+
+
+def fake_parse_cv(source):
+    content = source.read().decode()
+    if "broken" in content:
+        raise ValueError("Unsupported file format")
+    return {
+        "personalInfo": {"name": content, "email": "N/A", "phone": "N/A"},
+        "education": [],
+        "experience": [],
+        "skills": [],
+        "source": {"type": "rule-based", "aiUsed": False}
+    }
+
+
+class TestParseCvBatchEndpoint(unittest.TestCase):
+    """Test suite for /api/parse-cv/batch."""
+
+    def setUp(self):
+        self.app = create_app()
+        self.app.config['TESTING'] = True
+        self.client = self.app.test_client()
+        self.tmpdir = tempfile.mkdtemp()
+        self.cache = ParseResultCache(max_entries=16, db_path=os.path.join(self.tmpdir, "cache.sqlite3"))
+        self.db_service = MagicMock()
+        self.db_service.save_analyses_batch.return_value = {"success": True, "stub": True, "count": 0}
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _post(self, data):
+        with patch.object(cv_parsing_routes, 'get_parse_cache', return_value=self.cache), \
+             patch.object(cv_parsing_routes, 'get_db_service', return_value=self.db_service), \
+             patch.object(cv_parsing_routes._cv_service(), 'parse_cv', side_effect=fake_parse_cv):
+            response = self.client.post('/api/parse-cv/batch', data=data, content_type='multipart/form-data')
+            lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        return response, lines
+
+    def test_multiple_files_stream_one_line_each(self):
+        data = {'files': [
+            (io.BytesIO(b"Alice"), 'alice.pdf'),
+            (io.BytesIO(b"Bob"), 'bob.docx'),
+            (io.BytesIO(b"Carol"), 'carol.pdf'),
+        ]}
+        response, lines = self._post(data)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'application/x-ndjson')
+        results = [line for line in lines if line["type"] == "result"]
+        self.assertEqual(len(results), 3)
+        self.assertTrue(all(line["success"] for line in results))
+        self.assertEqual(lines[-1]["type"], "summary")
+        self.assertEqual(lines[-1]["succeeded"], 3)
+
+        # One bulk write instead of save_analysis per file
+        self.db_service.save_analyses_batch.assert_called_once()
+        self.db_service.save_analysis.assert_not_called()
+        analyses = self.db_service.save_analyses_batch.call_args[0][0]
+        self.assertEqual(sorted(a["candidate_id"] for a in analyses), ["cv_alice.pdf", "cv_bob.docx", "cv_carol.pdf"])
+
+    def test_zip_archive_is_expanded(self):
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("fair/dung.pdf", "Dung")
+            zf.writestr("fair/hoa.docx", "Hoa")
+            zf.writestr("fair/notes.txt", "ignored")
+            zf.writestr("__MACOSX/fair/._dung.pdf", "junk")
+        archive.seek(0)
+
+        response, lines = self._post({'files': [(archive, 'job_fair.zip')]})
+
+        results = [line for line in lines if line["type"] == "result"]
+        succeeded = sorted(line["filename"] for line in results if line["success"])
+        self.assertEqual(succeeded, ["dung.pdf", "hoa.docx"])
+        rejected = [line for line in results if not line["success"]]
+        self.assertEqual(rejected[0]["filename"], "notes.txt")
+        self.assertEqual(lines[-1]["total"], 3)
+        self.assertEqual(lines[-1]["failed"], 1)
+
+    def test_parse_failure_does_not_abort_batch(self):
+        data = {'files': [
+            (io.BytesIO(b"Alice"), 'alice.pdf'),
+            (io.BytesIO(b"broken"), 'broken.pdf'),
+        ]}
+        response, lines = self._post(data)
+
+        failures = [line for line in lines if line["type"] == "result" and not line["success"]]
+        self.assertEqual(len(failures), 1)
+        self.assertEqual(failures[0]["filename"], "broken.pdf")
+        self.assertEqual(len(self.db_service.save_analyses_batch.call_args[0][0]), 1)
+
+    def test_decompressed_bytes_are_capped(self):
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zf:
+            for name in ("a.pdf", "b.pdf", "c.pdf"):
+                zf.writestr(f"fair/{name}", name.upper() + " " * 600)
+            zf.writestr("fair/huge.pdf", " " * 5000)
+        archive.seek(0)
+
+        with patch.dict(os.environ, {'CV_BATCH_MAX_ENTRY_BYTES': '4096', 'CV_BATCH_MAX_TOTAL_BYTES': '1500'}):
+            response, lines = self._post({'files': [(archive, 'job_fair.zip')]})
+
+        results = {line["filename"]: line for line in lines if line["type"] == "result"}
+        self.assertTrue(results["a.pdf"]["success"] and results["b.pdf"]["success"])
+        self.assertIn("Batch size limit", results["c.pdf"]["error"])
+        self.assertEqual(results["huge.pdf"]["error"], "File too large")
+        self.assertEqual((lines[-1]["total"], lines[-1]["succeeded"]), (4, 2))
+
+    def test_raw_zip_body(self):
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("dung.pdf", "Dung")
+        with patch.object(cv_parsing_routes, 'get_parse_cache', return_value=self.cache), \
+             patch.object(cv_parsing_routes, 'get_db_service', return_value=self.db_service), \
+             patch.object(cv_parsing_routes._cv_service(), 'parse_cv', side_effect=fake_parse_cv):
+            response = self.client.post('/api/parse-cv/batch', data=archive.getvalue(), content_type='application/zip')
+            lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+        self.assertEqual(lines[0]["filename"], "dung.pdf")
+        self.assertEqual(lines[-1]["succeeded"], 1)
+
+    def test_body_limit_is_raised_for_the_batch_route(self):
+        self.app.config['MAX_CONTENT_LENGTH'] = 1024
+        body = b"Alice" + b" " * 4096
+        response = self.client.post('/api/parse-cv', data={'file': (io.BytesIO(body), 'alice.pdf')},
+                                    content_type='multipart/form-data')
+        self.assertEqual(response.status_code, 413)
+
+        response, lines = self._post({'files': [(io.BytesIO(body), 'alice.pdf')]})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(lines[-1]["succeeded"], 1)
+
+        with patch.dict(os.environ, {'CV_BATCH_MAX_BYTES': '1024'}):
+            response = self.client.post('/api/parse-cv/batch', data={'files': [(io.BytesIO(body), 'alice.pdf')]},
+                                        content_type='multipart/form-data')
+        self.assertEqual(response.status_code, 413)
+
+    def test_missing_files_returns_400(self):
+        response = self.client.post('/api/parse-cv/batch', data={}, content_type='multipart/form-data')
+        self.assertEqual(response.status_code, 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
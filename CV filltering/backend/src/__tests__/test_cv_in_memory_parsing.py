@@ -0,0 +1,104 @@
+# backend/src/__tests__/test_cv_in_memory_parsing.py
+"""
+Tests for parsing CVs from bytes and file-like objects, with the format
+detected from magic bytes instead of the filename suffix.
+"""
+
+import unittest
+from unittest.mock import patch
+import io
+import sys
+import tempfile
+from pathlib import Path
+
+import docx
+
+# Add parent directories to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.services.cv_parsing_service import CvParsingService
+from src.services.parse_cache import ParseResultCache
+from test_pdf_text_extractor import build_pdf
+
+
+def build_docx(paragraphs):
+    document = docx.Document()
+    for paragraph in paragraphs:
+        document.add_paragraph(paragraph)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+class TestInMemoryParsing(unittest.TestCase):
+    """CvParsingService accepts bytes and streams."""
+
+    def setUp(self):
+        with patch.dict('os.environ', {'GEMINI_API_KEY': ''}):
+            self.service = CvParsingService()
+        self.pdf = build_pdf(["Nguyen Van A", "Contact pdf@example.com"])
+        self.docx = build_docx(["Tran Thi B", "Email: docx@example.com"])
+
+    def test_pdf_bytes(self):
+        result = self.service.parse_cv(self.pdf)
+        self.assertEqual(result["personalInfo"]["email"], "pdf@example.com")
+
+    def test_docx_bytesio(self):
+        result = self.service.parse_cv(io.BytesIO(self.docx))
+        self.assertEqual(result["personalInfo"]["email"], "docx@example.com")
+
+    def test_spooled_temporary_file(self):
+        spooled = tempfile.SpooledTemporaryFile(max_size=1024 * 1024)
+        spooled.write(self.pdf)
+        result = self.service.parse_cv(spooled)
+        self.assertEqual(result["personalInfo"]["email"], "pdf@example.com")
+
+    def test_format_ignores_misleading_suffix(self):
+        with tempfile.NamedTemporaryFile(suffix=".pdf") as tmp:
+            tmp.write(self.docx)
+            tmp.flush()
+            result = self.service.parse_cv(tmp.name)
+        self.assertEqual(result["personalInfo"]["email"], "docx@example.com")
+
+    def test_detect_format(self):
+        self.assertEqual(self.service._detect_format(io.BytesIO(self.pdf)), "pdf")
+        self.assertEqual(self.service._detect_format(io.BytesIO(self.docx)), "docx")
+        self.assertIsNone(self.service._detect_format(io.BytesIO(b"plain text")))
+
+    def test_non_docx_zip_is_rejected(self):
+        archive = io.BytesIO()
+        import zipfile
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("xl/workbook.xml", "<workbook/>")
+        with self.assertRaises(ValueError):
+            self.service.parse_cv(archive.getvalue())
+
+
+class TestParseCvEndpointWithoutTempfile(unittest.TestCase):
+    """/api/parse-cv no longer writes uploads to a temporary file."""
+
+    def test_upload_is_parsed_in_memory(self):
+        from src.app import create_app
+        from src.routes import cv_parsing_routes
+
+        app = create_app()
+        app.config['TESTING'] = True
+        client = app.test_client()
+        pdf = build_pdf(["Contact mem@example.com"])
+
+        with patch.object(cv_parsing_routes, 'get_parse_cache', return_value=ParseResultCache(max_entries=0, db_path="")), \
+             patch.object(cv_parsing_routes._cv_service(), 'model', None), \
+             patch('tempfile.mkstemp', side_effect=AssertionError("upload written to disk")):
+            response = client.post(
+                '/api/parse-cv',
+                data={'file': (io.BytesIO(pdf), 'upload.bin')},
+                content_type='multipart/form-data'
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()["personalInfo"]["email"], "mem@example.com")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+# backend/src/__tests__/test_cv_section_segmenter.py
+"""
+Unit tests for CV section segmentation and the token-budgeted Gemini prompt.
+"""
+
+import unittest
+from unittest.mock import patch
+import sys
+from pathlib import Path
+
+# Add parent directories to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.services.cv_section_segmenter import CvSectionSegmenter, estimate_tokens
+
+SAMPLE_CV = """Nguyễn Văn An
+an.nguyen@example.com    |   0912 345 678
+Trang 1/2
+
+MỤC TIÊU NGHỀ NGHIỆP
+Trở thành kỹ sư backend giỏi.
+
+KINH NGHIỆM LÀM VIỆC
+01/2020 - Present: Senior Backend Developer - FPT Software
+Nguyễn Văn An - CV
+2017 - 2019: Software Engineer - Tiki
+
+Học vấn:
+Cử nhân CNTT - Đại học Bách Khoa Hà Nội (2011 - 2015)
+Nguyễn Văn An - CV
+
+Skills: Python, Django, PostgreSQL
+
+SỞ THÍCH
+Đọc sách, du lịch, bóng đá
+Trang 2/2
+Nguyễn Văn An - CV
+
+REFERENCES
+Mr. Tran Van B - CTO - 0987 654 321
+"""
+
+
+class TestCvSectionSegmenter(unittest.TestCase):
+    """Test suite for CvSectionSegmenter."""
+
+    def setUp(self):
+        self.segmenter = CvSectionSegmenter(token_budget=3000)
+
+    def test_detects_english_and_vietnamese_headings(self):
+        sections = [name for name, _ in self.segmenter.segment(SAMPLE_CV)]
+        self.assertEqual(sections, ["header", "summary", "experience", "education", "skills", "interests", "references"])
+
+    def test_inline_heading_content_is_kept(self):
+        segments = dict(self.segmenter.segment(SAMPLE_CV))
+        self.assertEqual(segments["skills"], "Python, Django, PostgreSQL")
+
+    def test_whitespace_page_markers_and_running_footers_are_removed(self):
+        segments = dict(self.segmenter.segment(SAMPLE_CV))
+        self.assertEqual(segments["header"], "Nguyễn Văn An\nan.nguyen@example.com | 0912 345 678")
+        self.assertEqual(segments["experience"].count("Nguyễn Văn An - CV"), 1)
+        self.assertNotIn("Trang 2/2", segments["interests"])
+
+    def test_irrelevant_sections_are_dropped(self):
+        result = self.segmenter.build_prompt_text(SAMPLE_CV)
+        self.assertEqual(result["dropped_sections"], ["interests", "references"])
+        self.assertNotIn("CTO", result["text"])
+        self.assertIn("Senior Backend Developer", result["text"])
+        self.assertGreater(result["tokens_saved"], 0)
+        self.assertEqual(result["tokens_saved"], result["original_tokens"] - result["prompt_tokens"])
+
+    def test_text_without_headings_is_sent_whole(self):
+        text = "Tran Thi B\nPython developer\nHanoi"
+        result = self.segmenter.build_prompt_text(text)
+        self.assertEqual(result["text"], text)
+        self.assertEqual(result["dropped_sections"], [])
+
+    def test_token_budget_keeps_priority_sections(self):
+        long_summary = "\n".join(f"Summary line {i} " + "x" * 60 for i in range(200))
+        text = f"Le Van C\nc@example.com\nSUMMARY\n{long_summary}\nEXPERIENCE\nBackend Developer - VNG\nSKILLS\nGo, Kafka"
+        segmenter = CvSectionSegmenter(token_budget=200)
+
+        result = segmenter.build_prompt_text(text)
+
+        self.assertTrue(result["truncated"])
+        self.assertLessEqual(result["prompt_tokens"], 200)
+        self.assertIn("Backend Developer - VNG", result["text"])
+        self.assertIn("Go, Kafka", result["text"])
+        # Sections are restored to document order after packing
+        self.assertLess(result["text"].index("SUMMARY"), result["text"].index("EXPERIENCE"))
+
+    def test_cumulative_stats(self):
+        self.segmenter.build_prompt_text(SAMPLE_CV)
+        self.segmenter.build_prompt_text(SAMPLE_CV)
+        stats = self.segmenter.get_stats()
+        self.assertEqual(stats["requests"], 2)
+        self.assertEqual(stats["original_tokens"], 2 * estimate_tokens(SAMPLE_CV))
+        self.assertGreater(stats["saved_ratio"], 0)
+
+
+class TestGeminiPromptUsesSegments(unittest.TestCase):
+    """CvParsingService sends the segmented text to Gemini and reports savings."""
+
+    def test_prompt_excludes_dropped_sections(self):
+        from src.services.cv_parsing_service import CvParsingService
+
+        with patch.dict('os.environ', {'GEMINI_API_KEY': ''}):
+            service = CvParsingService()
+        service.segmenter = CvSectionSegmenter(token_budget=3000)
+        prompts = []
+
+        class FakeModel:
+            def generate_content(self, prompt):
+                prompts.append(prompt)
+                return type("Response", (), {"text": '{"personalInfo": {}, "skills": []}'})()
+
+        service.model = FakeModel()
+        with patch.object(service, '_extract_text', return_value=SAMPLE_CV):
+            result = service.parse_cv("dummy.pdf")
+
+        self.assertNotIn("Đọc sách", prompts[0])
+        self.assertIn("Senior Backend Developer", prompts[0])
+        self.assertGreater(result["source"]["prompt"]["tokensSaved"], 0)
+        self.assertNotIn("references", result["source"]["prompt"]["sections"])
+
+
+if __name__ == '__main__':
+    unittest.main()
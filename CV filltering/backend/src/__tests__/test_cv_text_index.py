@@ -0,0 +1,194 @@
+# backend/src/__tests__/test_cv_text_index.py
+"""
+Unit tests for the BM25 CV text index and /api/jobs/.../cv-matches.
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+import sys
+import time
+import threading
+from pathlib import Path
+
+# Add parent directories to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.services.cv_text_index import CvTextIndex, get_cv_text_index, tokenize, document_text
+
+CVS = {
+    "A": {"skills": ["Python", "Machine Learning", "SQL"],
+          "experience": [{"title": "Data Scientist", "description": "Xây dựng mô hình dự báo với Python và Pandas"}],
+          "personalInfo": {"name": "Nguyen Van An", "email": "python@example.com"},
+          "source": {"type": "gemini"}},
+    "B": {"skills": ["JavaScript", "React", "Node.js"],
+          "experience": [{"title": "Frontend Developer", "description": "Phát triển giao diện web"}]},
+    "C": {"skills": ["Python", "Django"],
+          "experience": [{"title": "Backend Developer", "description": "REST API, PostgreSQL"}]},
+}
+
+
+class TestCvTextIndex(unittest.TestCase):
+    """Test suite for tokenisation and BM25 ranking."""
+
+    def setUp(self):
+        self.index = CvTextIndex()
+        self.index.rebuild({"candidate_id": cid, "raw_response": cv} for cid, cv in CVS.items())
+
+    def _ids(self, result):
+        return [m["candidate_id"] for m in result["matches"]]
+
+    def test_tokenize_folds_diacritics_and_keeps_tech_terms(self):
+        self.assertEqual(tokenize("Phát triển C++, C# và Node.js."), ["phat", "trien", "c++", "c#", "node.js"])
+        self.assertEqual(tokenize("The data and the models"), ["data", "models"])
+
+    def test_stopwords_do_not_drop_folded_content_words(self):
+        self.assertEqual(tokenize("Kỹ sư cơ khí tại Đà Nẵng, có kinh nghiệm tư vấn"),
+                         ["ky", "su", "co", "khi", "da", "nang", "kinh", "nghiem", "tu", "van"])
+
+        index = CvTextIndex()
+        index.add("M", {"experience": [{"title": "Kỹ sư cơ khí", "description": "Tư vấn thiết kế tại Đà Nẵng"}]})
+        index.add("B", CVS["B"])
+        result = index.top_n("Tuyển kỹ sư cơ khí làm việc tại Đà Nẵng, có kinh nghiệm tư vấn")
+        self.assertEqual(self._ids(result), ["M"])
+        self.assertEqual(self._ids(index.top_n("cơ khí")), ["M"])
+        self.assertEqual(index.top_n("cơ khí")["query_terms"], 2)
+
+    def test_document_text_skips_metadata_and_boosts_skills(self):
+        text = document_text(CVS["A"])
+        self.assertNotIn("example.com", text)
+        self.assertNotIn("gemini", text)
+        self.assertEqual(tokenize(text).count("sql"), 2)
+
+    def test_top_n_ranks_by_relevance(self):
+        result = self.index.top_n("Data Scientist: Python, machine learning, pandas", n=10)
+        self.assertEqual(self._ids(result), ["A", "C"])
+        self.assertGreater(result["matches"][0]["score"], result["matches"][1]["score"])
+        self.assertEqual(result["matches"][0]["rank"], 1)
+
+        # Vietnamese JD without diacritics still matches the accented CV text
+        self.assertEqual(self._ids(self.index.top_n("phat trien giao dien")), ["B"])
+        self.assertEqual(self.index.top_n("Rust embedded")["matches"], [])
+
+    def test_n_limits_results(self):
+        self.assertEqual(len(self.index.top_n("python developer", n=1)["matches"]), 1)
+
+    def test_re_adding_replaces_previous_cv(self):
+        self.assertTrue(self.index.add("B", {"skills": ["Python", "FastAPI"]}))
+        self.assertEqual(self.index.top_n("giao dien")["matches"], [])
+        self.assertIn("B", self._ids(self.index.top_n("fastapi")))
+        stats = self.index.get_stats()
+        self.assertEqual((stats["documents"], stats["tombstoned"]), (3, 1))
+
+        self.assertFalse(self.index.add("B", {}))
+        self.assertEqual(self.index.get_stats()["documents"], 2)
+
+    def test_bm25_matches_reference_formula(self):
+        import math
+        index = CvTextIndex(k1=1.2, b=0.75)
+        index.add("X", {"skills": ["go go rust"]})
+        index.add("Y", {"skills": ["rust"]})
+        # X: 6 tokens (boost 2) with go x4, rust x2; Y: 2 tokens with rust x2
+        avg = (6 + 2) / 2
+        idf = math.log(1 + (2 - 1 + 0.5) / (1 + 0.5))
+        expected = idf * 4 * 2.2 / (4 + 1.2 * (1 - 0.75 + 0.75 * 6 / avg))
+        self.assertAlmostEqual(index.top_n("go")["matches"][0]["score"], round(expected, 4))
+
+    def test_load_reads_cv_analyses(self):
+        db = MagicMock()
+        db.fetch_rows.return_value = [{"candidate_id": "A", "raw_response": CVS["A"]}]
+        index = CvTextIndex()
+
+        self.assertEqual(index.load(db), 1)
+        db.fetch_rows.assert_called_once_with('cv_analyses', 'candidate_id,raw_response', order_by='created_at')
+
+
+class TestCvTextIndexRefresh(unittest.TestCase):
+    """ensure_loaded builds once under concurrency and reloads a stale index."""
+
+    def _db(self, cvs):
+        db = MagicMock()
+
+        def fetch_rows(*args, **kwargs):
+            time.sleep(0.05)
+            return [{"candidate_id": cid, "raw_response": cv} for cid, cv in cvs.items()]
+        db.fetch_rows.side_effect = fetch_rows
+        return db
+
+    def test_concurrent_first_requests_build_once(self):
+        index = CvTextIndex(refresh_seconds=300)
+        db = self._db(CVS)
+        threads = [threading.Thread(target=index.ensure_loaded, args=(db,)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        db.fetch_rows.assert_called_once()
+        self.assertEqual(index.get_stats()["documents"], 3)
+
+    def test_stale_index_reloads_and_failed_refresh_keeps_it(self):
+        index = CvTextIndex(refresh_seconds=300)
+        index.ensure_loaded(self._db({"A": CVS["A"]}))
+        self.assertFalse(index.ensure_loaded(self._db(CVS)))
+
+        index._loaded_at -= 301  # another worker saved CVs meanwhile
+        self.assertTrue(index.ensure_loaded(self._db(CVS)))
+        self.assertEqual(index.get_stats()["documents"], 3)
+
+        index._loaded_at -= 301
+        down = MagicMock()
+        down.fetch_rows.side_effect = ConnectionError("database down")
+        self.assertFalse(index.ensure_loaded(down))
+        self.assertEqual(index.get_stats()["documents"], 3)
+
+
+class TestCvMatchEndpoints(unittest.TestCase):
+    """Integration tests for /api/jobs/cv-matches and /api/jobs/<id>/cv-matches."""
+
+    def setUp(self):
+        from src.app import create_app
+        self.app = create_app()
+        self.app.config['TESTING'] = True
+        self.client = self.app.test_client()
+        index = get_cv_text_index()
+        saved = dict(index.__dict__)
+        index.rebuild({"candidate_id": cid, "raw_response": cv} for cid, cv in CVS.items())
+        self.addCleanup(index.__dict__.update, saved)
+
+    def test_free_text_description(self):
+        response = self.client.post('/api/jobs/cv-matches?n=5', json={"description": "React Node.js developer"})
+
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertTrue(data["success"])
+        self.assertEqual(data["matches"][0]["candidate_id"], "B")
+
+    def test_catalogue_job(self):
+        # job-001 asks for JavaScript, React, Node.js, PostgreSQL, ...
+        response = self.client.get('/api/jobs/job-001/cv-matches?n=2')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([m["candidate_id"] for m in response.get_json()["matches"]], ["B", "C"])
+
+    def test_refresh_requires_admin_token(self):
+        index = get_cv_text_index()
+        with patch.object(index, 'load') as load, patch('src.routes.job_routes.get_db_service'):
+            response = self.client.post('/api/jobs/cv-matches?refresh=true', json={"description": "python"})
+            self.assertEqual(response.status_code, 403)
+            self.assertEqual(self.client.get('/api/jobs/job-001/cv-matches?refresh=true').status_code, 403)
+            load.assert_not_called()
+
+            with patch.dict('os.environ', {'ADMIN_API_TOKEN': 'secret'}):
+                response = self.client.post('/api/jobs/cv-matches?refresh=true', json={"description": "python"},
+                                            headers={'X-Admin-Token': 'secret'})
+            self.assertEqual(response.status_code, 200)
+            load.assert_called_once()
+
+    def test_bad_requests(self):
+        self.assertEqual(self.client.post('/api/jobs/cv-matches', json={}).status_code, 400)
+        self.assertEqual(self.client.post('/api/jobs/cv-matches?n=0', json={"description": "python"}).status_code, 400)
+        self.assertEqual(self.client.get('/api/jobs/nope/cv-matches').status_code, 404)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -263,6 +263,78 @@ class TestBatchInsertOperations(unittest.TestCase):
         # Should be only 1 batch insert to screening_results
         self.assertEqual(len(screening_insert_calls), 1)
 
+    @patch('src.services.database_service.create_client')
+    def test_batch_insert_writes_each_table_once(self, mock_create_client):
+        """Test that source-specific rows are grouped into one insert per table."""
+        mock_client = MagicMock()
+        mock_create_client.return_value = mock_client
+
+        mock_table = MagicMock()
+        mock_client.table.return_value = mock_table
+        mock_table.select.return_value.eq.return_value.execute.return_value.data = [{"candidate_id": "x"}]
+
+        db_service = get_db_service()
+        analyses = [
+            {
+                "candidate_id": f"CV-{i:03d}",
+                "source_type": "cv_parsing",
+                "raw_data": {"personalInfo": {"name": f"User {i}"}, "source": {"type": "gemini", "aiUsed": True}},
+                "summary": {"name": f"User {i}"}
+            }
+            for i in range(5)
+        ]
+
+        result = db_service.save_analyses_batch(analyses)
+
+        self.assertEqual(result["count"], 5)
+        table_calls = [call_args[0][0] for call_args in mock_client.table.call_args_list]
+        self.assertEqual(table_calls.count('cv_analyses'), 1)
+        self.assertEqual(table_calls.count('activity_logs'), 1)
+        cv_rows = [c[0][0] for c in mock_table.insert.call_args_list if isinstance(c[0][0], list) and c[0][0] and "parsing_method" in c[0][0][0]]
+        self.assertEqual(len(cv_rows), 1)
+        self.assertEqual(len(cv_rows[0]), 5)
+
+
+    @patch('src.services.database_service.create_client')
+    def test_failed_table_insert_falls_back_to_rows(self, mock_create_client):
+        """A failing cv_analyses batch is retried per row; analyses without their row skip screening_results."""
+        mock_client = MagicMock()
+        mock_create_client.return_value = mock_client
+        inserts = []
+
+        def table(name):
+            mock_table = MagicMock()
+
+            def insert(rows):
+                if name == 'cv_analyses' and (isinstance(rows, list) or rows["candidate_id"] == "CV-001"):
+                    mock_table.insert.return_value.execute.side_effect = Exception("constraint violation")
+                else:
+                    mock_table.insert.return_value.execute.side_effect = None
+                    inserts.append((name, rows))
+                return mock_table.insert.return_value
+
+            mock_table.insert.side_effect = insert
+            mock_table.select.return_value.range.return_value.execute.return_value.data = []
+            return mock_table
+
+        mock_client.table.side_effect = table
+        db_service = get_db_service()
+        analyses = [
+            {"candidate_id": f"CV-{i:03d}", "source_type": "cv_parsing", "raw_data": {}, "summary": {"name": f"User {i}"}}
+            for i in range(3)
+        ]
+
+        result = db_service.save_analyses_batch(analyses)
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["count"], 2)
+        self.assertEqual(result["errors"], [{"candidate_id": "CV-001", "error": "constraint violation"}])
+        self.assertEqual([r["tables"] for r in result["results"]],
+                         [['cv_analyses', 'screening_results'], [], ['cv_analyses', 'screening_results']])
+        screening = [rows for name, rows in inserts if name == 'screening_results']
+        self.assertEqual(len(screening), 1)
+        self.assertEqual([row["candidate_id"] for row in screening[0]], ["CV-000", "CV-002"])
+
 
 class TestSupabaseResponseParsing(unittest.TestCase):
     """Test suite for Supabase response parsing fixes."""
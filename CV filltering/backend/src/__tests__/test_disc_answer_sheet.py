@@ -0,0 +1,171 @@
+# backend/src/__tests__/test_disc_answer_sheet.py
+"""
+Unit tests for reading DISC scores from the printable answer sheet's
+checkbox grid, and for process_ocr_image / /api/disc/upload-ocr-image
+scoring sheets without full-page OCR.
+"""
+
+import unittest
+from unittest.mock import patch, MagicMock
+import io
+import sys
+from pathlib import Path
+
+# Add parent directories to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import cv2
+import numpy as np
+from src.services.disc_answer_sheet import AnswerSheetReader, render_answer_sheet, GRID_ROWS, GRID_X, GRID_Y, CELL
+from src.services.disc_pipeline import DISCExternalPipeline
+
+# Q1..Q3 x D, I, S, C
+ANSWERS = [8, 6, 7, 5, 9, 5, 6, 4, 7, 7, 8, 6]
+
+
+def photo(sheet, seed=1):
+    """The sheet as a skewed, noisy, downscaled phone photo on a dark table."""
+    height, width = sheet.shape
+    canvas = np.full((height + 400, width + 400), 90, np.uint8)
+    canvas[200:200 + height, 200:200 + width] = sheet
+    page = np.float32([[200, 200], [200 + width, 200], [200 + width, 200 + height], [200, 200 + height]])
+    skewed = np.float32([[260, 180], [180 + width, 240], [230 + width, 150 + height], [150, 230 + height]])
+    image = cv2.warpPerspective(canvas, cv2.getPerspectiveTransform(page, skewed), canvas.shape[::-1], borderValue=90)
+    image = cv2.resize(image, None, fx=0.6, fy=0.6, interpolation=cv2.INTER_AREA)
+    noise = np.random.default_rng(seed).normal(0, 12, image.shape)
+    return np.clip(image + noise, 0, 255).astype(np.uint8)
+
+
+def png(image):
+    return cv2.imencode('.png', image)[1].tobytes()
+
+
+class TestAnswerSheetReader(unittest.TestCase):
+    """Test suite for AnswerSheetReader."""
+
+    def setUp(self):
+        self.reader = AnswerSheetReader()
+
+    def test_reads_clean_and_photographed_sheets(self):
+        for image in (render_answer_sheet("CAND-0042", ANSWERS), photo(render_answer_sheet("CAND-0042", ANSWERS))):
+            result = self.reader.read(image)
+            self.assertEqual(result["scores"], {"d_score": 8.0, "i_score": 6.0, "s_score": 7.0, "c_score": 5.0})
+            self.assertGreater(result["confidence"], 0.9)
+            self.assertEqual([row["score"] for row in result["rows"]], ANSWERS)
+            self.assertEqual(result["issues"], [])
+
+    def test_style_scores_average_the_questions(self):
+        answers = [10, 1, 5, 2, 9, 2, 5, 3, 9, 1, 6, 3]
+        result = self.reader.read(render_answer_sheet("", answers))
+        self.assertEqual(result["scores"], {"d_score": 9.33, "i_score": 1.33, "s_score": 5.33, "c_score": 2.67})
+
+    def test_blank_and_double_marked_rows_are_not_scored(self):
+        answers = list(ANSWERS)
+        answers[2] = None
+        sheet = render_answer_sheet("", answers)
+        cv2.circle(sheet, (260 + 2 * 70 + 35, 430 + 35), 22, 0, -1)  # second mark on Q1 D
+
+        result = self.reader.read(sheet)
+        self.assertIsNone(result["scores"])
+        self.assertEqual(result["confidence"], 0.0)
+        self.assertEqual(result["issues"], ["Q1 D: several boxes filled", "Q1 S: no box filled"])
+
+    def test_no_grid(self):
+        self.assertIsNone(self.reader.read(np.full((800, 600), 255, np.uint8)))
+        self.assertIsNone(self.reader.read_bytes(b"not an image"))
+
+    def test_layout_matches_printable_survey(self):
+        survey = DISCExternalPipeline().generate_printable_survey()["survey"]
+        self.assertEqual(len(survey["answer_sheet"]["rows"]), GRID_ROWS)
+        self.assertEqual(len(survey["questions"]) * 4, GRID_ROWS)
+
+
+class TestOcrImageUsesAnswerSheet(unittest.TestCase):
+    """process_ocr_image and the upload route with answer-sheet scans."""
+
+    @patch('src.services.disc_pipeline.pytesseract')
+    def test_sheet_scored_with_id_only_ocr(self, mock_pytesseract):
+        mock_pytesseract.image_to_string.return_value = "CAND-0042\n"
+        pipeline = DISCExternalPipeline()
+        result = pipeline.process_ocr_image(png(photo(render_answer_sheet("CAND-0042", ANSWERS))), "C-1")
+
+        self.assertEqual(result["status"], "auto_scored")
+        self.assertEqual(result["detected_candidate_id"], "CAND-0042")
+        self.assertEqual(result["disc_profile"]["primary_style"], "Dominance")
+        # Only the small id box went to Tesseract
+        mock_pytesseract.image_to_string.assert_called_once()
+        id_image = mock_pytesseract.image_to_string.call_args[0][0]
+        self.assertLess(id_image.size, 100000)
+        self.assertEqual(mock_pytesseract.image_to_string.call_args[1]["config"], pipeline.ocr_id_config)
+
+    @patch('src.services.disc_pipeline.pytesseract')
+    def test_unreadable_sheet_falls_back_to_full_page_ocr(self, mock_pytesseract):
+        mock_pytesseract.image_to_string.return_value = "D: 8"
+        answers = list(ANSWERS)
+        answers[5] = None
+        pipeline = DISCExternalPipeline()
+        result = pipeline.process_ocr_image(png(render_answer_sheet("", answers)), "C-2")
+
+        self.assertEqual(result["status"], "pending_manual_review")
+        self.assertEqual(result["answer_sheet"]["issues"], ["Q2 I: no box filled"])
+        self.assertEqual(mock_pytesseract.image_to_string.call_args[1]["config"], pipeline.ocr_config)
+
+    @patch('src.services.disc_pipeline.pytesseract')
+    def test_upload_route_saves_scored_sheet(self, mock_pytesseract):
+        from src.app import create_app
+        app = create_app()
+        app.config['TESTING'] = True
+        mock_pytesseract.image_to_string.return_value = "CAND-0042"
+        db = MagicMock()
+        with patch('src.routes.disc_routes.get_db_service', return_value=db):
+            response = app.test_client().post(
+                '/api/disc/upload-ocr-image', content_type='multipart/form-data',
+                data={'file': (io.BytesIO(png(render_answer_sheet("CAND-0042", ANSWERS))), 'sheet.png')}
+            )
+
+        self.assertEqual(response.status_code, 200)
+        saved = db.save_analysis.call_args[1]
+        self.assertEqual((saved["candidate_id"], saved["source_type"]), ("CAND-0042", "disc_omr"))
+        self.assertEqual((saved["summary"]["D"], saved["summary"]["primary_type"]), (8.0, "Dominance"))
+
+
+class TestAnswerSheetDownload(unittest.TestCase):
+    """The survey links to a per-candidate answer sheet that the reader scores."""
+
+    def setUp(self):
+        from src.app import create_app
+        app = create_app()
+        app.config['TESTING'] = True
+        self.client = app.test_client()
+
+    def test_downloaded_sheet_is_scored(self):
+        survey = self.client.get('/api/disc/generate-survey?candidate_id=CAND-0042').get_json()
+        links = survey["survey"]["answer_sheet"]["download"]
+        self.assertEqual(links["png"], "/api/disc/answer-sheet/CAND-0042?format=png")
+
+        response = self.client.get(links["png"])
+        self.assertEqual((response.status_code, response.mimetype), (200, 'image/png'))
+        sheet = cv2.imdecode(np.frombuffer(response.data, np.uint8), cv2.IMREAD_GRAYSCALE)
+        np.testing.assert_array_equal(sheet, render_answer_sheet("CAND-0042"))
+
+        # Filled in by hand and photographed
+        for row, score in enumerate(ANSWERS):
+            cv2.circle(sheet, (GRID_X + (score - 1) * CELL + CELL // 2, GRID_Y + row * CELL + CELL // 2), 22, 0, -1)
+        result = AnswerSheetReader().read(photo(sheet))
+        self.assertEqual(result["scores"], {"d_score": 8.0, "i_score": 6.0, "s_score": 7.0, "c_score": 5.0})
+
+    def test_pdf_and_bad_requests(self):
+        response = self.client.get('/api/disc/answer-sheet/CAND-0042?format=pdf')
+        self.assertEqual((response.status_code, response.mimetype), (200, 'application/pdf'))
+        self.assertTrue(response.data.startswith(b'%PDF'))
+        self.assertIn(b'595', response.data)  # A4 width in points
+
+        self.assertEqual(self.client.get('/api/disc/answer-sheet/CAND-0042?format=gif').status_code, 400)
+        self.assertEqual(self.client.get('/api/disc/answer-sheet/Nguy%E1%BB%85n').status_code, 400)
+        self.assertEqual(self.client.get('/api/disc/answer-sheet/' + 'X' * 21).status_code, 400)
+        template = self.client.get('/api/disc/generate-survey').get_json()["survey"]["answer_sheet"]["download"]
+        self.assertEqual(template["pdf"], "/api/disc/answer-sheet/<candidate_id>?format=pdf")
+
+
+if __name__ == '__main__':
+    unittest.main()
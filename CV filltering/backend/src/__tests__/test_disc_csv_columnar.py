@@ -0,0 +1,85 @@
+# backend/src/__tests__/test_disc_csv_columnar.py
+"""
+The columnar DISC CSV path must return exactly what the per-row
+validate_disc_scores + generate_disc_profile loop returned.
+Uses the reference loop in tools/bench_disc_csv.py.
+"""
+
+import unittest
+from unittest.mock import patch
+import os
+import random
+import sys
+from pathlib import Path
+
+# Add parent directories to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / 'tools'))
+
+import bench_disc_csv
+from src.services.disc_pipeline import DISCExternalPipeline
+
+HEADER = "candidate_id,name,d_score,i_score,s_score,c_score,notes"
+
+
+class TestColumnarCsvMatchesPerRow(unittest.TestCase):
+    """process_csv_upload vs the per-row reference implementation."""
+
+    def setUp(self):
+        self.pipeline = DISCExternalPipeline()
+
+    def _assert_same(self, text, max_rows=1000):
+        data = text.encode("utf-8")
+        with patch.dict(os.environ, {"DISC_CSV_MAX_ROWS": str(max_rows)}):
+            result = self.pipeline.process_csv_upload(data)
+        expected = bench_disc_csv.loop_process(self.pipeline, data, max_rows)
+        # repr also catches int/float and dict key order differences
+        self.assertEqual(repr(result), repr(expected))
+        return result
+
+    def test_ties_keep_d_i_s_c_order(self):
+        result = self._assert_same(f"{HEADER}\nA,An,7,7,3,7,tie\nB,Binh,2,5,5,1,\nC,Chi,4,4,4,4,flat")
+        self.assertEqual(result["candidates"][0]["disc_profile"]["style_ranking"], ["D", "I", "C", "S"])
+        self.assertEqual(result["candidates"][1]["disc_profile"]["primary_style"], "Influence")
+        self.assertEqual(result["candidates"][2]["disc_profile"]["secondary_style"], "I")
+
+    def test_invalid_values_report_the_same_errors(self):
+        result = self._assert_same(
+            f"{HEADER}\nA,An,11,abc,5,5,\nB,Binh, 3 ,1e1,nan,inf,\nC,Chi,,0,10,1_0,\nD,Dung,5,5,5,5,ok"
+        )
+        self.assertEqual(result["processed_count"], 1)
+        self.assertEqual(len(result["errors"]), 3)
+        self.assertIn("Row 2: Invalid data - Invalid scores: d_score: 11 ngoài khoảng", result["errors"][0])
+
+    def test_csv_shape_edge_cases(self):
+        # Blank lines, short and long rows, quoted commas, no notes column, duplicate header
+        self._assert_same(f"{HEADER}\n\nA,An,5,6\nB,\"Tran, Binh\",1,2,3,4,n,extra,more\n\nC,Chi,9,8,7,6,x")
+        self._assert_same("candidate_id,name,d_score,i_score,s_score,c_score\nA,An,5,6,7,8")
+        self._assert_same("candidate_id,d_score,name,i_score,s_score,c_score,d_score\nA,1,An,5,6,7,9")
+
+    def test_row_limit_and_malformed_input(self):
+        rows = "\n".join(f"C{i},N{i},{i % 10 + 1},5,5,5,n" for i in range(10))
+        result = self._assert_same(f"{HEADER}\n{rows}", max_rows=4)
+        self.assertEqual(result["processed_count"], 4)
+        self.assertEqual(result["warnings"], ["Processing stopped at 4 rows limit."])
+
+        self._assert_same("candidate_id,name\nA,An")
+        self._assert_same("")
+        # Field over the csv size limit: rows before it are still processed, then the failure is reported
+        result = self.pipeline.process_csv_upload(f"{HEADER}\nA,An,5,6,7,8,\nB,{'x' * 200000}".encode("utf-8"))
+        self.assertEqual(result["processed_count"], 1)
+        self.assertTrue(result["errors"][-1].startswith("Failed to process CSV file"))
+
+    def test_random_files(self):
+        rng = random.Random(5)
+        values = ["1", "10", "5", "7.5", "2", "2.0", "0", "11", "x", ""]
+        for _ in range(50):
+            rows = "\n".join(
+                ",".join([f"C{i}", f"N{i}"] + [rng.choice(values) for _ in range(4)] + ["n"])
+                for i in range(rng.randint(1, 40))
+            )
+            self._assert_same(f"{HEADER}\n{rows}", max_rows=rng.choice([5, 1000]))
+
+
+if __name__ == '__main__':
+    unittest.main()
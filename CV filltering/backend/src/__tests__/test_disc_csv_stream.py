@@ -0,0 +1,172 @@
+# backend/src/__tests__/test_disc_csv_stream.py
+"""
+Unit tests for streaming DISC CSV imports: incremental decoding, batched
+processing and /api/disc/upload-csv/stream.
+"""
+
+import unittest
+from unittest.mock import patch, MagicMock
+import io
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+
+# Add parent directories to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.services.disc_pipeline import DISCExternalPipeline
+
+HEADER = "candidate_id,name,d_score,i_score,s_score,c_score,notes\n"
+ROWS = (
+    'A,Nguyễn Văn An,8,6,7,5,\n'
+    'B,"Trần, Thị\nBình",5,9,6,7,multi-line name\n'
+    '\n'
+    'C,Lê Đức,11,5,8,6,bad\n'
+    'D,Phạm Hà,7,5,8,6,\n'
+    'E,Võ Lan,4,4,4,4,last'
+)
+
+
+class GeneratedCsv(io.RawIOBase):
+    """Readable stream producing `rows` DISC rows without holding the file in memory."""
+
+    def __init__(self, rows):
+        self._lines = (HEADER if i < 0 else f"C{i},Name {i},{i % 10 + 1},5,6,7,note\n" for i in range(-1, rows))
+        self._buffer = b''
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        while len(self._buffer) < size:
+            line = next(self._lines, None)
+            if line is None:
+                break
+            self._buffer += line.encode('utf-8')
+        chunk, self._buffer = self._buffer[:size], self._buffer[size:]
+        return chunk
+
+
+class TestCsvStreaming(unittest.TestCase):
+    """Test suite for open_csv_stream / process_csv_batches."""
+
+    def setUp(self):
+        self.pipeline = DISCExternalPipeline()
+
+    def _stream_results(self, data, chunk_size, batch_rows):
+        fieldnames, rows = self.pipeline.open_csv_stream(io.BytesIO(data), chunk_size=chunk_size)
+        return list(self.pipeline.process_csv_batches(fieldnames, rows, batch_rows=batch_rows))
+
+    def test_batches_match_whole_file_processing(self):
+        data = (HEADER + ROWS).encode('utf-8')
+        expected = self.pipeline.process_csv_upload(data)
+
+        # Tiny chunks split lines and multi-byte characters; a BOM is tolerated
+        for chunk_size in (3, 7, 64 * 1024):
+            batches = self._stream_results(b'\xef\xbb\xbf' + data, chunk_size, batch_rows=2)
+            self.assertEqual([b["first_row"] for b in batches], [2, 4, 6])
+            self.assertEqual([c for b in batches for c in b["candidates"]], expected["candidates"])
+            self.assertEqual([e for b in batches for e in b["errors"]], expected["errors"])
+            self.assertEqual(sum(b["processed_count"] for b in batches), 4)
+
+    def test_missing_headers(self):
+        with self.assertRaises(ValueError):
+            self.pipeline.open_csv_stream(io.BytesIO(b'candidate_id,name\nA,An\n'))
+        with self.assertRaises(ValueError):
+            self.pipeline.open_csv_stream(io.BytesIO(b''))
+
+    def test_read_error_ends_stream_after_reporting(self):
+        data = (HEADER + 'A,An,5,6,7,8,\nB,' + 'x' * 200000).encode('utf-8')
+        batches = self._stream_results(data, 4096, batch_rows=10)
+
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(batches[0]["processed_count"], 1)
+        self.assertTrue(batches[0]["errors"][-1].startswith("Failed to process CSV file"))
+
+    def test_peak_memory_does_not_grow_with_file_size(self):
+        def peak(rows):
+            tracemalloc.start()
+            try:
+                fieldnames, reader = self.pipeline.open_csv_stream(GeneratedCsv(rows), chunk_size=16 * 1024)
+                processed = sum(b["processed_count"] for b in self.pipeline.process_csv_batches(fieldnames, reader, 500))
+                self.assertEqual(processed, rows)
+                return tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        small, large = peak(2000), peak(10000)
+        self.assertLess(large, small * 1.5)
+
+
+class TestCsvStreamEndpoint(unittest.TestCase):
+    """Integration tests for /api/disc/upload-csv/stream."""
+
+    def setUp(self):
+        from src.app import create_app
+        self.app = create_app()
+        self.app.config['TESTING'] = True
+        self.client = self.app.test_client()
+        self.db = MagicMock()
+        self.db.save_analyses_batch.side_effect = lambda analyses: {"success": True, "count": len(analyses)}
+        patcher = patch('src.routes.disc_routes.get_db_service', return_value=self.db)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _lines(self, response):
+        return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+    def test_raw_body_streams_batches_and_flushes_each(self):
+        with patch.dict('os.environ', {'DISC_CSV_STREAM_BATCH_ROWS': '2'}):
+            response = self.client.post('/api/disc/upload-csv/stream', data=(HEADER + ROWS).encode('utf-8'),
+                                        content_type='text/csv')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'application/x-ndjson')
+        lines = self._lines(response)
+        self.assertEqual([line["type"] for line in lines], ["batch", "batch", "batch", "summary"])
+        self.assertEqual(self.db.save_analyses_batch.call_count, 3)
+        first_batch = self.db.save_analyses_batch.call_args_list[0][0][0]
+        self.assertEqual(first_batch[0]["source_type"], "disc_csv")
+        self.assertEqual(first_batch[0]["summary"]["primary_type"], "Dominance")
+
+        summary = lines[-1]
+        self.assertEqual((summary["rows"], summary["processed_count"], summary["error_count"]), (5, 4, 1))
+        self.assertEqual(summary["saved_count"], 4)
+        self.assertFalse(summary["success"])
+
+    def test_multipart_upload(self):
+        response = self.client.post('/api/disc/upload-csv/stream', content_type='multipart/form-data',
+                                    data={'file': (io.BytesIO((HEADER + 'A,An,5,6,7,8,').encode()), 'disc.csv')})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(self._lines(response)[-1]["success"])
+
+    def test_body_limit_is_the_stream_limit(self):
+        # Larger than the app-wide 16MB MAX_CONTENT_LENGTH
+        rows = 80000
+        note = 'n' * 200
+        data = (HEADER + ''.join(f"C{i},Name {i},{i % 10 + 1},5,6,7,{note}\n" for i in range(rows))).encode('utf-8')
+        self.assertGreater(len(data), self.app.config['MAX_CONTENT_LENGTH'])
+
+        with patch.dict('os.environ', {'DISC_CSV_STREAM_BATCH_ROWS': '50000'}):
+            response = self.client.post('/api/disc/upload-csv/stream', data=data, content_type='text/csv')
+        self.assertEqual(response.status_code, 200)
+        summary = self._lines(response)[-1]
+        self.assertEqual((summary["rows"], summary["processed_count"]), (rows, rows))
+
+        with patch.dict('os.environ', {'DISC_CSV_STREAM_MAX_BYTES': '1024'}):
+            response = self.client.post('/api/disc/upload-csv/stream', data=data[:2048], content_type='text/csv')
+        self.assertEqual(response.status_code, 413)
+
+    def test_bad_requests(self):
+        response = self.client.post('/api/disc/upload-csv/stream', data=b'id,name\n1,x', content_type='text/csv')
+        self.assertEqual(response.status_code, 400)
+        response = self.client.post('/api/disc/upload-csv/stream', content_type='multipart/form-data',
+                                    data={'file': (io.BytesIO(b'x'), 'disc.txt')})
+        self.assertEqual(response.status_code, 400)
+        self.db.save_analyses_batch.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,185 @@
+# backend/src/__tests__/test_disc_ocr_batch.py
+"""
+Unit tests for batch DISC survey OCR: process_ocr_batch on the process pool
+and /api/disc/upload-ocr-batch (images and ZIP archives, NDJSON results,
+one bulk database write).
+"""
+
+import unittest
+from unittest.mock import patch, MagicMock
+import io
+import json
+import sys
+import zipfile
+from pathlib import Path
+
+# Add parent directories to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import cv2
+from src.services.disc_answer_sheet import render_answer_sheet
+from src.services.disc_pipeline import DISCExternalPipeline
+
+
+def sheet_png(d_score):
+    """Answer sheet whose D rows are all `d_score` (so d_score reads back as given)."""
+    answers = [d_score, 5, 6, 4] * 3
+    return cv2.imencode('.png', render_answer_sheet("", answers))[1].tobytes()
+
+
+def zip_bytes(members):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+class TestProcessOcrBatch(unittest.TestCase):
+    """Test suite for DISCExternalPipeline.process_ocr_batch."""
+
+    def setUp(self):
+        self.pipeline = DISCExternalPipeline()
+        self.images = [(f"scans/CAND-{d}.png", sheet_png(d)) for d in (3, 7, 9)] + [("broken.jpg", b"not an image")]
+
+    def _by_index(self, results):
+        return {result["index"]: result for result in results}
+
+    def test_pool_and_inline_give_the_same_results(self):
+        for workers in (2, 1):
+            results = self._by_index(self.pipeline.process_ocr_batch(iter(self.images), max_workers=workers))
+
+            self.assertEqual(sorted(results), [0, 1, 2, 3])
+            for index, d_score in enumerate((3, 7, 9)):
+                self.assertEqual(results[index]["status"], "auto_scored")
+                self.assertEqual(results[index]["disc_scores"]["d_score"], float(d_score))
+                self.assertEqual(results[index]["candidate_id"], f"CAND-{d_score}")
+                self.assertEqual(results[index]["filename"], f"scans/CAND-{d_score}.png")
+            self.assertFalse(results[3]["success"])
+            self.assertEqual(results[3]["candidate_id"], "broken")
+
+    def test_workers_are_not_forked_from_request_threads(self):
+        from src.services.disc_pipeline import _get_ocr_batch_pool
+        self.assertIn(_get_ocr_batch_pool(2)._mp_context.get_start_method(), ('forkserver', 'spawn'))
+
+    def test_input_is_read_lazily(self):
+        consumed = []
+
+        def images():
+            for i in range(12):
+                consumed.append(i)
+                yield f"{i}.png", b"not an image"
+
+        results = self.pipeline.process_ocr_batch(images(), max_workers=2)
+        next(results)
+        # At most two images per worker in flight before the first result
+        self.assertLessEqual(len(consumed), 5)
+        self.assertEqual(len(list(results)), 11)
+
+
+class TestOcrBatchEndpoint(unittest.TestCase):
+    """Integration tests for /api/disc/upload-ocr-batch."""
+
+    def setUp(self):
+        from src.app import create_app
+        self.app = create_app()
+        self.app.config['TESTING'] = True
+        self.client = self.app.test_client()
+        self.db = MagicMock()
+        self.db.save_analyses_batch.side_effect = lambda analyses: {"success": True, "count": len(analyses)}
+        for target in [patch('src.routes.disc_routes.get_db_service', return_value=self.db),
+                       patch.dict('os.environ', {'DISC_OCR_BATCH_WORKERS': '2'})]:
+            target.start()
+            self.addCleanup(target.stop)
+
+    def _lines(self, response):
+        return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+    def test_images_and_zip_saved_in_one_bulk_write(self):
+        archive = zip_bytes({
+            "day1/CAND-4.png": sheet_png(4),
+            "day1/CAND-5.jpg": sheet_png(5),
+            "day1/notes.txt": b"ignored",
+            "__MACOSX/day1/._CAND-4.png": b"ignored",
+        })
+        response = self.client.post('/api/disc/upload-ocr-batch', content_type='multipart/form-data', data={
+            'files': [(io.BytesIO(sheet_png(8)), 'CAND-8.png'), (io.BytesIO(archive), 'surveys.zip'),
+                      (io.BytesIO(b"not an image"), 'blurry.jpg')]
+        })
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'application/x-ndjson')
+        lines = self._lines(response)
+        results = [line for line in lines if line["type"] == "result"]
+        self.assertEqual(sorted(r["filename"] for r in results),
+                         ["CAND-8.png", "blurry.jpg", "day1/CAND-4.png", "day1/CAND-5.jpg"])
+
+        summary = lines[-1]
+        self.assertEqual(summary["type"], "summary")
+        self.assertEqual((summary["images"], summary["auto_scored"], summary["failed"]), (4, 3, 1))
+        self.db.save_analyses_batch.assert_called_once()
+        saved = self.db.save_analyses_batch.call_args[0][0]
+        self.assertEqual(sorted(a["candidate_id"] for a in saved), ["CAND-4", "CAND-5", "CAND-8"])
+        self.assertEqual({a["source_type"] for a in saved}, {"disc_omr"})
+
+    def test_raw_zip_body_and_image_limit(self):
+        archive = zip_bytes({f"CAND-{d}.png": sheet_png(d) for d in (2, 6, 10)})
+        with patch.dict('os.environ', {'DISC_OCR_BATCH_MAX_IMAGES': '2'}):
+            response = self.client.post('/api/disc/upload-ocr-batch', data=archive, content_type='application/zip')
+
+        summary = self._lines(response)[-1]
+        self.assertEqual((summary["images"], summary["auto_scored"]), (2, 2))
+        self.assertEqual(summary["skipped"], ["CAND-10.png: over the 2 images limit"])
+        self.assertTrue(summary["success"])
+
+    def test_total_decompressed_bytes_budget(self):
+        sheets = {f"CAND-{d}.png": sheet_png(d) for d in (2, 6, 10)}
+        budget = len(sheets["CAND-2.png"]) + len(sheets["CAND-6.png"]) + 10
+        archive = zip_bytes(sheets)
+        opened = []
+
+        class TrackedZipFile(zipfile.ZipFile):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                opened.append(self)
+
+        with patch.dict('os.environ', {'DISC_OCR_BATCH_MAX_TOTAL_BYTES': str(budget)}), \
+                patch('src.routes.disc_routes.zipfile.ZipFile', TrackedZipFile):
+            response = self.client.post('/api/disc/upload-ocr-batch', data=archive, content_type='application/zip')
+
+        summary = self._lines(response)[-1]
+        self.assertEqual(summary["images"], 2)
+        self.assertEqual(summary["skipped"], [f"CAND-10.png: over the {budget} bytes batch limit"])
+        # The archive was closed by _batch_images, not left to the garbage collector
+        self.assertEqual([archive.fp for archive in opened], [None])
+
+    def test_body_limit_is_the_batch_limit(self):
+        self.app.config['MAX_CONTENT_LENGTH'] = 1024
+        archive = zip_bytes({"CAND-7.png": sheet_png(7)})
+        self.assertGreater(len(archive), 1024)
+
+        response = self.client.post('/api/disc/upload-ocr-batch', data=archive, content_type='application/zip')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._lines(response)[-1]["auto_scored"], 1)
+
+        with patch.dict('os.environ', {'DISC_OCR_BATCH_MAX_BYTES': '1024'}):
+            response = self.client.post('/api/disc/upload-ocr-batch', data=archive, content_type='application/zip')
+        self.assertEqual(response.status_code, 413)
+        response = self.client.post('/api/disc/upload-ocr-image', content_type='multipart/form-data',
+                                    data={'file': (io.BytesIO(sheet_png(7)), 'CAND-7.png')})
+        self.assertEqual(response.status_code, 413)
+
+    def test_bad_requests(self):
+        response = self.client.post('/api/disc/upload-ocr-batch', content_type='multipart/form-data',
+                                    data={'files': [(io.BytesIO(b"PK not really"), 'surveys.zip')]})
+        self.assertEqual(response.status_code, 400)
+        response = self.client.post('/api/disc/upload-ocr-batch', content_type='multipart/form-data',
+                                    data={'files': [(io.BytesIO(b"x"), 'notes.txt')]})
+        self.assertEqual(response.status_code, 400)
+        response = self.client.post('/api/disc/upload-ocr-batch', data=b"{}", content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+        self.db.save_analyses_batch.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+# backend/src/__tests__/test_disc_ocr_preprocess.py
+"""
+Unit tests for DISC survey OCR preprocessing: reduced decoding, DPI
+normalisation, perspective correction from the page contour, deskew and
+per-stage timings.
+"""
+
+import unittest
+from unittest.mock import patch
+import sys
+from pathlib import Path
+
+# Add parent directories to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import cv2
+import numpy as np
+from src.services.disc_pipeline import DISCExternalPipeline, skew_angle, _encoded_image_size
+from src.services.stage_timing import get_stage_timings
+
+
+def survey_page():
+    """A4 survey page at 150 DPI with a few lines of text."""
+    page = np.full((1754, 1240), 255, dtype=np.uint8)
+    lines = ["DISC SURVEY", "Candidate ID: CAND-0001", "D: 8", "I: 4", "S: 7", "C: 2", "Signed: Nguyen Van An"]
+    for row, text in enumerate(lines):
+        cv2.putText(page, text, (100, 200 + row * 150), cv2.FONT_HERSHEY_SIMPLEX, 2.0, 0, 4, cv2.LINE_AA)
+    return page
+
+
+def rotated(image, degrees):
+    height, width = image.shape
+    rotation = cv2.getRotationMatrix2D((width / 2, height / 2), degrees, 1.0)
+    return cv2.warpAffine(image, rotation, (width, height), borderValue=255)
+
+
+def phone_photo(page, zoom=2.0):
+    """The page photographed at an angle on a dark table, at phone-camera resolution."""
+    height, width = page.shape
+    canvas = np.full((height + 400, width + 400), 90, np.uint8)
+    canvas[200:200 + height, 200:200 + width] = page
+    flat = np.float32([[200, 200], [200 + width, 200], [200 + width, 200 + height], [200, 200 + height]])
+    tilted = np.float32([[260, 180], [180 + width, 240], [230 + width, 150 + height], [150, 230 + height]])
+    image = cv2.warpPerspective(canvas, cv2.getPerspectiveTransform(flat, tilted), canvas.shape[::-1], borderValue=90)
+    return cv2.resize(image, None, fx=zoom, fy=zoom, interpolation=cv2.INTER_CUBIC)
+
+
+def jpeg(image):
+    return cv2.imencode('.jpg', image, [cv2.IMWRITE_JPEG_QUALITY, 90])[1].tobytes()
+
+
+def ink_iou(binary, page):
+    """Overlap of the ink in a preprocessed image and in the upright page resized onto it."""
+    expected = cv2.resize(page, binary.shape[::-1], interpolation=cv2.INTER_AREA) < 128
+    ink = binary < 128
+    return np.count_nonzero(ink & expected) / np.count_nonzero(ink | expected)
+
+
+class TestOcrPreprocessing(unittest.TestCase):
+    """Test suite for DISCExternalPipeline._preprocess_image_for_ocr."""
+
+    def setUp(self):
+        self.pipeline = DISCExternalPipeline()
+
+    def test_header_sizes(self):
+        page = survey_page()
+        self.assertEqual(_encoded_image_size(jpeg(page)), (1240, 1754))
+        self.assertEqual(_encoded_image_size(cv2.imencode('.png', page)[1].tobytes()), (1240, 1754))
+        self.assertIsNone(_encoded_image_size(b"not an image"))
+
+    def test_large_images_decoded_reduced(self):
+        self.pipeline.ocr_target_dpi = 100  # page width 827 px
+        for size, expected_width in (((1700, 2400), 850), ((1500, 2400), 1500), ((7000, 9000), 875)):
+            image = np.full(size[::-1], 200, np.uint8)
+            self.assertEqual(self.pipeline._decode_for_ocr(jpeg(image)).shape[1], expected_width)
+        with self.assertRaises(ValueError):
+            self.pipeline._decode_for_ocr(b"not an image")
+
+    def test_skew_angle(self):
+        page = survey_page()
+        for degrees in (-7, -2, 0, 1, 4):
+            # getRotationMatrix2D turns counter-clockwise, so lines then slope up to the right
+            self.assertAlmostEqual(skew_angle(rotated(page, degrees)), -degrees, delta=0.15)
+        self.assertEqual(skew_angle(np.full((400, 400), 255, np.uint8)), 0.0)
+
+    def test_deskew_levels_a_rotated_scan(self):
+        with patch.dict('os.environ', {'DISC_OCR_TARGET_DPI': '150'}):
+            pipeline = DISCExternalPipeline()
+        scan = rotated(survey_page(), 4)
+        binary = pipeline._preprocess_image_for_ocr(jpeg(scan))
+
+        self.assertLess(abs(skew_angle(binary)), 0.3)
+        self.assertGreater(binary.shape[1], scan.shape[1])  # canvas grew instead of cutting corners
+
+    def test_photo_warped_to_upright_page_at_target_dpi(self):
+        page = survey_page()
+        binary = self.pipeline._preprocess_image_for_ocr(jpeg(phone_photo(page)))
+
+        self.assertEqual(binary.shape[1], round(300 * 8.27))
+        self.assertAlmostEqual(binary.shape[0] / binary.shape[1], 1754 / 1240, delta=0.03)
+        self.assertGreater(ink_iou(binary, page), 0.5)
+        self.assertEqual(set(np.unique(binary)), {0, 255})
+
+        with patch.dict('os.environ', {'DISC_OCR_PREPROCESS_STEPS': 'denoise', 'DISC_OCR_TARGET_DPI': '0'}):
+            legacy = DISCExternalPipeline()._preprocess_image_for_ocr(jpeg(phone_photo(page)))
+        self.assertEqual(legacy.shape, phone_photo(page).shape)
+        self.assertLess(ink_iou(legacy, page), 0.1)
+
+    def test_flat_scan_resized_to_target_dpi(self):
+        binary = self.pipeline._preprocess_image_for_ocr(jpeg(survey_page()))
+        # No page contour (the page is the whole image): 150 -> 300 DPI
+        self.assertEqual(binary.shape, (3508, 2480))
+        self.assertGreater(ink_iou(binary, survey_page()), 0.7)
+
+    def test_stages_timed(self):
+        timings = get_stage_timings()
+        before = {name: stats["count"] for name, stats in timings.get_stats()["stages"].items()}
+        self.pipeline._preprocess_image_for_ocr(jpeg(phone_photo(survey_page(), zoom=1.0)))
+
+        after = timings.get_stats()["stages"]
+        for name in ("decode", "perspective", "deskew", "binarise"):
+            key = f"disc.ocr_preprocess.{name}"
+            self.assertEqual(after[key]["count"], before.get(key, 0) + 1, key)
+
+    def test_failing_step_is_skipped(self):
+        with patch.object(DISCExternalPipeline, '_deskew', side_effect=RuntimeError("no lines")):
+            binary = self.pipeline._preprocess_image_for_ocr(jpeg(survey_page()))
+        self.assertEqual(binary.shape, (3508, 2480))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+# backend/src/__tests__/test_disc_profile_table.py
+"""
+The precomputed DISC profile table (and its memoised fallback) must give
+exactly the profiles the per-call sort produced. Uses the reference
+implementation in tools/bench_disc_profile.py.
+"""
+
+import unittest
+import itertools
+import sys
+from pathlib import Path
+
+# Add parent directories to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / 'tools'))
+
+import bench_disc_profile
+from src.services import disc_pipeline
+from src.services.disc_pipeline import DISCExternalPipeline, disc_ranking_code, _sorted_ranking_code
+
+KEYS = ('d_score', 'i_score', 's_score', 'c_score')
+
+
+class TestDiscProfileTable(unittest.TestCase):
+    """generate_disc_profile vs the computed reference."""
+
+    def setUp(self):
+        self.pipeline = DISCExternalPipeline()
+
+    def _assert_same(self, values):
+        scores = dict(zip(KEYS, values))
+        self.assertEqual(repr(self.pipeline.generate_disc_profile(scores)),
+                         repr(bench_disc_profile.computed_profile(scores)))
+
+    def test_table_covers_every_integer_combination(self):
+        self.assertEqual(len(disc_pipeline.DISC_PROFILE_TABLE), 10 ** 4)
+        for values in itertools.product(range(1, 11), repeat=4):
+            self.assertEqual(disc_ranking_code(*values), _sorted_ranking_code(*values))
+            self._assert_same(tuple(float(v) for v in values))
+
+    def test_integral_floats_and_ints_use_the_table(self):
+        disc_pipeline._memoised_ranking_code.cache_clear()
+        self._assert_same((7.0, 7.0, 3.0, 7.0))
+        self._assert_same((2, 5, 5, 1))
+        self.assertEqual(disc_pipeline._memoised_ranking_code.cache_info().currsize, 0)
+
+    def test_fractional_and_out_of_table_scores_are_memoised(self):
+        disc_pipeline._memoised_ranking_code.cache_clear()
+        for values in [(7.5, 7.5, 3.0, 8.0), (0.5, 10.0, 9.99, 10.0), (12.0, 0.0, -1.0, 12.0), (7.5, 7.5, 3.0, 8.0)]:
+            self._assert_same(values)
+
+        info = disc_pipeline._memoised_ranking_code.cache_info()
+        self.assertEqual((info.misses, info.hits), (3, 1))
+
+    def test_style_ranking_is_a_fresh_list(self):
+        first = self.pipeline.generate_disc_profile(dict(zip(KEYS, (4.0, 4.0, 4.0, 4.0))))
+        first["style_ranking"].append("X")
+        second = self.pipeline.generate_disc_profile(dict(zip(KEYS, (4.0, 4.0, 4.0, 4.0))))
+        self.assertEqual(second["style_ranking"], ["D", "I", "S", "C"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,159 @@
+# backend/src/__tests__/test_disc_xlsx_import.py
+"""
+Unit tests for XLSX DISC imports: read-only worksheet streaming must give the
+same results as the equivalent CSV, through /api/disc/upload-csv and
+/api/disc/upload-csv/stream.
+"""
+
+import unittest
+from unittest.mock import patch, MagicMock
+import io
+import json
+import sys
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+# Add parent directories to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import openpyxl
+from src.services.disc_pipeline import DISCExternalPipeline, _xlsx_cell_text
+
+HEADER = ["candidate_id", "name", "d_score", "i_score", "s_score", "c_score", "notes"]
+ROWS = [
+    ["A", "Nguyễn Văn An", 8, 6, 7, 5, None],
+    ["B", "Trần, Thị Bình", 5, 9.0, 6, 7.5, "comma in name"],
+    [None, None, None, None, None, None, None],
+    ["C", "Lê Đức", 11, 5, 8, 6, "bad"],
+    [1001, "Phạm Hà", "7", 5, "x", 6, None],
+    ["E", "Võ Lan", 4, 4, 4, 4, "last"],
+]
+CSV = (
+    "candidate_id,name,d_score,i_score,s_score,c_score,notes\n"
+    "A,Nguyễn Văn An,8,6,7,5,\n"
+    'B,"Trần, Thị Bình",5,9,6,7.5,comma in name\n'
+    "C,Lê Đức,11,5,8,6,bad\n"
+    "1001,Phạm Hà,7,5,x,6,\n"
+    "E,Võ Lan,4,4,4,4,last\n"
+)
+
+
+def xlsx_bytes(rows, header=HEADER, sheets=("DISC",)):
+    workbook = openpyxl.Workbook(write_only=True)
+    for title in sheets:
+        worksheet = workbook.create_sheet(title)
+        if header:
+            worksheet.append(header)
+        for row in rows:
+            worksheet.append(row)
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+class TestXlsxImport(unittest.TestCase):
+    """Test suite for open_xlsx_stream / process_xlsx_upload."""
+
+    def setUp(self):
+        self.pipeline = DISCExternalPipeline()
+
+    def test_matches_csv_processing(self):
+        result = self.pipeline.process_xlsx_upload(io.BytesIO(xlsx_bytes(ROWS)))
+        expected = self.pipeline.process_csv_upload(CSV.encode("utf-8"))
+
+        self.assertEqual(repr(result), repr(expected))
+        self.assertEqual(result["processed_count"], 3)
+        self.assertEqual(result["candidates"][0]["candidate_id"], "A")
+        self.assertEqual(len(result["errors"]), 2)
+
+    def test_cells_read_as_excel_csv_text(self):
+        self.assertEqual(_xlsx_cell_text(7.0), "7")
+        self.assertEqual(_xlsx_cell_text(7.25), "7.25")
+        self.assertEqual(_xlsx_cell_text(True), "TRUE")
+        self.assertEqual(_xlsx_cell_text(None), "")
+        self.assertEqual(_xlsx_cell_text(datetime(2024, 5, 1, 9, 30)), "2024-05-01T09:30:00")
+
+    def test_sheet_selection_and_bad_files(self):
+        data = xlsx_bytes(ROWS[:1], sheets=("Notes", "DISC"))
+        fieldnames, rows = self.pipeline.open_xlsx_stream(io.BytesIO(data), "DISC")
+        self.assertEqual(fieldnames, HEADER)
+        self.assertEqual(list(rows), [["A", "Nguyễn Văn An", "8", "6", "7", "5", ""]])
+
+        for stream, sheet in [(io.BytesIO(data), "Missing"), (io.BytesIO(b"candidate_id,name\n"), None),
+                              (io.BytesIO(xlsx_bytes(ROWS, header=["id", "name"])), None),
+                              (io.BytesIO(xlsx_bytes([], header=None)), None)]:
+            with self.assertRaises(ValueError):
+                self.pipeline.open_xlsx_stream(stream, sheet)
+
+    def test_row_limit(self):
+        rows = [[f"C{i}", f"N{i}", i % 10 + 1, 5, 5, 5, "n"] for i in range(10)]
+        with patch.dict('os.environ', {'DISC_CSV_MAX_ROWS': '4', 'DISC_CSV_STREAM_BATCH_ROWS': '3'}):
+            result = self.pipeline.process_xlsx_upload(io.BytesIO(xlsx_bytes(rows)))
+
+        self.assertEqual(result["processed_count"], 4)
+        self.assertEqual([c["row_index"] for c in result["candidates"]], [2, 3, 4, 5])
+        self.assertEqual(result["warnings"], ["Processing stopped at 4 rows limit."])
+
+    def test_peak_memory_does_not_grow_with_row_count(self):
+        def peak(count):
+            data = xlsx_bytes([[i, "Name", i % 10 + 1, 5, 6, 7, "note"] for i in range(count)])
+            tracemalloc.start()
+            try:
+                fieldnames, rows = self.pipeline.open_xlsx_stream(io.BytesIO(data))
+                processed = sum(b["processed_count"] for b in self.pipeline.process_csv_batches(fieldnames, rows, 500))
+                self.assertEqual(processed, count)
+                return tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        small, large = peak(2000), peak(10000)
+        self.assertLess(large, small * 1.5)
+
+
+class TestXlsxUploadEndpoints(unittest.TestCase):
+    """Integration tests for XLSX uploads."""
+
+    def setUp(self):
+        from src.app import create_app
+        self.app = create_app()
+        self.app.config['TESTING'] = True
+        self.client = self.app.test_client()
+        self.db = MagicMock()
+        self.db.save_analyses_batch.side_effect = lambda analyses: {"success": True, "count": len(analyses)}
+        patcher = patch('src.routes.disc_routes.get_db_service', return_value=self.db)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.valid = xlsx_bytes([ROWS[0], ROWS[5]])
+
+    def test_upload_csv_accepts_xlsx(self):
+        response = self.client.post('/api/disc/upload-csv', content_type='multipart/form-data',
+                                    data={'file': (io.BytesIO(self.valid), 'disc.xlsx')})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()["data"]["processed_count"], 2)
+        self.assertEqual(len(self.db.save_analyses_batch.call_args[0][0]), 2)
+
+    def test_stream_multipart_and_raw_body(self):
+        requests = [
+            {'content_type': 'multipart/form-data', 'data': {'file': (io.BytesIO(self.valid), 'disc.xlsx')}},
+            {'content_type': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet', 'data': self.valid},
+        ]
+        for kwargs in requests:
+            response = self.client.post('/api/disc/upload-csv/stream', **kwargs)
+            self.assertEqual(response.status_code, 200)
+            summary = json.loads(response.get_data(as_text=True).splitlines()[-1])
+            self.assertEqual((summary["type"], summary["processed_count"], summary["saved_count"]), ("summary", 2, 2))
+
+    def test_bad_xlsx_is_rejected(self):
+        response = self.client.post('/api/disc/upload-csv/stream', content_type='multipart/form-data',
+                                    data={'file': (io.BytesIO(b'not a zip'), 'disc.xlsx')})
+        self.assertEqual(response.status_code, 400)
+        response = self.client.post('/api/disc/upload-csv?sheet=Missing', content_type='multipart/form-data',
+                                    data={'file': (io.BytesIO(self.valid), 'disc.xlsx')})
+        self.assertEqual(response.status_code, 400)
+        self.db.save_analyses_batch.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
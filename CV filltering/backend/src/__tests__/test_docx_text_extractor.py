@@ -0,0 +1,134 @@
+# backend/src/__tests__/test_docx_text_extractor.py
+"""
+Unit tests for the streaming DOCX text extractor.
+"""
+
+import unittest
+from unittest.mock import patch
+import io
+import sys
+import zipfile
+from pathlib import Path
+
+import docx
+
+# Add parent directories to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.services.docx_text_extractor import DocxTextExtractor
+
+W_NS = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+MC_NS = 'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006"'
+
+
+def build_docx(paragraphs=(), table_rows=None):
+    document = docx.Document()
+    for paragraph in paragraphs:
+        document.add_paragraph(paragraph)
+    if table_rows:
+        table = document.add_table(rows=len(table_rows), cols=len(table_rows[0]))
+        for r, row in enumerate(table_rows):
+            for c, value in enumerate(row):
+                table.cell(r, c).text = value
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def build_raw_docx(body_xml, media=None):
+    """Minimal DOCX around a hand-written <w:body>, for constructs python-docx cannot author."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('[Content_Types].xml', '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types"/>')
+        archive.writestr('word/document.xml', f'<w:document {W_NS} {MC_NS}><w:body>{body_xml}</w:body></w:document>')
+        for name, data in (media or {}).items():
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+def p(text):
+    return f'<w:p><w:r><w:t xml:space="preserve">{text}</w:t></w:r></w:p>'
+
+
+class TestDocxTextExtractor(unittest.TestCase):
+    """Test suite for DocxTextExtractor."""
+
+    def setUp(self):
+        self.extractor = DocxTextExtractor()
+
+    def test_paragraphs_match_python_docx(self):
+        data = build_docx(["Nguyễn Văn An", "Email: an@example.com", "", "Kỹ năng: Python"])
+        result = self.extractor.extract(data)
+        expected = [p.text for p in docx.Document(io.BytesIO(data)).paragraphs if p.text]
+        self.assertEqual(result["text"].split("\n"), expected)
+
+    def test_tables_are_extracted_in_order(self):
+        data = build_docx(
+            ["KINH NGHIỆM"],
+            table_rows=[["2019 - 2021", "FPT Software", "Developer"], ["2021 - nay", "Tiki", "Senior Developer"]]
+        )
+        result = self.extractor.extract(data)
+        self.assertEqual(result["text"].split("\n"), [
+            "KINH NGHIỆM",
+            "2019 - 2021 | FPT Software | Developer",
+            "2021 - nay | Tiki | Senior Developer"
+        ])
+        self.assertEqual(result["table_count"], 1)
+
+    def test_multi_paragraph_cells_keep_their_lines(self):
+        body = (
+            '<w:tbl><w:tr>'
+            f'<w:tc>{p("HỌC VẤN")}{p("Đại học Bách Khoa")}</w:tc>'
+            f'<w:tc>{p("KỸ NĂNG")}{p("Python, SQL")}</w:tc>'
+            '</w:tr></w:tbl>'
+        )
+        result = self.extractor.extract(build_raw_docx(body))
+        self.assertEqual(result["text"].split("\n"), ["HỌC VẤN", "Đại học Bách Khoa", "KỸ NĂNG", "Python, SQL"])
+
+    def test_nested_tables(self):
+        inner = f'<w:tbl><w:tr><w:tc>{p("a")}</w:tc><w:tc>{p("b")}</w:tc></w:tr></w:tbl>'
+        body = f'<w:tbl><w:tr><w:tc>{p("outer")}{inner}</w:tc></w:tr></w:tbl>{p("after")}'
+        result = self.extractor.extract(build_raw_docx(body))
+        self.assertEqual(result["text"].split("\n"), ["outer", "a | b", "after"])
+        self.assertEqual(result["table_count"], 2)
+
+    def test_text_box_is_read_once(self):
+        textbox = f'<w:txbxContent>{p("Liên hệ: 0912 345 678")}</w:txbxContent>'
+        body = (
+            p("Nguyễn Văn An")
+            + '<w:p><w:r><mc:AlternateContent>'
+            + f'<mc:Choice Requires="wps"><w:drawing>{textbox}</w:drawing></mc:Choice>'
+            + f'<mc:Fallback><w:pict>{textbox}</w:pict></mc:Fallback>'
+            + '</mc:AlternateContent></w:r><w:r><w:t>Anchor</w:t></w:r></w:p>'
+            + p("Tail")
+        )
+        result = self.extractor.extract(build_raw_docx(body))
+        self.assertEqual(result["text"].split("\n"), ["Nguyễn Văn An", "Liên hệ: 0912 345 678", "Anchor", "Tail"])
+        self.assertEqual(result["textbox_count"], 1)
+
+    def test_tabs_and_breaks(self):
+        body = '<w:p><w:r><w:t>Python</w:t><w:tab/><w:t>5 năm</w:t><w:br/><w:t>SQL</w:t></w:r></w:p>'
+        self.assertEqual(self.extractor.extract(build_raw_docx(body))["text"], "Python\t5 năm\nSQL")
+
+    def test_media_is_never_decompressed(self):
+        data = build_raw_docx(p("CV"), media={"word/media/image1.png": b"\x89PNG" + b"\0" * 4096})
+        opened = []
+        original_open = zipfile.ZipFile.open
+
+        def tracking_open(archive, name, *args, **kwargs):
+            opened.append(getattr(name, 'filename', name))
+            return original_open(archive, name, *args, **kwargs)
+
+        with patch.object(zipfile.ZipFile, 'open', tracking_open):
+            self.extractor.extract(io.BytesIO(data))
+        self.assertEqual(opened, ["word/document.xml"])
+
+    def test_max_chars_truncates(self):
+        data = build_docx([f"Paragraph {i} " + "x" * 50 for i in range(100)])
+        result = DocxTextExtractor(max_chars=500).extract(data)
+        self.assertTrue(result["truncated"])
+        self.assertEqual(len(result["text"]), 500)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,212 @@
+# backend/src/__tests__/test_gemini_governor.py
+"""
+Unit tests for the Gemini call governor, run against a local fake model.
+"""
+
+import unittest
+from unittest.mock import patch
+import sys
+import threading
+from pathlib import Path
+
+# Add parent directories to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.services.gemini_governor import GeminiGovernor, GeminiThrottledError, TokenBucket
+
+
+class ResourceExhausted(Exception):
+    """Mirrors google.api_core.exceptions.ResourceExhausted (HTTP 429)."""
+    code = 429
+
+
+class InvalidArgument(Exception):
+    code = 400
+
+
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeModel:
+    """Local stand-in for genai.GenerativeModel with scripted failures."""
+
+    def __init__(self, failures=None, text='{"personalInfo": {}}'):
+        self.failures = list(failures or [])
+        self.text = text
+        self.calls = 0
+
+    def generate_content(self, prompt):
+        self.calls += 1
+        if self.failures:
+            raise self.failures.pop(0)
+        return FakeResponse(self.text)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def make_governor(clock, **kwargs):
+    options = dict(max_concurrency=2, requests_per_minute=600, burst=10, max_retries=3,
+                   base_delay=1.0, max_delay=8.0, queue_timeout=30.0)
+    options.update(kwargs)
+    return GeminiGovernor(sleep=clock.sleep, clock=clock, **options)
+
+
+class TestGeminiGovernor(unittest.TestCase):
+    """Test suite for GeminiGovernor."""
+
+    def test_successful_call_passes_through(self):
+        clock = FakeClock()
+        governor = make_governor(clock)
+        model = FakeModel()
+
+        response = governor.generate_content(model, "prompt")
+
+        self.assertEqual(response.text, '{"personalInfo": {}}')
+        stats = governor.get_stats()
+        self.assertEqual(stats["succeeded"], 1)
+        self.assertEqual(stats["in_flight"], 0)
+        self.assertEqual(stats["queued"], 0)
+
+    def test_retries_429_with_backoff(self):
+        clock = FakeClock()
+        governor = make_governor(clock)
+        model = FakeModel(failures=[ResourceExhausted("quota"), ResourceExhausted("quota")])
+
+        with patch('src.services.gemini_governor.random.uniform', side_effect=lambda a, b: b):
+            governor.generate_content(model, "prompt")
+
+        self.assertEqual(model.calls, 3)
+        self.assertEqual(clock.sleeps, [1.0, 2.0])
+        stats = governor.get_stats()
+        self.assertEqual(stats["retries"], 2)
+        self.assertEqual(stats["throttled"], 2)
+
+    def test_backoff_is_capped_and_jittered(self):
+        governor = make_governor(FakeClock())
+        for attempt in range(10):
+            delay = governor.backoff_delay(attempt)
+            self.assertGreaterEqual(delay, 0)
+            self.assertLessEqual(delay, 8.0)
+
+    def test_gives_up_with_throttled_error(self):
+        clock = FakeClock()
+        governor = make_governor(clock, max_retries=2)
+        model = FakeModel(failures=[ResourceExhausted("quota")] * 5)
+
+        with self.assertRaises(GeminiThrottledError):
+            governor.generate_content(model, "prompt")
+        self.assertEqual(model.calls, 3)
+        self.assertEqual(governor.get_stats()["failed"], 1)
+
+    def test_non_retryable_error_raises_immediately(self):
+        governor = make_governor(FakeClock())
+        model = FakeModel(failures=[InvalidArgument("bad prompt")])
+
+        with self.assertRaises(InvalidArgument):
+            governor.generate_content(model, "prompt")
+        self.assertEqual(model.calls, 1)
+
+    def test_token_bucket_waits_for_quota(self):
+        clock = FakeClock()
+        governor = make_governor(clock, requests_per_minute=60, burst=1)
+        model = FakeModel()
+
+        governor.generate_content(model, "first")
+        governor.generate_content(model, "second")
+
+        self.assertEqual(len(clock.sleeps), 1)
+        self.assertAlmostEqual(clock.sleeps[0], 1.0)
+        self.assertEqual(governor.get_stats()["throttled"], 1)
+
+    def test_quota_wait_beyond_timeout_raises(self):
+        clock = FakeClock()
+        governor = make_governor(clock, requests_per_minute=1, burst=1, queue_timeout=5.0)
+        model = FakeModel()
+
+        governor.generate_content(model, "first")
+        with self.assertRaises(GeminiThrottledError):
+            governor.generate_content(model, "second")
+        self.assertEqual(governor.get_stats()["in_flight"], 0)
+
+    def test_concurrency_is_limited(self):
+        governor = GeminiGovernor(max_concurrency=2, requests_per_minute=6000, burst=100, max_retries=0)
+        lock = threading.Lock()
+        state = {"current": 0, "peak": 0}
+        release = threading.Event()
+
+        def slow_call():
+            with lock:
+                state["current"] += 1
+                state["peak"] = max(state["peak"], state["current"])
+            release.wait(0.1)
+            with lock:
+                state["current"] -= 1
+
+        threads = [threading.Thread(target=governor.call, args=(slow_call,)) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertLessEqual(state["peak"], 2)
+        self.assertEqual(governor.get_stats()["succeeded"], 6)
+
+    def test_token_bucket_refills(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2.0, capacity=2, clock=clock)
+        self.assertEqual(bucket.try_acquire(), 0)
+        self.assertEqual(bucket.try_acquire(), 0)
+        self.assertAlmostEqual(bucket.try_acquire(), 0.5)
+        clock.now += 0.5
+        self.assertEqual(bucket.try_acquire(), 0)
+
+
+class TestCvParsingServiceUsesGovernor(unittest.TestCase):
+    """CvParsingService routes Gemini calls through the governor."""
+
+    def test_rate_limited_parse_falls_back_with_warning(self):
+        from src.services.cv_parsing_service import CvParsingService
+
+        with patch.dict('os.environ', {'GEMINI_API_KEY': ''}):
+            service = CvParsingService()
+        clock = FakeClock()
+        service.model = FakeModel(failures=[ResourceExhausted("quota")] * 5)
+        service.governor = make_governor(clock, max_retries=1)
+
+        with patch.object(service, '_extract_text', return_value="Contact: rate@example.com"):
+            result = service.parse_cv("dummy.pdf")
+
+        self.assertEqual(result["source"]["warning"], "AI_RATE_LIMITED")
+        self.assertEqual(result["personalInfo"]["email"], "rate@example.com")
+        self.assertEqual(service.model.calls, 2)
+
+    def test_gemini_success_through_governor(self):
+        from src.services.cv_parsing_service import CvParsingService
+
+        with patch.dict('os.environ', {'GEMINI_API_KEY': ''}):
+            service = CvParsingService()
+        service.model = FakeModel(text='```json\n{"personalInfo": {"name": "An"}, "skills": []}\n```')
+        service.governor = make_governor(FakeClock())
+
+        with patch.object(service, '_extract_text', return_value="CV text"):
+            result = service.parse_cv("dummy.pdf")
+
+        self.assertTrue(result["source"]["aiUsed"])
+        self.assertEqual(result["personalInfo"]["name"], "An")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,175 @@
+# backend/src/__tests__/test_job_ranking_service.py
+"""
+Unit tests for the vectorised candidate-job ranking service
+and /api/jobs/<id>/shortlist.
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+import random
+import sys
+from datetime import date
+from pathlib import Path
+
+# Add parent directories to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.services.job_ranking_service import (
+    JobRankingService, CandidateFeatures, estimate_experience_years, normalize_skill
+)
+
+JOB = {
+    "id": "job-test",
+    "level": "junior",
+    "requirements": {
+        "technical_skills": ["Python", "SQL", "Machine Learning"],
+        "soft_skills": ["Communication"],
+        "experience_years": 2
+    },
+    "ideal_personality": {
+        "disc_profile": {"d": 40, "i": 30, "s": 60, "c": 90},
+        "numerology_traits": ["Analytical", "Methodical"]
+    }
+}
+
+
+def _features():
+    return CandidateFeatures(
+        candidates=[
+            {"candidate_id": "A", "name": "An", "email": "an@example.com"},
+            {"candidate_id": "B", "name": "Binh", "email": "binh@example.com"},
+            {"candidate_id": "C", "name": "Chi", "email": None},
+        ],
+        disc_rows=[
+            {"candidate_id": "A", "d_score": 1, "i_score": 1, "s_score": 1, "c_score": 1},
+            {"candidate_id": "A", "d_score": 4, "i_score": 3, "s_score": 6, "c_score": 9},  # latest wins
+        ],
+        numerology_rows=[{"candidate_id": "A", "life_path_number": 7, "birth_number": 4}],
+        cv_rows=[
+            {"candidate_id": "A", "skills": ["Python", "SQL", "Machine Learning", "Communication"],
+             "experience": [{"duration": "2019 - 2021"}, {"duration": "2020 - 2022"}]},
+            {"candidate_id": "B", "skills": ["python", "PostgreSQL"], "experience": [{"duration": "2023 - 2024"}]},
+        ]
+    )
+
+
+class TestJobRankingService(unittest.TestCase):
+    """Test suite for JobRankingService scoring and top-k selection."""
+
+    def setUp(self):
+        self.service = JobRankingService(db_service=MagicMock())
+
+    def test_experience_years_merges_overlaps(self):
+        self.assertEqual(estimate_experience_years([{"duration": "2019 - 2021"}, {"duration": "2020 - 2022"}]), 3.0)
+        self.assertEqual(estimate_experience_years([{"duration": "03/2020 - nay"}], today=date(2025, 6, 1)), 5.0)
+        self.assertEqual(estimate_experience_years([{"duration": "Hiện tại"}, "garbage"]), 0.0)
+        self.assertEqual(estimate_experience_years(None), 0.0)
+
+    def test_normalize_skill(self):
+        self.assertEqual(normalize_skill(" Machine  Learning "), "machinelearning")
+        self.assertEqual(normalize_skill("Node.JS"), "node.js")
+
+    def test_component_scores(self):
+        scores = self.service.score(JOB, _features())
+
+        # A: ideal DISC, every skill, 3 years >= 2, traits of 7 and 4 match both
+        self.assertAlmostEqual(scores["personality_fit"][0], 100.0)
+        self.assertAlmostEqual(scores["skills_match"][0], 100.0)
+        self.assertAlmostEqual(scores["experience_fit"][0], 98.0)
+        self.assertAlmostEqual(scores["numerology_harmony"][0], 100.0)
+        # B: Python exact, SQL partial via PostgreSQL, 1 of 2 years, no DISC/numerology
+        self.assertAlmostEqual(scores["skills_match"][1], (1 + 0.7) / 3 * 100 * 0.7)
+        self.assertAlmostEqual(scores["experience_fit"][1], 50.0)
+        self.assertAlmostEqual(scores["personality_fit"][1], 50.0)
+        self.assertAlmostEqual(scores["numerology_harmony"][1], 70.0)
+        # C: no data at all -> frontend defaults
+        self.assertAlmostEqual(scores["skills_match"][2], 40.0)
+        self.assertAlmostEqual(scores["overall"][2], 50 * 0.25 + 40 * 0.30 + 50 * 0.20 + 75 * 0.15 + 70 * 0.10)
+
+    def test_shortlist_is_top_k_in_order(self):
+        result = self.service.shortlist(JOB, k=2, features=_features())
+
+        self.assertEqual(result["total_candidates"], 3)
+        self.assertEqual([c["candidate_id"] for c in result["shortlist"]], ["A", "C"])
+        self.assertEqual(result["shortlist"][0]["rank"], 1)
+        self.assertEqual(result["shortlist"][0]["name"], "An")
+
+    def test_heap_selection_matches_full_sort(self):
+        rng = random.Random(3)
+        skills = ["Python", "SQL", "Java", "Machine Learning", "Docker", "Communication"]
+        features = CandidateFeatures(
+            candidates=[{"candidate_id": f"C{i}"} for i in range(500)],
+            disc_rows=[{"candidate_id": f"C{i}", "d_score": rng.randint(1, 10), "i_score": rng.randint(1, 10),
+                        "s_score": rng.randint(1, 10), "c_score": rng.randint(1, 10)} for i in range(0, 500, 2)],
+            numerology_rows=[{"candidate_id": f"C{i}", "life_path_number": rng.choice([1, 4, 7, 11]),
+                              "birth_number": rng.randint(1, 9)} for i in range(0, 500, 3)],
+            cv_rows=[{"candidate_id": f"C{i}", "skills": rng.sample(skills, rng.randint(0, 4)),
+                      "experience": [{"duration": f"{2024 - rng.randint(0, 8)} - 2024"}]} for i in range(500)]
+        )
+        overall = self.service.score(JOB, features)["overall"]
+        expected = sorted(range(500), key=lambda i: -overall[i])[:25]
+
+        result = self.service.shortlist(JOB, k=25, features=features)
+        self.assertEqual([c["candidate_id"] for c in result["shortlist"]], [f"C{i}" for i in expected])
+
+    def test_features_are_cached(self):
+        db = MagicMock()
+        db.fetch_rows.return_value = []
+        service = JobRankingService(db_service=db, cache_seconds=60)
+
+        service.get_features()
+        service.get_features()
+        self.assertEqual(db.fetch_rows.call_count, 4)
+        service.get_features(refresh=True)
+        self.assertEqual(db.fetch_rows.call_count, 8)
+
+
+class TestShortlistEndpoint(unittest.TestCase):
+    """Integration tests for /api/jobs/<id>/shortlist."""
+
+    def setUp(self):
+        from src.app import create_app
+        from src.services.service_registry import get_service
+        self.app = create_app()
+        self.app.config['TESTING'] = True
+        self.client = self.app.test_client()
+        self.ranking = get_service('job_ranking')
+        self.ranking._features = _features()
+        self.ranking._loaded_at = float('inf')
+        self.addCleanup(setattr, self.ranking, '_features', None)
+
+    def test_catalogue_job_shortlist(self):
+        response = self.client.get('/api/jobs/job-003/shortlist?k=2')
+
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertTrue(data["success"])
+        self.assertEqual(len(data["shortlist"]), 2)
+        self.assertEqual(data["shortlist"][0]["candidate_id"], "A")
+
+    def test_posted_job_spec(self):
+        response = self.client.post('/api/jobs/custom/shortlist?k=5', json=JOB)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()["job_id"], "custom")
+        self.assertEqual(len(response.get_json()["shortlist"]), 3)
+
+    def test_refresh_requires_admin_token(self):
+        with patch.object(self.ranking, 'get_features', return_value=self.ranking._features) as get_features:
+            response = self.client.get('/api/jobs/job-003/shortlist?refresh=true')
+            self.assertEqual(response.status_code, 403)
+            get_features.assert_not_called()
+
+            with patch.dict('os.environ', {'ADMIN_API_TOKEN': 'secret'}):
+                response = self.client.get('/api/jobs/job-003/shortlist?refresh=true',
+                                           headers={'X-Admin-Token': 'secret'})
+            self.assertEqual(response.status_code, 200)
+            get_features.assert_called_once_with(refresh=True)
+
+    def test_unknown_job_and_bad_k(self):
+        self.assertEqual(self.client.get('/api/jobs/nope/shortlist').status_code, 404)
+        self.assertEqual(self.client.get('/api/jobs/job-001/shortlist?k=abc').status_code, 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,192 @@
+# backend/src/__tests__/test_ocr_cache.py
+"""
+Unit tests for the near-duplicate OCR text cache: perceptual-hash lookup with
+fingerprint verification, LRU eviction, the SQLite tier, and process_ocr_image
+skipping Tesseract for re-uploaded surveys.
+"""
+
+import unittest
+from unittest.mock import patch
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directories to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import cv2
+import numpy as np
+from src.services.ocr_cache import OcrTextCache
+from src.services.disc_answer_sheet import AnswerSheetReader, render_answer_sheet
+from src.services.disc_pipeline import DISCExternalPipeline
+from test_disc_answer_sheet import ANSWERS, photo, png
+
+CONFIG = "--oem 3 --psm 6"
+
+
+def survey(d_score, candidate_id="CAND-0001"):
+    """Binarised free-form survey page, as the pipeline hands it to Tesseract."""
+    page = np.full((900, 1240), 255, dtype=np.uint8)
+    lines = ["DISC SURVEY", f"Candidate ID: {candidate_id}", f"D: {d_score}", "I: 4", "S: 7", "C: 2"]
+    for row, text in enumerate(lines):
+        cv2.putText(page, text, (80, 120 + row * 120), cv2.FONT_HERSHEY_SIMPLEX, 2.0, 0, 4, cv2.LINE_AA)
+    return page
+
+
+def recompressed(image, scale=1.0, quality=50):
+    """A chat-app copy: optionally downsized, JPEG re-encoded, then binarised again."""
+    if scale != 1.0:
+        image = cv2.resize(image, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+    decoded = cv2.imdecode(cv2.imencode('.jpg', image, [cv2.IMWRITE_JPEG_QUALITY, quality])[1], cv2.IMREAD_GRAYSCALE)
+    return cv2.threshold(decoded, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)[1]
+
+
+class TestOcrTextCache(unittest.TestCase):
+    """Test suite for OcrTextCache."""
+
+    def setUp(self):
+        self.cache = OcrTextCache(max_entries=8, db_path="")
+
+    def _store(self, image, text, config=CONFIG):
+        self.cache.put(self.cache.image_key(image), config, text)
+
+    def _lookup(self, image, config=CONFIG):
+        return self.cache.get(self.cache.image_key(image), config)
+
+    def test_recompressed_and_downsized_copies_hit(self):
+        self._store(survey(5), "D: 5")
+        for copy in (survey(5), recompressed(survey(5)), recompressed(survey(5), scale=0.5, quality=70)):
+            self.assertEqual(self._lookup(copy), "D: 5")
+
+        stats = self.cache.get_stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["hit_rate"]), (3, 0, 1.0))
+        self.assertGreaterEqual(stats["near_hits"], 1)
+
+    def test_one_changed_character_is_not_a_hit(self):
+        self._store(survey(5), "D: 5")
+        for other in (survey(6), survey(8), survey(5, candidate_id="CAND-0002")):
+            self.assertIsNone(self._lookup(other))
+        self.assertIsNone(self._lookup(survey(5), config="--psm 7"))
+
+        stats = self.cache.get_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (0, 4))
+        # The hash alone would have matched: verification turned them down
+        self.assertGreaterEqual(stats["rejected"], 3)
+
+    def test_answer_sheet_id_boxes(self):
+        reader = AnswerSheetReader()
+
+        def id_box(candidate_id, seed):
+            return reader.read(photo(render_answer_sheet(candidate_id, ANSWERS), seed=seed))["id_image"]
+
+        self._store(id_box("CAND-0042", 1), "CAND-0042")
+        self.assertEqual(self._lookup(id_box("CAND-0042", 7)), "CAND-0042")
+        self.assertIsNone(self._lookup(id_box("CAND-0043", 7)))
+        self.assertIsNone(self._lookup(id_box("", 1)))
+
+    def test_lru_eviction(self):
+        cache = OcrTextCache(max_entries=2, db_path="")
+        keys = {d: cache.image_key(survey(d, candidate_id=f"CAND-{d}")) for d in (1, 2, 3)}
+        cache.put(keys[1], CONFIG, "one")
+        cache.put(keys[2], CONFIG, "two")
+        self.assertEqual(cache.get(keys[1], CONFIG), "one")  # 2 is now least recently used
+        cache.put(keys[3], CONFIG, "three")
+
+        self.assertIsNone(cache.get(keys[2], CONFIG))
+        self.assertEqual((cache.get(keys[1], CONFIG), cache.get(keys[3], CONFIG)), ("one", "three"))
+        stats = cache.get_stats()
+        self.assertEqual((stats["entries"], stats["evictions"], stats["stores"]), (2, 1, 3))
+        self.assertLess(stats["memory_bytes"], 2 * 30000)
+
+    def test_unusable_images_and_disabled_cache(self):
+        self.assertIsNone(self.cache.image_key(np.zeros((0, 10), np.uint8)))
+        self.assertIsNone(self.cache.image_key(np.zeros((10, 10), np.float32)))
+        self.assertIsNone(OcrTextCache(max_entries=0, db_path="").image_key(survey(1)))
+
+
+class TestOcrTextCacheDisk(unittest.TestCase):
+    """The SQLite tier survives a restart and is trimmed to max_entries."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.db_path = os.path.join(self.tmp.name, 'ocr_cache.sqlite3')
+
+    def test_entries_reloaded_by_a_new_process(self):
+        cache = OcrTextCache(max_entries=2, db_path=self.db_path)
+        for d in (1, 2, 3):
+            cache.put(cache.image_key(survey(d, candidate_id=f"CAND-{d}")), CONFIG, f"D: {d}")
+
+        restarted = OcrTextCache(max_entries=2, db_path=self.db_path)
+        self.assertEqual(restarted.get_stats()["entries"], 2)
+        self.assertTrue(restarted.get_stats()["disk_enabled"])
+        self.assertEqual(restarted.get(restarted.image_key(recompressed(survey(3, "CAND-3"))), CONFIG), "D: 3")
+        self.assertIsNone(restarted.get(restarted.image_key(survey(1, candidate_id="CAND-1")), CONFIG))
+
+    def test_unwritable_path_falls_back_to_memory(self):
+        cache = OcrTextCache(db_path=os.path.join(self.tmp.name, 'missing', 'ocr.sqlite3'))
+        self.assertFalse(cache.get_stats()["disk_enabled"])
+        cache.put(cache.image_key(survey(1)), CONFIG, "D: 1")
+        self.assertEqual(cache.get(cache.image_key(survey(1)), CONFIG), "D: 1")
+
+
+class TestPipelineUsesOcrCache(unittest.TestCase):
+    """process_ocr_image only runs Tesseract for images the cache has not seen."""
+
+    def setUp(self):
+        self.cache = OcrTextCache(max_entries=16, db_path="")
+        target = patch('src.services.disc_pipeline.get_ocr_cache', return_value=self.cache)
+        target.start()
+        self.addCleanup(target.stop)
+
+    @patch('src.services.disc_pipeline.pytesseract')
+    def test_resent_sheet_photo_skips_id_ocr(self, mock_pytesseract):
+        mock_pytesseract.image_to_string.return_value = "CAND-0042\n"
+        pipeline = DISCExternalPipeline()
+        first = pipeline.process_ocr_image(png(photo(render_answer_sheet("CAND-0042", ANSWERS))), "C-1")
+        resent = photo(render_answer_sheet("CAND-0042", ANSWERS), seed=7)
+        second = pipeline.process_ocr_image(cv2.imencode('.jpg', resent)[1].tobytes(), "C-2")
+
+        mock_pytesseract.image_to_string.assert_called_once()
+        self.assertEqual(second["detected_candidate_id"], first["detected_candidate_id"])
+        self.assertEqual(second["candidate_id"], "C-2")
+        self.assertEqual(second["disc_scores"], first["disc_scores"])
+        self.assertEqual(self.cache.get_stats()["hits"], 1)
+
+    @patch('src.services.disc_pipeline.pytesseract')
+    def test_full_page_fallback_cached(self, mock_pytesseract):
+        mock_pytesseract.image_to_string.side_effect = ["D: 5", "D: 6"]
+        pipeline = DISCExternalPipeline()
+        texts = [pipeline.process_ocr_image(png(image))["extracted_text"]
+                 for image in (survey(5), recompressed(survey(5)), survey(6))]
+
+        self.assertEqual(texts, ["D: 5", "D: 5", "D: 6"])
+        self.assertEqual(mock_pytesseract.image_to_string.call_count, 2)
+
+    @patch('src.services.disc_pipeline.pytesseract')
+    def test_cache_disabled(self, mock_pytesseract):
+        mock_pytesseract.image_to_string.return_value = "D: 5"
+        with patch.dict('os.environ', {'DISC_OCR_CACHE_ENABLED': 'false'}):
+            pipeline = DISCExternalPipeline()
+        for _ in range(2):
+            pipeline.process_ocr_image(png(survey(5)))
+        self.assertEqual(mock_pytesseract.image_to_string.call_count, 2)
+        self.assertEqual(self.cache.get_stats()["stores"], 0)
+
+    def test_stats_endpoint(self):
+        from src.app import create_app
+        app = create_app()
+        app.config['TESTING'] = True
+        with patch('src.routes.disc_routes.get_ocr_cache', return_value=self.cache):
+            self.assertEqual(app.test_client().get('/api/disc/ocr-cache').status_code, 403)
+            with patch.dict('os.environ', {'ADMIN_API_TOKEN': 'secret'}):
+                response = app.test_client().get('/api/disc/ocr-cache', headers={'X-Admin-Token': 'secret'})
+
+        self.assertEqual(response.status_code, 200)
+        stats = response.get_json()["stats"]
+        self.assertEqual((stats["entries"], stats["hit_rate"], stats["max_entries"]), (0, 0.0, 16))
+
+
+if __name__ == '__main__':
+    unittest.main()
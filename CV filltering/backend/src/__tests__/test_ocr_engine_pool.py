@@ -0,0 +1,152 @@
+# backend/src/__tests__/test_ocr_engine_pool.py
+"""
+Unit tests for the warm Tesseract engine pool used by DISC survey OCR.
+The workers run stand-in engines so the tests do not need the tesseract binary.
+"""
+
+import unittest
+from unittest.mock import patch, MagicMock
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add parent directories to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import numpy as np
+from src.services.ocr_engine_pool import OcrEnginePool, OcrTimeoutError, _tesseract_options
+from src.services.disc_pipeline import DISCExternalPipeline
+
+
+def echo_engine(lang, config):
+    """Engine that reports which process served the job and how often its engine was reused."""
+    calls = []
+
+    def image_to_string(image, timeout):
+        if image[0, 0] == 255:
+            time.sleep(5)
+        if image[0, 0] == 254:
+            raise ValueError("unreadable scan")
+        calls.append(1)
+        return f"{os.getpid()}:{len(calls)}:{lang}:{int(image.sum())}"
+
+    return "echo", image_to_string
+
+
+ENGINE_LOADS = []
+
+
+def config_engine(lang, config):
+    """Engine whose output names the config it was loaded with and the worker's engine count."""
+    ENGINE_LOADS.append(config)
+    return "config", lambda image, timeout: f"{config}|{len(ENGINE_LOADS)}"
+
+
+def broken_engine(lang, config):
+    raise OSError("traineddata not found")
+
+
+class TestOcrEnginePool(unittest.TestCase):
+    """Test suite for OcrEnginePool."""
+
+    def setUp(self):
+        self.pool = OcrEnginePool(size=2, timeout=5, lang='vie', engine_factory=echo_engine)
+        self.addCleanup(self.pool.close)
+
+    def _image(self, value, corner=0):
+        image = np.full((8, 8), value, dtype=np.uint8)
+        image[0, 0] = corner
+        return image
+
+    def test_engines_stay_warm_across_jobs(self):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            texts = list(executor.map(self.pool.image_to_string, [self._image(v) for v in range(1, 21)]))
+
+        self.assertEqual([int(text.split(':')[3]) for text in texts], [v * 63 for v in range(1, 21)])
+        self.assertTrue(all(text.split(':')[2] == 'vie' for text in texts))
+        # At most two processes served the 20 jobs, each reusing the engine it loaded once
+        calls_by_pid = {}
+        for text in texts:
+            pid, calls = text.split(':')[:2]
+            calls_by_pid.setdefault(pid, []).append(int(calls))
+        self.assertLessEqual(len(calls_by_pid), 2)
+        for calls in calls_by_pid.values():
+            self.assertEqual(sorted(calls), list(range(1, len(calls) + 1)))
+        stats = self.pool.get_stats()
+        self.assertEqual((stats["engine"], stats["jobs"], stats["restarts"]), ("echo", 20, 0))
+        # Started from request threads, so never forked
+        self.assertIn(self.pool._context.get_start_method(), ('forkserver', 'spawn'))
+
+    def test_timeout_replaces_the_worker(self):
+        self.pool.image_to_string(self._image(1))
+        started = time.monotonic()
+        with self.assertRaises(OcrTimeoutError):
+            self.pool.image_to_string(self._image(1, corner=255), timeout=0.5)
+        self.assertLess(time.monotonic() - started, 3)
+
+        for value in range(1, 5):
+            self.assertTrue(self.pool.image_to_string(self._image(value)).endswith(f":{value * 63}"))
+        stats = self.pool.get_stats()
+        self.assertEqual((stats["timeouts"], stats["restarts"], stats["workers"]), (1, 1, 2))
+
+    def test_engine_errors_keep_the_worker(self):
+        with self.assertRaisesRegex(RuntimeError, "unreadable scan"):
+            self.pool.image_to_string(self._image(1, corner=254))
+        self.pool.image_to_string(self._image(1))
+        self.assertEqual(self.pool.get_stats()["restarts"], 0)
+
+        pool = OcrEnginePool(size=1, timeout=5, engine_factory=broken_engine)
+        self.addCleanup(pool.close)
+        with self.assertRaisesRegex(RuntimeError, "traineddata not found"):
+            pool.image_to_string(self._image(1))
+
+    def test_jobs_run_with_their_own_config(self):
+        pool = OcrEnginePool(size=1, timeout=5, config='--psm 6', engine_factory=config_engine)
+        self.addCleanup(pool.close)
+        texts = [pool.image_to_string(self._image(1), config=config) for config in (None, '--psm 7', None, '--psm 7')]
+
+        self.assertEqual([text.split('|')[0] for text in texts], ['--psm 6', '--psm 7', '--psm 6', '--psm 7'])
+        # The worker loaded one engine per config, once
+        self.assertEqual(texts[-1].split('|')[1], '2')
+
+    def test_config_parsing(self):
+        options = _tesseract_options('--oem 1 --psm 6 -c tessedit_char_whitelist=0123456789 --dpi 300')
+        self.assertEqual(options, {"oem": 1, "psm": 6, "variables": {"tessedit_char_whitelist": "0123456789"}})
+
+
+class TestPipelineUsesPool(unittest.TestCase):
+    """process_ocr_image routes through the pool when DISC_OCR_POOL_ENABLED is set."""
+
+    @patch('src.services.disc_pipeline.pytesseract')
+    @patch('src.services.disc_pipeline.get_ocr_engine_pool')
+    def test_pool_enabled(self, mock_get_pool, mock_pytesseract):
+        mock_get_pool.return_value.image_to_string.return_value = "D: 8\nI: 6"
+        with patch.dict('os.environ', {'DISC_OCR_POOL_ENABLED': 'true'}), \
+                patch.object(DISCExternalPipeline, '_preprocess_image_for_ocr', return_value=MagicMock()):
+            result = DISCExternalPipeline().process_ocr_image(b"image", candidate_id="OCR-1")
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["extracted_text"], "D: 8\nI: 6")
+        mock_pytesseract.image_to_string.assert_not_called()
+
+    @patch('src.services.disc_pipeline.get_ocr_cache', return_value=None)
+    @patch('src.services.disc_pipeline.get_ocr_engine_pool')
+    def test_id_box_uses_the_id_config(self, mock_get_pool, mock_get_cache):
+        from src.services.disc_answer_sheet import render_answer_sheet
+        from test_disc_answer_sheet import ANSWERS, photo, png
+        mock_get_pool.return_value.image_to_string.return_value = "CAND-0042\n"
+        with patch.dict('os.environ', {'DISC_OCR_POOL_ENABLED': 'true', 'DISC_OCR_CACHE_ENABLED': 'false'}):
+            pipeline = DISCExternalPipeline()
+            result = pipeline.process_ocr_image(png(photo(render_answer_sheet("CAND-0042", ANSWERS))))
+
+        self.assertEqual(result["status"], "auto_scored")
+        self.assertEqual(result["detected_candidate_id"], "CAND-0042")
+        mock_get_pool.return_value.image_to_string.assert_called_once()
+        self.assertEqual(mock_get_pool.return_value.image_to_string.call_args.kwargs["config"], pipeline.ocr_id_config)
+        self.assertNotEqual(pipeline.ocr_id_config, pipeline.ocr_config)
+
+
+if __name__ == '__main__':
+    unittest.main()
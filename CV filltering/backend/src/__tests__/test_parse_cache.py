@@ -0,0 +1,178 @@
+# backend/src/__tests__/test_parse_cache.py
+"""
+Unit tests for the content-addressed CV parse result cache
+and its integration with /api/parse-cv.
+"""
+
+import unittest
+from unittest.mock import patch
+import io
+import os
+import sys
+import shutil
+import tempfile
+from pathlib import Path
+
+# Add parent directories to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.services.parse_cache import ParseResultCache, content_hash
+
+
+SAMPLE_RESULT = {
+    "personalInfo": {"name": "Nguyen Van A", "email": "a@example.com", "phone": "0901234567"},
+    "education": [],
+    "experience": [],
+    "skills": ["Python"],
+    "source": {"type": "gemini", "aiUsed": True}
+}
+
+
+class TestParseResultCache(unittest.TestCase):
+    """Test suite for ParseResultCache tiers."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmpdir, "cache.sqlite3")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_miss_then_hit(self):
+        cache = ParseResultCache(max_entries=4, db_path=self.db_path)
+        key = content_hash(b"cv bytes")
+
+        self.assertIsNone(cache.get(key, "v1"))
+        cache.put(key, "v1", SAMPLE_RESULT)
+        self.assertEqual(cache.get(key, "v1"), SAMPLE_RESULT)
+        self.assertEqual(cache.get_stats()["memory_hits"], 1)
+        self.assertEqual(cache.get_stats()["misses"], 1)
+
+    def test_parser_version_is_part_of_key(self):
+        cache = ParseResultCache(max_entries=4, db_path=self.db_path)
+        key = content_hash(b"cv bytes")
+        cache.put(key, "v1", SAMPLE_RESULT)
+
+        self.assertIsNone(cache.get(key, "v2"))
+
+    def test_memory_tier_is_bounded_lru(self):
+        cache = ParseResultCache(max_entries=2, db_path="")
+        cache.put("a", "v1", {"n": 1})
+        cache.put("b", "v1", {"n": 2})
+        cache.get("a", "v1")          # "a" becomes most recently used
+        cache.put("c", "v1", {"n": 3})  # evicts "b"
+
+        self.assertEqual(cache.get_stats()["memory_entries"], 2)
+        self.assertIsNone(cache.get("b", "v1"))
+        self.assertEqual(cache.get("a", "v1"), {"n": 1})
+
+    def test_returned_results_are_copies(self):
+        cache = ParseResultCache(max_entries=2, db_path="")
+        cache.put("a", "v1", SAMPLE_RESULT)
+        cached = cache.get("a", "v1")
+        cached["cache"] = {"hit": True}
+
+        self.assertNotIn("cache", cache.get("a", "v1"))
+
+    def test_disk_tier_is_shared_between_instances(self):
+        writer = ParseResultCache(max_entries=2, db_path=self.db_path)
+        reader = ParseResultCache(max_entries=2, db_path=self.db_path)
+        writer.put("shared", "v1", SAMPLE_RESULT)
+
+        self.assertEqual(reader.get("shared", "v1"), SAMPLE_RESULT)
+        self.assertEqual(reader.get_stats()["disk_hits"], 1)
+
+    def test_disk_tier_is_bounded(self):
+        cache = ParseResultCache(max_entries=0, db_path=self.db_path, max_disk_entries=2)
+        for key in ("a", "b", "c"):
+            cache.put(key, "v1", {"key": key})
+        cache.put("b", "v1", {"key": "b", "again": True})  # rewriting makes "b" the newest
+        cache.put("d", "v1", {"key": "d"})
+
+        self.assertIsNone(cache.get("a", "v1"))
+        self.assertIsNone(cache.get("c", "v1"))
+        self.assertEqual(cache.get("b", "v1")["again"], True)
+        self.assertEqual(cache.get("d", "v1"), {"key": "d"})
+
+    def test_invalidation_propagates_to_other_workers(self):
+        worker_a = ParseResultCache(max_entries=2, db_path=self.db_path, sync_interval=0)
+        worker_b = ParseResultCache(max_entries=2, db_path=self.db_path, sync_interval=0)
+        worker_a.put("dup", "v1", SAMPLE_RESULT)
+        worker_a.put("dup", "v2", SAMPLE_RESULT)
+        self.assertIsNotNone(worker_b.get("dup", "v1"))  # now in worker_b memory tier
+
+        removed = worker_a.invalidate("dup")
+
+        self.assertEqual(removed, 2)
+        self.assertIsNone(worker_b.get("dup", "v1"))
+
+    def test_invalidate_all(self):
+        cache = ParseResultCache(max_entries=4, db_path=self.db_path)
+        cache.put("a", "v1", SAMPLE_RESULT)
+        cache.put("b", "v1", SAMPLE_RESULT)
+
+        self.assertEqual(cache.invalidate(), 2)
+        self.assertIsNone(cache.get("a", "v1"))
+
+
+class TestParseCvEndpointCache(unittest.TestCase):
+    """Integration tests for cache behaviour on /api/parse-cv."""
+
+    def setUp(self):
+        from src.app import create_app
+        from src.routes import cv_parsing_routes
+        self.routes = cv_parsing_routes
+        self.app = create_app()
+        self.app.config['TESTING'] = True
+        self.client = self.app.test_client()
+        self.tmpdir = tempfile.mkdtemp()
+        self.cache = ParseResultCache(max_entries=4, db_path=os.path.join(self.tmpdir, "cache.sqlite3"))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _upload(self, content=b"%PDF-1.4 same bytes"):
+        data = {'file': (io.BytesIO(content), 'cv.pdf')}
+        return self.client.post('/api/parse-cv', data=data, content_type='multipart/form-data')
+
+    def test_second_upload_is_cache_hit(self):
+        with patch.object(self.routes, 'get_parse_cache', return_value=self.cache), \
+             patch.object(self.routes._cv_service(), 'parse_cv', return_value=dict(SAMPLE_RESULT)) as mock_parse:
+            first = self._upload()
+            second = self._upload()
+
+        self.assertEqual(first.status_code, 200)
+        self.assertFalse(first.get_json()["cache"]["hit"])
+        self.assertEqual(first.headers["X-Parse-Cache"], "MISS")
+        self.assertTrue(second.get_json()["cache"]["hit"])
+        self.assertEqual(second.headers["X-Parse-Cache"], "HIT")
+        self.assertEqual(mock_parse.call_count, 1)
+
+    def test_fallback_results_are_not_cached(self):
+        degraded = dict(SAMPLE_RESULT, source={"type": "rule-based", "aiUsed": False, "warning": "AI_PARSING_FAILED"})
+        with patch.object(self.routes, 'get_parse_cache', return_value=self.cache), \
+             patch.object(self.routes._cv_service(), 'parse_cv', return_value=degraded) as mock_parse:
+            self._upload()
+            self._upload()
+
+        self.assertEqual(mock_parse.call_count, 2)
+
+    def test_admin_endpoint_requires_token(self):
+        with patch.dict(os.environ, {"ADMIN_API_TOKEN": ""}):
+            response = self.client.delete('/api/parse-cv/cache')
+        self.assertEqual(response.status_code, 403)
+
+    def test_admin_endpoint_invalidates_entry(self):
+        file_hash = content_hash(b"%PDF-1.4 same bytes")
+        self.cache.put(file_hash, "v1", SAMPLE_RESULT)
+        with patch.object(self.routes, 'get_parse_cache', return_value=self.cache), \
+             patch.dict(os.environ, {"ADMIN_API_TOKEN": "secret"}):
+            response = self.client.delete(f'/api/parse-cv/cache/{file_hash}', headers={"X-Admin-Token": "secret"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()["invalidated"], 1)
+        self.assertIsNone(self.cache.get(file_hash, "v1"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,156 @@
+# backend/src/__tests__/test_parse_job_queue.py
+"""
+Unit tests for the SQLite-backed asynchronous CV parsing job queue
+and the POST /api/parse-cv?mode=async / GET /api/parse-cv/jobs/<id> flow.
+"""
+
+import unittest
+from unittest.mock import patch, MagicMock
+import io
+import os
+import sys
+import time
+import shutil
+import sqlite3
+import tempfile
+from pathlib import Path
+
+# Add parent directories to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.services.parse_job_queue import ParseJobQueue, STATUS_SUCCEEDED, STATUS_FAILED
+
+
+def echo_handler(filename, file_bytes):
+    if file_bytes == b"boom":
+        raise ValueError("Unsupported file format")
+    return {"data": {"filename": filename, "size": len(file_bytes)}}
+
+
+class TestParseJobQueue(unittest.TestCase):
+    """Test suite for ParseJobQueue."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmpdir, "jobs.sqlite3")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_submit_and_process(self):
+        queue = ParseJobQueue(echo_handler, db_path=self.db_path, workers=0)
+        job_id = queue.submit("cv.pdf", b"12345")
+
+        self.assertEqual(queue.get(job_id)["status"], "queued")
+        self.assertEqual(queue.run_pending(), 1)
+
+        job = queue.get(job_id)
+        self.assertEqual(job["status"], STATUS_SUCCEEDED)
+        self.assertEqual(job["result"]["data"], {"filename": "cv.pdf", "size": 5})
+        self.assertEqual(job["attempts"], 1)
+
+    def test_handler_error_marks_job_failed(self):
+        queue = ParseJobQueue(echo_handler, db_path=self.db_path, workers=0)
+        job_id = queue.submit("bad.pdf", b"boom")
+        queue.run_pending()
+
+        job = queue.get(job_id)
+        self.assertEqual(job["status"], STATUS_FAILED)
+        self.assertIn("Unsupported file format", job["error"])
+
+    def test_unknown_job_returns_none(self):
+        queue = ParseJobQueue(echo_handler, db_path=self.db_path, workers=0)
+        self.assertIsNone(queue.get("missing"))
+
+    def test_jobs_survive_restart(self):
+        first = ParseJobQueue(echo_handler, db_path=self.db_path, workers=0)
+        job_id = first.submit("cv.pdf", b"abc")
+        del first
+
+        restarted = ParseJobQueue(echo_handler, db_path=self.db_path, workers=0)
+        restarted.run_pending()
+        self.assertEqual(restarted.get(job_id)["status"], STATUS_SUCCEEDED)
+
+    def test_expired_lease_is_reclaimed(self):
+        queue = ParseJobQueue(echo_handler, db_path=self.db_path, workers=0, lease_seconds=60)
+        job_id = queue.submit("cv.pdf", b"abc")
+        # Simulate a worker that claimed the job and then died
+        self.assertIsNotNone(queue._claim())
+        self.assertEqual(queue.run_pending(), 0)
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("UPDATE parse_jobs SET lease_expires_at = ? WHERE id = ?", (time.time() - 1, job_id))
+
+        self.assertEqual(queue.run_pending(), 1)
+        job = queue.get(job_id)
+        self.assertEqual(job["status"], STATUS_SUCCEEDED)
+        self.assertEqual(job["attempts"], 2)
+
+    def test_background_workers_process_jobs(self):
+        queue = ParseJobQueue(echo_handler, db_path=self.db_path, workers=2, poll_interval=0.05)
+        try:
+            job_ids = [queue.submit(f"cv{i}.pdf", b"x" * i) for i in range(5)]
+            deadline = time.time() + 5
+            while time.time() < deadline and any(queue.get(j)["status"] != STATUS_SUCCEEDED for j in job_ids):
+                time.sleep(0.02)
+        finally:
+            queue.stop()
+
+        self.assertTrue(all(queue.get(j)["status"] == STATUS_SUCCEEDED for j in job_ids))
+
+
+class TestParseCvAsyncEndpoint(unittest.TestCase):
+    """Integration tests for the async job mode of /api/parse-cv."""
+
+    def setUp(self):
+        from src.app import create_app
+        from src.routes import cv_parsing_routes
+        self.routes = cv_parsing_routes
+        self.app = create_app()
+        self.app.config['TESTING'] = True
+        self.client = self.app.test_client()
+        self.tmpdir = tempfile.mkdtemp()
+        self.queue = ParseJobQueue(echo_handler, db_path=os.path.join(self.tmpdir, "jobs.sqlite3"), workers=0)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_async_upload_returns_job_id_and_status(self):
+        with patch.object(self.routes, '_get_job_queue', return_value=self.queue):
+            response = self.client.post(
+                '/api/parse-cv?mode=async',
+                data={'file': (io.BytesIO(b"cv bytes"), 'cv.pdf')},
+                content_type='multipart/form-data'
+            )
+            self.assertEqual(response.status_code, 202)
+            job_id = response.get_json()["job_id"]
+
+            pending = self.client.get(f'/api/parse-cv/jobs/{job_id}')
+            self.assertEqual(pending.get_json()["status"], "queued")
+
+            self.queue.run_pending()
+            done = self.client.get(f'/api/parse-cv/jobs/{job_id}')
+
+        self.assertEqual(done.status_code, 200)
+        self.assertEqual(done.get_json()["status"], STATUS_SUCCEEDED)
+        self.assertEqual(done.get_json()["result"]["data"]["filename"], "cv.pdf")
+
+    def test_workers_start_on_the_first_request_of_a_process(self):
+        queue = MagicMock()
+        queue.get.return_value = None
+        with patch.object(self.routes, '_get_job_queue', return_value=queue), \
+             patch.object(self.routes, '_job_queue_started_pid', None):
+            self.client.get('/api')
+            queue.start.assert_called_once()
+
+            # Status polling only reads
+            self.client.get('/api/parse-cv/jobs/some-job')
+            queue.start.assert_called_once()
+
+    def test_unknown_job_returns_404(self):
+        with patch.object(self.routes, '_get_job_queue', return_value=self.queue):
+            response = self.client.get('/api/parse-cv/jobs/does-not-exist')
+        self.assertEqual(response.status_code, 404)
+
+
+if __name__ == '__main__':
+    unittest.main()
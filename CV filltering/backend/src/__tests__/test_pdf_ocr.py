@@ -0,0 +1,163 @@
+# backend/src/__tests__/test_pdf_ocr.py
+"""
+Unit tests for the scanned-page OCR fallback of the PDF text extractor.
+Tesseract itself is mocked; the scan images are real JPEG XObjects.
+"""
+
+import unittest
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import cv2
+
+# Add parent directories to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.services.pdf_ocr import ScannedPageOcr, is_textless, _ocr_page
+from src.services.pdf_text_extractor import PdfTextExtractor
+
+
+def _scan_jpeg(width=600, height=800):
+    """A noisy page-sized grayscale JPEG, large enough to count as a scan."""
+    rng = np.random.default_rng(7)
+    image = rng.integers(180, 255, size=(height, width), dtype=np.uint8)
+    cv2.putText(image, "SCANNED CV", (40, 120), cv2.FONT_HERSHEY_SIMPLEX, 2, 0, 4)
+    ok, encoded = cv2.imencode('.jpg', image)
+    assert ok
+    return encoded.tobytes(), width, height
+
+
+def build_pdf(pages):
+    """
+    Builds a minimal PDF. Each entry of `pages` is either a text string
+    (a text-layer page) or None (a page holding only a scanned JPEG).
+    """
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # Pages, filled in below
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    jpeg, width, height = _scan_jpeg()
+    page_ids = []
+    for text in pages:
+        if text is None:
+            objects.append(
+                b"<< /Type /XObject /Subtype /Image /Width %d /Height %d /ColorSpace /DeviceGray "
+                b"/BitsPerComponent 8 /Filter /DCTDecode /Length %d >>\nstream\n%s\nendstream"
+                % (width, height, len(jpeg), jpeg)
+            )
+            image_id = len(objects)
+            stream = b"q 612 0 0 792 0 0 cm /Im1 Do Q"
+            resources = b"<< /XObject << /Im1 %d 0 R >> >>" % image_id
+        else:
+            stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode("latin-1")
+            resources = b"<< /Font << /F1 3 0 R >> >>"
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        content_id = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources %s /Contents %d 0 R >>" % (resources, content_id)
+        )
+        page_ids.append(len(objects))
+    kids = b" ".join(b"%d 0 R" % i for i in page_ids)
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(page_ids))
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref_offset = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref_offset)
+    return bytes(out)
+
+
+class TestScannedPageOcr(unittest.TestCase):
+    """Test suite for the OCR fallback on text-less PDF pages."""
+
+    def setUp(self):
+        patcher = patch('src.services.pdf_ocr.pytesseract')
+        self.tesseract = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.tesseract.image_to_string.return_value = "Nguyen Van An\nPython Developer"
+        self.tesseract.TesseractError = type('TesseractError', (RuntimeError,), {})
+
+    def _extractor(self, **ocr_kwargs):
+        ocr = ScannedPageOcr(max_workers=1, lang='eng', **ocr_kwargs)
+        return PdfTextExtractor(max_pages=0, max_chars=0, parallel_min_pages=0, ocr=ocr)
+
+    def test_is_textless(self):
+        self.assertTrue(is_textless("", 20))
+        self.assertTrue(is_textless("  1  \n", 20))
+        self.assertFalse(is_textless("Kinh nghiệm làm việc tại FPT Software", 20))
+
+    def test_text_pages_are_not_ocrd(self):
+        pdf = build_pdf(["Page one has a full text layer", "Page two has a full text layer"])
+        result = self._extractor().extract(pdf)
+
+        self.tesseract.image_to_string.assert_not_called()
+        self.assertIsNone(result["ocr"])
+        self.assertEqual([p["source"] for p in result["page_timings"]], ["text", "text"])
+
+    def test_scanned_page_text_is_merged_in_page_order(self):
+        pdf = build_pdf(["Page one has a full text layer", None, "Page three has a full text layer"])
+        result = self._extractor().extract(pdf)
+
+        self.assertEqual(self.tesseract.image_to_string.call_count, 1)
+        self.assertEqual(result["ocr"]["pages"], [2])
+        self.assertEqual(result["ocr"]["skipped"], [])
+        self.assertEqual([p["source"] for p in result["page_timings"]], ["text", "ocr", "text"])
+        text = result["text"]
+        self.assertLess(text.index("Page one"), text.index("Nguyen Van An"))
+        self.assertLess(text.index("Python Developer"), text.index("Page three"))
+
+    def test_ocr_receives_preprocessed_grayscale_image(self):
+        pdf = build_pdf([None])
+        self._extractor().extract(pdf)
+
+        image = self.tesseract.image_to_string.call_args[0][0]
+        self.assertEqual(image.ndim, 2)
+
+    def test_exhausted_time_budget_skips_pages(self):
+        pdf = build_pdf([None, None])
+        result = self._extractor(time_budget=0).extract(pdf)
+
+        self.tesseract.image_to_string.assert_not_called()
+        self.assertEqual(result["ocr"]["pages"], [])
+        self.assertEqual(result["ocr"]["skipped"], [1, 2])
+        self.assertEqual(result["text"], "")
+
+    def test_parallel_jobs_carry_only_page_images(self):
+        pdf = build_pdf(["Page one has a full text layer", None, None, "Page four has a full text layer", None])
+        ocr = ScannedPageOcr(max_workers=2, lang='eng')
+        extractor = PdfTextExtractor(max_pages=0, max_chars=0, parallel_min_pages=0, ocr=ocr)
+        with patch('src.services.pdf_ocr._ocr_page', wraps=_ocr_page) as job:
+            # A thread pool stands in for the process pool so the mocked Tesseract is used
+            with patch('src.services.pdf_text_extractor._get_process_pool', return_value=ThreadPoolExecutor(2)):
+                result = extractor.extract(pdf)
+
+        self.assertEqual(result["ocr"]["pages"], [2, 3, 5])
+        self.assertEqual([call.args[0] for call in job.call_args_list], [2, 3, 5])
+        for call in job.call_args_list:
+            images = call.args[1]
+            self.assertEqual(len(images), 1)
+            self.assertLess(len(images[0]), len(pdf) / 2)
+
+    def test_ocr_errors_are_reported_not_raised(self):
+        self.tesseract.image_to_string.side_effect = RuntimeError("Tesseract process timeout")
+        pdf = build_pdf(["Page one has a full text layer", None])
+        result = self._extractor().extract(pdf)
+
+        self.assertEqual(result["ocr"]["errors"], {2: "timeout"})
+        self.assertEqual(result["page_timings"][1]["source"], "empty")
+        self.assertIn("Page one", result["text"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+# backend/src/__tests__/test_pdf_text_extractor.py
+"""
+Unit tests for the streaming PDF text extractor.
+"""
+
+import unittest
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+# Add parent directories to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.services.pdf_text_extractor import PdfTextExtractor, _get_process_pool, _extract_page_range
+
+
+def build_pdf(page_texts):
+    """Builds a minimal multi-page PDF with one line of Helvetica text per page."""
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # Pages, filled in below
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    page_ids = []
+    for text in page_texts:
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode("latin-1")
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        content_id = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_id
+        )
+        page_ids.append(len(objects))
+    kids = b" ".join(b"%d 0 R" % i for i in page_ids)
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(page_ids))
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref_offset = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref_offset)
+    return bytes(out)
+
+
+class TestPdfTextExtractor(unittest.TestCase):
+    """Test suite for PdfTextExtractor."""
+
+    def setUp(self):
+        self.pages = [f"Page number {i} content" for i in range(1, 7)]
+        self.pdf = build_pdf(self.pages)
+
+    def test_sequential_extraction_joins_all_pages(self):
+        extractor = PdfTextExtractor(max_pages=0, max_chars=0, parallel_min_pages=0)
+        result = extractor.extract(self.pdf)
+
+        self.assertFalse(result["parallel"])
+        self.assertEqual(result["page_count"], 6)
+        self.assertEqual(result["pages_processed"], 6)
+        self.assertFalse(result["truncated"])
+        for text in self.pages:
+            self.assertIn(text, result["text"])
+        self.assertEqual([p["page"] for p in result["page_timings"]], [1, 2, 3, 4, 5, 6])
+
+    def test_page_budget_stops_early(self):
+        extractor = PdfTextExtractor(max_pages=2, max_chars=0, parallel_min_pages=0)
+        result = extractor.extract(self.pdf)
+
+        self.assertEqual(result["pages_processed"], 2)
+        self.assertTrue(result["truncated"])
+        self.assertEqual(result["truncated_reason"], "max_pages")
+        self.assertNotIn("Page number 3", result["text"])
+
+    def test_char_budget_truncates_text(self):
+        extractor = PdfTextExtractor(max_pages=0, max_chars=30, parallel_min_pages=0)
+        result = extractor.extract(self.pdf)
+
+        self.assertEqual(result["truncated_reason"], "max_chars")
+        self.assertEqual(sum(p["chars"] for p in result["page_timings"]), 30)
+        self.assertLess(result["pages_processed"], 6)
+
+    def test_parallel_extraction_matches_sequential(self):
+        sequential = PdfTextExtractor(max_pages=0, max_chars=0, parallel_min_pages=0).extract(self.pdf)
+        parallel = PdfTextExtractor(max_pages=0, max_chars=0, parallel_min_pages=4,
+                                    max_workers=2, chunk_size=2).extract(self.pdf)
+
+        self.assertTrue(parallel["parallel"])
+        self.assertEqual(parallel["text"], sequential["text"])
+        self.assertEqual([p["page"] for p in parallel["page_timings"]], [1, 2, 3, 4, 5, 6])
+
+    def test_parallel_chunks_carry_only_their_pages(self):
+        pages = [f"Page number {i} content " + "x" * 2000 for i in range(1, 13)]
+        pdf = build_pdf(pages)
+        extractor = PdfTextExtractor(max_pages=0, max_chars=0, parallel_min_pages=4, max_workers=2, chunk_size=3)
+        with patch('src.services.pdf_text_extractor._extract_page_range', wraps=_extract_page_range) as worker:
+            # Swap the process pool for a thread pool so the submitted arguments can be inspected
+            with patch('src.services.pdf_text_extractor._get_process_pool', return_value=ThreadPoolExecutor(2)):
+                result = extractor.extract(pdf)
+
+        self.assertEqual([p["page"] for p in result["page_timings"]], list(range(1, 13)))
+        for text in pages:
+            self.assertIn(text, result["text"])
+        chunks = [call.args for call in worker.call_args_list]
+        self.assertEqual([(start, stop, first) for _, start, stop, first in chunks],
+                         [(0, 3, 1), (0, 3, 4), (0, 3, 7), (0, 3, 10)])
+        for chunk, *_ in chunks:
+            self.assertLess(len(chunk), len(pdf) / 2)
+
+    def test_pool_workers_are_not_forked(self):
+        self.assertIn(_get_process_pool(2)._mp_context.get_start_method(), ('forkserver', 'spawn'))
+
+    def test_accepts_file_path(self):
+        import tempfile
+        import os
+        fd, path = tempfile.mkstemp(suffix=".pdf")
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                tmp.write(self.pdf)
+            result = PdfTextExtractor(parallel_min_pages=0).extract(path)
+            self.assertIn("Page number 1", result["text"])
+        finally:
+            os.remove(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+# backend/src/__tests__/test_rule_based_extractor.py
+"""
+Unit tests for the Aho–Corasick skill matcher and the rule-based CV extractor.
+"""
+
+import unittest
+from unittest.mock import patch
+import sys
+from pathlib import Path
+
+# Add parent directories to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.services.skill_matcher import SkillMatcher, fold_text, get_skill_matcher
+from src.services.rule_based_extractor import RuleBasedCvExtractor
+
+SAMPLE_CV = """CURRICULUM VITAE
+NGUYỄN VĂN AN
+Email: an.nguyen@example.com | SĐT: 0912 345 678
+
+KINH NGHIỆM LÀM VIỆC
+01/2020 - Present: Senior Backend Developer - FPT Software
+Jun 2017 – Dec 2019 | Software Engineer | Tiki Corporation
+
+HỌC VẤN
+Cử nhân Công nghệ thông tin - Đại học Bách Khoa Hà Nội (2011 - 2015)
+
+KỸ NĂNG
+Python, C++, Go, PostgreSQL, Docker, tiếng Anh, làm việc nhóm
+"""
+
+
+class TestSkillMatcher(unittest.TestCase):
+    """Test suite for SkillMatcher."""
+
+    def setUp(self):
+        self.matcher = SkillMatcher([
+            ("C", ["C"]),
+            ("C++", ["C++", "cpp"]),
+            ("Java", ["Java"]),
+            ("JavaScript", ["JavaScript", "JS"]),
+            ("Go", ["=Go", "golang"]),
+            ("English", ["English", "tiếng anh"]),
+            ("Machine Learning", ["machine learning"]),
+        ])
+
+    def test_fold_preserves_length(self):
+        text = "Tiếng Việt Đà Nẵng"
+        self.assertEqual(fold_text(text), "tieng viet da nang")
+        self.assertEqual(len(fold_text(text)), len(text))
+
+    def test_case_and_diacritic_insensitive(self):
+        self.assertEqual(self.matcher.match("TIẾNG ANH giao tiếp, Machine Learning"), ["English", "Machine Learning"])
+        self.assertEqual(self.matcher.match("tieng anh"), ["English"])
+
+    def test_word_boundaries(self):
+        self.assertEqual(self.matcher.match("JavaScript developer"), ["JavaScript"])
+        self.assertEqual(self.matcher.match("Javanese, cpp11"), [])
+
+    def test_leftmost_longest(self):
+        self.assertEqual(self.matcher.match("C++ and C"), ["C++", "C"])
+
+    def test_short_and_marked_terms_are_case_sensitive(self):
+        self.assertEqual(self.matcher.match("we go to work, js"), [])
+        self.assertEqual(self.matcher.match("Go, JS, Golang"), ["Go", "JavaScript"])
+
+    def test_results_are_deduplicated_in_order(self):
+        self.assertEqual(self.matcher.match("Java, C, Java, c++"), ["Java", "C", "C++"])
+
+    def test_bundled_dictionary_loads(self):
+        matcher = get_skill_matcher()
+        self.assertGreater(matcher.term_count, 1000)
+        self.assertIn("Python", matcher.match("Kỹ năng: python, Django"))
+
+
+class TestRuleBasedCvExtractor(unittest.TestCase):
+    """Test suite for RuleBasedCvExtractor."""
+
+    def setUp(self):
+        self.extractor = RuleBasedCvExtractor()
+
+    def test_personal_info(self):
+        info = self.extractor.extract(SAMPLE_CV)["personalInfo"]
+        self.assertEqual(info, {
+            "name": "Nguyễn Văn An",
+            "email": "an.nguyen@example.com",
+            "phone": "0912345678"
+        })
+
+    def test_phone_formats(self):
+        cases = {
+            "Tel: +84 912.345.678": "+84912345678",
+            "Tel: (+84) 28 3822 1234": "+842838221234",
+            "Tel: +84 (0) 98-765-4321": "+84987654321",
+            "Tel: 0084 912 345 678": "+84912345678",
+            "Phone: +1 (415) 555-2671": "+14155552671",
+        }
+        for text, expected in cases.items():
+            with self.subTest(text=text):
+                self.assertEqual(self.extractor.extract(text)["personalInfo"]["phone"], expected)
+
+    def test_years_are_not_phones(self):
+        self.assertEqual(self.extractor.extract("2015 - 2019 2020")["personalInfo"]["phone"], "N/A")
+
+    def test_name_label(self):
+        result = self.extractor.extract("Hồ sơ ứng viên\nHọ và tên: Trần Thị Bình\nEmail: b@x.vn")
+        self.assertEqual(result["personalInfo"]["name"], "Trần Thị Bình")
+
+    def test_experience_from_date_ranges(self):
+        experience = self.extractor.extract(SAMPLE_CV)["experience"]
+        self.assertEqual(experience[0], {
+            "title": "Senior Backend Developer",
+            "company": "FPT Software",
+            "duration": "01/2020 - Present"
+        })
+        self.assertEqual(experience[1]["company"], "Tiki Corporation")
+        self.assertEqual(len(experience), 2)
+
+    def test_education(self):
+        education = self.extractor.extract(SAMPLE_CV)["education"]
+        self.assertEqual(education, [{
+            "degree": "Cử nhân Công nghệ thông tin",
+            "institution": "Đại học Bách Khoa Hà Nội",
+            "year": "2015"
+        }])
+
+    def test_skills(self):
+        skills = self.extractor.extract(SAMPLE_CV)["skills"]
+        for skill in ("Python", "C++", "Go", "PostgreSQL", "Docker", "English", "Teamwork"):
+            self.assertIn(skill, skills)
+
+    def test_empty_text(self):
+        result = self.extractor.extract("")
+        self.assertEqual(result["personalInfo"]["name"], "N/A")
+        self.assertEqual(result["skills"], [])
+
+
+class TestCvParsingServiceRuleFallback(unittest.TestCase):
+    """CvParsingService uses the rule engine when Gemini is unavailable."""
+
+    def test_parse_with_rules_output(self):
+        from src.services.cv_parsing_service import CvParsingService
+
+        with patch.dict('os.environ', {'GEMINI_API_KEY': ''}):
+            service = CvParsingService()
+        with patch.object(service, '_extract_text', return_value=SAMPLE_CV):
+            result = service.parse_cv("dummy.pdf")
+
+        self.assertEqual(result["source"], {"type": "rule-based", "aiUsed": False})
+        self.assertEqual(result["personalInfo"]["phone"], "0912345678")
+        self.assertIn("Python", result["skills"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,206 @@
+# backend/src/__tests__/test_skill_index.py
+"""
+Unit tests for the inverted skill index, its incremental updates from
+DatabaseService and /api/candidates/search.
+"""
+
+import unittest
+from unittest.mock import patch, MagicMock
+import os
+import sys
+import time
+import threading
+from pathlib import Path
+
+# Add parent directories to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.services.skill_index import SkillIndex, get_skill_index
+from src.services.database_service import DatabaseService, get_db_service
+
+ROWS = [
+    {"candidate_id": "A", "skills": ["Python", "SQL", "Machine Learning"]},
+    {"candidate_id": "B", "skills": ["python", "ReactJS", "Docker"]},
+    {"candidate_id": "C", "skills": ["SQL", "Docker", "Tiếng Anh"]},
+    {"candidate_id": "A", "skills": ["Python", "SQL", "Machine Learning", "Docker"]},  # latest CV wins
+]
+
+
+class TestSkillIndex(unittest.TestCase):
+    """Test suite for SkillIndex queries and updates."""
+
+    def setUp(self):
+        self.index = SkillIndex()
+        self.index.rebuild(ROWS)
+
+    def _ids(self, result):
+        return [c["candidate_id"] for c in result["candidates"]]
+
+    def test_and_query_intersects_postings(self):
+        result = self.index.search(["python", "docker"])
+        self.assertEqual(self._ids(result), ["A", "B"])
+        self.assertEqual(result["total"], 2)
+        self.assertEqual(self._ids(self.index.search(["Python", "SQL", "Docker"])), ["A"])
+        self.assertEqual(self.index.search(["Python", "Rust"])["total"], 0)
+
+    def test_or_query_ranks_by_matched_count(self):
+        result = self.index.search(["Python", "Docker", "Machine Learning"], mode="or")
+        self.assertEqual(self._ids(result), ["A", "B", "C"])
+        self.assertEqual(len(result["candidates"][0]["matched_skills"]), 3)
+
+    def test_terms_are_normalised(self):
+        # Case, whitespace, diacritics and dictionary aliases fold to one term
+        self.assertEqual(self._ids(self.index.search(["  machine   learning "])), ["A"])
+        self.assertEqual(self._ids(self.index.search(["tieng anh"])), ["C"])
+        self.assertEqual(self.index.term("ReactJS"), self.index.term("React"))
+
+    def test_re_adding_a_candidate_replaces_skills(self):
+        self.index.add("C", ["Java"])
+        self.assertEqual(self._ids(self.index.search(["SQL"])), ["A"])
+        self.assertEqual(self._ids(self.index.search(["Java"])), ["C"])
+
+        self.index.remove("C")
+        self.assertEqual(self.index.search(["Java"])["total"], 0)
+        self.assertEqual(self.index.suggest("ja"), [])
+
+    def test_pagination(self):
+        result = self.index.search(["Docker", "SQL"], mode="or", limit=1, offset=1)
+        self.assertEqual(result["total"], 3)
+        self.assertEqual(self._ids(result), ["C"])
+
+    def test_suggest_prefix(self):
+        self.assertEqual(self.index.suggest("py"), [{"skill": "Python", "candidates": 2}])
+        self.assertEqual([s["skill"] for s in self.index.suggest("d")], ["Docker"])
+        self.assertEqual(self.index.suggest(""), [])
+
+    def test_load_reads_cv_analyses(self):
+        db = MagicMock()
+        db.fetch_rows.return_value = ROWS[:2]
+        index = SkillIndex()
+
+        self.assertEqual(index.load(db), 2)
+        db.fetch_rows.assert_called_once_with('cv_analyses', 'candidate_id,skills', order_by='created_at')
+        self.assertTrue(index.is_built())
+
+
+class TestIndexRefresh(unittest.TestCase):
+    """ensure_loaded builds once under concurrency and reloads a stale index."""
+
+    def _slow_db(self, rows):
+        db = MagicMock()
+
+        def fetch_rows(*args, **kwargs):
+            time.sleep(0.05)
+            return rows
+        db.fetch_rows.side_effect = fetch_rows
+        return db
+
+    def test_concurrent_first_requests_build_once(self):
+        index = SkillIndex(refresh_seconds=300)
+        db = self._slow_db(ROWS)
+        threads = [threading.Thread(target=index.ensure_loaded, args=(db,)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        db.fetch_rows.assert_called_once()
+        self.assertEqual(index.search(["docker"])["total"], 3)
+
+    def test_stale_index_reloads(self):
+        index = SkillIndex(refresh_seconds=300)
+        self.assertTrue(index.ensure_loaded(self._slow_db(ROWS[:1])))
+        self.assertFalse(index.ensure_loaded(self._slow_db(ROWS)))
+
+        index._loaded_at -= 301  # another worker saved CVs meanwhile
+        self.assertTrue(index.is_stale())
+        self.assertTrue(index.ensure_loaded(self._slow_db(ROWS)))
+        self.assertEqual(index.search(["docker"])["total"], 3)
+
+    def test_failed_refresh_keeps_the_index(self):
+        index = SkillIndex(refresh_seconds=300)
+        index.ensure_loaded(self._slow_db(ROWS))
+        index._loaded_at -= 301
+        db = MagicMock()
+        db.fetch_rows.side_effect = ConnectionError("database down")
+
+        self.assertFalse(index.ensure_loaded(db))
+        self.assertEqual(index.search(["docker"])["total"], 3)
+        self.assertFalse(index.is_stale())  # retried after the next interval
+        with self.assertRaises(ConnectionError):
+            SkillIndex().ensure_loaded(db)
+
+
+class TestIncrementalIndexing(unittest.TestCase):
+    """DatabaseService adds saved CV analyses to the skill index."""
+
+    def setUp(self):
+        DatabaseService._instance = None
+        patcher = patch.dict(os.environ, {"SUPABASE_URL": "http://localhost:54321", "SUPABASE_KEY": "dummy-key"})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(setattr, DatabaseService, '_instance', None)
+        self.addCleanup(get_skill_index().remove, "cv_skill_test.pdf")
+
+    def _analysis(self, skills):
+        return {
+            "candidate_id": "cv_skill_test.pdf",
+            "source_type": "cv_parsing",
+            "raw_data": {"skills": skills},
+            "summary": {"name": "Tran Thi Skill", "email": "skill.test@example.com"}
+        }
+
+    @patch('src.services.database_service.create_client')
+    def test_save_and_batch_update_index(self, mock_create_client):
+        mock_create_client.return_value.table.return_value.select.return_value.range.return_value.execute.return_value.data = []
+        db_service = get_db_service()
+
+        db_service.save_analysis(**self._analysis(["Kotlin"]))
+        self.assertEqual(get_skill_index().search(["kotlin"])["total"], 1)
+
+        db_service.save_analyses_batch([self._analysis(["Elixir"])])
+        self.assertEqual(get_skill_index().search(["kotlin"])["total"], 0)
+        self.assertEqual(get_skill_index().search(["elixir"])["total"], 1)
+
+
+class TestCandidateSearchEndpoint(unittest.TestCase):
+    """Integration tests for /api/candidates/search."""
+
+    def setUp(self):
+        from src.app import create_app
+        self.app = create_app()
+        self.app.config['TESTING'] = True
+        self.client = self.app.test_client()
+        index = get_skill_index()
+        saved = (index._postings, index._candidate_terms, index._display, index._built_at)
+        index.rebuild(ROWS)
+        self.addCleanup(self._restore, index, saved)
+
+    def _restore(self, index, saved):
+        index._postings, index._candidate_terms, index._display, index._built_at = saved
+        index._sorted_terms = None
+
+    def test_search(self):
+        response = self.client.get('/api/candidates/search?skills=python,docker')
+
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertTrue(data["success"])
+        self.assertEqual([c["candidate_id"] for c in data["candidates"]], ["A", "B"])
+
+        response = self.client.get('/api/candidates/search?skills=python,docker&mode=or')
+        self.assertEqual(response.get_json()["total"], 3)
+
+    def test_suggest(self):
+        response = self.client.get('/api/candidates/skills/suggest?prefix=sq')
+        self.assertEqual(response.get_json()["suggestions"], [{"skill": "SQL", "candidates": 2}])
+
+    def test_bad_requests(self):
+        self.assertEqual(self.client.get('/api/candidates/search').status_code, 400)
+        self.assertEqual(self.client.get('/api/candidates/search?skills=sql&mode=xor').status_code, 400)
+        self.assertEqual(self.client.get('/api/candidates/search?skills=sql&limit=0').status_code, 400)
+        self.assertEqual(self.client.get('/api/candidates/skills/index').status_code, 403)
+
+
+if __name__ == '__main__':
+    unittest.main()
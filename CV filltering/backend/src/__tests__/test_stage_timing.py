@@ -0,0 +1,124 @@
+# backend/src/__tests__/test_stage_timing.py
+"""
+Unit tests for per-stage timing (histograms, Server-Timing header)
+and its wiring into /api/parse-cv.
+"""
+
+import unittest
+from unittest.mock import patch
+import io
+import os
+import sys
+import shutil
+import tempfile
+from pathlib import Path
+
+# Add parent directories to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.services.parse_cache import ParseResultCache
+from src.services.stage_timing import (
+    StageHistogram, get_stage_timings, stage, timed,
+    begin_request, end_request, server_timing_header
+)
+
+
+class TestStageTiming(unittest.TestCase):
+    """Test suite for stage timers and histograms."""
+
+    def setUp(self):
+        get_stage_timings().reset()
+
+    def test_histogram_buckets_and_quantiles(self):
+        histogram = StageHistogram(buckets_ms=(10, 100, 1000))
+        for elapsed_ms in (5, 7, 50, 500, 5000):
+            histogram.observe(elapsed_ms)
+        snapshot = histogram.snapshot()
+
+        self.assertEqual(snapshot["count"], 5)
+        self.assertEqual(snapshot["buckets"], {"le_10": 2, "le_100": 1, "le_1000": 1, "le_inf": 1})
+        self.assertEqual(snapshot["p50_ms"], 100.0)
+        self.assertEqual(snapshot["p99_ms"], 5000)
+        self.assertEqual(snapshot["max_ms"], 5000)
+
+    def test_stage_is_recorded_when_block_raises(self):
+        with self.assertRaises(ValueError):
+            with stage("test.failing"):
+                raise ValueError("boom")
+
+        self.assertEqual(get_stage_timings().get_stats()["stages"]["test.failing"]["count"], 1)
+
+    def test_request_collects_stages_in_order(self):
+        @timed("test.decorated")
+        def work():
+            with stage("test.inner"):
+                pass
+
+        begin_request()
+        work()
+        work()
+        stages = end_request()
+
+        self.assertEqual([name for name, _ in stages], ["test.inner", "test.decorated"] * 2)
+        # Outside a request stages only feed the histograms
+        work()
+        self.assertEqual(end_request(), [])
+        self.assertEqual(get_stage_timings().get_stats()["stages"]["test.decorated"]["count"], 3)
+
+    def test_server_timing_header_merges_repeated_stages(self):
+        header = server_timing_header([("db.candidate", 1.25), ("cv.gemini", 900.0), ("db.candidate", 2.0)], total_ms=950)
+        self.assertEqual(header, "db.candidate;dur=3.2, cv.gemini;dur=900.0, total;dur=950.0")
+
+
+class TestParseCvServerTiming(unittest.TestCase):
+    """Integration tests for Server-Timing on /api/parse-cv and the internal stats endpoint."""
+
+    def setUp(self):
+        from src.app import create_app
+        from src.routes import cv_parsing_routes
+        self.routes = cv_parsing_routes
+        self.app = create_app()
+        self.app.config['TESTING'] = True
+        self.client = self.app.test_client()
+        self.tmpdir = tempfile.mkdtemp()
+        self.cache = ParseResultCache(max_entries=4, db_path=os.path.join(self.tmpdir, "cache.sqlite3"))
+        get_stage_timings().reset()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _upload(self):
+        data = {'file': (io.BytesIO(b"%PDF-1.4 timing"), 'cv.pdf')}
+        result = {"personalInfo": {"name": "Nguyen Van A"}, "skills": [], "source": {"type": "gemini", "aiUsed": True}}
+        with patch.object(self.routes, 'get_parse_cache', return_value=self.cache), \
+             patch.object(self.routes._cv_service(), 'parse_cv', return_value=result):
+            return self.client.post('/api/parse-cv', data=data, content_type='multipart/form-data')
+
+    def test_parse_response_has_server_timing(self):
+        response = self._upload()
+
+        self.assertEqual(response.status_code, 200)
+        names = [entry.split(';')[0] for entry in response.headers["Server-Timing"].split(', ')]
+        for name in ("upload.receive", "upload.hash", "cache.lookup", "cv.parse", "db.save_analysis", "total"):
+            self.assertIn(name, names)
+        self.assertEqual(names[-1], "total")
+
+    def test_internal_endpoint_requires_token(self):
+        with patch.dict(os.environ, {"ADMIN_API_TOKEN": ""}):
+            response = self.client.get('/api/internal/stage-timings')
+        self.assertEqual(response.status_code, 403)
+
+    def test_internal_endpoint_exposes_histograms(self):
+        self._upload()
+        with patch.dict(os.environ, {"ADMIN_API_TOKEN": "secret"}):
+            response = self.client.get('/api/internal/stage-timings', headers={"X-Admin-Token": "secret"})
+            stages = response.get_json()["timings"]["stages"]
+            self.assertEqual(stages["cv.parse"]["count"], 1)
+            self.assertIn("p95_ms", stages["db.save_analysis"])
+
+            self.client.delete('/api/internal/stage-timings', headers={"X-Admin-Token": "secret"})
+        self.assertEqual(get_stage_timings().get_stats()["stages"], {})
+
+
+if __name__ == '__main__':
+    unittest.main()
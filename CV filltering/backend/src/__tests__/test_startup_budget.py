@@ -0,0 +1,71 @@
+# backend/src/__tests__/test_startup_budget.py
+"""
+Cold-start budget: importing the app and serving the first /health must stay
+cheap, and heavy dependencies must not load until a request needs them.
+Uses tools/bench_startup.py; override the budget with STARTUP_BUDGET_SECONDS.
+"""
+
+import unittest
+import os
+import sys
+from pathlib import Path
+
+# Add parent directories to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / 'tools'))
+
+import bench_startup
+from src.services.service_registry import ServiceRegistry, lazy_import
+
+
+class TestStartupBudget(unittest.TestCase):
+    """Time to first /health in a fresh interpreter."""
+
+    def test_first_health_within_budget(self):
+        budget = float(os.getenv('STARTUP_BUDGET_SECONDS', 1.5))
+        result = bench_startup.measure(runs=2)
+
+        self.assertEqual(result["status_code"], 200)
+        self.assertEqual(result["heavy_modules_loaded"], [])
+        self.assertLessEqual(
+            result["first_health_seconds"], budget,
+            f"Cold start took {result['first_health_seconds']:.2f}s (budget {budget}s)"
+        )
+
+
+class TestServiceRegistry(unittest.TestCase):
+    """Test suite for ServiceRegistry and lazy_import."""
+
+    def test_service_is_built_once_on_first_use(self):
+        registry = ServiceRegistry()
+        builds = []
+        registry.register('svc', lambda: builds.append(1) or object())
+
+        self.assertFalse(registry.is_loaded('svc'))
+        first = registry.get('svc')
+        self.assertIs(registry.get('svc'), first)
+        self.assertEqual(len(builds), 1)
+        self.assertIn('svc', registry.get_stats()["loaded"])
+
+    def test_services_are_rebuilt_in_a_forked_worker(self):
+        registry = ServiceRegistry()
+        registry.register('svc', object)
+        parent_instance = registry.get('svc')
+
+        registry._pid = -1  # as seen from a child process after fork()
+        self.assertIsNot(registry.get('svc'), parent_instance)
+
+    def test_unknown_service_raises(self):
+        with self.assertRaises(KeyError):
+            ServiceRegistry().get('missing')
+
+    def test_lazy_import_defers_until_attribute_access(self):
+        sys.modules.pop('colorsys', None)
+        module = lazy_import('colorsys')
+        self.assertNotIn('colorsys', sys.modules)
+        self.assertEqual(module.rgb_to_hsv(0, 0, 0), (0.0, 0.0, 0.0))
+        self.assertIn('colorsys', sys.modules)
+
+
+if __name__ == '__main__':
+    unittest.main()
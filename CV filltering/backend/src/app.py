@@ -3,16 +3,23 @@ CV Screening Platform - Main Flask Application
 Full Stack Backend Integration với Supabase
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Request, request, jsonify, g
 from flask_cors import CORS
 import logging
 import os
+import time
+import tempfile
 from datetime import datetime
 
-# Import route blueprints
+# Import route blueprints (route modules build their services lazily through
+# services.service_registry, so importing them stays cheap)
 from .routes.numerology_routes import numerology_bp
 from .routes.disc_routes import disc_bp
 from .routes.cv_parsing_routes import cv_parsing_bp
+from .routes.job_routes import job_bp
+from .routes.candidate_routes import candidate_bp
+from .routes.admin_auth import is_admin_request
+from .services.stage_timing import get_stage_timings, begin_request, end_request, server_timing_header
 
 # Setup logging
 logging.basicConfig(
@@ -21,11 +28,40 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+class UploadRequest(Request):
+    """
+    Keeps uploaded files up to UPLOAD_MEMORY_THRESHOLD bytes in memory
+    (Werkzeug's default spools anything over 500KB to disk), so typical CVs
+    are parsed without touching the filesystem. Batch upload endpoints get
+    their own body limit instead of the app-wide MAX_CONTENT_LENGTH.
+    """
+
+    # endpoint -> (environment variable, default limit in bytes)
+    ENDPOINT_BODY_LIMITS = {
+        'cv_parsing_bp.parse_cv_batch_endpoint': ('CV_BATCH_MAX_BYTES', 256 * 1024 * 1024),
+        'disc.upload_disc_ocr_batch': ('DISC_OCR_BATCH_MAX_BYTES', 512 * 1024 * 1024),
+        'disc.upload_csv_disc_stream': ('DISC_CSV_STREAM_MAX_BYTES', 1024 * 1024 * 1024),
+    }
+
+    @property
+    def max_content_length(self):
+        # Resolved per request: the endpoint is known once the URL is matched,
+        # before the view reads the body
+        limit = self.ENDPOINT_BODY_LIMITS.get(self.endpoint)
+        if limit:
+            return int(os.environ.get(*limit))
+        return super().max_content_length
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        max_size = int(os.environ.get('UPLOAD_MEMORY_THRESHOLD', 2 * 1024 * 1024))
+        return tempfile.SpooledTemporaryFile(max_size=max_size, mode='rb+')
+
 def create_app():
     """
     Application factory pattern
     """
     app = Flask(__name__)
+    app.request_class = UploadRequest
     
     # Configuration
     app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'dev-secret-key')
@@ -39,10 +75,13 @@ def create_app():
     app.register_blueprint(numerology_bp)
     app.register_blueprint(disc_bp)
     app.register_blueprint(cv_parsing_bp)
+    app.register_blueprint(job_bp)
+    app.register_blueprint(candidate_bp)
     
     # Import services for health checking
-    from .services.numerology_service import NumerologyService
-    from .services.disc_pipeline import DISCExternalPipeline
+    from .services.service_registry import get_service, get_registry
+    from .services.gemini_governor import get_gemini_governor
+    from .services.cv_section_segmenter import get_section_segmenter
     
     # Health check endpoint với REAL service testing và detailed logging
     @app.route('/health', methods=['GET'])
@@ -58,7 +97,7 @@ def create_app():
             # Test Numerology Service với real function call
             logger.info("Testing Numerology Service...")
             try:
-                numerology_service = NumerologyService()
+                numerology_service = get_service('numerology')
                 # Real test với Vietnamese name
                 test_result = numerology_service.calculate_full_numerology("Nguyễn Văn A", "1990-01-01")
                 if test_result and test_result.get("success"):
@@ -78,7 +117,7 @@ def create_app():
             # Test DISC Pipeline với real function call
             logger.info("Testing DISC Pipeline...")
             try:
-                disc_pipeline = DISCExternalPipeline()
+                disc_pipeline = get_service('disc_pipeline')
                 # Real test với manual input
                 test_scores = {"d_score": 8, "i_score": 6, "s_score": 5, "c_score": 7}
                 test_result = disc_pipeline.process_manual_input("HEALTH_TEST", test_scores)
@@ -103,6 +142,13 @@ def create_app():
             # CV Parser (honest status)
             health_status["services"]["cv_parser"] = "not_implemented"
             health_status["tests_performed"].append("cv_parser_not_implemented")
+
+            # Gemini call governor counters (queued / in-flight / throttled)
+            health_status["gemini_governor"] = get_gemini_governor().get_stats()
+            # Estimated prompt tokens saved by CV section segmentation
+            health_status["gemini_prompt"] = get_section_segmenter().get_stats()
+            # Which lazily built services this worker has loaded so far
+            health_status["service_registry"] = get_registry().get_stats()
             
             # Determine overall status
             operational_services = [
@@ -140,6 +186,16 @@ def create_app():
     def api_health_check():
         return health_check()
     
+    # Per-stage latency histograms (upload, extraction, Gemini, DB, ...) of this worker
+    @app.route('/api/internal/stage-timings', methods=['GET', 'DELETE'])
+    def stage_timings():
+        if not is_admin_request():
+            return jsonify({"error": "Forbidden"}), 403
+        timings = get_stage_timings()
+        if request.method == 'DELETE':
+            timings.reset()
+        return jsonify({"success": True, "timings": timings.get_stats()}), 200
+    
     # API info endpoint
     @app.route('/api', methods=['GET'])
     def api_info():
@@ -155,14 +211,28 @@ def create_app():
                     "test": "GET /api/numerology/test"
                 },
                 "disc": {
-                    "upload_csv": "POST /api/disc/upload-csv",
+                    "upload_csv": "POST /api/disc/upload-csv (.csv or .xlsx)",
+                    "upload_csv_stream": "POST /api/disc/upload-csv/stream (.csv or .xlsx, NDJSON progress)",
                     "manual_input": "POST /api/disc/manual-input",
-                    "generate_survey": "GET /api/disc/generate-survey",
+                    "generate_survey": "GET /api/disc/generate-survey?candidate_id=",
+                    "answer_sheet": "GET /api/disc/answer-sheet/<candidate_id>?format=png|pdf",
                     "upload_ocr": "POST /api/disc/upload-ocr-image",
+                    "upload_ocr_batch": "POST /api/disc/upload-ocr-batch (images or ZIP, NDJSON results)",
                     "status": "GET /api/disc/status/<candidate_id>",
+                    "ocr_cache": "GET /api/disc/ocr-cache (OCR cache hit rate, admin)",
                     "test": "GET /api/disc/test",
                     "csv_template": "GET /api/disc/formats/csv-template"
                 },
+                "jobs": {
+                    "shortlist": "GET|POST /api/jobs/<job_id>/shortlist?k=20",
+                    "cv_matches": "GET /api/jobs/<job_id>/cv-matches?n=20",
+                    "cv_matches_for_description": "POST /api/jobs/cv-matches?n=20"
+                },
+                "candidates": {
+                    "search": "GET /api/candidates/search?skills=python,sql&mode=and|or",
+                    "suggest_skills": "GET /api/candidates/skills/suggest?prefix=py",
+                    "skill_index": "GET|POST /api/candidates/skills/index (admin)"
+                },
                 "health": "GET /health"
             },
             "documentation": "See README.md for detailed API documentation"
@@ -196,10 +266,16 @@ def create_app():
     @app.before_request
     def log_request_info():
         logger.info(f"Request: {request.method} {request.url}")
+        g.request_started = time.perf_counter()
+        begin_request()
         
     @app.after_request
     def log_response_info(response):
         logger.info(f"Response: {response.status_code}")
+        stages = end_request()
+        if get_stage_timings().enabled and 'request_started' in g:
+            total_ms = (time.perf_counter() - g.request_started) * 1000
+            response.headers['Server-Timing'] = server_timing_header(stages, total_ms)
         return response
     
     return app
@@ -0,0 +1,16 @@
+# backend/src/routes/admin_auth.py
+"""
+Admin token check shared by the internal endpoints (caches, indexes, stage
+timings) of every blueprint.
+"""
+
+from flask import request
+import os
+import hmac
+
+
+def is_admin_request():
+    """Admin endpoints are disabled unless ADMIN_API_TOKEN is set; callers send it as X-Admin-Token."""
+    expected = os.getenv("ADMIN_API_TOKEN")
+    provided = request.headers.get("X-Admin-Token", "")
+    return bool(expected) and hmac.compare_digest(provided, expected)
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""
+Candidate search API Routes
+Skill lookups served from the in-process inverted skill index
+"""
+
+from flask import Blueprint, request, jsonify
+from ..services.skill_index import get_skill_index
+from ..services.database_service import get_db_service
+from ..services.stage_timing import stage
+from .admin_auth import is_admin_request
+import logging
+import os
+
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+candidate_bp = Blueprint('candidates', __name__, url_prefix='/api/candidates')
+
+
+def _ensure_index():
+    """The skill index, built from cv_analyses on first use and refreshed once stale."""
+    index = get_skill_index()
+    if index.is_stale():
+        with stage("candidates.index_build"):
+            index.ensure_loaded(get_db_service())
+    return index
+
+
+def _int_arg(name, default, low, high):
+    value = int(request.args.get(name, default))
+    if value < low or value > high:
+        raise ValueError(name)
+    return value
+
+
+@candidate_bp.route('/search', methods=['GET'])
+def search_candidates():
+    """
+    GET /api/candidates/search?skills=python,sql&mode=and|or&limit=50&offset=0
+    Candidates with all (and) or any (or) of the comma-separated skills.
+    """
+    skills = [s.strip() for s in request.args.get('skills', '').split(',') if s.strip()]
+    if not skills:
+        return jsonify({"success": False, "error": "Missing skills parameter"}), 400
+    mode = request.args.get('mode', 'and').lower()
+    if mode not in ('and', 'or'):
+        return jsonify({"success": False, "error": "Invalid mode, use 'and' or 'or'"}), 400
+    try:
+        limit = _int_arg('limit', os.getenv('CANDIDATE_SEARCH_DEFAULT_LIMIT', 50),
+                         1, int(os.getenv('CANDIDATE_SEARCH_MAX_LIMIT', 500)))
+        offset = _int_arg('offset', 0, 0, 10 ** 9)
+    except ValueError:
+        return jsonify({"success": False, "error": "Invalid limit or offset"}), 400
+
+    try:
+        index = _ensure_index()
+        with stage("candidates.search"):
+            result = index.search(skills, mode=mode, limit=limit, offset=offset)
+        return jsonify({"success": True, **result}), 200
+    except Exception as e:
+        logger.error(f"Candidate search error: {str(e)}")
+        return jsonify({
+            "success": False,
+            "error": f"Search failed: {str(e)}"
+        }), 500
+
+
+@candidate_bp.route('/skills/suggest', methods=['GET'])
+def suggest_skills():
+    """
+    GET /api/candidates/skills/suggest?prefix=py&limit=10
+    Indexed skills starting with the prefix, most common first (type-ahead).
+    """
+    try:
+        limit = _int_arg('limit', 10, 1, 100)
+    except ValueError:
+        return jsonify({"success": False, "error": "Invalid limit"}), 400
+
+    try:
+        suggestions = _ensure_index().suggest(request.args.get('prefix', ''), limit=limit)
+        return jsonify({"success": True, "suggestions": suggestions}), 200
+    except Exception as e:
+        logger.error(f"Skill suggestion error: {str(e)}")
+        return jsonify({
+            "success": False,
+            "error": f"Suggestion failed: {str(e)}"
+        }), 500
+
+
+@candidate_bp.route('/skills/index', methods=['GET', 'POST'])
+def skill_index_admin():
+    """
+    GET  /api/candidates/skills/index  -> index statistics
+    POST /api/candidates/skills/index  -> rebuild from cv_analyses
+    Requires the X-Admin-Token header.
+    """
+    if not is_admin_request():
+        return jsonify({"success": False, "error": "Forbidden"}), 403
+
+    index = get_skill_index()
+    if request.method == 'POST':
+        try:
+            with stage("candidates.index_build"):
+                index.load(get_db_service())
+        except Exception as e:
+            logger.error(f"Skill index rebuild error: {str(e)}")
+            return jsonify({"success": False, "error": f"Rebuild failed: {str(e)}"}), 500
+    return jsonify({"success": True, "index": index.get_stats()}), 200
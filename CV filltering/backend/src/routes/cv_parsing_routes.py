@@ -1,66 +1,336 @@
 # backend/src/routes/cv_parsing_routes.py
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, Response, stream_with_context
 from werkzeug.utils import secure_filename
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 import os
-import tempfile
-from ..services.cv_parsing_service import CvParsingService
+import io
+import json
+import zipfile
+from ..services.service_registry import get_service
 from ..services.database_service import get_db_service
+from ..services.parse_cache import get_parse_cache, content_hash
+from ..services.parse_job_queue import ParseJobQueue
+from ..services.stage_timing import stage
+from .uploads import ZIP_MIMETYPES, detach_upload, spool_body, read_zip_entry
+from .admin_auth import is_admin_request
+import threading
 import logging
 
 cv_parsing_bp = Blueprint('cv_parsing_bp', __name__)
-service = CvParsingService()
 
-# Removed UPLOAD_FOLDER - using tempfile instead for security and scalability
+
+def _cv_service():
+    # Built on the first CV request of each worker, not at import time
+    return get_service('cv_parser')
+
+
+SUPPORTED_CV_EXTENSIONS = ('.pdf', '.docx')
+
+# Uploads are parsed in memory: small files stay in the request's spooled
+# buffer (see UPLOAD_MEMORY_THRESHOLD in app.py) and are never written to disk.
+
+def _parse_upload(filename, upload):
+    """
+    Parses one uploaded CV (bytes or a seekable binary stream) through the
+    content-addressed cache. Returns (result, cache_hit, file_hash).
+    """
+    with stage("upload.hash"):
+        file_hash = content_hash(upload)
+    service = _cv_service()
+    parser_version = service.parser_version()
+    cache = get_parse_cache()
+
+    # Re-uploads of the same bytes skip parsing (and the paid Gemini call)
+    with stage("cache.lookup"):
+        result = cache.get(file_hash, parser_version)
+    if result is not None:
+        return result, True, file_hash
+
+    # The format is detected from magic bytes, no temporary file is needed
+    with stage("cv.parse"):
+        result = service.parse_cv(io.BytesIO(upload) if isinstance(upload, (bytes, bytearray)) else upload)
+
+    # Degraded fallbacks are not cached so the next upload retries Gemini
+    if result and not result.get("source", {}).get("warning"):
+        cache.put(file_hash, parser_version, result)
+    return result, False, file_hash
+
+
+def _analysis_for_db(result, filename):
+    """Builds the save_analysis()/save_analyses_batch() payload for a parsed CV."""
+    summary_for_db = {
+        "name": result.get("personalInfo", {}).get("name"),
+        "email": result.get("personalInfo", {}).get("email"),
+        "phone": result.get("personalInfo", {}).get("phone"),
+        "ai_used": result.get("source", {}).get("aiUsed", False)
+    }
+    return {
+        "candidate_id": result.get("candidateId", f"cv_{secure_filename(filename)}"),
+        "source_type": "cv_parsing",
+        "raw_data": result,
+        "summary": summary_for_db
+    }
+
 
 @cv_parsing_bp.route('/api/parse-cv', methods=['POST'])
 def parse_cv_endpoint():
-    if 'file' not in request.files:
+    # Werkzeug parses (and spools) the multipart body on first access
+    with stage("upload.receive"):
+        files = request.files
+    if 'file' not in files:
         return jsonify({"error": "No file part"}), 400
     
-    file = request.files['file']
+    file = files['file']
     if file.filename == '':
         return jsonify({"error": "No selected file"}), 400
     
     if file:
         filename = secure_filename(file.filename)
-        
-        # Use a temporary file to handle the upload securely in memory/temp storage
-        # This avoids saving files permanently in the application directory
-        fd, file_path = tempfile.mkstemp(suffix=os.path.splitext(filename)[1]) # Added suffix for better file handling
+
+        # Job mode: return immediately, a background worker parses and saves
+        if request.args.get('mode') == 'async':
+            job_id = _get_job_queue().submit(filename, file.read())
+            return jsonify({
+                "job_id": job_id,
+                "status": "queued",
+                "status_url": f"/api/parse-cv/jobs/{job_id}"
+            }), 202
         
         try:
-            # Write uploaded file to temporary location
-            with os.fdopen(fd, 'wb') as tmp:
-                file.save(tmp)
-            
-            # Parse CV using the temporary file
-            result = service.parse_cv(file_path)
+            result, cache_hit, file_hash = _parse_upload(filename, file.stream)
 
             # Save to database with correct data extraction
             if result:  # Ensure result is not None or empty
                 db_service = get_db_service()
-                summary_for_db = {
-                    "name": result.get("personalInfo", {}).get("name"),
-                    "email": result.get("personalInfo", {}).get("email"),
-                    "phone": result.get("personalInfo", {}).get("phone"),
-                    "ai_used": result.get("source", {}).get("aiUsed", False)
-                }
-                db_service.save_analysis(
-                    candidate_id=result.get("candidateId", f"cv_{secure_filename(filename)}"),
-                    source_type="cv_parsing",
-                    raw_data=result,
-                    summary=summary_for_db
-                )
+                db_service.save_analysis(**_analysis_for_db(result, filename))
             
             # Return the parsed data directly, as per common API practice
-            return jsonify(result), 200
+            result["cache"] = {"hit": cache_hit, "key": file_hash}
+            response = jsonify(result)
+            response.headers['X-Parse-Cache'] = 'HIT' if cache_hit else 'MISS'
+            return response, 200
             
         except Exception as e:
             logging.error(f"Error parsing CV {filename}: {e}", exc_info=True)
             return jsonify({"error": str(e)}), 500
-        finally:
-            # Clean up the temporary file
-            if os.path.exists(file_path):
-                os.remove(file_path)
     
     return jsonify({"error": "Invalid file"}), 400
+
+
+def _run_parse_job(filename, file_bytes):
+    """Background job handler: parse (through the cache) and save, like the sync endpoint."""
+    result, cache_hit, file_hash = _parse_upload(filename, file_bytes)
+    db_result = None
+    if result:
+        db_result = get_db_service().save_analysis(**_analysis_for_db(result, filename))
+        result["cache"] = {"hit": cache_hit, "key": file_hash}
+    return {"data": result, "db_save": db_result}
+
+
+_job_queue = None
+_job_queue_lock = threading.Lock()
+_job_queue_started_pid = None
+
+
+def _get_job_queue():
+    """Per-process job queue; worker threads start lazily so they are never forked by gunicorn."""
+    global _job_queue
+    with _job_queue_lock:
+        if _job_queue is None:
+            _job_queue = ParseJobQueue(_run_parse_job)
+        return _job_queue
+
+
+@cv_parsing_bp.before_app_request
+def _start_job_queue():
+    """
+    Starts the job workers on each process's first request, whatever the route,
+    so jobs left queued by a previous process resume after a restart.
+    """
+    global _job_queue_started_pid
+    if _job_queue_started_pid == os.getpid():
+        return
+    _job_queue_started_pid = os.getpid()
+    try:
+        _get_job_queue().start()
+    except Exception as e:
+        logging.error(f"CV parsing job queue could not start: {e}", exc_info=True)
+
+
+@cv_parsing_bp.route('/api/parse-cv/jobs/<job_id>', methods=['GET'])
+def parse_cv_job_status(job_id):
+    """
+    GET /api/parse-cv/jobs/<job_id>
+    Status of a job submitted with POST /api/parse-cv?mode=async.
+    `result` is present once the job succeeded, `error` once it failed.
+    """
+    job = _get_job_queue().get(job_id)
+    if job is None:
+        return jsonify({"error": "Job not found"}), 404
+    return jsonify(job), 200
+
+
+def _batch_uploads(sources, max_files, max_entry_bytes, max_total_bytes, rejected):
+    """
+    (filename, bytes) of every CV in `sources` ((filename, seekable stream)
+    uploads) and their ZIP archives, read one at a time as the caller asks for
+    them. Entries that are unsupported, too large, past `max_files` or past
+    `max_total_bytes` of decompressed data go to `rejected` as
+    {"filename", "error"}.
+    """
+    taken_files = taken_bytes = 0
+
+    def take(name, declared_size, read):
+        """The entry's bytes, or None once it is rejected."""
+        nonlocal taken_files, taken_bytes
+        if taken_files >= max_files:
+            rejected.append({"filename": name, "error": f"Batch limit of {max_files} files reached"})
+            return None
+        # Reads stop one byte past the limit: nothing larger is ever held in memory
+        limit = min(max_entry_bytes, max_total_bytes - taken_bytes)
+        data = read(limit + 1) if declared_size <= limit else b""
+        size = max(declared_size, len(data))
+        if size > limit:
+            error = "File too large" if size > max_entry_bytes else f"Batch size limit of {max_total_bytes} bytes reached"
+            rejected.append({"filename": name, "error": error})
+            return None
+        taken_files += 1
+        taken_bytes += len(data)
+        return data
+
+    for filename, stream in sources:
+        filename = secure_filename(filename)
+        if filename.lower().endswith('.zip'):
+            try:
+                archive = zipfile.ZipFile(stream)
+            except zipfile.BadZipFile:
+                rejected.append({"filename": filename, "error": "Invalid ZIP archive"})
+                continue
+            with archive:
+                for info in archive.infolist():
+                    entry_name = secure_filename(os.path.basename(info.filename))
+                    if info.is_dir() or info.filename.startswith('__MACOSX/') or not entry_name:
+                        continue
+                    if not entry_name.lower().endswith(SUPPORTED_CV_EXTENSIONS):
+                        rejected.append({"filename": entry_name, "error": "Unsupported file format"})
+                        continue
+                    try:
+                        data = take(entry_name, info.file_size,
+                                    lambda limit, info=info: read_zip_entry(archive, info, limit))
+                    except (zipfile.BadZipFile, OSError, EOFError) as e:
+                        rejected.append({"filename": entry_name, "error": f"Invalid ZIP entry: {e}"})
+                        continue
+                    if data is not None:
+                        yield entry_name, data
+        elif not filename.lower().endswith(SUPPORTED_CV_EXTENSIONS):
+            rejected.append({"filename": filename, "error": "Unsupported file format"})
+        else:
+            data = take(filename, 0, stream.read)
+            if data is not None:
+                yield filename, data
+
+
+@cv_parsing_bp.route('/api/parse-cv/batch', methods=['POST'])
+def parse_cv_batch_endpoint():
+    """
+    POST /api/parse-cv/batch
+    Accepts several CVs (`files` / `file` fields) and/or ZIP archives of CVs,
+    or a raw ZIP body (Content-Type: application/zip). Files and ZIP entries
+    are read one at a time as workers free up, and one NDJSON line is streamed
+    per CV as it finishes, then a summary line once all results are persisted
+    with a single bulk DatabaseService write.
+    The body may be up to CV_BATCH_MAX_BYTES (see UploadRequest in app.py).
+    """
+    if request.mimetype in ZIP_MIMETYPES:
+        sources = [("upload.zip", spool_body())]
+    else:
+        files = request.files.getlist('files') + request.files.getlist('file')
+        if not files:
+            return jsonify({"error": "No file part"}), 400
+        sources = [(file.filename, detach_upload(file)) for file in files if file and file.filename]
+        if not sources:
+            return jsonify({"error": "No selected file"}), 400
+
+    max_files = int(os.getenv('CV_BATCH_MAX_FILES', 500))
+    max_workers = max(1, int(os.getenv('CV_BATCH_WORKERS', 4)))
+    max_entry_bytes = int(os.getenv('CV_BATCH_MAX_ENTRY_BYTES', 16 * 1024 * 1024))
+    max_total_bytes = int(os.getenv('CV_BATCH_MAX_TOTAL_BYTES', 1024 * 1024 * 1024))
+
+    def generate():
+        analyses, rejected, pending = [], [], {}
+        total = failed = 0
+
+        def rejected_lines():
+            nonlocal total, failed
+            while rejected:
+                total += 1
+                failed += 1
+                yield json.dumps({"type": "result", "success": False, **rejected.pop(0)}, ensure_ascii=False) + "\n"
+
+        def finished_lines(done):
+            nonlocal failed
+            for future in done:
+                index, filename = pending.pop(future)
+                line = {"type": "result", "index": index, "filename": filename}
+                try:
+                    result, cache_hit, file_hash = future.result()
+                    if result:
+                        analyses.append(_analysis_for_db(result, filename))
+                    line.update({"success": True, "cache": {"hit": cache_hit, "key": file_hash}, "data": result})
+                except Exception as e:
+                    logging.error(f"Error parsing CV {filename} in batch: {e}", exc_info=True)
+                    failed += 1
+                    line.update({"success": False, "error": str(e)})
+                yield json.dumps(line, ensure_ascii=False) + "\n"
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            uploads = _batch_uploads(sources, max_files, max_entry_bytes, max_total_bytes, rejected)
+            for index, (filename, file_bytes) in enumerate(uploads):
+                yield from rejected_lines()
+                total += 1
+                pending[executor.submit(_parse_upload, filename, file_bytes)] = (index, filename)
+                # Read ahead at most two files per worker
+                if len(pending) >= max_workers * 2:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    yield from finished_lines(done)
+            yield from rejected_lines()
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                yield from finished_lines(done)
+        finally:
+            # Stops queued work if the client disconnects mid-stream
+            executor.shutdown(wait=False, cancel_futures=True)
+            for _, stream in sources:
+                stream.close()
+
+        db_result = get_db_service().save_analyses_batch(analyses)
+        yield json.dumps({
+            "type": "summary",
+            "total": total,
+            "succeeded": len(analyses),
+            "failed": failed,
+            "db_save": db_result
+        }, ensure_ascii=False) + "\n"
+
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+
+@cv_parsing_bp.route('/api/parse-cv/cache', methods=['GET', 'DELETE'])
+@cv_parsing_bp.route('/api/parse-cv/cache/<file_hash>', methods=['DELETE'])
+def parse_cache_admin(file_hash=None):
+    """
+    GET    /api/parse-cv/cache          -> cache statistics
+    DELETE /api/parse-cv/cache          -> invalidate every cached result
+    DELETE /api/parse-cv/cache/<sha256> -> invalidate one uploaded file (all parser versions)
+    Requires the X-Admin-Token header.
+    """
+    if not is_admin_request():
+        return jsonify({"error": "Forbidden"}), 403
+
+    cache = get_parse_cache()
+    if request.method == 'GET':
+        return jsonify({"success": True, "stats": cache.get_stats()}), 200
+
+    removed = cache.invalidate(file_hash)
+    return jsonify({"success": True, "invalidated": removed, "key": file_hash}), 200
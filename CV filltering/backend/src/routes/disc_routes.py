@@ -4,11 +4,18 @@ DISC External Pipeline API Routes - TRUTHFUL IMPLEMENTATION
 Real routes without fake claims, proper error handling
 """
 
-from flask import Blueprint, request, jsonify
-from ..services.disc_pipeline import DISCExternalPipeline
+from flask import Blueprint, Response, request, jsonify, stream_with_context
+from ..services.service_registry import get_service
 from ..services.database_service import get_db_service
+from ..services.ocr_cache import get_ocr_cache
+from ..services.disc_answer_sheet import encode_answer_sheet, ANSWER_SHEET_FORMATS
+from .uploads import ZIP_MIMETYPES, detach_upload, spool_body, read_zip_entry
+from .admin_auth import is_admin_request
 from werkzeug.utils import secure_filename
 import logging
+import json
+import os
+import zipfile
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -16,6 +23,9 @@ logger = logging.getLogger(__name__)
 
 disc_bp = Blueprint('disc', __name__, url_prefix='/api/disc')
 
+XLSX_MIMETYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+OCR_IMAGE_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif'}
+
 @disc_bp.route('/manual-input', methods=['POST'])
 def manual_input_disc():
     """
@@ -38,7 +48,7 @@ def manual_input_disc():
             }), 400
         
         # Process manual input
-        disc_pipeline = DISCExternalPipeline()
+        disc_pipeline = get_service('disc_pipeline')
         result = disc_pipeline.process_manual_input(candidate_id, data)
         
         logger.info(f"DISC manual input - Candidate: {candidate_id}, Success: {result['success']}")
@@ -55,11 +65,33 @@ def manual_input_disc():
             "error": f"Manual input failed: {str(e)}"
         }), 500
 
+def _disc_analysis_for_db(candidate, source_type="disc_csv"):
+    """Builds the save_analyses_batch() payload for a scored candidate (DISC CSV row or answer sheet)."""
+    disc_profile = candidate.get("disc_profile", {})
+    summary_for_db = {
+        "D": candidate.get("disc_scores", {}).get("d_score"),
+        "I": candidate.get("disc_scores", {}).get("i_score"),
+        "S": candidate.get("disc_scores", {}).get("s_score"),
+        "C": candidate.get("disc_scores", {}).get("c_score"),
+        "primary_type": disc_profile.get("primary_style"),
+        "secondary_type": disc_profile.get("secondary_style"),
+        "interpretation": {
+            "description": disc_profile.get("description"),
+            "style_ranking": disc_profile.get("style_ranking")
+        }
+    }
+    return {
+        "candidate_id": candidate.get("candidate_id"),
+        "source_type": source_type,
+        "raw_data": candidate,
+        "summary": summary_for_db
+    }
+
 @disc_bp.route('/upload-csv', methods=['POST'])
 def upload_csv_disc():
     """
     POST /api/disc/upload-csv  
-    CSV upload processing - UNDER DEVELOPMENT
+    CSV or XLSX upload processing (`?sheet=` picks the XLSX worksheet, default the first)
     """
     if 'file' not in request.files:
         return jsonify({"success": False, "errors": ["No file part"]}), 400
@@ -68,38 +100,20 @@ def upload_csv_disc():
     if file.filename == '':
         return jsonify({"success": False, "errors": ["No selected file"]}), 400
 
-    if file and file.filename.endswith('.csv'):
+    if file and file.filename.endswith(('.csv', '.xlsx')):
         try:
-            file_bytes = file.read()
-            result = disc_pipeline.process_csv_upload(file_bytes)
+            disc_pipeline = get_service('disc_pipeline')
+            if file.filename.endswith('.xlsx'):
+                result = disc_pipeline.process_xlsx_upload(file.stream, request.args.get('sheet'))
+            else:
+                result = disc_pipeline.process_csv_upload(file.read())
             
             if result["errors"]:
                 return jsonify({"success": False, "data": None, "errors": result["errors"], "warnings": result["warnings"]}), 400
 
             # Save to database using batch insert for better performance
             db_service = get_db_service()
-            analyses_batch = []
-
-            for candidate in result.get("candidates", []):
-                disc_profile = candidate.get("disc_profile", {})
-                summary_for_db = {
-                    "D": candidate.get("disc_scores", {}).get("d_score"),
-                    "I": candidate.get("disc_scores", {}).get("i_score"),
-                    "S": candidate.get("disc_scores", {}).get("s_score"),
-                    "C": candidate.get("disc_scores", {}).get("c_score"),
-                    "primary_type": disc_profile.get("primary_style"),
-                    "secondary_type": disc_profile.get("secondary_style"),
-                    "interpretation": {
-                        "description": disc_profile.get("description"),
-                        "style_ranking": disc_profile.get("style_ranking")
-                    }
-                }
-                analyses_batch.append({
-                    "candidate_id": candidate.get("candidate_id"),
-                    "source_type": "disc_csv",
-                    "raw_data": candidate,
-                    "summary": summary_for_db
-                })
+            analyses_batch = [_disc_analysis_for_db(candidate) for candidate in result.get("candidates", [])]
 
             # Batch save all analyses at once
             batch_result = db_service.save_analyses_batch(analyses_batch)
@@ -113,7 +127,82 @@ def upload_csv_disc():
             logging.error(f"Error processing DISC CSV: {e}")
             return jsonify({"success": False, "errors": ["An internal error occurred."]}), 500
     
-    return jsonify({"success": False, "errors": ["Invalid file type. Please upload a CSV."]}), 400
+    return jsonify({"success": False, "errors": ["Invalid file type. Please upload a CSV or XLSX file."]}), 400
+
+@disc_bp.route('/upload-csv/stream', methods=['POST'])
+def upload_csv_disc_stream():
+    """
+    POST /api/disc/upload-csv/stream
+    Streaming CSV/XLSX import: the body is either the raw file (Content-Type: text/csv,
+    read straight from the request stream, or the XLSX media type) or a multipart
+    `file` field; `?sheet=` picks the XLSX worksheet. Rows are validated and profiled
+    in batches of DISC_CSV_STREAM_BATCH_ROWS, each batch is saved to the database as
+    soon as it is done, and progress is streamed as NDJSON: one "batch" line per
+    batch, then a "summary" line. The body may be up to DISC_CSV_STREAM_MAX_BYTES
+    (see UploadRequest in app.py).
+    """
+    if request.mimetype == 'multipart/form-data':
+        file = request.files.get('file')
+        if not file or file.filename == '':
+            return jsonify({"success": False, "errors": ["No selected file"]}), 400
+        if not file.filename.endswith(('.csv', '.xlsx')):
+            return jsonify({"success": False, "errors": ["Invalid file type. Please upload a CSV or XLSX file."]}), 400
+        is_xlsx = file.filename.endswith('.xlsx')
+        stream = detach_upload(file)
+    elif request.mimetype == XLSX_MIMETYPE:
+        is_xlsx = True
+        stream = spool_body()
+    else:
+        is_xlsx = False
+        stream = request.stream
+    owns_stream = stream is not request.stream
+
+    disc_pipeline = get_service('disc_pipeline')
+    try:
+        if is_xlsx:
+            fieldnames, rows = disc_pipeline.open_xlsx_stream(stream, request.args.get('sheet'))
+        else:
+            fieldnames, rows = disc_pipeline.open_csv_stream(stream)
+    except (ValueError, UnicodeDecodeError) as e:
+        if owns_stream:
+            stream.close()
+        return jsonify({"success": False, "errors": [str(e)]}), 400
+
+    def generate():
+        db_service = get_db_service()
+        totals = {"rows": 0, "processed_count": 0, "error_count": 0, "saved_count": 0, "batches": 0}
+        try:
+            for batch in disc_pipeline.process_csv_batches(fieldnames, rows):
+                db_result = None
+                if batch["candidates"]:
+                    db_result = db_service.save_analyses_batch([_disc_analysis_for_db(c) for c in batch["candidates"]])
+                    if not db_result.get("success"):
+                        logger.warning(f"DISC stream batch save had issues: {db_result.get('error') or db_result.get('errors')}")
+                    totals["saved_count"] += db_result.get("count", 0) if db_result.get("success") else 0
+                totals["batches"] += 1
+                totals["rows"] += batch["rows"]
+                totals["processed_count"] += batch["processed_count"]
+                totals["error_count"] += len(batch["errors"])
+                yield json.dumps({
+                    "type": "batch",
+                    "batch": totals["batches"],
+                    "first_row": batch["first_row"],
+                    "rows": batch["rows"],
+                    "processed_count": batch["processed_count"],
+                    "errors": batch["errors"],
+                    "db_save": db_result,
+                    "total_processed": totals["processed_count"]
+                }, ensure_ascii=False) + "\n"
+        finally:
+            if is_xlsx:
+                rows.close()
+            if owns_stream:
+                stream.close()
+
+        logger.info(f"DISC {'XLSX' if is_xlsx else 'CSV'} stream: {totals['processed_count']}/{totals['rows']} rows in {totals['batches']} batches")
+        yield json.dumps({"type": "summary", "success": totals["error_count"] == 0, **totals}, ensure_ascii=False) + "\n"
+
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
 
 @disc_bp.route('/upload-ocr-image', methods=['POST'])
 def upload_disc_ocr_image():
@@ -128,23 +217,28 @@ def upload_disc_ocr_image():
     if file.filename == '':
         return jsonify({"success": False, "errors": ["No selected file"]}), 400
 
-    allowed_extensions = {'png', 'jpg', 'jpeg', 'gif'}
-    if '.' in file.filename and file.filename.rsplit('.', 1)[1].lower() in allowed_extensions:
+    if _is_ocr_image(file.filename):
         try:
             image_bytes = file.read()
             candidate_id = request.form.get('candidate_id', 'unknown_ocr_upload')
 
-            disc_pipeline = DISCExternalPipeline()
+            disc_pipeline = get_service('disc_pipeline')
             result = disc_pipeline.process_ocr_image(image_bytes, candidate_id=candidate_id)
             
-            # Save to database (stubbed)
             db_service = get_db_service()
-            db_service.save_analysis(
-                candidate_id=candidate_id,
-                source_type="disc_ocr_stub",
-                raw_data=result,
-                summary={"status": "pending_manual_review"}
-            )
+            if result.get("status") == "auto_scored":
+                # Scored from the answer sheet grid: saved like a CSV row
+                if 'candidate_id' not in request.form and result.get("detected_candidate_id"):
+                    result["candidate_id"] = result["detected_candidate_id"]
+                db_service.save_analysis(**_disc_analysis_for_db(result, source_type="disc_omr"))
+            else:
+                # Save to database (stubbed)
+                db_service.save_analysis(
+                    candidate_id=candidate_id,
+                    source_type="disc_ocr_stub",
+                    raw_data=result,
+                    summary={"status": "pending_manual_review"}
+                )
 
             return jsonify({"success": True, "data": result}), 200
         except Exception as e:
@@ -153,6 +247,180 @@ def upload_disc_ocr_image():
     
     return jsonify({"success": False, "errors": ["Invalid file type. Please upload an image (png, jpg, jpeg, gif)."]}), 400
 
+def _is_ocr_image(filename):
+    return '.' in filename and filename.rsplit('.', 1)[1].lower() in OCR_IMAGE_EXTENSIONS
+
+def _batch_images(sources, max_images, max_image_bytes, max_total_bytes, skipped):
+    """
+    (filename, bytes) of every survey image in the uploads, ZIP members read one
+    at a time. Images that are too large, past `max_images` or past
+    `max_total_bytes` of decompressed data go to `skipped`.
+    """
+    taken_images = taken_bytes = 0
+
+    def take(name, declared_size, read):
+        """The image's bytes, or None once it is skipped."""
+        nonlocal taken_images, taken_bytes
+        if taken_images >= max_images:
+            skipped.append(f"{name}: over the {max_images} images limit")
+            return None
+        # Reads stop one byte past the limit: nothing larger is ever held in memory
+        limit = min(max_image_bytes, max_total_bytes - taken_bytes)
+        data = read(limit + 1) if declared_size <= limit else b""
+        size = max(declared_size, len(data))
+        if size > limit:
+            if size > max_image_bytes:
+                skipped.append(f"{name}: larger than {max_image_bytes} bytes")
+            else:
+                skipped.append(f"{name}: over the {max_total_bytes} bytes batch limit")
+            return None
+        taken_images += 1
+        taken_bytes += len(data)
+        return data
+
+    for filename, stream in sources:
+        if not filename.lower().endswith('.zip'):
+            image_bytes = take(filename, 0, stream.read)
+            if image_bytes is not None:
+                yield filename, image_bytes
+            continue
+        with zipfile.ZipFile(stream) as archive:
+            for member in archive.infolist():
+                if member.is_dir() or member.filename.startswith('__MACOSX/') or not _is_ocr_image(member.filename):
+                    continue
+                try:
+                    image_bytes = take(member.filename, member.file_size,
+                                       lambda limit, member=member: read_zip_entry(archive, member, limit))
+                except (zipfile.BadZipFile, OSError, EOFError) as e:
+                    skipped.append(f"{member.filename}: {e}")
+                    continue
+                if image_bytes is not None:
+                    yield member.filename, image_bytes
+
+@disc_bp.route('/upload-ocr-batch', methods=['POST'])
+def upload_disc_ocr_batch():
+    """
+    POST /api/disc/upload-ocr-batch
+    Many survey images in one request: multipart `files` (images and/or ZIP
+    archives of images) or a raw ZIP body (Content-Type: application/zip).
+    Images are decoded, preprocessed and OCR'd on a process pool sized to the
+    CPU cores (DISC_OCR_BATCH_WORKERS); each result is streamed as an NDJSON
+    "result" line as soon as it finishes, then all of them are saved with one
+    bulk database write and a "summary" line closes the stream. Pool processes
+    have OCR caches of their own: a batch does not use this worker's cache, and
+    a duplicate image hits only if it lands on the process that read the first.
+    The body may be up to DISC_OCR_BATCH_MAX_BYTES (see UploadRequest in app.py).
+    """
+    if request.mimetype == 'multipart/form-data':
+        uploads = [f for f in request.files.getlist('files') + request.files.getlist('file') if f.filename]
+        if not uploads:
+            return jsonify({"success": False, "errors": ["No selected file"]}), 400
+        invalid = [f.filename for f in uploads if not (f.filename.lower().endswith('.zip') or _is_ocr_image(f.filename))]
+        if invalid:
+            return jsonify({"success": False, "errors": [f"Invalid file type: {', '.join(invalid)}. Upload images (png, jpg, jpeg, gif) or ZIP archives."]}), 400
+        sources = [(f.filename, detach_upload(f)) for f in uploads]
+    elif request.mimetype in ZIP_MIMETYPES:
+        sources = [("upload.zip", spool_body())]
+    else:
+        return jsonify({"success": False, "errors": ["Upload images or ZIP archives as multipart `files`, or a ZIP body."]}), 400
+
+    for name, stream in sources:
+        if name.lower().endswith('.zip') and not zipfile.is_zipfile(stream):
+            for _, other in sources:
+                other.close()
+            return jsonify({"success": False, "errors": [f"Invalid ZIP file: {name}"]}), 400
+        stream.seek(0)
+
+    disc_pipeline = get_service('disc_pipeline')
+    max_images = int(os.getenv('DISC_OCR_BATCH_MAX_IMAGES', 500))
+    max_image_bytes = int(os.getenv('DISC_OCR_BATCH_MAX_IMAGE_BYTES', 20 * 1024 * 1024))
+    max_total_bytes = int(os.getenv('DISC_OCR_BATCH_MAX_TOTAL_BYTES', 1024 * 1024 * 1024))
+
+    def generate():
+        analyses, skipped = [], []
+        totals = {"images": 0, "auto_scored": 0, "pending_review": 0, "failed": 0}
+        error = None
+        try:
+            images = _batch_images(sources, max_images, max_image_bytes, max_total_bytes, skipped)
+            for result in disc_pipeline.process_ocr_batch(images):
+                totals["images"] += 1
+                if result.get("status") == "auto_scored":
+                    totals["auto_scored"] += 1
+                    # The id printed on the sheet beats the file name (IMG_1234.jpg)
+                    result["candidate_id"] = result.get("detected_candidate_id") or result["candidate_id"]
+                    analyses.append(_disc_analysis_for_db(result, source_type="disc_omr"))
+                elif result.get("success"):
+                    totals["pending_review"] += 1
+                    analyses.append({
+                        "candidate_id": result["candidate_id"],
+                        "source_type": "disc_ocr_stub",
+                        "raw_data": result,
+                        "summary": {"status": "pending_manual_review"}
+                    })
+                else:
+                    totals["failed"] += 1
+                yield json.dumps({"type": "result", **result}, ensure_ascii=False) + "\n"
+        except Exception as e:
+            # Keep what was processed: it is still saved below
+            logger.error(f"DISC OCR batch stopped early: {e}")
+            error = str(e)
+        finally:
+            for _, stream in sources:
+                stream.close()
+
+        db_result = get_db_service().save_analyses_batch(analyses) if analyses else None
+        if db_result and not db_result.get("success"):
+            logger.warning(f"DISC OCR batch save had issues: {db_result.get('error') or db_result.get('errors')}")
+        logger.info(f"DISC OCR batch: {totals['auto_scored']}/{totals['images']} images auto-scored")
+        yield json.dumps({
+            "type": "summary",
+            "success": error is None and totals["failed"] == 0,
+            **totals,
+            "skipped": skipped,
+            "error": error,
+            "db_save": db_result
+        }, ensure_ascii=False) + "\n"
+
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+@disc_bp.route('/generate-survey', methods=['GET'])
+def generate_disc_survey():
+    """
+    GET /api/disc/generate-survey?candidate_id=CAND-0042
+    Printable DISC survey, with links to the candidate's answer sheet
+    """
+    disc_pipeline = get_service('disc_pipeline')
+    return jsonify(disc_pipeline.generate_printable_survey(request.args.get('candidate_id'))), 200
+
+@disc_bp.route('/answer-sheet/<candidate_id>', methods=['GET'])
+def download_answer_sheet(candidate_id):
+    """
+    GET /api/disc/answer-sheet/<candidate_id>?format=png|pdf
+    The answer sheet with the candidate id printed in its box: a photo of the
+    filled sheet sent to /upload-ocr-image is scored from its checkbox grid
+    """
+    fmt = request.args.get('format', 'png').lower()
+    try:
+        content = encode_answer_sheet(candidate_id, fmt)
+    except ValueError as e:
+        return jsonify({"success": False, "errors": [str(e)]}), 400
+    response = Response(content, mimetype=ANSWER_SHEET_FORMATS[fmt])
+    response.headers['Content-Disposition'] = f'inline; filename="disc_answer_sheet_{candidate_id}.{fmt}"'
+    return response
+
+@disc_bp.route('/ocr-cache', methods=['GET'])
+def get_disc_ocr_cache_stats():
+    """
+    GET /api/disc/ocr-cache
+    Hit rate and size of this worker's survey OCR cache (single-image uploads;
+    /upload-ocr-batch runs in pool processes with caches of their own).
+    Requires the X-Admin-Token header.
+    """
+    if not is_admin_request():
+        return jsonify({"error": "Forbidden"}), 403
+
+    return jsonify({"success": True, "stats": get_ocr_cache().get_stats()}), 200
+
 @disc_bp.route('/test', methods=['GET'])
 def test_disc_pipeline():
     """
@@ -160,7 +428,7 @@ def test_disc_pipeline():
     Test DISC pipeline basic functionality
     """
     try:
-        disc_pipeline = DISCExternalPipeline()
+        disc_pipeline = get_service('disc_pipeline')
         result = disc_pipeline.test_pipeline()
         return jsonify({
             "success": True,
@@ -182,7 +450,7 @@ def get_disc_status(candidate_id):
     Get DISC processing status for candidate
     """
     try:
-        disc_pipeline = DISCExternalPipeline()
+        disc_pipeline = get_service('disc_pipeline')
         result = disc_pipeline.get_status(candidate_id)
         return jsonify(result), 200
     except Exception as e:
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+Job shortlist API Routes
+Server-side ranking of all candidates against a job
+"""
+
+from flask import Blueprint, request, jsonify
+from ..services.service_registry import get_service
+from ..services.cv_text_index import get_cv_text_index
+from ..services.database_service import get_db_service
+from ..services.stage_timing import stage
+from .admin_auth import is_admin_request
+import logging
+import os
+
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+job_bp = Blueprint('jobs', __name__, url_prefix='/api/jobs')
+
+
+@job_bp.route('/<job_id>/shortlist', methods=['GET', 'POST'])
+def job_shortlist(job_id):
+    """
+    GET  /api/jobs/<job_id>/shortlist?k=20
+    POST /api/jobs/<job_id>/shortlist?k=20  (JSON job spec, merged over the catalogue entry)
+    Ranks every stored candidate for the job and returns the top k.
+    `refresh=true` reloads the candidate features and requires the X-Admin-Token header.
+    """
+    refresh = request.args.get('refresh') == 'true'
+    if refresh and not is_admin_request():
+        return jsonify({"success": False, "error": "Forbidden"}), 403
+    try:
+        k = int(request.args.get('k', os.getenv('SHORTLIST_DEFAULT_K', 20)))
+        if k < 1 or k > int(os.getenv('SHORTLIST_MAX_K', 500)):
+            return jsonify({"success": False, "error": "Invalid k"}), 400
+    except ValueError:
+        return jsonify({"success": False, "error": "Invalid k"}), 400
+
+    ranking = get_service('job_ranking')
+    job = ranking.get_job(job_id)
+    if request.method == 'POST':
+        spec = request.get_json(silent=True)
+        if not isinstance(spec, dict):
+            return jsonify({"success": False, "error": "Missing job specification"}), 400
+        job = {**(job or {}), **spec, "id": job_id}
+    if job is None:
+        return jsonify({"success": False, "error": f"Job not found: {job_id}"}), 404
+
+    try:
+        with stage("jobs.load_features"):
+            features = ranking.get_features(refresh=refresh)
+        with stage("jobs.rank"):
+            result = ranking.shortlist(job, k, features=features)
+        logger.info(f"Shortlist for job {job_id}: top {k} of {result['total_candidates']} candidates "
+                    f"in {result['elapsed_ms']} ms")
+        return jsonify({"success": True, **result}), 200
+    except Exception as e:
+        logger.error(f"Shortlist error for job {job_id}: {str(e)}")
+        return jsonify({
+            "success": False,
+            "error": f"Shortlist failed: {str(e)}"
+        }), 500
+
+
+def _job_text(job):
+    """Free text of a catalogue job: title, description and required skills."""
+    requirements = job.get('requirements') or {}
+    parts = [job.get('title') or '', job.get('description') or '']
+    parts += requirements.get('technical_skills') or []
+    parts += requirements.get('soft_skills') or []
+    return '\n'.join(parts)
+
+
+def _cv_matches(description):
+    refresh = request.args.get('refresh') == 'true'
+    if refresh and not is_admin_request():
+        return jsonify({"success": False, "error": "Forbidden"}), 403
+    try:
+        n = int(request.args.get('n', os.getenv('CV_MATCH_DEFAULT_N', 20)))
+        if n < 1 or n > int(os.getenv('CV_MATCH_MAX_N', 500)):
+            return jsonify({"success": False, "error": "Invalid n"}), 400
+    except ValueError:
+        return jsonify({"success": False, "error": "Invalid n"}), 400
+    if not description.strip():
+        return jsonify({"success": False, "error": "Missing job description"}), 400
+
+    try:
+        index = get_cv_text_index()
+        if refresh:
+            with stage("jobs.cv_index_build"):
+                index.load(get_db_service())
+        elif index.is_stale():
+            with stage("jobs.cv_index_build"):
+                index.ensure_loaded(get_db_service())
+        with stage("jobs.cv_match"):
+            result = index.top_n(description, n)
+        logger.info(f"CV match: top {n} of {result['indexed_cvs']} CVs in {result['elapsed_ms']} ms")
+        return jsonify({"success": True, **result}), 200
+    except Exception as e:
+        logger.error(f"CV match error: {str(e)}")
+        return jsonify({
+            "success": False,
+            "error": f"CV match failed: {str(e)}"
+        }), 500
+
+
+@job_bp.route('/cv-matches', methods=['POST'])
+def cv_matches_for_description():
+    """
+    POST /api/jobs/cv-matches?n=20  {"description": "..."}
+    Ranks indexed CVs against a free-text job description (BM25).
+    `refresh=true` rebuilds the index and requires the X-Admin-Token header.
+    """
+    data = request.get_json(silent=True) or {}
+    description = data.get('description')
+    if not isinstance(description, str):
+        return jsonify({"success": False, "error": "Missing job description"}), 400
+    return _cv_matches(description)
+
+
+@job_bp.route('/<job_id>/cv-matches', methods=['GET'])
+def cv_matches_for_job(job_id):
+    """
+    GET /api/jobs/<job_id>/cv-matches?n=20
+    Ranks indexed CVs against a catalogue job's title, description and skills.
+    `refresh=true` rebuilds the index and requires the X-Admin-Token header.
+    """
+    job = get_service('job_ranking').get_job(job_id)
+    if job is None:
+        return jsonify({"success": False, "error": f"Job not found: {job_id}"}), 404
+    return _cv_matches(_job_text(job))
@@ -0,0 +1,45 @@
+# backend/src/routes/uploads.py
+"""
+Request body helpers shared by the streaming upload endpoints: handles on
+uploaded files and raw bodies that outlive the view function, so NDJSON
+generators can read them while the response streams, and bounded reads of
+ZIP members.
+"""
+
+from flask import request
+import io
+import os
+import shutil
+import tempfile
+
+ZIP_MIMETYPES = {'application/zip', 'application/x-zip-compressed'}
+
+
+def detach_upload(file):
+    """
+    An independent handle on an uploaded file, still readable after the view
+    returns (Flask closes request.files before a streamed response is consumed).
+    Spooled uploads are rolled to disk and their descriptor duplicated.
+    """
+    try:
+        handle = os.fdopen(os.dup(file.stream.fileno()), 'rb')
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        # Stream without a descriptor: an in-memory upload, bounded by UPLOAD_MEMORY_THRESHOLD
+        file.stream.seek(0)
+        return io.BytesIO(file.stream.read())
+    handle.seek(0)
+    return handle
+
+
+def spool_body():
+    """The raw request body in a seekable file (XLSX is a zip archive), on disk past UPLOAD_MEMORY_THRESHOLD."""
+    spooled = tempfile.SpooledTemporaryFile(max_size=int(os.environ.get('UPLOAD_MEMORY_THRESHOLD', 2 * 1024 * 1024)))
+    shutil.copyfileobj(request.stream, spooled)
+    spooled.seek(0)
+    return spooled
+
+
+def read_zip_entry(archive, info, limit):
+    """At most `limit` bytes of a ZIP member, decompressed (callers read limit + 1 to detect overflow)."""
+    with archive.open(info) as entry:
+        return entry.read(limit)
@@ -0,0 +1,248 @@
+# backend/src/services/candidate_resolver.py
+"""
+Candidate identity resolution.
+
+Keeps an in-process index of known candidates keyed by normalised email and
+phone (Vietnamese numbers in national 0xxxxxxxxx form, whether written with
++84, 0084 or 0), warmed once from the `candidates` table and then updated as
+candidates are created (later refreshes run on a background thread, so a
+save never waits for a table scan). Resolving an analysis is a dict lookup: the same
+person uploaded under different filenames maps to the existing candidate id,
+and saves no longer need a SELECT to know whether a candidate exists.
+"""
+
+import os
+import re
+import time
+import hashlib
+import logging
+import threading
+from typing import Dict, Any, Optional, List, Tuple
+
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Placeholders the parsers emit when a field was not found
+MISSING_VALUES = {'', 'n/a', 'na', 'none', 'null', 'unknown', '-'}
+
+EMAIL_PATTERN = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+
+
+def normalize_email(email: Any) -> Optional[str]:
+    """Lower-cased, trimmed email, or None when missing or not an email."""
+    if not isinstance(email, str):
+        return None
+    email = email.strip().lower()
+    if email.startswith('mailto:'):
+        email = email[len('mailto:'):]
+    if email in MISSING_VALUES or not EMAIL_PATTERN.match(email):
+        return None
+    return email
+
+
+def normalize_phone(phone: Any) -> Optional[str]:
+    """
+    Digits-only phone number. Vietnamese numbers are folded to the national
+    form ('+84 912 345 678', '0084912345678' and '0912.345.678' all become
+    '0912345678'); other numbers keep their country code. None when fewer
+    than 8 digits remain.
+    """
+    if isinstance(phone, int):
+        phone = str(phone)
+    if not isinstance(phone, str) or phone.strip().lower() in MISSING_VALUES:
+        return None
+    phone = phone.replace('(0)', '')
+    digits = re.sub(r'\D', '', phone)
+    if digits.startswith('00'):
+        digits = digits[2:]
+    elif not phone.lstrip(' (').startswith('+') and digits.startswith('0'):
+        return digits if len(digits) >= 8 else None
+    # Country-coded from here on
+    if digits.startswith('84') and len(digits) in (11, 12):
+        return '0' + digits[2:]
+    return digits if len(digits) >= 8 else None
+
+
+class CandidateResolver:
+    """
+    In-process candidate identity index.
+
+    `resolve()` maps an incoming (candidate_id, summary) to the id of the
+    candidate it belongs to; `register()` records a candidate.
+    The index is (re)loaded from the `candidates` table through `warm()`
+    when it is older than `refresh_seconds`, so candidates created by other
+    workers are picked up; `ensure_warm()` does the first load inline and
+    later ones in the background.
+    """
+
+    def __init__(self, page_size: Optional[int] = None, refresh_seconds: Optional[float] = None):
+        self.page_size = page_size if page_size is not None else int(os.getenv('CANDIDATE_INDEX_PAGE_SIZE', 1000))
+        self.refresh_seconds = (refresh_seconds if refresh_seconds is not None
+                                else float(os.getenv('CANDIDATE_INDEX_REFRESH_SECONDS', 300)))
+        self._ids: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        self._by_email: Dict[str, str] = {}
+        self._by_phone: Dict[str, str] = {}
+        self._warmed_at: Optional[float] = None
+        # Candidates registered while a warm() reads the table, re-applied after it swaps the index in
+        self._registered_during_warm: Optional[Dict[str, Tuple[Any, Any]]] = None
+        self._lock = threading.RLock()
+        self._warm_lock = threading.Lock()
+        self._warm_thread: Optional[threading.Thread] = None
+        self._stats = {"resolved": 0, "merged": 0, "created": 0, "warm_loads": 0}
+
+    # ==================== Public API ====================
+
+    def warm(self, client) -> int:
+        """Loads every candidate (id, email, phone) from Supabase, page by page. Returns the count."""
+        rows: List[Dict[str, Any]] = []
+        start = 0
+        with self._lock:
+            self._registered_during_warm = {}
+        try:
+            while True:
+                page = (client.table('candidates')
+                        .select('candidate_id,email,phone')
+                        .range(start, start + self.page_size - 1)
+                        .execute()).data or []
+                rows.extend(page)
+                if len(page) < self.page_size:
+                    break
+                start += self.page_size
+        except Exception:
+            # Retry after the refresh interval rather than on every save
+            with self._lock:
+                self._warmed_at = time.monotonic()
+                self._registered_during_warm = None
+            raise
+
+        with self._lock:
+            registered = self._registered_during_warm or {}
+            self._registered_during_warm = None
+            self._ids.clear()
+            self._by_email.clear()
+            self._by_phone.clear()
+            for row in rows:
+                self._add_locked(row.get('candidate_id'), row.get('email'), row.get('phone'))
+            for candidate_id, (email, phone) in registered.items():
+                self._add_locked(candidate_id, email, phone)
+            self._warmed_at = time.monotonic()
+            self._stats["warm_loads"] += 1
+        logger.info(f"Candidate index warmed with {len(self._ids)} candidates")
+        return len(self._ids)
+
+    def needs_warm(self) -> bool:
+        with self._lock:
+            return self._warmed_at is None or time.monotonic() - self._warmed_at > self.refresh_seconds
+
+    def ensure_warm(self, client) -> None:
+        """
+        Warms the index on first use (concurrent first callers wait for one
+        load) and re-warms a stale index on a background thread, so the
+        caller resolves against the current index instead of waiting for a
+        full table scan. Warm failures are logged, not raised.
+        """
+        if not self.needs_warm():
+            return
+        with self._lock:
+            warmed = self._warmed_at is not None
+        if not warmed:
+            with self._warm_lock:
+                if self._warmed_at is None:
+                    self._warm_logged(client)
+            return
+        if not self._warm_lock.acquire(blocking=False):
+            return  # a refresh is already running
+        if not self.needs_warm():
+            self._warm_lock.release()
+            return
+        self._warm_thread = threading.Thread(target=self._background_warm, args=(client,),
+                                             name="candidate-index-warm", daemon=True)
+        self._warm_thread.start()
+
+    def resolve(self, candidate_id: str, summary: Dict[str, Any]) -> str:
+        """
+        Returns the id the analysis belongs to. An email match wins over a
+        phone match, which wins over the proposed id. A proposed id already
+        taken by a different person (e.g. two people uploading "CV.pdf") gets
+        a suffix derived from the new person's email/phone.
+        """
+        email = normalize_email(summary.get('email'))
+        phone = normalize_phone(summary.get('phone'))
+        with self._lock:
+            self._stats["resolved"] += 1
+            existing = (email and self._by_email.get(email)) or (phone and self._by_phone.get(phone))
+            if existing:
+                if existing != candidate_id:
+                    self._stats["merged"] += 1
+                return existing
+
+            known = self._ids.get(candidate_id)
+            if known is not None and any(known) and (email or phone):
+                # Taken by someone with a different identity
+                identity = email or phone
+                return f"{candidate_id}_{hashlib.sha1(identity.encode('utf-8')).hexdigest()[:8]}"
+            return candidate_id
+
+    def register(self, candidate_id: str, email: Any = None, phone: Any = None) -> bool:
+        """
+        Records a candidate. Returns True when it was not known yet (the
+        caller creates it and calls `discard()` if that fails), False when
+        it was, in which case missing contact details are attached.
+        """
+        with self._lock:
+            is_new = candidate_id not in self._ids
+            self._add_locked(candidate_id, email, phone)
+            if self._registered_during_warm is not None:
+                self._registered_during_warm[candidate_id] = self._ids[candidate_id]
+            if is_new:
+                self._stats["created"] += 1
+            return is_new
+
+    def discard(self, candidate_id: str) -> None:
+        """Forgets a candidate whose insert failed."""
+        with self._lock:
+            if self._registered_during_warm is not None:
+                self._registered_during_warm.pop(candidate_id, None)
+            email, phone = self._ids.pop(candidate_id, (None, None))
+            if email and self._by_email.get(email) == candidate_id:
+                del self._by_email[email]
+            if phone and self._by_phone.get(phone) == candidate_id:
+                del self._by_phone[phone]
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self._stats,
+                "candidates": len(self._ids),
+                "emails": len(self._by_email),
+                "phones": len(self._by_phone),
+                "warmed": self._warmed_at is not None
+            }
+
+    # ==================== Private Helper Methods ====================
+
+    def _warm_logged(self, client) -> None:
+        try:
+            self.warm(client)
+        except Exception as e:
+            logger.warning(f"Failed to warm candidate index: {e}")
+
+    def _background_warm(self, client) -> None:
+        try:
+            self._warm_logged(client)
+        finally:
+            self._warm_lock.release()
+
+    def _add_locked(self, candidate_id: Optional[str], email: Any, phone: Any) -> None:
+        if not candidate_id:
+            return
+        email = normalize_email(email)
+        phone = normalize_phone(phone)
+        old_email, old_phone = self._ids.get(candidate_id, (None, None))
+        self._ids[candidate_id] = (email or old_email, phone or old_phone)
+        # First candidate seen for an email/phone keeps it
+        if email:
+            self._by_email.setdefault(email, candidate_id)
+        if phone:
+            self._by_phone.setdefault(phone, candidate_id)
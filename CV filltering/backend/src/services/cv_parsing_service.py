@@ -1,16 +1,42 @@
 # backend/src/services/cv_parsing_service.py
 import os
-import google.generativeai as genai
-import PyPDF2
-import docx
+import io
 import json
+import hashlib
 import logging
+import zipfile
+from .service_registry import lazy_import
+from .pdf_text_extractor import PdfTextExtractor
+from .docx_text_extractor import DocxTextExtractor
+from .gemini_governor import get_gemini_governor, GeminiThrottledError
+from .rule_based_extractor import RuleBasedCvExtractor
+from .cv_section_segmenter import get_section_segmenter
+from .stage_timing import stage, timed
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Imported on first use: the Gemini SDK alone dominates backend cold start
+genai = lazy_import('google.generativeai')
+
+GEMINI_PROMPT_TEMPLATE = """
+        Extract the following information from the CV text below.
+        Return the information as a JSON object with the specified keys.
+        - "personalInfo": {{ "name": "...", "email": "...", "phone": "..." }}
+        - "education": [ {{ "degree": "...", "institution": "...", "year": "..." }} ]
+        - "experience": [ {{ "title": "...", "company": "...", "duration": "..." }} ]
+        - "skills": [ "...", "..." ]
+
+        CV Text:
+        {text}
+        """
+
 class CvParsingService:
+    # Bump when parsing logic changes in a way that invalidates cached results.
+    # The prompt template is hashed into parser_version() automatically.
+    PARSER_VERSION = "5"
+
     def __init__(self):
         self.gemini_api_key = os.getenv("GEMINI_API_KEY")
         if self.gemini_api_key:
@@ -19,13 +45,37 @@ class CvParsingService:
         else:
             self.model = None
             logger.warning("GEMINI_API_KEY not found. Falling back to rule-based parsing.")
+        self.pdf_extractor = PdfTextExtractor()
+        self.docx_extractor = DocxTextExtractor()
+        self.governor = get_gemini_governor()
+        self.rule_extractor = RuleBasedCvExtractor()
+        self.segmenter = get_section_segmenter()
+
+    def parser_version(self):
+        """Identifies the parser configuration that produced a result, for cache keys."""
+        prompt_hash = hashlib.sha256(GEMINI_PROMPT_TEMPLATE.encode("utf-8")).hexdigest()[:12]
+        mode = "gemini" if self.model else "rules"
+        return f"{self.PARSER_VERSION}:{mode}:{prompt_hash}"
 
-    def parse_cv(self, file_path):
+    def parse_cv(self, source):
+        """
+        Parses a CV from a file path, raw bytes or a binary file-like object
+        (BytesIO, SpooledTemporaryFile, upload stream). The format is detected
+        from magic bytes, so in-memory uploads never need a filename or a
+        temporary file.
+        """
         try:
-            text = self._extract_text(file_path)
+            with stage("cv.extract_text"):
+                text = self._extract_text(source)
+            if not text.strip():
+                # Nothing for Gemini to read (e.g. a scan OCR could not recover)
+                return self._parse_with_rules(text, ai_used=False, warning="NO_TEXT_EXTRACTED")
             if self.model:
                 try:
                     return self._parse_with_gemini(text)
+                except GeminiThrottledError as e:
+                    logger.warning(f"Gemini quota exhausted: {e}. Falling back to rule-based parsing.")
+                    return self._parse_with_rules(text, ai_used=False, warning="AI_RATE_LIMITED")
                 except Exception as e:
                     logger.error(f"Gemini parsing failed: {e}. Falling back to rule-based parsing.")
                     return self._parse_with_rules(text, ai_used=False, warning="AI_PARSING_FAILED")
@@ -35,68 +85,103 @@ class CvParsingService:
             logger.error(f"Failed to parse CV: {e}")
             raise
 
-    def _extract_text(self, file_path):
-        if file_path.endswith(".pdf"):
-            return self._extract_text_from_pdf(file_path)
-        elif file_path.endswith(".docx"):
-            return self._extract_text_from_docx(file_path)
+    def _extract_text(self, source):
+        if isinstance(source, (bytes, bytearray)):
+            source = io.BytesIO(source)
+        file_format = self._detect_format(source)
+        if file_format == "pdf":
+            return self._extract_text_from_pdf(source)
+        elif file_format == "docx":
+            return self._extract_text_from_docx(source)
         else:
             raise ValueError("Unsupported file format")
 
-    def _extract_text_from_pdf(self, file_path):
-        with open(file_path, "rb") as f:
-            reader = PyPDF2.PdfReader(f)
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text()
-        return text
+    def _detect_format(self, source):
+        """Returns "pdf", "docx" or None based on the file's magic bytes."""
+        if isinstance(source, str):
+            with open(source, "rb") as f:
+                head = f.read(1024)
+        else:
+            source.seek(0)
+            head = source.read(1024)
+            source.seek(0)
 
-    def _extract_text_from_docx(self, file_path):
-        doc = docx.Document(file_path)
-        text = ""
-        for para in doc.paragraphs:
-            text += para.text + "\n"
-        return text
+        # PDF readers accept the header anywhere in the first 1024 bytes
+        if b"%PDF-" in head:
+            return "pdf"
+        if head.startswith(b"PK\x03\x04"):
+            try:
+                # ZipFile leaves caller-provided streams open
+                with zipfile.ZipFile(source) as archive:
+                    is_docx = "word/document.xml" in archive.namelist()
+            except zipfile.BadZipFile:
+                is_docx = False
+            finally:
+                if not isinstance(source, str):
+                    source.seek(0)
+            if is_docx:
+                return "docx"
+        return None
 
-    def _parse_with_gemini(self, text):
-        prompt = f"""
-        Extract the following information from the CV text below.
-        Return the information as a JSON object with the specified keys.
-        - "personalInfo": {{ "name": "...", "email": "...", "phone": "..." }}
-        - "education": [ {{ "degree": "...", "institution": "...", "year": "..." }} ]
-        - "experience": [ {{ "title": "...", "company": "...", "duration": "..." }} ]
-        - "skills": [ "...", "..." ]
+    def _extract_text_from_pdf(self, source):
+        extraction = self.pdf_extractor.extract(source)
+        slowest = max(extraction["page_timings"], key=lambda p: p["elapsed_ms"], default=None)
+        logger.info(
+            f"Extracted {extraction['pages_processed']}/{extraction['page_count']} PDF pages "
+            f"in {extraction['elapsed_ms']} ms (parallel={extraction['parallel']}, "
+            f"truncated={extraction['truncated_reason']}, "
+            f"slowest_page={slowest['page'] if slowest else None})"
+        )
+        ocr = extraction.get("ocr")
+        if ocr:
+            logger.info(
+                f"OCR'd scanned PDF pages {ocr['pages']} in {ocr['elapsed_ms']} ms "
+                f"(skipped={ocr['skipped']}, errors={ocr['errors']})"
+            )
+        return extraction["text"]
 
-        CV Text:
-        {text}
-        """
-        response = self.model.generate_content(prompt)
-        # Clean the response to get a valid JSON
-        cleaned_response = response.text.strip().replace("```json", "").replace("```", "")
-        parsed_data = json.loads(cleaned_response)
-        parsed_data["source"] = {"type": "gemini", "aiUsed": True}
+    def _extract_text_from_docx(self, source):
+        extraction = self.docx_extractor.extract(source)
+        logger.info(
+            f"Extracted DOCX text in {extraction['elapsed_ms']} ms "
+            f"(paragraphs={extraction['paragraph_count']}, tables={extraction['table_count']}, "
+            f"textboxes={extraction['textbox_count']}, truncated={extraction['truncated']})"
+        )
+        return extraction["text"]
+
+    def _parse_with_gemini(self, text):
+        # Only the sections the prompt asks about, normalised and within the token budget
+        with stage("cv.segment"):
+            prompt_input = self.segmenter.build_prompt_text(text)
+        logger.info(
+            f"Gemini prompt: {prompt_input['prompt_tokens']}/{prompt_input['original_tokens']} est. tokens "
+            f"(saved {prompt_input['tokens_saved']}, sections={prompt_input['sections']}, "
+            f"dropped={prompt_input['dropped_sections']}, truncated={prompt_input['truncated']})"
+        )
+        prompt = GEMINI_PROMPT_TEMPLATE.format(text=prompt_input["text"])
+        with stage("cv.gemini"):
+            response = self.governor.generate_content(self.model, prompt)
+        with stage("cv.json_parse"):
+            # Clean the response to get a valid JSON
+            cleaned_response = response.text.strip().replace("```json", "").replace("```", "")
+            parsed_data = json.loads(cleaned_response)
+        parsed_data["source"] = {
+            "type": "gemini",
+            "aiUsed": True,
+            "prompt": {
+                "originalTokens": prompt_input["original_tokens"],
+                "promptTokens": prompt_input["prompt_tokens"],
+                "tokensSaved": prompt_input["tokens_saved"],
+                "sections": prompt_input["sections"],
+                "truncated": prompt_input["truncated"]
+            }
+        }
         return parsed_data
 
+    @timed("cv.rules")
     def _parse_with_rules(self, text, ai_used=False, warning=None):
-        # Simple rule-based fallback (can be improved)
-        data = {
-            "personalInfo": {
-                "name": "N/A",
-                "email": "N/A",
-                "phone": "N/A"
-            },
-            "education": [],
-            "experience": [],
-            "skills": [],
-            "source": {"type": "rule-based", "aiUsed": ai_used}
-        }
+        data = self.rule_extractor.extract(text)
+        data["source"] = {"type": "rule-based", "aiUsed": ai_used}
         if warning:
             data["source"]["warning"] = warning
-        
-        # Example rule: find email
-        import re
-        email_match = re.search(r'[\w\.-]+@[\w\.-]+', text)
-        if email_match:
-            data["personalInfo"]["email"] = email_match.group(0)
-
         return data
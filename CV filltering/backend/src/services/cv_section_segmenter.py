@@ -0,0 +1,268 @@
+# backend/src/services/cv_section_segmenter.py
+"""
+CV section segmenter.
+
+Splits extracted CV text into sections by their English or Vietnamese
+headings (Experience / Kinh nghiệm, Education / Học vấn, ...), normalises
+whitespace, drops repeated page headers/footers and sections the parser does
+not need (references, hobbies, declarations), and packs what is left into a
+token budget for the Gemini prompt. Token counts are estimates (~4 chars per
+token); per-request and cumulative savings are recorded.
+"""
+
+import os
+import re
+import math
+import logging
+import threading
+from collections import Counter
+from typing import Dict, Any, List, Optional, Tuple
+
+from .skill_matcher import fold_text
+
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+CHARS_PER_TOKEN = 4
+
+# Headings are matched on folded text (lowercase, no diacritics)
+SECTION_HEADINGS: Dict[str, List[str]] = {
+    "contact": [
+        "contact", "contact information", "contact info", "contact details", "personal information",
+        "personal details", "personal info", "thong tin lien he", "lien he", "thong tin ca nhan"
+    ],
+    "summary": [
+        "summary", "professional summary", "profile", "about me", "objective", "career objective",
+        "muc tieu", "muc tieu nghe nghiep", "gioi thieu", "gioi thieu ban than", "tom tat"
+    ],
+    "experience": [
+        "experience", "work experience", "professional experience", "employment", "employment history",
+        "work history", "career history", "kinh nghiem", "kinh nghiem lam viec", "qua trinh cong tac",
+        "qua trinh lam viec"
+    ],
+    "education": [
+        "education", "academic background", "education and training", "qualifications", "hoc van",
+        "trinh do hoc van", "qua trinh hoc tap", "dao tao", "trinh do chuyen mon"
+    ],
+    "skills": [
+        "skills", "technical skills", "key skills", "core competencies", "competencies", "skills summary",
+        "ky nang", "ky nang chuyen mon", "ky nang mem", "chuyen mon"
+    ],
+    "projects": ["projects", "personal projects", "key projects", "du an", "du an tieu bieu", "cac du an"],
+    "certifications": [
+        "certifications", "certificates", "licenses", "licenses and certifications", "chung chi", "chung nhan"
+    ],
+    "languages": ["languages", "language skills", "ngoai ngu", "ngon ngu"],
+    "awards": ["awards", "honors", "achievements", "honors and awards", "giai thuong", "thanh tich"],
+    "activities": [
+        "activities", "extracurricular activities", "volunteer", "volunteering", "hoat dong",
+        "hoat dong ngoai khoa", "hoat dong xa hoi"
+    ],
+    "interests": ["interests", "hobbies", "hobbies and interests", "so thich"],
+    "references": ["references", "referees", "nguoi tham chieu", "nguoi gioi thieu", "tham khao"],
+    "declaration": ["declaration", "loi cam doan", "cam ket"],
+}
+
+# Packing order under the token budget; sections not listed are never sent
+RELEVANT_SECTIONS = [
+    "header", "contact", "experience", "education", "skills",
+    "languages", "certifications", "projects", "summary", "awards"
+]
+
+_HEADING_PATTERN = re.compile(
+    r'^(?:\d{1,2}[.)]\s*|[ivx]{1,4}[.)]\s+|[-•*#>▪●■◆]+\s*)?'
+    r'(?P<heading>' + '|'.join(sorted(
+        (re.escape(h) for headings in SECTION_HEADINGS.values() for h in headings), key=len, reverse=True
+    )) + r')\s*(?:(?P<sep>[:：\-–|])\s*(?P<rest>.*))?$'
+)
+_HEADING_SECTION = {h: section for section, headings in SECTION_HEADINGS.items() for h in headings}
+_PAGE_MARKER_PATTERN = re.compile(r'^(?:page|trang)\s*\d+(?:\s*(?:/|of|trên)\s*\d+)?$|^\d+\s*/\s*\d+$', re.IGNORECASE)
+_SPACES_PATTERN = re.compile(r'[ \t ​　]+')
+
+MAX_HEADING_WORDS = 6
+REPEATED_LINE_MIN_COUNT = 3
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count (no tokenizer round-trip)."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN) if text else 0
+
+
+class CvSectionSegmenter:
+    """Builds compact, section-filtered CV text for LLM prompts."""
+
+    def __init__(self, token_budget: Optional[int] = None):
+        self.token_budget = token_budget if token_budget is not None else int(os.getenv('GEMINI_PROMPT_TOKEN_BUDGET', 3000))
+        self._lock = threading.Lock()
+        self._totals = {
+            "requests": 0,
+            "original_tokens": 0,
+            "prompt_tokens": 0,
+            "tokens_saved": 0,
+            "truncated": 0
+        }
+
+    # ==================== Public API ====================
+
+    def segment(self, text: str) -> List[Tuple[str, str]]:
+        """
+        Returns (section, text) pairs in document order. Text before the first
+        heading is the "header" section (usually name and contact details).
+        Lines are whitespace-normalised; page markers and lines repeated on
+        every page are dropped.
+        """
+        lines = self._normalize_lines(text)
+        sections: List[Tuple[str, List[str]]] = [("header", [])]
+        for line in lines:
+            heading = self._match_heading(line)
+            if heading:
+                section, inline = heading
+                sections.append((section, [inline] if inline else []))
+            else:
+                sections[-1][1].append(line)
+        return [(name, "\n".join(body)) for name, body in sections if body]
+
+    def build_prompt_text(self, text: str) -> Dict[str, Any]:
+        """
+        Returns {"text", "sections", "dropped_sections", "original_tokens",
+        "prompt_tokens", "tokens_saved", "truncated"} and adds the numbers to
+        the cumulative stats.
+        """
+        original_tokens = estimate_tokens(text or "")
+        segments = self.segment(text or "")
+        found = {name for name, _ in segments}
+
+        if found <= {"header"}:
+            # No recognisable headings: send everything, only normalised and budgeted
+            selected = segments
+        else:
+            selected = [(name, body) for name, body in segments if name in RELEVANT_SECTIONS]
+        dropped = sorted(found - {name for name, _ in selected})
+
+        packed, truncated = self._pack(selected)
+        prompt_text = "\n\n".join(
+            body if name == "header" else f"{name.upper()}\n{body}" for name, body in packed
+        )
+        prompt_tokens = estimate_tokens(prompt_text)
+        result = {
+            "text": prompt_text,
+            "sections": [name for name, _ in packed],
+            "dropped_sections": dropped,
+            "original_tokens": original_tokens,
+            "prompt_tokens": prompt_tokens,
+            "tokens_saved": max(0, original_tokens - prompt_tokens),
+            "truncated": truncated
+        }
+        self._record(result)
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._totals)
+        stats["token_budget"] = self.token_budget
+        stats["saved_ratio"] = round(stats["tokens_saved"] / stats["original_tokens"], 3) if stats["original_tokens"] else 0.0
+        return stats
+
+    # ==================== Private Helper Methods ====================
+
+    def _normalize_lines(self, text: str) -> List[str]:
+        lines = []
+        for raw in text.splitlines():
+            line = _SPACES_PATTERN.sub(' ', raw).strip()
+            if line and not _PAGE_MARKER_PATTERN.match(line):
+                lines.append(line)
+
+        # Running headers/footers repeat on every page; keep only the first occurrence
+        counts = Counter(lines)
+        repeated = {line for line, count in counts.items() if count >= REPEATED_LINE_MIN_COUNT}
+        if not repeated:
+            return lines
+        seen = set()
+        kept = []
+        for line in lines:
+            if line in repeated:
+                if line in seen:
+                    continue
+                seen.add(line)
+            kept.append(line)
+        return kept
+
+    def _match_heading(self, line: str) -> Optional[Tuple[str, str]]:
+        """Returns (section, inline content) when `line` is a section heading."""
+        if len(line.split()) > MAX_HEADING_WORDS and ':' not in line:
+            return None
+        folded = fold_text(line)
+        match = _HEADING_PATTERN.match(folded)
+        if not match:
+            return None
+        rest = match.group('rest')
+        if rest and match.group('sep') not in (':', '：'):
+            return None
+        section = _HEADING_SECTION[match.group('heading')]
+        # Folding is length-preserving, so the inline content can be cut from the original line
+        inline = line[match.start('rest'):].strip() if rest else ""
+        return section, inline
+
+    def _pack(self, segments: List[Tuple[str, str]]) -> Tuple[List[Tuple[str, str]], bool]:
+        """Fills the budget in RELEVANT_SECTIONS priority order, then restores document order."""
+        budget = self.token_budget
+        if budget <= 0:
+            return segments, False
+
+        order = sorted(range(len(segments)), key=lambda i: (
+            RELEVANT_SECTIONS.index(segments[i][0]) if segments[i][0] in RELEVANT_SECTIONS else len(RELEVANT_SECTIONS), i
+        ))
+        kept: Dict[int, str] = {}
+        remaining = budget
+        truncated = False
+        for index in order:
+            name, body = segments[index]
+            # Heading line plus the blank separator
+            cost = estimate_tokens(body) + (0 if name == "header" else estimate_tokens(name) + 1)
+            if cost <= remaining:
+                kept[index] = body
+                remaining -= cost
+                continue
+            truncated = True
+            partial = self._truncate_lines(body, remaining * CHARS_PER_TOKEN - len(name) - 2)
+            if partial:
+                kept[index] = partial
+                remaining -= estimate_tokens(partial) + estimate_tokens(name) + 1
+            if remaining <= 0:
+                break
+        return [(segments[i][0], kept[i]) for i in sorted(kept)], truncated
+
+    @staticmethod
+    def _truncate_lines(body: str, max_chars: int) -> str:
+        if max_chars <= 0:
+            return ""
+        lines = []
+        used = 0
+        for line in body.split("\n"):
+            if used + len(line) + 1 > max_chars:
+                break
+            lines.append(line)
+            used += len(line) + 1
+        return "\n".join(lines)
+
+    def _record(self, result: Dict[str, Any]) -> None:
+        with self._lock:
+            self._totals["requests"] += 1
+            self._totals["original_tokens"] += result["original_tokens"]
+            self._totals["prompt_tokens"] += result["prompt_tokens"]
+            self._totals["tokens_saved"] += result["tokens_saved"]
+            self._totals["truncated"] += int(result["truncated"])
+
+
+_segmenter = None
+_segmenter_lock = threading.Lock()
+
+
+def get_section_segmenter() -> CvSectionSegmenter:
+    """Process-wide segmenter so savings are accumulated across requests."""
+    global _segmenter
+    with _segmenter_lock:
+        if _segmenter is None:
+            _segmenter = CvSectionSegmenter()
+        return _segmenter
@@ -0,0 +1,279 @@
+# backend/src/services/cv_text_index.py
+"""
+BM25 index over parsed CVs, for ranking CVs against free-text job descriptions
+without an LLM call per pair.
+
+Documents are the text fields of a parsed CV (experience, education, summary,
+... with skills counted SKILL_BOOST times), folded with `fold_text` so
+Vietnamese with or without diacritics and English share one vocabulary.
+Posting lists are compact append-only `array`s (doc index, term frequency),
+so adding a CV is O(its length); a query converts the postings of the job
+description's terms to NumPy and scores them in a few vectorised passes.
+Re-adding a candidate tombstones their previous document. `ensure_loaded()`
+rebuilds from `cv_analyses` every CV_INDEX_REFRESH_SECONDS to pick up CVs
+saved by other worker processes.
+"""
+
+import os
+import re
+import time
+import logging
+import threading
+from array import array
+from collections import Counter
+from typing import Dict, Any, List, Optional, Iterable
+
+from .service_registry import lazy_import
+from .skill_matcher import fold_text
+
+np = lazy_import('numpy')
+
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# c++, c#, node.js, asp.net stay single tokens
+TOKEN_PATTERN = re.compile(r'[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*')
+
+# English and Vietnamese function words, matched before folding: with the
+# diacritics gone "có" (has) would also drop "cơ" in "cơ khí", "đã" the "Đà"
+# in "Đà Nẵng" and "từ" the "tư" in "tư vấn"
+STOPWORDS = frozenset("""
+a an and are as at be by for from has have in is it of on or that the this to was were will with
+we you your our their they i my me us etc
+và của các những là có với trong cho để được một người tại về từ theo này đó cũng như đến hoặc
+sẽ đã đang thì mà nếu vào ra rất nhiều
+""".split())
+
+# Parsed-CV keys that are metadata, not CV content
+SKIPPED_KEYS = frozenset({"source", "email", "phone", "filename", "file_name"})
+
+# Skills weigh like this many mentions in the body text
+SKILL_BOOST = 2
+
+
+def tokenize(text: str) -> List[str]:
+    """Case/diacritic-folded word tokens without stopwords."""
+    text = text or ''
+    # fold_text preserves length, so each token's span is the word as written
+    return [match.group() for match in TOKEN_PATTERN.finditer(fold_text(text))
+            if text[match.start():match.end()].lower() not in STOPWORDS]
+
+
+def document_text(parsed_cv: Dict[str, Any]) -> str:
+    """Flattens the text of a parsed CV (all string fields but metadata), skills boosted."""
+    parts: List[str] = []
+
+    def walk(value):
+        if isinstance(value, str):
+            parts.append(value)
+        elif isinstance(value, dict):
+            for key, item in value.items():
+                if key not in SKIPPED_KEYS:
+                    walk(item)
+        elif isinstance(value, (list, tuple)):
+            for item in value:
+                walk(item)
+
+    walk(parsed_cv or {})
+    skills = [s for s in (parsed_cv or {}).get("skills") or [] if isinstance(s, str)]
+    parts.extend(skills * (SKILL_BOOST - 1))
+    return '\n'.join(parts)
+
+
+class CvTextIndex:
+    """Incremental BM25 index of candidate CVs."""
+
+    def __init__(self, k1: Optional[float] = None, b: Optional[float] = None,
+                 refresh_seconds: Optional[float] = None):
+        self.k1 = k1 if k1 is not None else float(os.getenv('CV_INDEX_BM25_K1', 1.2))
+        self.b = b if b is not None else float(os.getenv('CV_INDEX_BM25_B', 0.75))
+        self.refresh_seconds = (refresh_seconds if refresh_seconds is not None
+                                else float(os.getenv('CV_INDEX_REFRESH_SECONDS', 300)))
+        self._reset()
+        self._loaded_at = 0.0
+        self._lock = threading.RLock()
+        self._load_lock = threading.Lock()
+
+    # ==================== Public API ====================
+
+    def add(self, candidate_id: str, parsed_cv: Dict[str, Any]) -> bool:
+        """Indexes a candidate's latest parsed CV, replacing the previous one. False if it has no text."""
+        if not candidate_id:
+            return False
+        counts = Counter(tokenize(document_text(parsed_cv)))
+        with self._lock:
+            previous = self._doc_of.pop(candidate_id, None)
+            if previous is not None:
+                self._alive[previous] = 0
+                self._version += 1
+                self._live_length -= self._lengths[previous]
+            if not counts:
+                return False
+
+            doc = len(self._candidate_ids)
+            length = sum(counts.values())
+            self._candidate_ids.append(candidate_id)
+            self._lengths.append(length)
+            self._alive.append(1)
+            self._version += 1
+            self._doc_of[candidate_id] = doc
+            self._live_length += length
+            for term, tf in counts.items():
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = self._postings[term] = (array('i'), array('f'))
+                postings[0].append(doc)
+                postings[1].append(tf)
+            return True
+
+    def rebuild(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """Replaces the index with `cv_analyses` rows ({candidate_id, raw_response}) read oldest first."""
+        fresh = CvTextIndex(self.k1, self.b)
+        for row in rows:
+            fresh.add(row.get('candidate_id'), row.get('raw_response') or {})
+        with self._lock:
+            self._postings = fresh._postings
+            self._candidate_ids = fresh._candidate_ids
+            self._lengths = fresh._lengths
+            self._alive = fresh._alive
+            self._doc_of = fresh._doc_of
+            self._live_length = fresh._live_length
+            self._version = fresh._version
+            self._arrays = None
+            self._posting_cache = {}
+            self._built_at = time.time()
+            self._loaded_at = time.monotonic()
+        logger.info(f"CV text index rebuilt: {len(self._doc_of)} CVs, {len(self._postings)} terms")
+        return len(self._doc_of)
+
+    def load(self, db_service) -> int:
+        """Rebuilds the index from the `cv_analyses` table."""
+        return self.rebuild(db_service.fetch_rows('cv_analyses', 'candidate_id,raw_response', order_by='created_at'))
+
+    def is_built(self) -> bool:
+        return self._built_at is not None
+
+    def is_stale(self) -> bool:
+        """Never built, or loaded more than refresh_seconds ago (0 disables the refresh)."""
+        if self._built_at is None:
+            return True
+        return self.refresh_seconds > 0 and time.monotonic() - self._loaded_at > self.refresh_seconds
+
+    def ensure_loaded(self, db_service) -> bool:
+        """
+        Loads the index on first use and reloads it once stale. Concurrent first
+        callers wait for a single build; during a refresh they keep querying the
+        current index, which a failed refresh leaves in place until the next
+        interval. True if this call (re)loaded the index.
+        """
+        if not self.is_stale():
+            return False
+        if not self._load_lock.acquire(blocking=not self.is_built()):
+            return False
+        try:
+            if not self.is_stale():
+                return False
+            try:
+                self.load(db_service)
+            except Exception as e:
+                if not self.is_built():
+                    raise
+                self._loaded_at = time.monotonic()
+                logger.warning(f"CV text index refresh failed, keeping the current index: {e}")
+                return False
+            return True
+        finally:
+            self._load_lock.release()
+
+    def top_n(self, description: str, n: int = 20) -> Dict[str, Any]:
+        """The n CVs scoring highest under BM25 for a job description."""
+        started = time.perf_counter()
+        query = Counter(tokenize(description))
+        with self._lock:
+            live = len(self._doc_of)
+            total = len(self._candidate_ids)
+            matched_terms = [term for term in query if term in self._postings]
+            if not live or not matched_terms:
+                return self._result([], query, matched_terms, started)
+
+            lengths, alive = self._document_arrays()
+            avg_length = self._live_length / live
+            norm = self.k1 * (1 - self.b + self.b * lengths / avg_length)
+            scores = np.zeros(total, dtype=np.float64)
+            for term in matched_terms:
+                docs, tfs = self._posting_arrays(term)
+                frequency = int(alive[docs].sum()) if total != live else len(docs)
+                idf = np.log(1 + (live - frequency + 0.5) / (frequency + 0.5))
+                # Each document appears once per posting list, so fancy-index += is exact
+                scores[docs] += query[term] * idf * tfs * (self.k1 + 1) / (tfs + norm[docs])
+            scores[~alive] = 0
+
+            hits = np.flatnonzero(scores)
+            if len(hits) > n:
+                hits = hits[np.argpartition(-scores[hits], n - 1)[:n]]
+            hits = hits[np.lexsort((hits, -scores[hits]))]
+            ranked = [{"rank": rank, "candidate_id": self._candidate_ids[doc], "score": round(float(scores[doc]), 4)}
+                      for rank, doc in enumerate(hits, start=1)]
+        return self._result(ranked, query, matched_terms, started)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "documents": len(self._doc_of),
+                "tombstoned": len(self._candidate_ids) - len(self._doc_of),
+                "terms": len(self._postings),
+                "built_at": self._built_at
+            }
+
+    # ==================== Private Helper Methods ====================
+
+    def _reset(self) -> None:
+        self._postings: Dict[str, tuple] = {}
+        self._candidate_ids: List[str] = []
+        self._lengths = array('i')
+        self._alive = array('b')
+        self._doc_of: Dict[str, int] = {}
+        self._live_length = 0
+        self._built_at: Optional[float] = None
+        # NumPy copies (not frombuffer views, which would block appends) reused
+        # until the arrays change: documents by version, postings by length
+        self._version = 0
+        self._arrays: Optional[tuple] = None
+        self._posting_cache: Dict[str, tuple] = {}
+
+    def _document_arrays(self):
+        if self._arrays is None or self._arrays[0] != self._version:
+            self._arrays = (self._version, np.array(self._lengths, dtype=np.float64),
+                            np.array(self._alive, dtype=np.bool_))
+        return self._arrays[1], self._arrays[2]
+
+    def _posting_arrays(self, term: str):
+        docs_buf, tf_buf = self._postings[term]
+        cached = self._posting_cache.get(term)
+        if cached is None or cached[0] != len(docs_buf):
+            cached = (len(docs_buf), np.array(docs_buf, dtype=np.intp), np.array(tf_buf, dtype=np.float64))
+            self._posting_cache[term] = cached
+        return cached[1], cached[2]
+
+    def _result(self, ranked, query, matched_terms, started) -> Dict[str, Any]:
+        return {
+            "matches": ranked,
+            "query_terms": len(query),
+            "matched_terms": len(matched_terms),
+            "indexed_cvs": len(self._doc_of),
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 3)
+        }
+
+
+_cv_text_index = None
+_cv_text_index_lock = threading.Lock()
+
+
+def get_cv_text_index() -> CvTextIndex:
+    """Process-wide CV text index."""
+    global _cv_text_index
+    with _cv_text_index_lock:
+        if _cv_text_index is None:
+            _cv_text_index = CvTextIndex()
+        return _cv_text_index
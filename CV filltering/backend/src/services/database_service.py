@@ -1,8 +1,19 @@
 # backend/src/services/database_service.py
 import os
 import logging
-from supabase import create_client, Client
 from typing import Dict, Any, List, Optional
+from .service_registry import lazy_import
+from .stage_timing import stage, timed
+from .candidate_resolver import CandidateResolver
+from .skill_index import get_skill_index
+from .cv_text_index import get_cv_text_index
+
+# The Supabase SDK is slow to import and unused in stub mode
+supabase = lazy_import('supabase')
+
+
+def create_client(url: str, key: str):
+    return supabase.create_client(url, key)
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -19,9 +30,10 @@ class DatabaseService:
         if cls._instance is None:
             cls._instance = super(DatabaseService, cls).__new__(cls)
             cls._instance.client = cls._instance._get_client()
+            cls._instance.resolver = CandidateResolver()
         return cls._instance
 
-    def _get_client(self) -> Optional[Client]:
+    def _get_client(self) -> Optional["supabase.Client"]:
         """Initializes the Supabase client if credentials are available."""
         url = os.environ.get("SUPABASE_URL")
         key = os.environ.get("SUPABASE_KEY")
@@ -41,6 +53,7 @@ class DatabaseService:
         """Check if the service is running in stub mode."""
         return self.client is None
 
+    @timed("db.save_analysis")
     def save_analysis(self, candidate_id: str, source_type: str, raw_data: Dict[str, Any], summary: Dict[str, Any]) -> Dict[str, Any]:
         """
         Saves analysis results to appropriate tables based on source_type.
@@ -59,8 +72,12 @@ class DatabaseService:
             return {"success": True, "stub": True, "message": log_message}
 
         try:
-            # 1. Ensure candidate exists
-            self._ensure_candidate_exists(candidate_id, summary)
+            # 1. Resolve the candidate (same email/phone -> same candidate) and create it if new
+            with stage("db.candidate"):
+                candidate_id = self._resolve_candidate_id(candidate_id, summary)
+                candidate_row = self._ensure_candidate_exists(candidate_id, summary)
+                if candidate_row:
+                    self._insert_candidates([candidate_row])
             
             # 2. Save to screening_results (backward compatibility)
             screening_data = {
@@ -70,18 +87,21 @@ class DatabaseService:
                 "summary": summary,
                 "processed_by": "backend-v1"
             }
-            self.client.table('screening_results').insert(screening_data).execute()
+            with stage("db.screening_results"):
+                self.client.table('screening_results').insert(screening_data).execute()
             
             # 3. Save to specific table based on source_type
-            if source_type == "cv_parsing":
-                self._save_cv_analysis(candidate_id, raw_data, summary)
-            elif source_type == "numerology":
-                self._save_numerology_data(candidate_id, raw_data, summary)
-            elif source_type.startswith("disc_"):
-                self._save_disc_assessment(candidate_id, raw_data, summary)
+            with stage("db.specific_table"):
+                if source_type == "cv_parsing":
+                    self._save_cv_analysis(candidate_id, raw_data, summary)
+                elif source_type == "numerology":
+                    self._save_numerology_data(candidate_id, raw_data, summary)
+                elif source_type.startswith("disc_"):
+                    self._save_disc_assessment(candidate_id, raw_data, summary)
             
             # 4. Log activity
-            self._log_activity(candidate_id, source_type, "analysis_saved")
+            with stage("db.activity_log"):
+                self._log_activity(candidate_id, source_type, "analysis_saved")
             
             logger.info(f"Successfully saved {source_type} analysis for candidate '{candidate_id}'")
             return {"success": True, "stub": False, "candidate_id": candidate_id}
@@ -89,16 +109,24 @@ class DatabaseService:
             logger.error(f"Failed to save analysis for candidate '{candidate_id}': {e}")
             return {"success": False, "error": str(e)}
 
+    @timed("db.save_analyses_batch")
     def save_analyses_batch(self, analyses: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Saves multiple analysis results in a single batch operation.
-        More efficient than calling save_analysis() multiple times.
+        More efficient than calling save_analysis() multiple times: rows are
+        validated per analysis, then each target table receives one insert.
+        Tables are written in dependency order (candidates, the source-specific
+        table, screening_results) and an analysis only moves on to the next
+        table once its row persisted. A table whose batch insert fails is
+        retried row by row, so one bad row does not fail the others.
 
         Args:
             analyses: List of dicts with keys: candidate_id, source_type, raw_data, summary
 
         Returns:
-            Dict with success status and count of saved records
+            Dict with success status, count of fully saved analyses, `errors`
+            for the others and `results`: per analysis (in input order) its
+            candidate_id, success, error and the `tables` its rows persisted in
         """
         if not analyses:
             return {"success": True, "stub": self.is_stub(), "count": 0, "message": "No analyses to save"}
@@ -108,126 +136,82 @@ class DatabaseService:
             return {"success": True, "stub": True, "count": len(analyses)}
 
         try:
-            saved_count = 0
-            errors = []
-
-            # Prepare batch data for screening_results
-            screening_batch = []
+            results = []
+            # Per analysis: (index in results, specific table, row, screening row)
+            pending = []
+            candidate_batch = []
             for analysis in analyses:
                 candidate_id = analysis.get("candidate_id")
                 source_type = analysis.get("source_type")
                 raw_data = analysis.get("raw_data", {})
                 summary = analysis.get("summary", {})
+                result = {"candidate_id": candidate_id, "success": False, "error": None, "tables": []}
+                results.append(result)
 
                 try:
-                    # Ensure candidate exists
-                    self._ensure_candidate_exists(candidate_id, summary)
+                    # Resolve the candidate; new ones are created in one insert below
+                    candidate_id = self._resolve_candidate_id(candidate_id, summary)
+                    result["candidate_id"] = candidate_id
 
-                    # Prepare screening_results data
-                    screening_batch.append({
+                    # Build the row for the source-specific table (validates raw_data)
+                    table, row = self._specific_row(candidate_id, source_type, raw_data, summary)
+
+                    candidate_row = self._ensure_candidate_exists(candidate_id, summary)
+                    if candidate_row:
+                        candidate_batch.append(candidate_row)
+                    pending.append((result, table, row, {
                         "candidate_id": candidate_id,
                         "source_type": source_type,
                         "raw_data": raw_data,
                         "summary": summary,
                         "processed_by": "backend-v1"
-                    })
-
-                    # Save to specific table based on source_type
-                    if source_type == "cv_parsing":
-                        self._save_cv_analysis(candidate_id, raw_data, summary)
-                    elif source_type == "numerology":
-                        self._save_numerology_data(candidate_id, raw_data, summary)
-                    elif source_type.startswith("disc_"):
-                        self._save_disc_assessment(candidate_id, raw_data, summary)
-
-                    # Log activity
-                    self._log_activity(candidate_id, source_type, "analysis_saved_batch")
-
-                    saved_count += 1
+                    }))
                 except Exception as e:
                     logger.error(f"Error processing candidate {candidate_id} in batch: {e}")
-                    errors.append({"candidate_id": candidate_id, "error": str(e)})
-
-            # Batch insert to screening_results
-            if screening_batch:
-                self.client.table('screening_results').insert(screening_batch).execute()
-
-            logger.info(f"Batch saved {saved_count}/{len(analyses)} analyses")
-
-            return {
-                "success": True,
-                "stub": False,
-                "count": saved_count,
-                "total": len(analyses),
-                "errors": errors if errors else None
-            }
-        except Exception as e:
-            logger.error(f"Batch save failed: {e}")
-            return {"success": False, "error": str(e)}
-
-    def save_analyses_batch(self, analyses: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """
-        Saves multiple analysis results in a single batch operation.
-        More efficient than calling save_analysis() multiple times.
-
-        Args:
-            analyses: List of dicts with keys: candidate_id, source_type, raw_data, summary
-
-        Returns:
-            Dict with success status and count of saved records
-        """
-        if not analyses:
-            return {"success": True, "stub": self.is_stub(), "count": 0, "message": "No analyses to save"}
-
-        if self.is_stub():
-            logger.info(f"[STUB] Would batch save {len(analyses)} analyses to DB")
-            return {"success": True, "stub": True, "count": len(analyses)}
-
-        try:
-            saved_count = 0
-            errors = []
-
-            # Prepare batch data for screening_results
-            screening_batch = []
-            for analysis in analyses:
-                candidate_id = analysis.get("candidate_id")
-                source_type = analysis.get("source_type")
-                raw_data = analysis.get("raw_data", {})
-                summary = analysis.get("summary", {})
-
+                    result["error"] = str(e)
+
+            # Candidates first: the analysis tables reference them (nothing else is written if this fails)
+            if candidate_batch:
+                self._insert_candidates(candidate_batch)
+
+            # Source-specific rows, one insert per table
+            by_table: Dict[str, List[tuple]] = {}
+            for entry in pending:
+                if entry[1]:
+                    by_table.setdefault(entry[1], []).append(entry)
+            for table, entries in by_table.items():
+                for (result, _, row, _), error in zip(entries, self._insert_rows(table, [e[2] for e in entries])):
+                    if error:
+                        result["error"] = error
+                    else:
+                        result["tables"].append(table)
+                        if table == 'cv_analyses':
+                            get_skill_index().add(row["candidate_id"], row["skills"])
+                            get_cv_text_index().add(row["candidate_id"], row["raw_response"])
+
+            # screening_results only for analyses whose specific row persisted
+            pending = [entry for entry in pending if entry[0]["error"] is None]
+            screening_errors = self._insert_rows('screening_results', [entry[3] for entry in pending])
+            for (result, _, _, _), error in zip(pending, screening_errors):
+                if error:
+                    result["error"] = error
+                else:
+                    result["tables"].append('screening_results')
+                    result["success"] = True
+
+            # Log activity (non-critical)
+            activity_batch = [
+                self._activity_row(result["candidate_id"], entry.get("source_type"), "analysis_saved_batch")
+                for result, entry in zip(results, analyses) if result["success"]
+            ]
+            if activity_batch:
                 try:
-                    # Ensure candidate exists
-                    self._ensure_candidate_exists(candidate_id, summary)
-
-                    # Prepare screening_results data
-                    screening_batch.append({
-                        "candidate_id": candidate_id,
-                        "source_type": source_type,
-                        "raw_data": raw_data,
-                        "summary": summary,
-                        "processed_by": "backend-v1"
-                    })
-
-                    # Save to specific table based on source_type
-                    if source_type == "cv_parsing":
-                        self._save_cv_analysis(candidate_id, raw_data, summary)
-                    elif source_type == "numerology":
-                        self._save_numerology_data(candidate_id, raw_data, summary)
-                    elif source_type.startswith("disc_"):
-                        self._save_disc_assessment(candidate_id, raw_data, summary)
-
-                    # Log activity
-                    self._log_activity(candidate_id, source_type, "analysis_saved_batch")
-
-                    saved_count += 1
+                    self.client.table('activity_logs').insert(activity_batch).execute()
                 except Exception as e:
-                    logger.error(f"Error processing candidate {candidate_id} in batch: {e}")
-                    errors.append({"candidate_id": candidate_id, "error": str(e)})
-
-            # Batch insert to screening_results
-            if screening_batch:
-                self.client.table('screening_results').insert(screening_batch).execute()
+                    logger.warning(f"Failed to log batch activity: {e}")
 
+            saved_count = sum(result["success"] for result in results)
+            errors = [{"candidate_id": r["candidate_id"], "error": r["error"]} for r in results if not r["success"]]
             logger.info(f"Batch saved {saved_count}/{len(analyses)} analyses")
 
             return {
@@ -235,82 +219,13 @@ class DatabaseService:
                 "stub": False,
                 "count": saved_count,
                 "total": len(analyses),
-                "errors": errors if errors else None
+                "errors": errors if errors else None,
+                "results": results
             }
         except Exception as e:
             logger.error(f"Batch save failed: {e}")
             return {"success": False, "error": str(e)}
 
-    def save_analyses_batch(self, analyses: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """
-        Saves multiple analysis results in a single batch operation.
-        More efficient than calling save_analysis() multiple times.
-
-        Args:
-            analyses: List of dicts with keys: candidate_id, source_type, raw_data, summary
-
-        Returns:
-            Dict with success status and count of saved records
-        """
-        if not analyses:
-            return {"success": True, "stub": self.is_stub(), "count": 0, "message": "No analyses to save"}
-
-        if self.is_stub():
-            logger.info(f"[STUB] Would batch save {len(analyses)} analyses to DB")
-            return {"success": True, "stub": True, "count": len(analyses)}
-
-        try:
-            saved_count = 0
-            errors = []
-
-            # Prepare batch data for screening_results
-            screening_batch = []
-            for analysis in analyses:
-                candidate_id = analysis.get("candidate_id")
-                source_type = analysis.get("source_type")
-                raw_data = analysis.get("raw_data", {})
-                summary = analysis.get("summary", {})
-
-                try:
-                    # Ensure candidate exists
-                    self._ensure_candidate_exists(candidate_id, summary)
-
-                    # Prepare screening_results data
-                    screening_batch.append({
-                        "candidate_id": candidate_id,
-                        "source_type": source_type,
-                        "raw_data": raw_data,
-                        "summary": summary,
-                        "processed_by": "backend-v1"
-                    })
-
-                    # Save to specific table based on source_type
-                    if source_type == "cv_parsing":
-                        self._save_cv_analysis(candidate_id, raw_data, summary)
-                    elif source_type == "numerology":
-                        self._save_numerology_data(candidate_id, raw_data, summary)
-                    elif source_type.startswith("disc_"):
-                        self._save_disc_assessment(candidate_id, raw_data, summary)
-
-                    # Log activity
-                    self._log_activity(candidate_id, source_type, "analysis_saved_batch")
-
-                    saved_count += 1
-                except Exception as e:
-                    logger.error(f"Error processing candidate {candidate_id} in batch: {e}")
-                    errors.append({"candidate_id": candidate_id, "error": str(e)})
-
-            # Batch insert to screening_results
-            if screening_batch:
-                self.client.table('screening_results').insert(screening_batch).execute()
-
-            logger.info(f"Batch saved {saved_count}/{len(analyses)} analyses")
-
-            return {"success": True, "stub": False, "count": saved_count, "total": len(analyses), "errors": errors if errors else None}
-        except Exception as e:
-            logger.error(f"Batch save failed: {e}")
-            return {"success": False, "error": str(e)}
-
     def get_recent_analyses(self, limit: int = 20) -> Dict[str, Any]:
         """
         Retrieves the most recent analysis results.
@@ -335,57 +250,177 @@ class DatabaseService:
             logger.error(f"Failed to retrieve recent analyses: {e}")
             return {"success": False, "error": str(e)}
 
+    def fetch_rows(self, table: str, columns: str, order_by: Optional[str] = None, page_size: int = 1000) -> List[Dict[str, Any]]:
+        """
+        Reads every row of `table` (only `columns`), page by page.
+        In stub mode, returns an empty list.
+        """
+        if self.is_stub():
+            logger.info(f"[STUB] Would read {columns} from {table}")
+            return []
+
+        rows: List[Dict[str, Any]] = []
+        start = 0
+        while True:
+            query = self.client.table(table).select(columns)
+            if order_by:
+                query = query.order(order_by)
+            page = query.range(start, start + page_size - 1).execute().data or []
+            rows.extend(page)
+            if len(page) < page_size:
+                return rows
+            start += page_size
+
     # ==================== Private Helper Methods ====================
     
-    def _ensure_candidate_exists(self, candidate_id: str, summary: Dict[str, Any]) -> None:
-        """Create candidate record if it doesn't exist."""
+    def _resolve_candidate_id(self, candidate_id: str, summary: Dict[str, Any]) -> str:
+        """Maps the proposed candidate id to an existing candidate with the same email/phone."""
+        self.resolver.ensure_warm(self.client)
+        resolved = self.resolver.resolve(candidate_id, summary)
+        if resolved != candidate_id:
+            logger.info(f"Candidate '{candidate_id}' resolved to existing candidate '{resolved}'")
+        return resolved
+
+    def _insert_rows(self, table: str, rows: List[Dict[str, Any]]) -> List[Optional[str]]:
+        """
+        Inserts `rows` into `table` in one request; if that fails, row by row.
+        Returns the error of each row (None when it persisted), in order.
+        """
+        if not rows:
+            return []
         try:
-            # Check if candidate exists
-            result = self.client.table('candidates').select('candidate_id').eq('candidate_id', candidate_id).execute()
-            
-            if not result.data:
-                # Create new candidate
-                candidate_data = {
-                    "candidate_id": candidate_id,
-                    "name": summary.get("name", "Unknown"),
-                    "email": summary.get("email"),
-                    "phone": summary.get("phone"),
-                    "status": "pending"
-                }
-                self.client.table('candidates').insert(candidate_data).execute()
-                logger.info(f"Created new candidate record: {candidate_id}")
+            self.client.table(table).insert(rows).execute()
+            return [None] * len(rows)
         except Exception as e:
-            logger.error(f"Error ensuring candidate exists: {e}")
+            logger.warning(f"Batch insert into {table} failed ({e}); retrying {len(rows)} rows one by one")
+        errors = []
+        for row in rows:
+            try:
+                self.client.table(table).insert(row).execute()
+                errors.append(None)
+            except Exception as e:
+                logger.error(f"Error inserting into {table} for candidate {row.get('candidate_id')}: {e}")
+                errors.append(str(e))
+        return errors
+
+    def _ensure_candidate_exists(self, candidate_id: str, summary: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Registers the candidate in the identity index. Returns the `candidates`
+        row to insert when it is new, None when it already exists (no query).
+        """
+        if not self.resolver.register(candidate_id, summary.get("email"), summary.get("phone")):
+            return None
+        return {
+            "candidate_id": candidate_id,
+            "name": summary.get("name", "Unknown"),
+            "email": summary.get("email"),
+            "phone": summary.get("phone"),
+            "status": "pending"
+        }
+
+    def _insert_candidates(self, rows: List[Dict[str, Any]]) -> None:
+        """Creates candidate records; ids another worker created meanwhile are left as they are."""
+        try:
+            self.client.table('candidates').upsert(rows, on_conflict='candidate_id', ignore_duplicates=True).execute()
+            logger.info(f"Created {len(rows)} candidate record(s)")
+        except Exception as e:
+            logger.error(f"Error creating candidates: {e}")
+            for row in rows:
+                self.resolver.discard(row["candidate_id"])
             raise
 
+    def _specific_row(self, candidate_id: str, source_type: str, raw_data: Dict[str, Any], summary: Dict[str, Any]):
+        """Returns (table, row) for the source-specific table, or (None, None) if there is none."""
+        if source_type == "cv_parsing":
+            return 'cv_analyses', self._cv_analysis_row(candidate_id, raw_data, summary)
+        if source_type == "numerology":
+            return 'numerology_data', self._numerology_row(candidate_id, raw_data, summary)
+        if source_type and source_type.startswith("disc_"):
+            return 'disc_assessments', self._disc_assessment_row(candidate_id, raw_data, summary)
+        return None, None
+
+    def _validate_raw_data(self, raw_data: Any) -> None:
+        if not isinstance(raw_data, dict):
+            logger.error(f"raw_data must be a dict, got {type(raw_data)}: {str(raw_data)[:100]}")
+            raise TypeError(f"raw_data must be a dictionary, received {type(raw_data)}")
+
+    def _cv_analysis_row(self, candidate_id: str, raw_data: Dict[str, Any], summary: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a cv_analyses row from CV parsing results."""
+        self._validate_raw_data(raw_data)
+
+        # Handle source field - can be string or dict
+        source = raw_data.get("source", {})
+        if isinstance(source, str):
+            source_dict = {"type": source, "aiUsed": source == "gemini"}
+        else:
+            source_dict = source if isinstance(source, dict) else {}
+
+        return {
+            "candidate_id": candidate_id,
+            "file_name": raw_data.get("filename", "unknown"),
+            "parsing_method": source_dict.get("type", "unknown"),
+            "ai_used": source_dict.get("aiUsed", False),
+            "personal_info": raw_data.get("personalInfo", {}),
+            "education": raw_data.get("education", []),
+            "experience": raw_data.get("experience", []),
+            "skills": raw_data.get("skills", []),
+            "source_info": source_dict,
+            "raw_response": raw_data
+        }
+
+    def _numerology_row(self, candidate_id: str, raw_data: Dict[str, Any], summary: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a numerology_data row from numerology calculation results."""
+        self._validate_raw_data(raw_data)
+        return {
+            "candidate_id": candidate_id,
+            "name_used": raw_data.get("full_name"),
+            "birth_date_used": raw_data.get("birth_date"),
+            "life_path_number": summary.get("life_path_number"),
+            "birth_number": summary.get("birth_number", summary.get("soul_urge_number")),
+            "life_path_meaning": summary.get("life_path_meaning", summary.get("interpretation", "")),
+            "birth_meaning": summary.get("birth_meaning", ""),
+            "compatibility_note": summary.get("compatibility_note", ""),
+            "name_calculation": raw_data.get("name_calculation", {}),
+            "birth_calculation": raw_data.get("birth_calculation", {}),
+            "combined_insight": summary.get("interpretation", {}),
+            "calculation_status": "available",
+            "warnings": raw_data.get("warnings", [])
+        }
+
+    def _disc_assessment_row(self, candidate_id: str, raw_data: Dict[str, Any], summary: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a disc_assessments row from DISC assessment results."""
+        self._validate_raw_data(raw_data)
+        return {
+            "candidate_id": candidate_id,
+            "upload_method": raw_data.get("source", "csv_upload"),
+            "d_score": summary.get("D", summary.get("d_score")),
+            "i_score": summary.get("I", summary.get("i_score")),
+            "s_score": summary.get("S", summary.get("s_score")),
+            "c_score": summary.get("C", summary.get("c_score")),
+            "primary_style": summary.get("primary_type", summary.get("primary_style")),
+            "secondary_style": summary.get("secondary_type", summary.get("secondary_style")),
+            "style_intensity": summary.get("style_intensity", "medium"),
+            "behavioral_description": str(summary.get("interpretation", "")),
+            "raw_data": raw_data,
+            "source_file_name": raw_data.get("filename", "test_data.csv")
+        }
+
+    def _activity_row(self, candidate_id: str, activity_type: str, details: str) -> Dict[str, Any]:
+        return {
+            "candidate_id": candidate_id,
+            "activity_type": activity_type,
+            "action": details,  # Fixed: action is required field
+            "status": "success",
+            "performed_by": "system"
+        }
+
     def _save_cv_analysis(self, candidate_id: str, raw_data: Dict[str, Any], summary: Dict[str, Any]) -> None:
         """Save CV parsing results to cv_analyses table."""
         try:
-            # Validate raw_data is a dict
-            if not isinstance(raw_data, dict):
-                logger.error(f"raw_data must be a dict, got {type(raw_data)}: {str(raw_data)[:100]}")
-                raise TypeError(f"raw_data must be a dictionary, received {type(raw_data)}")
-
-            # Handle source field - can be string or dict
-            source = raw_data.get("source", {})
-            if isinstance(source, str):
-                source_dict = {"type": source, "aiUsed": source == "gemini"}
-            else:
-                source_dict = source if isinstance(source, dict) else {}
-            
-            cv_data = {
-                "candidate_id": candidate_id,
-                "file_name": raw_data.get("filename", "unknown"),
-                "parsing_method": source_dict.get("type", "unknown"),
-                "ai_used": source_dict.get("aiUsed", False),
-                "personal_info": raw_data.get("personalInfo", {}),
-                "education": raw_data.get("education", []),
-                "experience": raw_data.get("experience", []),
-                "skills": raw_data.get("skills", []),
-                "source_info": source_dict,
-                "raw_response": raw_data
-            }
+            cv_data = self._cv_analysis_row(candidate_id, raw_data, summary)
             self.client.table('cv_analyses').insert(cv_data).execute()
+            get_skill_index().add(candidate_id, cv_data["skills"])
+            get_cv_text_index().add(candidate_id, raw_data)
             logger.info(f"Saved CV analysis for {candidate_id}")
         except Exception as e:
             logger.error(f"Error saving CV analysis: {e}")
@@ -394,26 +429,7 @@ class DatabaseService:
     def _save_numerology_data(self, candidate_id: str, raw_data: Dict[str, Any], summary: Dict[str, Any]) -> None:
         """Save numerology calculation results to numerology_data table."""
         try:
-            # Validate raw_data is a dict
-            if not isinstance(raw_data, dict):
-                logger.error(f"raw_data must be a dict, got {type(raw_data)}: {str(raw_data)[:100]}")
-                raise TypeError(f"raw_data must be a dictionary, received {type(raw_data)}")
-
-            num_data = {
-                "candidate_id": candidate_id,
-                "name_used": raw_data.get("full_name"),
-                "birth_date_used": raw_data.get("birth_date"),
-                "life_path_number": summary.get("life_path_number"),
-                "birth_number": summary.get("birth_number", summary.get("soul_urge_number")),
-                "life_path_meaning": summary.get("life_path_meaning", summary.get("interpretation", "")),
-                "birth_meaning": summary.get("birth_meaning", ""),
-                "compatibility_note": summary.get("compatibility_note", ""),
-                "name_calculation": raw_data.get("name_calculation", {}),
-                "birth_calculation": raw_data.get("birth_calculation", {}),
-                "combined_insight": summary.get("interpretation", {}),
-                "calculation_status": "available",
-                "warnings": raw_data.get("warnings", [])
-            }
+            num_data = self._numerology_row(candidate_id, raw_data, summary)
             self.client.table('numerology_data').insert(num_data).execute()
             logger.info(f"Saved numerology data for {candidate_id}")
         except Exception as e:
@@ -423,25 +439,7 @@ class DatabaseService:
     def _save_disc_assessment(self, candidate_id: str, raw_data: Dict[str, Any], summary: Dict[str, Any]) -> None:
         """Save DISC assessment results to disc_assessments table."""
         try:
-            # Validate raw_data is a dict
-            if not isinstance(raw_data, dict):
-                logger.error(f"raw_data must be a dict, got {type(raw_data)}: {str(raw_data)[:100]}")
-                raise TypeError(f"raw_data must be a dictionary, received {type(raw_data)}")
-
-            disc_data = {
-                "candidate_id": candidate_id,
-                "upload_method": raw_data.get("source", "csv_upload"),
-                "d_score": summary.get("D", summary.get("d_score")),
-                "i_score": summary.get("I", summary.get("i_score")),
-                "s_score": summary.get("S", summary.get("s_score")),
-                "c_score": summary.get("C", summary.get("c_score")),
-                "primary_style": summary.get("primary_type", summary.get("primary_style")),
-                "secondary_style": summary.get("secondary_type", summary.get("secondary_style")),
-                "style_intensity": summary.get("style_intensity", "medium"),
-                "behavioral_description": str(summary.get("interpretation", "")),
-                "raw_data": raw_data,
-                "source_file_name": raw_data.get("filename", "test_data.csv")
-            }
+            disc_data = self._disc_assessment_row(candidate_id, raw_data, summary)
             self.client.table('disc_assessments').insert(disc_data).execute()
             logger.info(f"Saved DISC assessment for {candidate_id}")
         except Exception as e:
@@ -451,13 +449,7 @@ class DatabaseService:
     def _log_activity(self, candidate_id: str, activity_type: str, details: str) -> None:
         """Log activity to activity_logs table."""
         try:
-            log_data = {
-                "candidate_id": candidate_id,
-                "activity_type": activity_type,
-                "action": details,  # Fixed: action is required field
-                "status": "success",
-                "performed_by": "system"
-            }
+            log_data = self._activity_row(candidate_id, activity_type, details)
             self.client.table('activity_logs').insert(log_data).execute()
         except Exception as e:
             logger.warning(f"Failed to log activity: {e}")  # Don't raise, logging is non-critical
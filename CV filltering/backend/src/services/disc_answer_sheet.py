@@ -0,0 +1,249 @@
+# backend/src/services/disc_answer_sheet.py
+"""
+Optical mark reading for the printable DISC answer sheet.
+
+The sheet has a fixed layout (A4 at 150 DPI, see the constants below): a
+candidate-id box, then a grid with one row per (question, style) and one
+checkbox per score 1-10. The respondent fills one box per row.
+
+Reading a scan:
+  1. find the grid's outer border (largest quadrilateral contour with the
+     grid's aspect ratio) and warp the page back onto the layout with a
+     perspective transform, which also undoes rotation and scale;
+  2. binarise and measure the ink fill ratio of every checkbox interior in
+     one vectorised NumPy reduction;
+  3. pick the filled box per row, with a confidence from how clearly it
+     stands out, and average each style's rows into d_score..c_score.
+
+Only the small candidate-id box is left for OCR; the scores need no Tesseract.
+`encode_answer_sheet()` renders the blank sheet with a candidate's id printed
+in the box, as PNG or PDF, for GET /api/disc/answer-sheet/<candidate_id>.
+"""
+
+import io
+import re
+import logging
+from typing import Dict, Any, List, Optional, Tuple
+
+from .service_registry import lazy_import
+
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+cv2 = lazy_import('cv2')
+np = lazy_import('numpy')
+# Pillow (a pytesseract dependency) writes the PDF version
+Image = lazy_import('PIL.Image')
+
+# ==================== Sheet layout (pixels on the 150 DPI page) ====================
+
+SHEET_SIZE = (1240, 1754)  # width, height
+SHEET_DPI = 150
+SHEET_QUESTIONS = 3
+SHEET_STYLES = ('D', 'I', 'S', 'C')
+SCORE_COLUMNS = 10  # boxes 1..10
+CELL = 70
+GRID_X, GRID_Y = 260, 430
+GRID_ROWS = SHEET_QUESTIONS * len(SHEET_STYLES)
+GRID_WIDTH, GRID_HEIGHT = SCORE_COLUMNS * CELL, GRID_ROWS * CELL
+ID_BOX = (260, 230, 700, 100)  # x, y, width, height
+
+# A box counts as filled at this ink ratio (its interior, grid lines excluded)
+MARK_THRESHOLD = 0.25
+# The grid's width/height may differ this much from the layout (perspective); an A4
+# page outline (0.71 against the grid's 0.83) must not pass
+ASPECT_TOLERANCE = 0.1
+# Share of each cell trimmed on every side before measuring, to skip the grid lines
+CELL_MARGIN = 0.2
+
+ANSWER_SHEET_FORMATS = {'png': 'image/png', 'pdf': 'application/pdf'}
+# Ids printed on a sheet: ASCII (cv2's fonts), fitting the id box, and what
+# the id OCR reads back
+CANDIDATE_ID_PATTERN = re.compile(r'[A-Za-z0-9][A-Za-z0-9_\-]{0,19}')
+
+
+def grid_rows() -> List[Tuple[int, str]]:
+    """(question id, style) of each grid row, top to bottom."""
+    return [(question, style) for question in range(1, SHEET_QUESTIONS + 1) for style in SHEET_STYLES]
+
+
+def order_corners(points: "np.ndarray") -> "np.ndarray":
+    """The 4 corners of a quadrilateral as (top-left, top-right, bottom-right, bottom-left)."""
+    sums = points.sum(axis=1)
+    diffs = np.diff(points, axis=1).ravel()
+    return np.array([points[np.argmin(sums)], points[np.argmin(diffs)],
+                     points[np.argmax(sums)], points[np.argmax(diffs)]], dtype=np.float32)
+
+
+def render_answer_sheet(candidate_id: str = "", answers: Optional[List[int]] = None) -> "np.ndarray":
+    """
+    The printable answer sheet as a grayscale image. `answers` (one score
+    1-10 per grid row) fills the chosen boxes, as a respondent would.
+    """
+    sheet = np.full((SHEET_SIZE[1], SHEET_SIZE[0]), 255, dtype=np.uint8)
+    cv2.putText(sheet, "DISC Answer Sheet", (GRID_X, 140), cv2.FONT_HERSHEY_SIMPLEX, 1.6, 0, 3, cv2.LINE_AA)
+
+    x, y, width, height = ID_BOX
+    cv2.putText(sheet, "Candidate ID", (x - 220, y + 60), cv2.FONT_HERSHEY_SIMPLEX, 0.8, 0, 2, cv2.LINE_AA)
+    cv2.rectangle(sheet, (x, y), (x + width, y + height), 0, 2)
+    if candidate_id:
+        cv2.putText(sheet, candidate_id, (x + 20, y + 68), cv2.FONT_HERSHEY_SIMPLEX, 1.6, 0, 3, cv2.LINE_AA)
+
+    for column in range(SCORE_COLUMNS):
+        cv2.putText(sheet, str(column + 1), (GRID_X + column * CELL + 22, GRID_Y - 15),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.8, 0, 2, cv2.LINE_AA)
+    for row, (question, style) in enumerate(grid_rows()):
+        cv2.putText(sheet, f"Q{question} {style}", (GRID_X - 130, GRID_Y + row * CELL + 47),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.8, 0, 2, cv2.LINE_AA)
+    for row in range(1, GRID_ROWS):
+        cv2.line(sheet, (GRID_X, GRID_Y + row * CELL), (GRID_X + GRID_WIDTH, GRID_Y + row * CELL), 0, 2)
+    for column in range(1, SCORE_COLUMNS):
+        cv2.line(sheet, (GRID_X + column * CELL, GRID_Y), (GRID_X + column * CELL, GRID_Y + GRID_HEIGHT), 0, 2)
+    cv2.rectangle(sheet, (GRID_X, GRID_Y), (GRID_X + GRID_WIDTH, GRID_Y + GRID_HEIGHT), 0, 6)
+
+    for row, score in enumerate(answers or []):
+        if score:
+            center = (GRID_X + (score - 1) * CELL + CELL // 2, GRID_Y + row * CELL + CELL // 2)
+            cv2.circle(sheet, center, int(CELL * 0.32), 0, -1)
+    return sheet
+
+
+def encode_answer_sheet(candidate_id: str, fmt: str = 'png') -> bytes:
+    """
+    The blank answer sheet with `candidate_id` printed in the id box, as a PNG
+    or a one-page A4 PDF. Raises ValueError for an id that cannot be printed
+    and read back, or an unknown format.
+    """
+    if not CANDIDATE_ID_PATTERN.fullmatch(candidate_id or ''):
+        raise ValueError(f"Invalid candidate id: {candidate_id!r}")
+    if fmt not in ANSWER_SHEET_FORMATS:
+        raise ValueError(f"Unsupported answer sheet format: {fmt!r}")
+
+    sheet = render_answer_sheet(candidate_id)
+    if fmt == 'png':
+        return cv2.imencode('.png', sheet)[1].tobytes()
+    buffer = io.BytesIO()
+    Image.fromarray(sheet).save(buffer, format='PDF', resolution=SHEET_DPI)
+    return buffer.getvalue()
+
+
+class AnswerSheetReader:
+    """Reads DISC scores from a scan or photo of the printable answer sheet."""
+
+    def __init__(self, mark_threshold: float = MARK_THRESHOLD):
+        self.mark_threshold = mark_threshold
+
+    # ==================== Public API ====================
+
+    def read(self, image: "np.ndarray") -> Optional[Dict[str, Any]]:
+        """
+        Scores from an answer-sheet image (BGR or grayscale). Returns None when
+        no answer grid is found, otherwise:
+        {"scores": {d_score..c_score} or None, "confidence": 0..1,
+         "rows": [{question, style, score, fill, confidence}],
+         "issues": [...], "id_image": warped candidate-id box}.
+        `scores` is None when a row is blank or has several boxes filled.
+        """
+        gray = image if image.ndim == 2 else cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        corners = self._find_grid(gray)
+        if corners is None:
+            return None
+
+        page = self._warp_to_layout(gray, corners)
+        _, ink = cv2.threshold(page, 0, 1, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+        fill = self.fill_ratios(ink)
+        result = self._score(fill)
+
+        x, y, width, height = ID_BOX
+        result["id_image"] = page[y + 6:y + height - 6, x + 6:x + width - 6]
+        return result
+
+    def read_bytes(self, image_bytes: bytes) -> Optional[Dict[str, Any]]:
+        """read() for an encoded image (PNG/JPEG bytes); None if it cannot be decoded."""
+        image = cv2.imdecode(np.frombuffer(image_bytes, np.uint8), cv2.IMREAD_GRAYSCALE)
+        if image is None:
+            return None
+        return self.read(image)
+
+    @staticmethod
+    def fill_ratios(ink: "np.ndarray") -> "np.ndarray":
+        """Ink share (0..1) inside each checkbox of a page warped onto the layout: (rows, columns)."""
+        grid = ink[GRID_Y:GRID_Y + GRID_HEIGHT, GRID_X:GRID_X + GRID_WIDTH]
+        cells = grid.reshape(GRID_ROWS, CELL, SCORE_COLUMNS, CELL)
+        margin = int(CELL * CELL_MARGIN)
+        interior = cells[:, margin:CELL - margin, :, margin:CELL - margin]
+        return interior.mean(axis=(1, 3), dtype=np.float64)
+
+    # ==================== Private Helper Methods ====================
+
+    def _find_grid(self, gray: "np.ndarray") -> Optional["np.ndarray"]:
+        """Corners (tl, tr, br, bl) of the largest quadrilateral shaped like the answer grid."""
+        _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+        contours, _ = cv2.findContours(binary, cv2.RETR_LIST, cv2.CHAIN_APPROX_SIMPLE)
+        min_area = gray.shape[0] * gray.shape[1] * 0.05
+        expected_aspect = GRID_WIDTH / GRID_HEIGHT
+
+        best, best_area = None, 0.0
+        for contour in contours:
+            area = cv2.contourArea(contour)
+            if area < min_area or area <= best_area:
+                continue
+            approx = cv2.approxPolyDP(contour, 0.02 * cv2.arcLength(contour, True), True)
+            if len(approx) != 4 or not cv2.isContourConvex(approx):
+                continue
+            # A dark background around the page outlines the whole image
+            x, y, width, height = cv2.boundingRect(approx)
+            if x <= 1 or y <= 1 or x + width >= gray.shape[1] - 1 or y + height >= gray.shape[0] - 1:
+                continue
+            corners = order_corners(approx.reshape(4, 2).astype(np.float32))
+            width = (np.linalg.norm(corners[1] - corners[0]) + np.linalg.norm(corners[2] - corners[3])) / 2
+            height = (np.linalg.norm(corners[3] - corners[0]) + np.linalg.norm(corners[2] - corners[1])) / 2
+            if height and abs(width / height / expected_aspect - 1) < ASPECT_TOLERANCE:
+                best, best_area = corners, area
+        return best
+
+    @staticmethod
+    def _warp_to_layout(gray: "np.ndarray", corners: "np.ndarray") -> "np.ndarray":
+        # The contour follows the outside of the 6 px border drawn centred on the grid edge
+        x0, y0, x1, y1 = GRID_X - 3, GRID_Y - 3, GRID_X + GRID_WIDTH + 3, GRID_Y + GRID_HEIGHT + 3
+        layout = np.array([[x0, y0], [x1, y0], [x1, y1], [x0, y1]], dtype=np.float32)
+        transform = cv2.getPerspectiveTransform(corners, layout)
+        return cv2.warpPerspective(gray, transform, SHEET_SIZE, flags=cv2.INTER_AREA, borderValue=255)
+
+    def _score(self, fill: "np.ndarray") -> Dict[str, Any]:
+        order = np.argsort(-fill, axis=1)
+        index = np.arange(GRID_ROWS)
+        best = fill[index, order[:, 0]]
+        second = fill[index, order[:, 1]]
+        marked = best >= self.mark_threshold
+        ambiguous = marked & (second >= self.mark_threshold)
+        # 1 when the filled box stands alone, towards 0 as a second box gets as dark
+        row_confidence = np.where(marked & ~ambiguous, (best - second) / np.maximum(best, 1e-9), 0.0)
+        selected = order[:, 0] + 1
+
+        rows, issues = [], []
+        for k, (question, style) in enumerate(grid_rows()):
+            rows.append({
+                "question": question,
+                "style": style,
+                "score": int(selected[k]) if marked[k] and not ambiguous[k] else None,
+                "fill": round(float(best[k]), 3),
+                "confidence": round(float(row_confidence[k]), 3)
+            })
+            if not marked[k]:
+                issues.append(f"Q{question} {style}: no box filled")
+            elif ambiguous[k]:
+                issues.append(f"Q{question} {style}: several boxes filled")
+
+        scores = None
+        if not issues:
+            per_style = selected.reshape(SHEET_QUESTIONS, len(SHEET_STYLES)).mean(axis=0)
+            scores = {f"{style.lower()}_score": round(float(value), 2)
+                      for style, value in zip(SHEET_STYLES, per_style)}
+        return {
+            "scores": scores,
+            "confidence": round(float(row_confidence.min()), 3),
+            "rows": rows,
+            "issues": issues
+        }
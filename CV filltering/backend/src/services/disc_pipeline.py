@@ -4,23 +4,247 @@ DISC External Pipeline Service
 Dịch vụ xử lý dữ liệu DISC từ nhiều nguồn: CSV, manual input, OCR image
 """
 
-from typing import Dict, Any, List, Optional, Union
-import pandas as pd
+from typing import Dict, Any, List, Optional, Union, Iterator, Iterable, BinaryIO, Tuple
 import logging
 import base64
 import io
 import json
 import csv
-import cv2
-import numpy as np
-import pytesseract
 import os
-from datetime import datetime
+import re
+import codecs
+import functools
+import gc
+import itertools
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime, date, time
+
+from .service_registry import lazy_import
+from .stage_timing import stage, timed
+from .ocr_engine_pool import get_ocr_engine_pool
+from .ocr_cache import get_ocr_cache
+from .disc_answer_sheet import AnswerSheetReader, grid_rows, order_corners, SCORE_COLUMNS, ANSWER_SHEET_FORMATS
+
+# OCR dependencies are only needed for image uploads; import them on first use
+cv2 = lazy_import('cv2')
+np = lazy_import('numpy')
+openpyxl = lazy_import('openpyxl')
+pytesseract = lazy_import('pytesseract')
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+DISC_SCORE_FIELDS = ['d_score', 'i_score', 's_score', 'c_score']
+DISC_CSV_HEADERS = {'candidate_id', 'name', 'd_score', 'i_score', 's_score', 'c_score'}
+DISC_STYLE_CODES = ('D', 'I', 'S', 'C')
+
+# Primary style code -> (style name, description)
+PRIMARY_STYLES = {
+    "D": ("Dominance", "Quyết đoán, thích thách thức, hướng kết quả"),
+    "I": ("Influence", "Giao tiếp tốt, lạc quan, thích tương tác xã hội"),
+    "S": ("Steadiness", "Ổn định, kiên nhẫn, làm việc nhóm tốt"),
+    "C": ("Compliance", "Cẩn thận, chính xác, tuân thủ quy trình"),
+}
+
+# Style ranking (column order as base-4 digits) -> (primary, description, secondary, ranking)
+_RANKING_PROFILES = {
+    order[0] * 64 + order[1] * 16 + order[2] * 4 + order[3]: (
+        *PRIMARY_STYLES[DISC_STYLE_CODES[order[0]]],
+        DISC_STYLE_CODES[order[1]],
+        tuple(DISC_STYLE_CODES[index] for index in order)
+    )
+    for order in itertools.permutations(range(4))
+}
+_RANK_WEIGHTS = (64, 16, 4, 1)
+
+# Precomputed profiles cover integer scores in this range
+PROFILE_TABLE_RANGE = (1, 10)
+
+
+def _sorted_ranking_code(d_score, i_score, s_score, c_score) -> int:
+    """Ranking code from a stable descending sort, exactly as generate_disc_profile ranked styles."""
+    scores = (d_score, i_score, s_score, c_score)
+    order = sorted(range(4), key=lambda index: scores[index], reverse=True)
+    return sum(index * weight for index, weight in zip(order, _RANK_WEIGHTS))
+
+
+def _build_profile_table() -> bytes:
+    """Ranking code of every integer score set, indexed by the scores as base-10 digits (10^4 bytes)."""
+    low, high = PROFILE_TABLE_RANGE
+    return bytes(_sorted_ranking_code(*scores) for scores in itertools.product(range(low, high + 1), repeat=4))
+
+
+DISC_PROFILE_TABLE = _build_profile_table()
+
+# Scalar lookups hash the score tuple; 7.0 and 7 are the same key
+_PROFILE_CODES = dict(zip(
+    itertools.product(range(PROFILE_TABLE_RANGE[0], PROFILE_TABLE_RANGE[1] + 1), repeat=4),
+    DISC_PROFILE_TABLE
+))
+
+# Non-integer score sets (e.g. 7.5) are sorted once and memoised
+_memoised_ranking_code = functools.lru_cache(maxsize=4096)(_sorted_ranking_code)
+
+
+def disc_ranking_code(d_score, i_score, s_score, c_score) -> int:
+    """Key of _RANKING_PROFILES for a score set: table lookup for integer scores, memoised sort otherwise."""
+    code = _PROFILE_CODES.get((d_score, i_score, s_score, c_score))
+    if code is None:
+        code = _memoised_ranking_code(d_score, i_score, s_score, c_score)
+    return code
+
+def _decoded_lines(stream: BinaryIO, chunk_size: int) -> Iterator[str]:
+    """
+    Lines of a UTF-8 byte stream (BOM dropped), read and decoded chunk by chunk.
+    Lines end at '\\n' only, as when iterating io.StringIO; a line longer than
+    DISC_CSV_MAX_LINE_CHARS raises ValueError instead of growing without bound.
+    """
+    decoder = codecs.getincrementaldecoder('utf-8-sig')()
+    max_line = int(os.getenv('DISC_CSV_MAX_LINE_CHARS', 1024 * 1024))
+    tail = ''
+    while True:
+        chunk = stream.read(chunk_size)
+        text = tail + decoder.decode(chunk or b'', final=not chunk)
+        if not chunk:
+            if text:
+                yield text
+            return
+        lines = text.split('\n')
+        tail = lines.pop()
+        if len(tail) > max_line:
+            raise ValueError(f"CSV line longer than {max_line} characters")
+        for line in lines:
+            yield line + '\n'
+
+
+def _xlsx_cell_text(value: Any) -> str:
+    """A worksheet cell as the text Excel writes for it when saving as CSV."""
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return 'TRUE' if value else 'FALSE'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    return str(value)
+
+
+def _xlsx_rows(workbook, worksheet) -> Iterator[List[str]]:
+    """
+    Non-empty rows of a read-only worksheet as text cells, padded to the header
+    width like an Excel CSV export (trailing empty cells are not stored).
+    Closes the workbook when done.
+    """
+    width = 0
+    try:
+        for values in worksheet.iter_rows(values_only=True):
+            row = [value if value.__class__ is str else _xlsx_cell_text(value) for value in values]
+            if any(row):
+                if len(row) < width:
+                    row.extend([''] * (width - len(row)))
+                width = width or len(row)
+                yield row
+    finally:
+        workbook.close()
+
+
+def _filename_stem(filename: str) -> str:
+    """Default candidate id of an uploaded image: its file name without folders or extension."""
+    return os.path.splitext(os.path.basename(filename or ''))[0] or "unknown"
+
+
+# OCR preprocessing: optional steps (DISC_OCR_PREPROCESS_STEPS) and their limits
+OCR_PREPROCESS_STEPS = ('perspective', 'deskew', 'denoise')
+# A page contour must cover this share of the photo
+PAGE_MIN_AREA = 0.2
+# Text lines tilted less than this are left alone; more than the max is not skew
+DESKEW_MIN_ANGLE = 0.3
+DESKEW_MAX_ANGLE = 15.0
+
+
+def _encoded_image_size(image_bytes: bytes) -> Optional[Tuple[int, int]]:
+    """(width, height) read from a PNG or JPEG header without decoding; None for other formats."""
+    if image_bytes[:8] == b'\x89PNG\r\n\x1a\n' and len(image_bytes) >= 24:
+        return int.from_bytes(image_bytes[16:20], 'big'), int.from_bytes(image_bytes[20:24], 'big')
+    if image_bytes[:2] != b'\xff\xd8':
+        return None
+    offset = 2
+    while offset + 9 <= len(image_bytes):
+        if image_bytes[offset] != 0xFF:
+            return None
+        marker = image_bytes[offset + 1]
+        if marker == 0xFF:  # fill byte
+            offset += 1
+            continue
+        # SOF0..SOF15 (C4 = DHT, C8 = JPG, CC = DAC are not frame headers)
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            height = int.from_bytes(image_bytes[offset + 5:offset + 7], 'big')
+            width = int.from_bytes(image_bytes[offset + 7:offset + 9], 'big')
+            return width, height
+        offset += 2 + int.from_bytes(image_bytes[offset + 2:offset + 4], 'big')
+    return None
+
+
+def skew_angle(gray: "np.ndarray") -> float:
+    """
+    Angle in degrees of the dominant text lines (positive: sloping down to the
+    right). Characters are smeared into line blobs; the strongest Hough lines
+    through the blob outlines within DESKEW_MAX_ANGLE of horizontal give the
+    angle (median of the top 15). 0.0 when no line is found.
+    """
+    scale = min(1.0, 1000 / gray.shape[1])
+    small = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA) if scale < 1 else gray
+    width = small.shape[1]
+    _, ink = cv2.threshold(small, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+    blobs = cv2.dilate(ink, cv2.getStructuringElement(cv2.MORPH_RECT, (max(3, width // 50), 1)))
+    max_tilt = np.radians(DESKEW_MAX_ANGLE)
+    lines = cv2.HoughLines(cv2.Canny(blobs, 50, 150), 1, np.pi / 3600, threshold=width // 5,
+                           min_theta=np.pi / 2 - max_tilt, max_theta=np.pi / 2 + max_tilt)
+    if lines is None:
+        return 0.0
+    # theta is the angle of the line's normal: pi/2 for a level line
+    return float(np.degrees(np.median(lines[:15, 0, 1])) - 90)
+
+
+_ocr_batch_pool = None
+_ocr_batch_pool_workers = 0
+_ocr_batch_pool_lock = threading.Lock()
+
+
+def _get_ocr_batch_pool(max_workers: int) -> ProcessPoolExecutor:
+    """
+    Returns the per-process pool for batch survey OCR, created lazily on first use.
+    It is created from a request thread, so workers come from a forkserver (spawn
+    where unavailable): forking a threaded process can copy a lock another thread
+    holds, like the logging module's, and deadlock the child.
+    """
+    global _ocr_batch_pool, _ocr_batch_pool_workers
+    with _ocr_batch_pool_lock:
+        if _ocr_batch_pool is None or _ocr_batch_pool_workers != max_workers:
+            if _ocr_batch_pool is not None:
+                _ocr_batch_pool.shutdown(wait=False, cancel_futures=True)
+            method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+            _ocr_batch_pool = ProcessPoolExecutor(max_workers=max_workers,
+                                                  mp_context=multiprocessing.get_context(method))
+            _ocr_batch_pool_workers = max_workers
+        return _ocr_batch_pool
+
+
+def _ocr_image_job(image_bytes: bytes, candidate_id: str) -> Dict[str, Any]:
+    """
+    Worker entry point: decode, answer-sheet read / preprocessing and OCR of one
+    image. Tesseract is called from this worker directly; an engine pool per
+    worker would oversubscribe the cores the batch pool already uses.
+    """
+    pipeline = DISCExternalPipeline()
+    pipeline.ocr_pool_enabled = False
+    return pipeline.process_ocr_image(image_bytes, candidate_id)
+
+
 class DISCExternalPipeline:
     """
     Pipeline xử lý dữ liệu DISC từ các nguồn bên ngoài
@@ -30,6 +254,18 @@ class DISCExternalPipeline:
         self.supported_formats = ['csv', 'manual', 'ocr']
         self.score_range = (1, 10)  # Valid DISC score range
         self.ocr_config = os.getenv('TESSERACT_CONFIG', r'--oem 3 --psm 6')
+        # Warm Tesseract engines in worker processes instead of a tesseract subprocess per image
+        self.ocr_pool_enabled = os.getenv('DISC_OCR_POOL_ENABLED', 'false').lower() == 'true'
+        # Answer sheets read with at least this confidence are scored without full-page OCR
+        self.omr_min_confidence = float(os.getenv('DISC_OMR_MIN_CONFIDENCE', 0.5))
+        self.ocr_id_config = os.getenv('DISC_OCR_ID_CONFIG', r'--oem 3 --psm 7')
+        # Reuse OCR text of near-duplicate images (re-uploads, re-compressed copies)
+        self.ocr_cache_enabled = os.getenv('DISC_OCR_CACHE_ENABLED', 'true').lower() == 'true'
+        # OCR preprocessing: pages are brought to this resolution (0 keeps the decoded size)
+        self.ocr_target_dpi = int(os.getenv('DISC_OCR_TARGET_DPI') or 300)
+        self.ocr_page_width_inches = float(os.getenv('DISC_OCR_PAGE_WIDTH_INCHES') or 8.27)
+        self.ocr_preprocess_steps = [step.strip() for step in os.getenv(
+            'DISC_OCR_PREPROCESS_STEPS', ','.join(OCR_PREPROCESS_STEPS)).split(',') if step.strip()]
         
     def validate_disc_scores(self, scores: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -74,6 +310,7 @@ class DISCExternalPipeline:
             "warnings": warnings
         }
     
+    @timed("disc.manual_input")
     def process_manual_input(self, candidate_id: str, disc_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Xử lý dữ liệu DISC nhập thủ công
@@ -111,39 +348,148 @@ class DISCExternalPipeline:
                 "candidate_id": candidate_id
             }
     
-    def _preprocess_image_for_ocr(self, image_bytes: bytes) -> np.ndarray:
+    @timed("disc.ocr_preprocess")
+    def _preprocess_image_for_ocr(self, image_bytes: bytes) -> "np.ndarray":
         """
-        Tiền xử lý ảnh để tăng độ chính xác cho Tesseract.
+        Tiền xử lý ảnh để tăng độ chính xác và tốc độ của Tesseract:
+          1. decode ảnh xám, ở 1/2, 1/4 hoặc 1/8 kích thước (IMREAD_REDUCED_*) khi
+             ảnh lớn hơn nhiều so với DPI mục tiêu;
+          2. perspective: tìm viền trang trong ảnh chụp và warp về trang thẳng ở DPI
+             mục tiêu; không thấy trang thì resize cả ảnh về DPI mục tiêu;
+          3. deskew: xoay theo góc chủ đạo của các dòng chữ;
+          4. nhị phân hoá Otsu, rồi lọc median (denoise).
+        Các bước tuỳ chọn nằm trong DISC_OCR_PREPROCESS_STEPS; bước nào lỗi thì bỏ
+        qua. Mỗi bước được đo thời gian riêng (disc.ocr_preprocess.<bước>).
         """
-        # Decode image bytes into an OpenCV image
-        nparr = np.frombuffer(image_bytes, np.uint8)
-        img = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+        with stage("disc.ocr_preprocess.decode"):
+            gray = self._decode_for_ocr(image_bytes)
+
+        page = None
+        if 'perspective' in self.ocr_preprocess_steps:
+            page = self._preprocess_step("perspective", self._correct_perspective, gray, None)
+        gray = page if page is not None else self._preprocess_step("dpi", self._normalise_dpi, gray, gray)
+        if 'deskew' in self.ocr_preprocess_steps:
+            gray = self._preprocess_step("deskew", self._deskew, gray, gray)
 
-        # 1. Convert to grayscale
-        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+        with stage("disc.ocr_preprocess.binarise"):
+            # THRESH_OTSU tự động tìm ngưỡng tối ưu
+            _, binary_img = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+            if 'denoise' in self.ocr_preprocess_steps:
+                binary_img = cv2.medianBlur(binary_img, 3)
+        return binary_img
 
-        # 2. Apply thresholding to get a binary image
-        # THRESH_OTSU tự động tìm ngưỡng tối ưu
-        _, binary_img = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    def _preprocess_step(self, name: str, step, image: "np.ndarray", fallback: Any) -> Any:
+        """Runs one timed, optional preprocessing step; returns `fallback` if the step fails."""
+        with stage(f"disc.ocr_preprocess.{name}"):
+            try:
+                return step(image)
+            except Exception as e:
+                logger.warning(f"OCR preprocessing step '{name}' skipped: {e}")
+                return fallback
+
+    def _target_page_width(self) -> int:
+        return round(self.ocr_target_dpi * self.ocr_page_width_inches)
+
+    def _decode_for_ocr(self, image_bytes: bytes) -> "np.ndarray":
+        """
+        Grayscale decode. A JPEG/PNG whose short side is at least 2x the target
+        page width is decoded reduced (JPEG scales in the DCT, so the full
+        image is never materialised).
+        """
+        flag = cv2.IMREAD_GRAYSCALE
+        size = _encoded_image_size(image_bytes)
+        if size and self.ocr_target_dpi:
+            # 5% slack so a 600 DPI scan still halves to 300 DPI
+            needed = self._target_page_width() * 0.95
+            for factor in (8, 4, 2):
+                if min(size) / factor >= needed:
+                    flag = getattr(cv2, f'IMREAD_REDUCED_GRAYSCALE_{factor}')
+                    break
+        image = cv2.imdecode(np.frombuffer(image_bytes, np.uint8), flag)
+        if image is None:
+            raise ValueError("Không đọc được ảnh (định dạng không hỗ trợ hoặc file hỏng)")
+        return image
+
+    def _correct_perspective(self, gray: "np.ndarray") -> Optional["np.ndarray"]:
+        """
+        Warps a photographed page to an upright page at the target DPI, using the
+        largest bright quadrilateral (the paper against a darker background).
+        None when there is no such page, e.g. a scan where the page fills the image.
+        """
+        height, width = gray.shape
+        scale = min(1.0, 1000 / max(height, width))
+        small = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA) if scale < 1 else gray
+        _, bright = cv2.threshold(cv2.GaussianBlur(small, (5, 5), 0), 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        contours, _ = cv2.findContours(bright, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        if not contours:
+            return None
+        contour = max(contours, key=cv2.contourArea)
+        if cv2.contourArea(contour) < PAGE_MIN_AREA * small.shape[0] * small.shape[1]:
+            return None
+        approx = cv2.approxPolyDP(contour, 0.02 * cv2.arcLength(contour, True), True)
+        if len(approx) != 4 or not cv2.isContourConvex(approx):
+            return None
+        x, y, box_width, box_height = cv2.boundingRect(approx)
+        if x <= 1 or y <= 1 or x + box_width >= small.shape[1] - 1 or y + box_height >= small.shape[0] - 1:
+            return None
 
-        # 3. (Optional but recommended) Denoising
-        denoised_img = cv2.medianBlur(binary_img, 3)
+        corners = order_corners(approx.reshape(4, 2).astype(np.float32) / scale)
+        page_width = (np.linalg.norm(corners[1] - corners[0]) + np.linalg.norm(corners[2] - corners[3])) / 2
+        page_height = (np.linalg.norm(corners[3] - corners[0]) + np.linalg.norm(corners[2] - corners[1])) / 2
+        out_width = self._target_page_width() if self.ocr_target_dpi else round(page_width)
+        out_height = round(out_width * page_height / page_width)
 
-        return denoised_img
+        # warpPerspective has no area filter: shrink first so large photos do not alias
+        shrink = out_width / page_width
+        if shrink < 0.75:
+            gray = cv2.resize(gray, None, fx=shrink, fy=shrink, interpolation=cv2.INTER_AREA)
+            corners = corners * shrink
+        target = np.array([[0, 0], [out_width, 0], [out_width, out_height], [0, out_height]], dtype=np.float32)
+        transform = cv2.getPerspectiveTransform(corners, target)
+        return cv2.warpPerspective(gray, transform, (out_width, out_height), flags=cv2.INTER_LINEAR, borderValue=255)
+
+    def _normalise_dpi(self, gray: "np.ndarray") -> "np.ndarray":
+        """Resizes an image taken to span the page width to the target DPI (upscaling at most 2x)."""
+        if not self.ocr_target_dpi:
+            return gray
+        scale = min(self._target_page_width() / gray.shape[1], 2.0)
+        if 0.9 <= scale <= 1.1:
+            return gray
+        interpolation = cv2.INTER_AREA if scale < 1 else cv2.INTER_CUBIC
+        return cv2.resize(gray, None, fx=scale, fy=scale, interpolation=interpolation)
+
+    def _deskew(self, gray: "np.ndarray") -> "np.ndarray":
+        """Rotates the page so the dominant text lines are level; the canvas grows so no corner is cut."""
+        angle = skew_angle(gray)
+        if abs(angle) < DESKEW_MIN_ANGLE:
+            return gray
+        height, width = gray.shape
+        rotation = cv2.getRotationMatrix2D((width / 2, height / 2), angle, 1.0)
+        cos, sin = abs(rotation[0, 0]), abs(rotation[0, 1])
+        out_width, out_height = int(height * sin + width * cos), int(height * cos + width * sin)
+        rotation[0, 2] += (out_width - width) / 2
+        rotation[1, 2] += (out_height - height) / 2
+        return cv2.warpAffine(gray, rotation, (out_width, out_height), flags=cv2.INTER_LINEAR, borderValue=255)
 
     def process_ocr_image(self, image_bytes: bytes, candidate_id: str = "unknown") -> Dict[str, Any]:
         """
         Xử lý ảnh survey DISC qua OCR.
         Sử dụng Tesseract OCR engine.
         """
-        logger.info(f"Processing OCR image for candidate '{candidate_id}' using Tesseract.")
         try:
+            # 0. Printed answer sheet: scores from the checkbox grid, OCR only for the id box
+            with stage("disc.omr_grid"):
+                sheet = AnswerSheetReader().read_bytes(image_bytes)
+            if sheet and sheet["scores"] and sheet["confidence"] >= self.omr_min_confidence:
+                return self._answer_sheet_result(sheet, candidate_id)
+
+            logger.info(f"Processing OCR image for candidate '{candidate_id}' using Tesseract.")
             # 1. Preprocess the image
             preprocessed_img = self._preprocess_image_for_ocr(image_bytes)
 
             # 2. Use Tesseract to extract text
             # Cấu hình để Tesseract nhận dạng số và layout của trang
-            extracted_text = pytesseract.image_to_string(preprocessed_img, config=self.ocr_config)
+            extracted_text = self._ocr_text(preprocessed_img, self.ocr_config)
 
             # 3. Parse the extracted text to get scores
             # Đây là phần logic phức tạp, cần phân tích text để tìm ra điểm số.
@@ -155,7 +501,7 @@ class DISCExternalPipeline:
             #     ...
 
             # For now, we'll return the extracted text for manual review
-            return {
+            result = {
                 "success": True,
                 "candidate_id": candidate_id,
                 "status": "pending_manual_review", # Vẫn cần review vì logic parse text chưa hoàn thiện
@@ -164,6 +510,10 @@ class DISCExternalPipeline:
                 "source": "ocr_tesseract",
                 "timestamp": datetime.now().isoformat()
             }
+            if sheet:
+                # Grid found but not trusted: show the reviewer why
+                result["answer_sheet"] = {"confidence": sheet["confidence"], "issues": sheet["issues"]}
+            return result
         except Exception as e:
             logger.error(f"Tesseract OCR processing failed for candidate {candidate_id}: {e}", exc_info=True)
             return {
@@ -172,58 +522,363 @@ class DISCExternalPipeline:
                 "candidate_id": candidate_id,
             }
     
+    def process_ocr_batch(self, images: Iterable[Tuple[str, bytes]],
+                          max_workers: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        OCR nhiều ảnh survey song song trên process pool (mặc định bằng số core).
+        `images` là các cặp (filename, bytes) và được đọc dần: mỗi worker có tối đa
+        2 ảnh đang chờ. Kết quả process_ocr_image của từng ảnh được trả về theo thứ
+        tự hoàn thành, kèm "index" và "filename"; candidate_id mặc định là tên file.
+        Mỗi process trong pool có OCR cache riêng: cache của process gọi hàm này
+        không được dùng cho batch.
+        """
+        max_workers = max_workers or int(os.getenv('DISC_OCR_BATCH_WORKERS') or os.cpu_count() or 1)
+        jobs = enumerate(images)
+        if max_workers <= 1:
+            for index, (filename, image_bytes) in jobs:
+                result = self.process_ocr_image(image_bytes, _filename_stem(filename))
+                yield {"index": index, "filename": filename, **result}
+            return
+
+        pool = _get_ocr_batch_pool(max_workers)
+        pending = {}
+
+        def finished(futures):
+            for future in futures:
+                index, filename = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"Batch OCR worker failed on {filename}: {e}")
+                    result = {"success": False, "error": f"Lỗi xử lý OCR: {e}", "candidate_id": _filename_stem(filename)}
+                yield {"index": index, "filename": filename, **result}
+
+        try:
+            for index, (filename, image_bytes) in jobs:
+                if len(pending) >= max_workers * 2:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    yield from finished(done)
+                pending[pool.submit(_ocr_image_job, image_bytes, _filename_stem(filename))] = (index, filename)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                yield from finished(done)
+        finally:
+            # Images not started yet are dropped if the consumer stops early
+            for future in pending:
+                future.cancel()
+
+    def _answer_sheet_result(self, sheet: Dict[str, Any], candidate_id: str) -> Dict[str, Any]:
+        """process_ocr_image result for an answer sheet read from its checkbox grid."""
+        scores = sheet["scores"]
+        with stage("disc.ocr_candidate_id"):
+            detected_id = self._ocr_candidate_id(sheet["id_image"])
+        logger.info(f"DISC answer sheet read for candidate '{candidate_id}' (confidence {sheet['confidence']})")
+        return {
+            "success": True,
+            "candidate_id": candidate_id,
+            "detected_candidate_id": detected_id,
+            "status": "auto_scored",
+            "disc_scores": scores,
+            "disc_profile": self.generate_disc_profile(scores),
+            "confidence": sheet["confidence"],
+            "answer_rows": sheet["rows"],
+            "source": "omr_answer_sheet",
+            "timestamp": datetime.now().isoformat()
+        }
+
+    def _ocr_candidate_id(self, id_image: "np.ndarray") -> Optional[str]:
+        """OCRs the candidate-id box of an answer sheet; None if empty or OCR is unavailable."""
+        try:
+            text = self._ocr_text(id_image, self.ocr_id_config)
+        except Exception as e:
+            logger.warning(f"Candidate id OCR failed: {e}")
+            return None
+        match = re.search(r'[A-Za-z0-9][A-Za-z0-9_\-]*', text or '')
+        return match.group(0) if match else None
+
+    def _ocr_text(self, image: "np.ndarray", config: str) -> str:
+        """
+        Tesseract text of a preprocessed image (warm engine pool or subprocess),
+        served from the OCR cache when a near-duplicate image was read before.
+        """
+        cache = get_ocr_cache() if self.ocr_cache_enabled else None
+        key = None
+        if cache:
+            with stage("disc.ocr_cache_lookup"):
+                key = cache.image_key(image)
+                text = cache.get(key, config) if key else None
+            if text is not None:
+                return text
+
+        with stage("disc.ocr_tesseract"):
+            if self.ocr_pool_enabled:
+                text = get_ocr_engine_pool().image_to_string(image, config=config)
+            else:
+                text = pytesseract.image_to_string(image, config=config)
+        if key:
+            cache.put(key, config, text)
+        return text
+
+    @timed("disc.csv_upload")
     def process_csv_upload(self, file_bytes):
-        max_rows = int(os.getenv('DISC_CSV_MAX_ROWS', 1000))
+        """
+        Xử lý file CSV DISC theo cột: 4 cột điểm được đưa vào ma trận NumPy (N, 4),
+        kiểm tra khoảng điểm bằng mask và xếp hạng style bằng argsort, thay vì
+        validate/generate profile từng dòng. Kết quả giống hệt validate_disc_scores
+        + generate_disc_profile cho từng dòng.
+        """
+        max_rows = int(os.getenv('DISC_CSV_MAX_ROWS', 100000))
         results = {
             "processed_count": 0,
             "errors": [],
             "warnings": [],
             "candidates": []
         }
-        
+
+        rows = []
+        failure = None
         try:
-            # Use io.StringIO to treat the byte string as a file
-            file_stream = io.StringIO(file_bytes.decode('utf-8'))
-            reader = csv.DictReader(file_stream)
+            reader = csv.reader(io.StringIO(file_bytes.decode('utf-8')))
+            fieldnames = next(reader, None)
 
-            expected_headers = {'candidate_id', 'name', 'd_score', 'i_score', 's_score', 'c_score'}
-            if not reader.fieldnames or not expected_headers.issubset(reader.fieldnames):
-                results["errors"].append(f"Missing required headers. Expected: {expected_headers}, Got: {reader.fieldnames}")
+            if not fieldnames or not DISC_CSV_HEADERS.issubset(fieldnames):
+                results["errors"].append(f"Missing required headers. Expected: {DISC_CSV_HEADERS}, Got: {fieldnames}")
                 return results
 
-            for i, row in enumerate(reader):
-                if i >= max_rows:
-                    results["warnings"].append(f"Processing stopped at {max_rows} rows limit.")
-                    break
-                
-                try:
-                    # Tái sử dụng hàm validate_disc_scores để đảm bảo tính nhất quán
-                    validation = self.validate_disc_scores(row)
-                    if not validation["valid"]:
-                        raise ValueError(validation.get("error", "Invalid score format."))
-                    
-                    scores = validation["scores"]
-                    profile = self.generate_disc_profile(scores)
-
-                    candidate_data = {
-                        "candidate_id": row.get('candidate_id'),
-                        "name": row.get('name'),
-                        "disc_scores": scores,
-                        "disc_profile": profile,
-                        "source": "csv_upload",
-                        "row_index": i + 2, # Account for header
-                        "notes": row.get("notes", "")
-                    }
-                    results["candidates"].append(candidate_data)
-                    results["processed_count"] += 1
-                except (ValueError, KeyError) as e:
-                    results["errors"].append(f"Row {i + 2}: Invalid data - {e}")
+            # Like csv.DictReader, blank lines are skipped. list.extend keeps the rows
+            # read before a malformed line raises, so they are still processed.
+            rows.extend(itertools.islice(filter(None, reader), max_rows + 1))
+        except Exception as e:
+            failure = f"Failed to process CSV file: {e}"
 
+        try:
+            if len(rows) > max_rows:
+                del rows[max_rows:]
+                results["warnings"].append(f"Processing stopped at {max_rows} rows limit.")
+            if rows:
+                self._process_csv_rows(fieldnames, rows, results)
         except Exception as e:
-            results["errors"].append(f"Failed to process CSV file: {e}")
-            
+            failure = failure or f"Failed to process CSV file: {e}"
+
+        if failure:
+            results["errors"].append(failure)
         return results
-    
+
+    def open_csv_stream(self, stream: BinaryIO, chunk_size: Optional[int] = None) -> Tuple[List[str], Iterator[List[str]]]:
+        """
+        Đọc header của CSV từ một binary stream (request body, file upload) và trả về
+        (fieldnames, iterator các dòng). Stream được đọc và decode từng chunk
+        (chấp nhận BOM UTF-8 của Excel), nên bộ nhớ không phụ thuộc kích thước file.
+        Raises ValueError nếu thiếu header bắt buộc.
+        """
+        chunk_size = chunk_size or int(os.getenv('DISC_CSV_STREAM_CHUNK_BYTES', 64 * 1024))
+        reader = csv.reader(_decoded_lines(stream, chunk_size))
+        fieldnames = next(reader, None)
+        if not fieldnames or not DISC_CSV_HEADERS.issubset(fieldnames):
+            raise ValueError(f"Missing required headers. Expected: {DISC_CSV_HEADERS}, Got: {fieldnames}")
+        # Like csv.DictReader, blank lines are skipped
+        return fieldnames, filter(None, reader)
+
+    def open_xlsx_stream(self, stream: BinaryIO, sheet_name: Optional[str] = None) -> Tuple[List[str], Iterator[List[str]]]:
+        """
+        Mở sheet XLSX (mặc định sheet đầu tiên) ở chế độ read-only của openpyxl và trả
+        về (fieldnames, iterator các dòng) giống open_csv_stream: các dòng được đọc
+        lần lượt từ XML của sheet, ô được chuyển thành text như khi Excel lưu CSV,
+        dòng trống bị bỏ qua. `stream` phải seek được (file upload, BytesIO).
+        Raises ValueError nếu file không phải XLSX, không có sheet hoặc thiếu header.
+        """
+        try:
+            workbook = openpyxl.load_workbook(stream, read_only=True, data_only=True)
+        except Exception as e:
+            raise ValueError(f"Invalid XLSX file: {e}")
+        if any(sheet.max_row is None for sheet in workbook.worksheets):
+            # Without a <dimension> element openpyxl parses the whole sheet to size it and
+            # leaves that tree in a reference cycle: free it before the row pass, not whenever GC runs
+            gc.collect()
+
+        try:
+            if sheet_name is None:
+                worksheet = workbook.worksheets[0]
+            elif sheet_name in workbook.sheetnames:
+                worksheet = workbook[sheet_name]
+            else:
+                raise ValueError(f"Sheet not found: {sheet_name}. Available: {workbook.sheetnames}")
+            # The stored dimensions are often wrong in exported files: read to the last row
+            worksheet.reset_dimensions()
+        except Exception:
+            workbook.close()
+            raise
+
+        rows = _xlsx_rows(workbook, worksheet)
+        fieldnames = next(rows, None)
+        if not fieldnames or not DISC_CSV_HEADERS.issubset(fieldnames):
+            rows.close()
+            raise ValueError(f"Missing required headers. Expected: {DISC_CSV_HEADERS}, Got: {fieldnames}")
+        return fieldnames, rows
+
+    @timed("disc.xlsx_upload")
+    def process_xlsx_upload(self, stream: BinaryIO, sheet_name: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Xử lý file XLSX DISC, trả về kết quả cùng dạng process_csv_upload. Sheet được
+        đọc từng lô DISC_CSV_STREAM_BATCH_ROWS dòng qua process_csv_batches, nên
+        bộ nhớ đọc file không phụ thuộc số dòng.
+        """
+        max_rows = int(os.getenv('DISC_CSV_MAX_ROWS', 100000))
+        results = {
+            "processed_count": 0,
+            "errors": [],
+            "warnings": [],
+            "candidates": []
+        }
+        try:
+            fieldnames, rows = self.open_xlsx_stream(stream, sheet_name)
+        except ValueError as e:
+            results["errors"].append(str(e))
+            return results
+
+        try:
+            for batch in self.process_csv_batches(fieldnames, itertools.islice(rows, max_rows)):
+                results["processed_count"] += batch["processed_count"]
+                results["errors"].extend(batch["errors"])
+                results["candidates"].extend(batch["candidates"])
+            if next(rows, None) is not None:
+                results["warnings"].append(f"Processing stopped at {max_rows} rows limit.")
+        except Exception as e:
+            results["errors"].append(f"Failed to process XLSX file: {e}")
+        finally:
+            rows.close()
+        return results
+
+    def process_csv_batches(self, fieldnames: List[str], rows: Iterable[List[str]],
+                            batch_rows: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Xử lý các dòng CSV theo từng lô cố định. Mỗi lô trả về kết quả cùng dạng
+        process_csv_upload (row_index / số dòng trong lỗi tính trên toàn file),
+        thêm "first_row" và "rows". Lỗi đọc CSV kết thúc luồng sau lô chứa nó.
+        """
+        batch_rows = batch_rows or int(os.getenv('DISC_CSV_STREAM_BATCH_ROWS', 1000))
+        rows = iter(rows)
+        offset = 0
+        while True:
+            batch = []
+            failure = None
+            try:
+                # list.extend keeps the rows read before a malformed line raises
+                batch.extend(itertools.islice(rows, batch_rows))
+            except Exception as e:
+                failure = f"Failed to process CSV file: {e}"
+            if not batch and not failure:
+                return
+
+            results = {
+                "first_row": offset + 2,
+                "rows": len(batch),
+                "processed_count": 0,
+                "errors": [],
+                "warnings": [],
+                "candidates": []
+            }
+            if batch:
+                with stage("disc.csv_batch"):
+                    self._process_csv_rows(fieldnames, batch, results, offset)
+            if failure:
+                results["errors"].append(failure)
+            yield results
+            if failure:
+                return
+            offset += len(batch)
+
+    def _process_csv_rows(self, fieldnames: List[str], rows: List[List[str]], results: Dict[str, Any],
+                          offset: int = 0) -> None:
+        """
+        Validates and profiles CSV rows column-wise, appending to results in row order.
+        `offset` is the number of data rows before `rows` in the file.
+        """
+        # Column lookup as csv.DictReader builds its dicts: the last duplicate
+        # header wins, short rows read as None
+        columns = {name: index for index, name in enumerate(fieldnames)}
+        shortest = min(map(len, rows))
+
+        def column(name):
+            index = columns[name]
+            if shortest > index:
+                return [row[index] for row in rows]
+            return [row[index] if index < len(row) else None for row in rows]
+
+        raw = [column(field) for field in DISC_SCORE_FIELDS]
+        parsed = [self._parse_score_column(values) for values in raw]
+        matrix = np.column_stack([values for values, _ in parsed])
+        not_number = np.column_stack([bad for _, bad in parsed])
+        in_range = (matrix >= self.score_range[0]) & (matrix <= self.score_range[1])
+        row_valid = in_range.all(axis=1)
+
+        # Integer rows read the precomputed table; the rest get a descending stable
+        # sort per row, which equals sorted(..., reverse=True) on (style, score) pairs
+        ranking_codes = np.zeros(len(rows), dtype=np.intp)
+        low, high = PROFILE_TABLE_RANGE
+        in_table = (row_valid & (matrix >= low).all(axis=1) & (matrix <= high).all(axis=1)
+                    & (matrix == np.floor(matrix)).all(axis=1))
+        if in_table.any():
+            span = high - low + 1
+            keys = (matrix[in_table] - low).astype(np.intp) @ np.array([span ** 3, span ** 2, span, 1])
+            ranking_codes[in_table] = np.frombuffer(DISC_PROFILE_TABLE, dtype=np.uint8)[keys]
+        sorted_rows = row_valid & ~in_table
+        if sorted_rows.any():
+            ranking = np.argsort(-matrix[sorted_rows], axis=1, kind='stable')
+            ranking_codes[sorted_rows] = ranking @ np.array(_RANK_WEIGHTS)
+
+        candidate_ids = column('candidate_id')
+        names = column('name')
+        notes = column('notes') if 'notes' in columns else None
+
+        valid_rows = np.flatnonzero(row_valid)
+        candidates = results["candidates"]
+        for k, (d, i, s, c), code in zip(valid_rows.tolist(), matrix[valid_rows].tolist(),
+                                         ranking_codes[valid_rows].tolist()):
+            primary_style, description, secondary_style, style_ranking = _RANKING_PROFILES[code]
+            candidates.append({
+                "candidate_id": candidate_ids[k],
+                "name": names[k],
+                "disc_scores": {"d_score": d, "i_score": i, "s_score": s, "c_score": c},
+                "disc_profile": {
+                    "primary_style": primary_style,
+                    "secondary_style": secondary_style,
+                    "description": description,
+                    "detailed_scores": {"dominance": d, "influence": i, "steadiness": s, "compliance": c},
+                    "style_ranking": list(style_ranking)
+                },
+                "source": "csv_upload",
+                "row_index": offset + k + 2,  # Account for header
+                "notes": notes[k] if notes is not None else ""
+            })
+        results["processed_count"] += len(valid_rows)
+
+        # Same messages as validate_disc_scores, in one pass over the rejected rows
+        for k in np.flatnonzero(~row_valid).tolist():
+            errors = []
+            for j, field in enumerate(DISC_SCORE_FIELDS):
+                if not_number[k, j]:
+                    errors.append(f"{field}: '{raw[j][k]}' không phải là số hợp lệ")
+                elif not in_range[k, j]:
+                    errors.append(f"{field}: {raw[j][k]} ngoài khoảng cho phép {self.score_range}")
+            results["errors"].append(f"Row {offset + k + 2}: Invalid data - Invalid scores: {', '.join(errors)}")
+
+    @staticmethod
+    def _parse_score_column(values: List[Any]):
+        """float() of every value -> (float64 array with NaN for failures, not-a-number mask)."""
+        try:
+            return np.fromiter(map(float, values), dtype=np.float64, count=len(values)), np.zeros(len(values), dtype=bool)
+        except (ValueError, TypeError):
+            parsed = np.empty(len(values), dtype=np.float64)
+            bad = np.zeros(len(values), dtype=bool)
+            for k, value in enumerate(values):
+                try:
+                    parsed[k] = float(value)
+                except (ValueError, TypeError):
+                    parsed[k] = np.nan
+                    bad[k] = True
+            return parsed, bad
+
     def generate_disc_profile(self, scores: Dict[str, float]) -> Dict[str, Any]:
         """
         Tạo profile DISC từ scores
@@ -232,30 +887,13 @@ class DISCExternalPipeline:
         i_score = scores["i_score"]
         s_score = scores["s_score"]
         c_score = scores["c_score"]
-        
-        # Determine primary style
-        max_score = max(d_score, i_score, s_score, c_score)
-        
-        if d_score == max_score:
-            primary_style = "Dominance"
-            description = "Quyết đoán, thích thách thức, hướng kết quả"
-        elif i_score == max_score:
-            primary_style = "Influence"
-            description = "Giao tiếp tốt, lạc quan, thích tương tác xã hội"
-        elif s_score == max_score:
-            primary_style = "Steadiness"
-            description = "Ổn định, kiên nhẫn, làm việc nhóm tốt"
-        else:
-            primary_style = "Compliance"
-            description = "Cẩn thận, chính xác, tuân thủ quy trình"
-        
-        # Calculate secondary style
-        scores_sorted = sorted([
-            ("D", d_score), ("I", i_score), ("S", s_score), ("C", c_score)
-        ], key=lambda x: x[1], reverse=True)
-        
-        secondary_style = scores_sorted[1][0] if len(scores_sorted) > 1 else None
-        
+
+        # Styles ranked by a stable descending sort (ties keep D, I, S, C order),
+        # read from the precomputed table
+        primary_style, description, secondary_style, style_ranking = _RANKING_PROFILES[
+            disc_ranking_code(d_score, i_score, s_score, c_score)
+        ]
+
         return {
             "primary_style": primary_style,
             "secondary_style": secondary_style,
@@ -266,12 +904,13 @@ class DISCExternalPipeline:
                 "steadiness": s_score,
                 "compliance": c_score
             },
-            "style_ranking": [style[0] for style in scores_sorted]
+            "style_ranking": list(style_ranking)
         }
     
-    def generate_printable_survey(self) -> Dict[str, Any]:
+    def generate_printable_survey(self, candidate_id: Optional[str] = None) -> Dict[str, Any]:
         """
-        Tạo survey DISC có thể in ra để điền tay
+        Tạo survey DISC có thể in ra để điền tay, kèm link tải phiếu trả lời
+        (PNG/PDF) in sẵn mã ứng viên để chấm tự động bằng AnswerSheetReader
         """
         survey_questions = [
             {
@@ -317,6 +956,16 @@ class DISCExternalPipeline:
                     "I": "Influence - Ảnh hưởng", 
                     "S": "Steadiness - Ổn định",
                     "C": "Compliance - Tuân thủ"
+                },
+                # Printed grid read back by AnswerSheetReader (process_ocr_image)
+                "answer_sheet": {
+                    "instructions": "Tô kín đúng một ô điểm (1-10) trên mỗi dòng.",
+                    "rows": [{"question_id": question, "style": style} for question, style in grid_rows()],
+                    "score_columns": list(range(1, SCORE_COLUMNS + 1)),
+                    "download": {
+                        fmt: f"/api/disc/answer-sheet/{candidate_id or '<candidate_id>'}?format={fmt}"
+                        for fmt in ANSWER_SHEET_FORMATS
+                    }
                 }
             },
             "format": "printable",
@@ -0,0 +1,222 @@
+# backend/src/services/gemini_governor.py
+"""
+Gemini call governor.
+
+Every Gemini request goes through one process-wide governor that combines:
+- a semaphore capping concurrent in-flight calls,
+- a token bucket sized to the API quota (requests per minute + burst),
+- jittered exponential backoff on retryable errors (429 / 5xx / timeouts),
+- counters for queued, in-flight, throttled and retried calls.
+"""
+
+import os
+import time
+import random
+import logging
+import threading
+from typing import Dict, Any, Callable, Optional
+
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+RETRYABLE_ERROR_NAMES = {
+    "ResourceExhausted", "TooManyRequests", "ServiceUnavailable",
+    "InternalServerError", "DeadlineExceeded", "GatewayTimeout"
+}
+
+
+class GeminiThrottledError(Exception):
+    """Raised when a call could not get quota in time or kept being rate limited."""
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens per second, up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: float, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> float:
+        """Takes a token and returns 0, or returns the seconds until one is available."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+
+class GeminiGovernor:
+    """
+    Wraps Gemini calls with concurrency, quota and retry control.
+
+    `sleep` and `clock` are injectable so tests can run without waiting.
+    """
+
+    def __init__(self,
+                 max_concurrency: Optional[int] = None,
+                 requests_per_minute: Optional[float] = None,
+                 burst: Optional[int] = None,
+                 max_retries: Optional[int] = None,
+                 base_delay: Optional[float] = None,
+                 max_delay: Optional[float] = None,
+                 queue_timeout: Optional[float] = None,
+                 sleep: Callable[[float], None] = time.sleep,
+                 clock: Callable[[], float] = time.monotonic):
+        self.max_concurrency = max_concurrency if max_concurrency is not None else int(os.getenv('GEMINI_MAX_CONCURRENCY', 4))
+        rpm = requests_per_minute if requests_per_minute is not None else float(os.getenv('GEMINI_REQUESTS_PER_MINUTE', 60))
+        burst = burst if burst is not None else int(os.getenv('GEMINI_BURST', 5))
+        self.max_retries = max_retries if max_retries is not None else int(os.getenv('GEMINI_MAX_RETRIES', 3))
+        self.base_delay = base_delay if base_delay is not None else float(os.getenv('GEMINI_BACKOFF_BASE_SECONDS', 1.0))
+        self.max_delay = max_delay if max_delay is not None else float(os.getenv('GEMINI_BACKOFF_MAX_SECONDS', 30.0))
+        self.queue_timeout = queue_timeout if queue_timeout is not None else float(os.getenv('GEMINI_QUEUE_TIMEOUT_SECONDS', 30.0))
+
+        self._sleep = sleep
+        self._clock = clock
+        self._semaphore = threading.BoundedSemaphore(max(1, self.max_concurrency))
+        self._bucket = TokenBucket(rate=max(rpm, 0.001) / 60.0, capacity=max(1, burst), clock=clock)
+        self._lock = threading.Lock()
+        self._counters = {
+            "queued": 0,
+            "in_flight": 0,
+            "throttled": 0,
+            "retries": 0,
+            "succeeded": 0,
+            "failed": 0
+        }
+
+    # ==================== Public API ====================
+
+    def generate_content(self, model, prompt, **kwargs):
+        """Governed equivalent of `model.generate_content(prompt, **kwargs)`."""
+        return self.call(model.generate_content, prompt, **kwargs)
+
+    def call(self, fn: Callable, *args, **kwargs):
+        """
+        Runs `fn` under the governor. Retryable errors are retried with
+        jittered exponential backoff; other errors are raised immediately.
+        Raises GeminiThrottledError if quota cannot be obtained in time or
+        the call is still rate limited after `max_retries` retries.
+        """
+        attempt = 0
+        while True:
+            self._acquire_slot()
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                if not self.is_retryable(e):
+                    self._count("failed")
+                    raise
+                if self._is_rate_limit(e):
+                    self._count("throttled")
+                if attempt >= self.max_retries:
+                    self._count("failed")
+                    logger.warning(f"Gemini call gave up after {attempt + 1} attempts: {e}")
+                    if self._is_rate_limit(e):
+                        raise GeminiThrottledError(f"Gemini rate limited after {attempt + 1} attempts: {e}") from e
+                    raise
+                delay = self.backoff_delay(attempt)
+                attempt += 1
+                self._count("retries")
+                logger.info(f"Retryable Gemini error ({e}); retry {attempt}/{self.max_retries} in {delay:.2f}s")
+            else:
+                self._count("succeeded")
+                return result
+            finally:
+                self._release_slot()
+            self._sleep(delay)
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Full-jitter exponential backoff: uniform(0, min(max_delay, base * 2^attempt))."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def is_retryable(self, error: Exception) -> bool:
+        code = self._status_code(error)
+        if code in RETRYABLE_STATUS_CODES:
+            return True
+        if type(error).__name__ in RETRYABLE_ERROR_NAMES:
+            return True
+        return isinstance(error, (TimeoutError, ConnectionError))
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self._counters,
+                "max_concurrency": self.max_concurrency,
+                "requests_per_minute": round(self._bucket.rate * 60, 3),
+                "burst": self._bucket.capacity
+            }
+
+    # ==================== Private Helper Methods ====================
+
+    def _acquire_slot(self) -> None:
+        """Waits for a concurrency slot and a quota token, bounded by queue_timeout."""
+        self._count("queued")
+        deadline = self._clock() + self.queue_timeout
+        try:
+            if not self._semaphore.acquire(timeout=max(0.0, self.queue_timeout)):
+                self._count("throttled")
+                raise GeminiThrottledError("Timed out waiting for a Gemini concurrency slot")
+            throttled = False
+            while True:
+                wait = self._bucket.try_acquire()
+                if wait == 0:
+                    break
+                if not throttled:
+                    self._count("throttled")
+                    throttled = True
+                if self._clock() + wait > deadline:
+                    self._semaphore.release()
+                    raise GeminiThrottledError("Timed out waiting for Gemini quota")
+                self._sleep(wait)
+        finally:
+            self._count("queued", -1)
+        self._count("in_flight")
+
+    def _release_slot(self) -> None:
+        self._count("in_flight", -1)
+        self._semaphore.release()
+
+    def _count(self, name: str, delta: int = 1) -> None:
+        with self._lock:
+            self._counters[name] += delta
+
+    @staticmethod
+    def _status_code(error: Exception) -> Optional[int]:
+        code = getattr(error, "code", None)
+        if callable(code):
+            try:
+                code = code()
+            except Exception:
+                code = None
+        code = getattr(code, "value", code)
+        if isinstance(code, tuple):
+            code = code[0]
+        if isinstance(code, int):
+            return code
+        status = getattr(error, "status_code", None)
+        return status if isinstance(status, int) else None
+
+    def _is_rate_limit(self, error: Exception) -> bool:
+        return self._status_code(error) == 429 or type(error).__name__ in ("ResourceExhausted", "TooManyRequests")
+
+
+_governor = None
+_governor_lock = threading.Lock()
+
+
+def get_gemini_governor() -> GeminiGovernor:
+    """Process-wide governor shared by every Gemini caller."""
+    global _governor
+    with _governor_lock:
+        if _governor is None:
+            _governor = GeminiGovernor()
+        return _governor
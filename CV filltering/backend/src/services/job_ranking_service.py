@@ -0,0 +1,351 @@
+# backend/src/services/job_ranking_service.py
+"""
+Server-side candidate ranking for a job.
+
+Candidate features are loaded from the stored assessments (DISC scores from
+`disc_assessments`, numerology numbers from `numerology_data`, skills and
+experience from `cv_analyses`) into NumPy arrays once and cached for
+RANKING_CACHE_SECONDS. A shortlist request scores every candidate in one
+vectorised pass with the weights of the frontend's jobMatchingService
+(personality 25%, skills 30%, experience 20%, culture 15%, numerology 10%)
+and selects the top k with a heap.
+"""
+
+import os
+import re
+import json
+import time
+import heapq
+import logging
+import threading
+from datetime import date
+from typing import Dict, Any, List, Optional, Iterable
+
+from .service_registry import lazy_import
+from .skill_matcher import fold_text, normalize_skill
+
+np = lazy_import('numpy')
+
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_JOBS_PATH = os.path.join(os.path.dirname(__file__), 'data', 'jobs.json')
+
+DEFAULT_WEIGHTS = {
+    "personality": 0.25,
+    "skills": 0.30,
+    "experience": 0.20,
+    "cultural": 0.15,
+    "numerology": 0.10
+}
+
+# Scores used when a candidate has no data for a component (as in jobMatchingService.ts)
+MISSING_PERSONALITY_SCORE = 50.0
+MISSING_SKILLS_SCORE = 40.0
+MISSING_EXPERIENCE_SCORE = 50.0
+MISSING_NUMEROLOGY_SCORE = 70.0
+# Culture fit needs MBTI, which is not stored server-side: every candidate gets the base score
+BASE_CULTURAL_SCORE = 75.0
+PARTIAL_SKILL_CREDIT = 0.7
+
+LEVEL_MULTIPLIERS = {
+    'entry': 0.8,
+    'junior': 1.0,
+    'senior': 1.2,
+    'lead': 1.4,
+    'manager': 1.5,
+    'director': 1.8,
+    'executive': 2.0
+}
+
+# Traits of each numerology number, in the vocabulary of the jobs' numerology_traits
+NUMEROLOGY_TRAITS = {
+    1: ['Leadership', 'Independent', 'Innovative', 'Strategic'],
+    2: ['Cooperative', 'Diplomatic', 'Supportive', 'Detail-oriented'],
+    3: ['Creative', 'Communicative', 'Expressive', 'Influential'],
+    4: ['Systematic', 'Reliable', 'Methodical', 'Detail-oriented'],
+    5: ['Adaptable', 'Innovative', 'Influential', 'Communicative'],
+    6: ['Supportive', 'Reliable', 'Responsible'],
+    7: ['Analytical', 'Technical', 'Methodical', 'Detail-oriented'],
+    8: ['Leadership', 'Strategic', 'Systematic'],
+    9: ['Humanitarian', 'Creative', 'Influential'],
+    11: ['Innovative', 'Influential', 'Leadership'],
+    22: ['Strategic', 'Systematic', 'Leadership', 'Technical'],
+    33: ['Supportive', 'Communicative', 'Creative']
+}
+TRAIT_VOCABULARY = sorted({trait for traits in NUMEROLOGY_TRAITS.values() for trait in traits})
+
+YEAR_PATTERN = re.compile(r'(?<!\d)(19[5-9]\d|20\d\d)(?!\d)')
+PRESENT_PATTERN = re.compile(r'present|now|current|today|nay|hien\s+tai|hien\s+nay')
+MAX_EXPERIENCE_YEARS = 45
+
+
+def estimate_experience_years(experience: Any, today: Optional[date] = None) -> float:
+    """
+    Total years over CV experience entries, from the years in each entry's
+    duration ("2019 - 2021", "03/2020 - nay"). Overlapping jobs are counted once.
+    """
+    if not isinstance(experience, list):
+        return 0.0
+    current_year = (today or date.today()).year
+    spans = []
+    for entry in experience:
+        duration = entry.get('duration') if isinstance(entry, dict) else entry
+        if not isinstance(duration, str):
+            continue
+        years = [int(year) for year in YEAR_PATTERN.findall(duration)]
+        if not years:
+            continue
+        end = current_year if PRESENT_PATTERN.search(fold_text(duration)) else max(years)
+        start = min(years)
+        if end >= start:
+            spans.append((start, min(end, current_year)))
+
+    total = 0
+    covered_until = None
+    for start, end in sorted(spans):
+        if covered_until is not None:
+            start = max(start, covered_until)
+        if end > start:
+            total += end - start
+        covered_until = end if covered_until is None else max(covered_until, end)
+    return float(min(total, MAX_EXPERIENCE_YEARS))
+
+
+def _latest_by_candidate(rows: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Keeps the most recent row per candidate (rows are read in created_at order)."""
+    latest = {}
+    for row in rows:
+        candidate_id = row.get('candidate_id')
+        if candidate_id:
+            latest[candidate_id] = row
+    return latest
+
+
+class CandidateFeatures:
+    """
+    Column-oriented candidate features. Row i of every array belongs to
+    `candidate_ids[i]`; skills are kept as postings (skill -> row indices)
+    so a job only materialises the columns it asks for.
+    """
+
+    def __init__(self,
+                 candidates: List[Dict[str, Any]],
+                 disc_rows: List[Dict[str, Any]],
+                 numerology_rows: List[Dict[str, Any]],
+                 cv_rows: List[Dict[str, Any]]):
+        discs = _latest_by_candidate(disc_rows)
+        numerologies = _latest_by_candidate(numerology_rows)
+        cvs = _latest_by_candidate(cv_rows)
+
+        people = {row['candidate_id']: row for row in candidates if row.get('candidate_id')}
+        ids = list(people)
+        for extra in (discs, numerologies, cvs):
+            ids.extend(candidate_id for candidate_id in extra if candidate_id not in people)
+            people.update({candidate_id: {} for candidate_id in extra if candidate_id not in people})
+
+        n = len(ids)
+        self.candidate_ids = ids
+        self.names = [people[candidate_id].get('name') for candidate_id in ids]
+        self.emails = [people[candidate_id].get('email') for candidate_id in ids]
+
+        # DISC scores are stored 1-10; job profiles use 0-100
+        self.disc = np.full((n, 4), 50.0)
+        self.has_disc = np.zeros(n, dtype=bool)
+        self.years = np.zeros(n)
+        self.has_cv = np.zeros(n, dtype=bool)
+        self.has_skills = np.zeros(n, dtype=bool)
+        self.traits = np.zeros((n, len(TRAIT_VOCABULARY)), dtype=bool)
+        self.has_numerology = np.zeros(n, dtype=bool)
+        trait_index = {trait: column for column, trait in enumerate(TRAIT_VOCABULARY)}
+        postings: Dict[str, List[int]] = {}
+
+        for row_index, candidate_id in enumerate(ids):
+            disc = discs.get(candidate_id)
+            if disc:
+                values = [disc.get(key) for key in ('d_score', 'i_score', 's_score', 'c_score')]
+                self.disc[row_index] = [float(value) * 10 if value else 50.0 for value in values]
+                self.has_disc[row_index] = True
+
+            numerology = numerologies.get(candidate_id)
+            if numerology:
+                for key in ('life_path_number', 'birth_number'):
+                    for trait in NUMEROLOGY_TRAITS.get(numerology.get(key), []):
+                        self.traits[row_index, trait_index[trait]] = True
+                self.has_numerology[row_index] = bool(self.traits[row_index].any())
+
+            cv = cvs.get(candidate_id)
+            if cv:
+                self.has_cv[row_index] = True
+                self.years[row_index] = estimate_experience_years(cv.get('experience'))
+                skills = {normalize_skill(skill) for skill in cv.get('skills') or [] if isinstance(skill, str)}
+                skills.discard('')
+                self.has_skills[row_index] = bool(skills)
+                for skill in skills:
+                    postings.setdefault(skill, []).append(row_index)
+
+        self.skill_postings = {skill: np.asarray(rows, dtype=np.int64) for skill, rows in postings.items()}
+
+    def __len__(self) -> int:
+        return len(self.candidate_ids)
+
+    def skill_match(self, required: List[str]) -> "np.ndarray":
+        """
+        Fraction (0-100) of the required skills each candidate has; a skill
+        that only contains or is contained in a required one counts 0.7.
+        """
+        n = len(self)
+        required = [normalize_skill(skill) for skill in required]
+        required = [skill for skill in required if skill]
+        if not required:
+            return np.full(n, 100.0)
+
+        matched = np.zeros(n)
+        for skill in required:
+            credit = np.zeros(n)
+            partial = [rows for term, rows in self.skill_postings.items()
+                       if term != skill and (skill in term or term in skill)]
+            if partial:
+                credit[np.concatenate(partial)] = PARTIAL_SKILL_CREDIT
+            exact = self.skill_postings.get(skill)
+            if exact is not None:
+                credit[exact] = 1.0
+            matched += credit
+        return np.where(self.has_skills, matched / len(required) * 100, 0.0)
+
+
+class JobRankingService:
+    """Scores and shortlists candidates for a job."""
+
+    def __init__(self, jobs_path: Optional[str] = None, cache_seconds: Optional[float] = None, db_service=None):
+        self.jobs_path = jobs_path or os.getenv('JOBS_CATALOG_PATH', DEFAULT_JOBS_PATH)
+        self.cache_seconds = (cache_seconds if cache_seconds is not None
+                              else float(os.getenv('RANKING_CACHE_SECONDS', 60)))
+        self._db_service = db_service
+        self._jobs: Optional[Dict[str, Dict[str, Any]]] = None
+        self._features: Optional[CandidateFeatures] = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    # ==================== Public API ====================
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        if self._jobs is None:
+            with open(self.jobs_path, encoding='utf-8') as f:
+                self._jobs = {job['id']: job for job in json.load(f)}
+        return self._jobs.get(job_id)
+
+    def get_features(self, refresh: bool = False) -> CandidateFeatures:
+        """Candidate features, reloaded from the database when older than cache_seconds."""
+        with self._lock:
+            if refresh or self._features is None or time.monotonic() - self._loaded_at > self.cache_seconds:
+                self._features = self._load_features()
+                self._loaded_at = time.monotonic()
+            return self._features
+
+    def score(self, job: Dict[str, Any], features: CandidateFeatures) -> Dict[str, "np.ndarray"]:
+        """Component and overall scores (0-100) of every candidate, as arrays aligned with `features`."""
+        requirements = job.get('requirements', {})
+        ideal = job.get('ideal_personality', {})
+        weights = {**DEFAULT_WEIGHTS, **(job.get('weights') or {})}
+        n = len(features)
+
+        # Personality: distance between DISC profiles (max distance 200)
+        ideal_disc = ideal.get('disc_profile')
+        if ideal_disc:
+            target = np.array([ideal_disc.get(key, 50) for key in ('d', 'i', 's', 'c')], dtype=float)
+            distance = np.sqrt(((features.disc - target) ** 2).sum(axis=1))
+            personality = np.where(features.has_disc, np.clip(100 - distance / 200 * 100, 0, 100), MISSING_PERSONALITY_SCORE)
+        else:
+            personality = np.full(n, MISSING_PERSONALITY_SCORE)
+
+        # Skills: technical 70%, soft 30%
+        technical = features.skill_match(requirements.get('technical_skills', []))
+        soft = features.skill_match(requirements.get('soft_skills', []))
+        skills = np.where(features.has_cv, technical * 0.7 + soft * 0.3, MISSING_SKILLS_SCORE)
+
+        # Experience: required years scaled by job level; slight over-qualification penalty
+        required_years = float(requirements.get('experience_years') or 0)
+        if required_years > 0:
+            adjusted = required_years * LEVEL_MULTIPLIERS.get(job.get('level'), 1.0)
+            over = np.maximum(75, 100 - (features.years - adjusted) * 2)
+            under = features.years / adjusted * 100
+            experience = np.where(features.years >= adjusted, over, under)
+        else:
+            experience = np.full(n, 100.0)
+        experience = np.where(features.has_cv, experience, MISSING_EXPERIENCE_SCORE)
+
+        cultural = np.full(n, BASE_CULTURAL_SCORE)
+
+        # Numerology: candidate traits matching any of the job's traits
+        ideal_traits = [trait.lower() for trait in ideal.get('numerology_traits', [])]
+        if ideal_traits:
+            matching = np.array([any(trait.lower() in wanted or wanted in trait.lower() for wanted in ideal_traits)
+                                 for trait in TRAIT_VOCABULARY], dtype=bool)
+            harmony = np.minimum(100, features.traits[:, matching].sum(axis=1) / len(ideal_traits) * 100)
+            numerology = np.where(features.has_numerology, harmony, MISSING_NUMEROLOGY_SCORE)
+        else:
+            numerology = np.full(n, 100.0)
+
+        overall = (personality * weights['personality'] + skills * weights['skills'] +
+                   experience * weights['experience'] + cultural * weights['cultural'] +
+                   numerology * weights['numerology'])
+        assessments = features.has_disc.astype(int) + features.has_cv + features.has_numerology
+        return {
+            "overall": overall,
+            "personality_fit": personality,
+            "skills_match": skills,
+            "experience_fit": experience,
+            "cultural_fit": cultural,
+            "numerology_harmony": numerology,
+            "confidence_level": np.minimum(100, assessments / 4 * 100 + 20)
+        }
+
+    def shortlist(self, job: Dict[str, Any], k: int = 20, features: Optional[CandidateFeatures] = None) -> Dict[str, Any]:
+        """Top `k` candidates for `job`, best first."""
+        started = time.perf_counter()
+        features = features if features is not None else self.get_features()
+        scores = self.score(job, features)
+        overall = scores["overall"]
+        # O(n log k); ties keep the candidates' load order
+        top = heapq.nlargest(max(0, k), range(len(features)), key=overall.__getitem__)
+
+        shortlist = []
+        for rank, row in enumerate(top, start=1):
+            shortlist.append({
+                "rank": rank,
+                "candidate_id": features.candidate_ids[row],
+                "name": features.names[row],
+                "email": features.emails[row],
+                "overall_score": round(float(overall[row]), 1),
+                "breakdown": {
+                    name: round(float(values[row]), 1) for name, values in scores.items()
+                    if name not in ("overall", "confidence_level")
+                },
+                "confidence_level": round(float(scores["confidence_level"][row]), 1)
+            })
+        return {
+            "job_id": job.get('id'),
+            "total_candidates": len(features),
+            "k": k,
+            "shortlist": shortlist,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 3)
+        }
+
+    # ==================== Private Helper Methods ====================
+
+    def _load_features(self) -> CandidateFeatures:
+        from .database_service import get_db_service
+
+        db = self._db_service or get_db_service()
+        started = time.perf_counter()
+        features = CandidateFeatures(
+            db.fetch_rows('candidates', 'candidate_id,name,email'),
+            db.fetch_rows('disc_assessments', 'candidate_id,d_score,i_score,s_score,c_score', order_by='created_at'),
+            db.fetch_rows('numerology_data', 'candidate_id,life_path_number,birth_number', order_by='created_at'),
+            db.fetch_rows('cv_analyses', 'candidate_id,skills,experience', order_by='created_at')
+        )
+        logger.info(f"Loaded ranking features for {len(features)} candidates in "
+                    f"{(time.perf_counter() - started) * 1000:.0f} ms")
+        return features
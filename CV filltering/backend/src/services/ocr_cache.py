@@ -0,0 +1,299 @@
+# backend/src/services/ocr_cache.py
+"""
+Near-duplicate cache for DISC survey OCR text.
+
+The same survey is often OCR'd more than once: re-uploads after a failed
+save, duplicates inside a batch ZIP, or a photo forwarded through a chat app
+that re-compresses or downsizes it. Byte hashes miss all but the first case,
+so entries are keyed by the image handed to Tesseract instead:
+
+  - a binary fingerprint: the image resized to FINGERPRINT_WIDTH (aspect
+    kept) and Otsu-binarised;
+  - a 256-bit dHash of that fingerprint, compared by Hamming distance.
+
+A perceptual hash alone is not enough for OCR: a form whose only change is
+one digit ("D: 5" vs "D: 6", "CAND-0042" vs "CAND-0043") is within a few
+bits of the original, as is a re-compressed copy. The hash therefore only
+shortlists entries; a hit also needs the fingerprints to agree pixel by
+pixel once thin edge jitter (resampling, JPEG) is removed with a
+morphological opening. A changed character leaves a solid blob there and is
+rejected.
+
+Entries live in a bounded in-memory LRU. With DISC_OCR_CACHE_PATH set they
+are also written to SQLite, and the newest ones are loaded back when the
+process starts. Each worker process keeps its own memory tier; that includes
+the batch OCR pool processes (see DISCExternalPipeline.process_ocr_batch),
+so images of a batch only hit entries their own pool process stored.
+"""
+
+import os
+import time
+import sqlite3
+import logging
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, NamedTuple, Tuple
+
+from .service_registry import lazy_import
+
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+cv2 = lazy_import('cv2')
+np = lazy_import('numpy')
+
+# Fingerprint width in pixels; narrower images are kept at their own width
+FINGERPRINT_WIDTH = 512
+# dHash grid: HASH_SIZE x HASH_SIZE bits
+HASH_SIZE = 16
+# Shortlisted entries verified per lookup, nearest hash first
+MAX_VERIFICATIONS = 3
+
+
+class OcrImageKey(NamedTuple):
+    """Lookup key of one image: dHash plus the packed binary fingerprint it was computed from."""
+    phash: int
+    shape: Tuple[int, int]
+    fingerprint: bytes
+
+
+def ocr_fingerprint(image: "np.ndarray") -> "np.ndarray":
+    """The image (BGR or grayscale) at FINGERPRINT_WIDTH as a 0/1 ink mask."""
+    gray = image if image.ndim == 2 else cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    height, width = gray.shape
+    target_width = min(FINGERPRINT_WIDTH, width)
+    target_height = max(1, round(height * target_width / width))
+    small = cv2.resize(gray, (target_width, target_height), interpolation=cv2.INTER_AREA)
+    _, ink = cv2.threshold(small, 0, 1, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+    return ink
+
+
+def perceptual_hash(fingerprint: "np.ndarray") -> int:
+    """dHash of a fingerprint: one bit per horizontally adjacent cell pair of a HASH_SIZE grid."""
+    cells = cv2.resize(fingerprint * 255, (HASH_SIZE + 1, HASH_SIZE), interpolation=cv2.INTER_AREA)
+    cells = cells.astype(np.int16)
+    return int.from_bytes(np.packbits((cells[:, 1:] > cells[:, :-1]).ravel()).tobytes(), 'big')
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin(a ^ b).count('1')
+
+
+class OcrTextCache:
+    """
+    OCR text cache keyed by perceptual hash (with a Hamming tolerance) plus
+    fingerprint verification.
+
+    `max_entries` of 0 disables the cache; `db_path` of "" disables the disk tier.
+    """
+
+    def __init__(self,
+                 max_entries: Optional[int] = None,
+                 max_distance: Optional[int] = None,
+                 max_diff_pixels: Optional[int] = None,
+                 db_path: Optional[str] = None):
+        self.max_entries = max_entries if max_entries is not None else int(
+            os.getenv('DISC_OCR_CACHE_MAX_ENTRIES', 256))
+        self.max_distance = max_distance if max_distance is not None else int(
+            os.getenv('DISC_OCR_CACHE_MAX_DISTANCE', 12))
+        self.max_diff_pixels = max_diff_pixels if max_diff_pixels is not None else int(
+            os.getenv('DISC_OCR_CACHE_MAX_DIFF_PIXELS', 12))
+        self.db_path = db_path if db_path is not None else os.getenv('DISC_OCR_CACHE_PATH', '')
+
+        # entry id -> (config, key, text); ids follow the SQLite rowids when the disk tier is on
+        self._memory: "OrderedDict[int, Tuple[str, OcrImageKey, str]]" = OrderedDict()
+        self._memory_bytes = 0
+        self._next_id = 1
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "near_hits": 0, "misses": 0, "rejected": 0, "stores": 0, "evictions": 0}
+
+        if self.db_path and self.max_entries > 0:
+            try:
+                self._init_db()
+                self._load_from_disk()
+            except sqlite3.Error as e:
+                logger.error(f"OCR cache disk tier disabled, cannot open '{self.db_path}': {e}")
+                self.db_path = ""
+
+    # ==================== Public API ====================
+
+    def image_key(self, image: Any) -> Optional[OcrImageKey]:
+        """Key of an image about to be OCR'd, or None if it cannot be fingerprinted."""
+        if self.max_entries <= 0:
+            return None
+        image = np.asarray(image)
+        if image.dtype != np.uint8 or image.ndim not in (2, 3) or 0 in image.shape[:2]:
+            return None
+        fingerprint = ocr_fingerprint(image)
+        return OcrImageKey(perceptual_hash(fingerprint), fingerprint.shape, np.packbits(fingerprint).tobytes())
+
+    def get(self, key: OcrImageKey, config: str) -> Optional[str]:
+        """Cached text of an image OCR'd with `config` that matches `key`, or None on a miss."""
+        with self._lock:
+            candidates = sorted(
+                (hamming_distance(key.phash, entry_key.phash), entry_id)
+                for entry_id, (entry_config, entry_key, _) in self._memory.items()
+                if entry_config == config
+            )
+            fingerprint = None
+            for distance, entry_id in candidates[:MAX_VERIFICATIONS]:
+                if distance > self.max_distance:
+                    break
+                _, entry_key, text = self._memory[entry_id]
+                if fingerprint is None:
+                    fingerprint = self._unpack(key)
+                if not self._same_content(fingerprint, entry_key):
+                    self.stats["rejected"] += 1
+                    continue
+                self._memory.move_to_end(entry_id)
+                self.stats["hits"] += 1
+                if distance:
+                    self.stats["near_hits"] += 1
+                return text
+            self.stats["misses"] += 1
+            return None
+
+    def put(self, key: OcrImageKey, config: str, text: str) -> None:
+        """Stores the OCR text of an image, evicting the least recently used entries past max_entries."""
+        if self.max_entries <= 0:
+            return
+        entry_id = self._disk_put(key, config, text)
+        with self._lock:
+            if entry_id is None:
+                entry_id = self._next_id
+            self._next_id = max(self._next_id, entry_id + 1)
+            self._memory_put(entry_id, (config, key, text))
+            self.stats["stores"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+        if self.db_path:
+            try:
+                with self._connect() as conn:
+                    conn.execute("DELETE FROM ocr_texts")
+            except sqlite3.Error as e:
+                logger.error(f"OCR cache clear failed: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.stats["hits"] + self.stats["misses"]
+            return {
+                **self.stats,
+                "hit_rate": round(self.stats["hits"] / lookups, 4) if lookups else 0.0,
+                "entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+                "max_entries": self.max_entries,
+                "max_distance": self.max_distance,
+                "disk_enabled": bool(self.db_path)
+            }
+
+    # ==================== Private Helper Methods ====================
+
+    @staticmethod
+    def _unpack(key: OcrImageKey) -> "np.ndarray":
+        height, width = key.shape
+        bits = np.unpackbits(np.frombuffer(key.fingerprint, np.uint8), count=height * width)
+        return bits.reshape(height, width)
+
+    def _same_content(self, fingerprint: "np.ndarray", entry_key: OcrImageKey) -> bool:
+        """Fingerprints agree once differences thinner than 2 px (edge jitter) are opened away."""
+        other = self._unpack(entry_key)
+        if other.shape != fingerprint.shape:
+            # Rounding of a rescaled copy's height; anything else is another layout
+            if other.shape[1] != fingerprint.shape[1] or abs(other.shape[0] - fingerprint.shape[0]) > 1:
+                return False
+            other = cv2.resize(other, fingerprint.shape[::-1], interpolation=cv2.INTER_NEAREST)
+        diff = cv2.morphologyEx(cv2.bitwise_xor(fingerprint, other), cv2.MORPH_OPEN, np.ones((2, 2), np.uint8))
+        return cv2.countNonZero(diff) <= self.max_diff_pixels
+
+    @staticmethod
+    def _entry_bytes(entry: Tuple[str, OcrImageKey, str]) -> int:
+        config, key, text = entry
+        return len(key.fingerprint) + len(text) + len(config)
+
+    def _memory_put(self, entry_id: int, entry: Tuple[str, OcrImageKey, str]) -> None:
+        """Caller must hold self._lock."""
+        self._memory[entry_id] = entry
+        self._memory_bytes += self._entry_bytes(entry)
+        while len(self._memory) > self.max_entries:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= self._entry_bytes(evicted)
+            self.stats["evictions"] += 1
+
+    @contextmanager
+    def _connect(self):
+        """Short-lived connection per operation; commits on success and always closes."""
+        conn = sqlite3.connect(self.db_path, timeout=5)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _init_db(self) -> None:
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS ocr_texts ("
+                " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+                " config TEXT NOT NULL,"
+                " phash TEXT NOT NULL,"
+                " height INTEGER NOT NULL,"
+                " width INTEGER NOT NULL,"
+                " fingerprint BLOB NOT NULL,"
+                " text TEXT NOT NULL,"
+                " created_at REAL NOT NULL)"
+            )
+
+    def _load_from_disk(self) -> None:
+        """Warms the memory tier with the newest max_entries entries, oldest first."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT id, config, phash, height, width, fingerprint, text FROM ocr_texts "
+                "ORDER BY id DESC LIMIT ?", (self.max_entries,)
+            ).fetchall()
+        with self._lock:
+            for entry_id, config, phash, height, width, fingerprint, text in reversed(rows):
+                key = OcrImageKey(int(phash, 16), (height, width), bytes(fingerprint))
+                self._memory_put(entry_id, (config, key, text))
+                self._next_id = entry_id + 1
+        if rows:
+            logger.info(f"OCR cache loaded {len(rows)} entries from '{self.db_path}'")
+
+    def _disk_put(self, key: OcrImageKey, config: str, text: str) -> Optional[int]:
+        """Writes an entry and trims the table to max_entries; returns its id, None without a disk tier."""
+        if not self.db_path:
+            return None
+        try:
+            with self._connect() as conn:
+                cursor = conn.execute(
+                    "INSERT INTO ocr_texts (config, phash, height, width, fingerprint, text, created_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (config, format(key.phash, 'x'), key.shape[0], key.shape[1],
+                     sqlite3.Binary(key.fingerprint), text, time.time())
+                )
+                entry_id = cursor.lastrowid
+                conn.execute("DELETE FROM ocr_texts WHERE id <= ?", (entry_id - self.max_entries,))
+            return entry_id
+        except sqlite3.Error as e:
+            logger.warning(f"OCR cache disk write failed: {e}")
+            return None
+
+
+_ocr_cache = None
+_ocr_cache_pid = None
+_ocr_cache_lock = threading.Lock()
+
+
+def get_ocr_cache() -> OcrTextCache:
+    """Per-process singleton for the OCR text cache (a forked batch worker gets its own)."""
+    global _ocr_cache, _ocr_cache_pid
+    with _ocr_cache_lock:
+        if _ocr_cache is None or _ocr_cache_pid != os.getpid():
+            _ocr_cache = OcrTextCache()
+            _ocr_cache_pid = os.getpid()
+        return _ocr_cache
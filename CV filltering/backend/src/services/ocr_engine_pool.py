@@ -0,0 +1,315 @@
+# backend/src/services/ocr_engine_pool.py
+"""
+Pool of warm Tesseract engines for DISC survey OCR.
+
+`pytesseract.image_to_string` writes the image to a temp file and forks a
+new `tesseract` process per call, which reloads the language data every
+time. The pool instead keeps DISC_OCR_POOL_SIZE worker processes, each of
+which initialises an engine at start-up and reuses it for every job (jobs
+with another config, like the candidate-id box's single-line --psm 7, get a
+second engine in the worker, loaded once):
+
+  - tesserocr (Tesseract C API bindings) when installed: images are handed
+    to the engine as raw pixel buffers, no temp files, no fork per image;
+  - otherwise pytesseract inside the worker (still a subprocess per image,
+    but off the request thread and under the same pool limits).
+
+Images travel to the workers in memory over a pipe. Each job has a timeout;
+a worker that exceeds it is killed and replaced, so a pathological scan
+cannot hold an engine forever.
+"""
+
+import os
+import time
+import queue
+import shlex
+import logging
+import threading
+import multiprocessing
+from typing import Dict, Any, Optional, Callable, Tuple
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+EngineFactory = Callable[[str, str], Tuple[str, Callable[[Any, float], str]]]
+
+
+class OcrTimeoutError(RuntimeError):
+    """An OCR job did not finish within its timeout (RuntimeError, like pytesseract's timeout)."""
+
+
+def _tesseract_options(config: str) -> Dict[str, Any]:
+    """`--oem N --psm N -c name=value` from a tesseract command-line config string."""
+    options: Dict[str, Any] = {"variables": {}}
+    tokens = shlex.split(config or '')
+    for index, token in enumerate(tokens[:-1]):
+        value = tokens[index + 1]
+        if token in ('--oem', '--psm') and value.isdigit():
+            options[token[2:]] = int(value)
+        elif token == '-c' and '=' in value:
+            name, _, setting = value.partition('=')
+            options["variables"][name] = setting
+    return options
+
+
+def load_tesseract_engine(lang: str, config: str) -> Tuple[str, Callable[[Any, float], str]]:
+    """
+    Worker side: (engine name, image_to_string(image, timeout)) for the best
+    available engine. `image` is a 2-D (grayscale) or 3-D uint8 array.
+    """
+    try:
+        import tesserocr
+    except ImportError:
+        tesserocr = None
+
+    if tesserocr is not None:
+        options = _tesseract_options(config)
+        api = tesserocr.PyTessBaseAPI(
+            lang=lang,
+            psm=options.get('psm', tesserocr.PSM.AUTO),
+            oem=options.get('oem', tesserocr.OEM.DEFAULT)
+        )
+        for name, setting in options["variables"].items():
+            api.SetVariable(name, setting)
+
+        def image_to_string(image, timeout):
+            height, width = image.shape[:2]
+            channels = image.shape[2] if image.ndim == 3 else 1
+            api.SetImageBytes(image.tobytes(), width, height, channels, width * channels)
+            return api.GetUTF8Text()
+
+        return "tesserocr", image_to_string
+
+    import pytesseract
+
+    def image_to_string(image, timeout):
+        return pytesseract.image_to_string(image, lang=lang, config=config, timeout=timeout)
+
+    return "pytesseract", image_to_string
+
+
+def _worker_main(conn, lang: str, config: str, engine_factory: EngineFactory) -> None:
+    """
+    Worker entry point: loads the engine for the pool's config, then serves
+    (image, timeout, config) jobs until told to stop, keeping one engine per config.
+    """
+    try:
+        engine_name, image_to_string = engine_factory(lang, config)
+    except Exception as e:
+        conn.send(("failed", f"{type(e).__name__}: {e}"))
+        return
+    engines = {config: image_to_string}
+    conn.send(("ready", engine_name))
+
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, OSError):
+            return
+        if job is None:
+            return
+        image, timeout, job_config = job
+        try:
+            if job_config not in engines:
+                engines[job_config] = engine_factory(lang, job_config)[1]
+            conn.send(("ok", engines[job_config](image, timeout)))
+        except Exception as e:
+            conn.send(("error", f"{type(e).__name__}: {e}"))
+
+
+class _EngineWorker:
+    """One worker process and the parent's end of its pipe."""
+
+    def __init__(self, context, lang: str, config: str, engine_factory: EngineFactory):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main, args=(child_conn, lang, config, engine_factory), daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.engine: Optional[str] = None
+
+    def run(self, image, timeout: float, config: str) -> str:
+        deadline = time.monotonic() + timeout
+        if self.engine is None:
+            # First job: the engine finishes loading before the worker reads it
+            status, payload = self._receive(deadline, "engine start-up")
+            if status != "ready":
+                raise RuntimeError(f"OCR engine failed to start: {payload}")
+            self.engine = payload
+
+        try:
+            self.conn.send((image, max(deadline - time.monotonic(), 0.001), config))
+        except OSError as e:
+            raise RuntimeError(f"OCR worker unavailable: {e}")
+        status, payload = self._receive(deadline, "OCR job")
+        if status != "ok":
+            raise RuntimeError(f"OCR engine error: {payload}")
+        return payload
+
+    def stop(self, kill: bool = False) -> None:
+        try:
+            if kill:
+                self.process.kill()
+            else:
+                self.conn.send(None)
+            self.process.join(timeout=1)
+            if self.process.is_alive():
+                self.process.kill()
+                self.process.join(timeout=1)
+        except (OSError, ValueError):
+            pass
+        finally:
+            self.conn.close()
+
+    def _receive(self, deadline: float, what: str):
+        if not self.conn.poll(max(deadline - time.monotonic(), 0)):
+            raise OcrTimeoutError(f"{what} timeout")
+        try:
+            return self.conn.recv()
+        except EOFError:
+            raise RuntimeError(f"OCR worker exited (code {self.process.exitcode}) during {what}")
+
+
+class OcrEnginePool:
+    """
+    Fixed-size pool of worker processes, each holding a warm Tesseract engine.
+
+    Thread-safe: request threads check a worker out, run one image on it and
+    return it. A job that times out or crashes its worker gets the worker
+    replaced with a fresh one.
+    """
+
+    def __init__(self,
+                 size: Optional[int] = None,
+                 timeout: Optional[float] = None,
+                 lang: Optional[str] = None,
+                 config: Optional[str] = None,
+                 engine_factory: Optional[EngineFactory] = None):
+        self.size = size if size is not None else int(os.getenv('DISC_OCR_POOL_SIZE', min(2, os.cpu_count() or 1)))
+        self.timeout = timeout if timeout is not None else float(os.getenv('DISC_OCR_TIMEOUT_SECONDS', 30))
+        self.lang = lang or os.getenv('DISC_OCR_LANG', 'eng')
+        self.config = config if config is not None else os.getenv('TESSERACT_CONFIG', r'--oem 3 --psm 6')
+        self.engine_factory = engine_factory or load_tesseract_engine
+
+        # Workers are started from request threads: take them from a forkserver
+        # (spawn where unavailable), as forking a threaded process can copy a
+        # lock another thread holds and deadlock the child
+        method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+        self._context = multiprocessing.get_context(method)
+        self._idle: "queue.Queue[_EngineWorker]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._workers = 0
+        self._closed = False
+        self._pid = os.getpid()
+        self._stats = {"jobs": 0, "errors": 0, "timeouts": 0, "restarts": 0, "total_ms": 0.0}
+        self._engine: Optional[str] = None
+
+    # ==================== Public API ====================
+
+    def start(self) -> None:
+        """Spawns the missing workers; their engines load in the background."""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("OCR engine pool is closed")
+            while self._workers < self.size:
+                self._idle.put(self._spawn())
+
+    def image_to_string(self, image, timeout: Optional[float] = None, config: Optional[str] = None) -> str:
+        """
+        OCRs one preprocessed image (uint8 NumPy array) on a warm engine set up
+        with `config` (default: the pool's TESSERACT_CONFIG).
+        `timeout` bounds waiting for a free worker plus the OCR itself.
+        Raises OcrTimeoutError on timeout, RuntimeError if the engine fails.
+        """
+        timeout = timeout if timeout is not None else self.timeout
+        deadline = time.monotonic() + timeout
+        if self._workers < self.size:
+            self.start()
+        try:
+            worker = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            self._count("timeouts")
+            raise OcrTimeoutError(f"No OCR engine free within {timeout}s timeout")
+
+        started = time.perf_counter()
+        replace = False
+        try:
+            text = worker.run(image, deadline - time.monotonic(), config if config is not None else self.config)
+            self._engine = worker.engine
+            return text
+        except OcrTimeoutError:
+            self._count("timeouts")
+            replace = True
+            raise
+        except RuntimeError:
+            self._count("errors")
+            replace = not worker.process.is_alive() or worker.engine is None
+            raise
+        finally:
+            self._count("jobs", (time.perf_counter() - started) * 1000)
+            if replace or self._closed:
+                if replace:
+                    logger.warning("Replacing OCR worker after timeout or crash")
+                worker.stop(kill=replace)
+                with self._lock:
+                    self._workers -= 1
+                    self._stats["restarts"] += replace
+                if not self._closed:
+                    self.start()
+            else:
+                self._idle.put(worker)
+
+    def close(self) -> None:
+        """Stops the idle workers; workers busy with a job stop when they are returned."""
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            worker.stop()
+            with self._lock:
+                self._workers -= 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            workers = self._workers
+        jobs = stats.pop("total_ms")
+        return {
+            "size": self.size,
+            "workers": workers,
+            "idle": self._idle.qsize(),
+            "engine": self._engine,
+            "timeout_seconds": self.timeout,
+            **stats,
+            "avg_ms": round(jobs / stats["jobs"], 3) if stats["jobs"] else 0.0
+        }
+
+    # ==================== Private Helper Methods ====================
+
+    def _spawn(self) -> _EngineWorker:
+        self._workers += 1
+        return _EngineWorker(self._context, self.lang, self.config, self.engine_factory)
+
+    def _count(self, name: str, elapsed_ms: Optional[float] = None) -> None:
+        with self._lock:
+            self._stats[name] += 1
+            if elapsed_ms is not None:
+                self._stats["total_ms"] += elapsed_ms
+
+
+_pool: Optional[OcrEnginePool] = None
+_pool_lock = threading.Lock()
+
+
+def get_ocr_engine_pool() -> OcrEnginePool:
+    """Returns the per-process OCR engine pool, created on first use (a forked child gets its own)."""
+    global _pool
+    with _pool_lock:
+        if _pool is None or _pool._pid != os.getpid():
+            _pool = OcrEnginePool()
+        return _pool
@@ -0,0 +1,249 @@
+# backend/src/services/parse_cache.py
+"""
+Content-addressed cache for CV parse results.
+
+Entries are keyed by the SHA-256 of the uploaded bytes plus the parser version
+(see CvParsingService.parser_version). Lookups go through a bounded in-memory
+LRU tier first, then a SQLite tier on local disk that every gunicorn worker on
+the host shares. Invalidations bump a generation counter in SQLite so other
+workers drop their in-memory tier on their next sync. The SQLite tier keeps
+the newest PARSE_CACHE_MAX_DISK_ENTRIES results; older ones are deleted as
+new ones are written.
+"""
+
+import os
+import copy
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import tempfile
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, Tuple, Union, BinaryIO
+
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def content_hash(upload: Union[bytes, BinaryIO]) -> str:
+    """SHA-256 hex digest of an uploaded file (bytes, or a seekable stream read in chunks)."""
+    if isinstance(upload, (bytes, bytearray)):
+        return hashlib.sha256(upload).hexdigest()
+    digest = hashlib.sha256()
+    upload.seek(0)
+    for chunk in iter(lambda: upload.read(64 * 1024), b""):
+        digest.update(chunk)
+    upload.seek(0)
+    return digest.hexdigest()
+
+
+class ParseResultCache:
+    """
+    Two-tier (memory LRU + SQLite) cache of parse results.
+
+    `db_path` of "" disables the disk tier; `max_entries` of 0 disables the
+    memory tier. The disk tier holds at most `max_disk_entries` results,
+    deleting the oldest first.
+    """
+
+    def __init__(self,
+                 max_entries: Optional[int] = None,
+                 db_path: Optional[str] = None,
+                 sync_interval: Optional[float] = None,
+                 max_disk_entries: Optional[int] = None):
+        self.max_entries = max_entries if max_entries is not None else int(os.getenv('PARSE_CACHE_MAX_ENTRIES', 256))
+        self.max_disk_entries = (max_disk_entries if max_disk_entries is not None
+                                 else int(os.getenv('PARSE_CACHE_MAX_DISK_ENTRIES', 10000)))
+        self.db_path = db_path if db_path is not None else os.getenv(
+            'PARSE_CACHE_PATH', os.path.join(tempfile.gettempdir(), 'cv_parse_cache.sqlite3'))
+        self.sync_interval = (sync_interval if sync_interval is not None
+                              else float(os.getenv('PARSE_CACHE_SYNC_SECONDS', 5)))
+
+        self._memory: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._last_sync = 0.0
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "stores": 0}
+
+        if self.db_path:
+            try:
+                self._init_db()
+                self._generation = self._read_generation()
+            except sqlite3.Error as e:
+                logger.error(f"Parse cache disk tier disabled, cannot open '{self.db_path}': {e}")
+                self.db_path = ""
+
+    # ==================== Public API ====================
+
+    def get(self, file_hash: str, parser_version: str) -> Optional[Dict[str, Any]]:
+        """Returns the cached result, or None on a miss."""
+        key = (file_hash, parser_version)
+        self._sync_generation()
+
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.stats["memory_hits"] += 1
+                return copy.deepcopy(self._memory[key])
+
+        result = self._disk_get(file_hash, parser_version)
+        with self._lock:
+            if result is None:
+                self.stats["misses"] += 1
+                return None
+            self.stats["disk_hits"] += 1
+            self._memory_put(key, copy.deepcopy(result))
+        return result
+
+    def put(self, file_hash: str, parser_version: str, result: Dict[str, Any]) -> None:
+        """Stores a result in both tiers."""
+        with self._lock:
+            self._memory_put((file_hash, parser_version), copy.deepcopy(result))
+            self.stats["stores"] += 1
+        self._disk_put(file_hash, parser_version, result)
+
+    def invalidate(self, file_hash: Optional[str] = None) -> int:
+        """
+        Removes every parser version cached for `file_hash`, or everything when
+        `file_hash` is None. Returns the number of disk entries removed.
+        """
+        with self._lock:
+            if file_hash is None:
+                memory_removed = len(self._memory)
+                self._memory.clear()
+            else:
+                stale = [key for key in self._memory if key[0] == file_hash]
+                for key in stale:
+                    del self._memory[key]
+                memory_removed = len(stale)
+
+        removed = memory_removed
+        if self.db_path:
+            try:
+                with self._connect() as conn:
+                    if file_hash is None:
+                        cursor = conn.execute("DELETE FROM parse_results")
+                    else:
+                        cursor = conn.execute("DELETE FROM parse_results WHERE content_hash = ?", (file_hash,))
+                    removed = cursor.rowcount
+                    conn.execute("UPDATE cache_meta SET value = value + 1 WHERE key = 'generation'")
+                self._generation = self._read_generation()
+            except sqlite3.Error as e:
+                logger.error(f"Parse cache invalidation failed: {e}")
+        logger.info(f"Parse cache invalidated: hash={file_hash or '*'}, removed={removed}")
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self.stats,
+                "memory_entries": len(self._memory),
+                "max_entries": self.max_entries,
+                "max_disk_entries": self.max_disk_entries,
+                "disk_enabled": bool(self.db_path)
+            }
+
+    # ==================== Private Helper Methods ====================
+
+    def _memory_put(self, key: Tuple[str, str], result: Dict[str, Any]) -> None:
+        """Caller must hold self._lock."""
+        if self.max_entries <= 0:
+            return
+        self._memory[key] = result
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    @contextmanager
+    def _connect(self):
+        """Short-lived connection per operation; commits on success and always closes."""
+        conn = sqlite3.connect(self.db_path, timeout=5)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _init_db(self) -> None:
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS parse_results ("
+                " content_hash TEXT NOT NULL,"
+                " parser_version TEXT NOT NULL,"
+                " result_json TEXT NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " PRIMARY KEY (content_hash, parser_version))"
+            )
+            conn.execute("CREATE TABLE IF NOT EXISTS cache_meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+            conn.execute("INSERT OR IGNORE INTO cache_meta (key, value) VALUES ('generation', 0)")
+
+    def _read_generation(self) -> int:
+        with self._connect() as conn:
+            row = conn.execute("SELECT value FROM cache_meta WHERE key = 'generation'").fetchone()
+        return row[0] if row else 0
+
+    def _sync_generation(self) -> None:
+        """Drops the memory tier if another worker invalidated entries since the last sync."""
+        if not self.db_path or time.monotonic() - self._last_sync < self.sync_interval:
+            return
+        self._last_sync = time.monotonic()
+        try:
+            generation = self._read_generation()
+        except sqlite3.Error as e:
+            logger.warning(f"Parse cache generation check failed: {e}")
+            return
+        if generation != self._generation:
+            with self._lock:
+                self._memory.clear()
+            self._generation = generation
+
+    def _disk_get(self, file_hash: str, parser_version: str) -> Optional[Dict[str, Any]]:
+        if not self.db_path:
+            return None
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT result_json FROM parse_results WHERE content_hash = ? AND parser_version = ?",
+                    (file_hash, parser_version)
+                ).fetchone()
+            return json.loads(row[0]) if row else None
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning(f"Parse cache disk read failed: {e}")
+            return None
+
+    def _disk_put(self, file_hash: str, parser_version: str, result: Dict[str, Any]) -> None:
+        if not self.db_path:
+            return
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO parse_results (content_hash, parser_version, result_json, created_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (file_hash, parser_version, json.dumps(result, ensure_ascii=False), time.time())
+                )
+                # INSERT OR REPLACE re-inserts, so rowids follow write order: keep the newest rows
+                conn.execute(
+                    "DELETE FROM parse_results WHERE rowid IN "
+                    "(SELECT rowid FROM parse_results ORDER BY rowid DESC LIMIT -1 OFFSET ?)",
+                    (max(self.max_disk_entries, 1),)
+                )
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"Parse cache disk write failed: {e}")
+
+
+_parse_cache = None
+_parse_cache_lock = threading.Lock()
+
+
+def get_parse_cache() -> ParseResultCache:
+    """Per-process singleton for the parse result cache."""
+    global _parse_cache
+    with _parse_cache_lock:
+        if _parse_cache is None:
+            _parse_cache = ParseResultCache()
+        return _parse_cache
@@ -0,0 +1,230 @@
+# backend/src/services/parse_job_queue.py
+"""
+Asynchronous CV parsing job queue.
+
+Jobs are persisted in a local SQLite file so they survive a worker restart:
+each gunicorn worker runs a small pool of background threads that claim queued
+jobs with a lease. A job whose lease expires (its worker died mid-parse) is
+claimed again, up to `max_attempts` times.
+"""
+
+import os
+import json
+import time
+import uuid
+import sqlite3
+import logging
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, Callable
+
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[str, bytes], Dict[str, Any]]
+
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_SUCCEEDED = "succeeded"
+STATUS_FAILED = "failed"
+
+
+class ParseJobQueue:
+    """
+    SQLite-backed job queue with an in-process worker pool.
+
+    `handler(filename, file_bytes)` runs for every job and must return a
+    JSON-serialisable dict, which becomes the job result.
+    """
+
+    def __init__(self,
+                 handler: JobHandler,
+                 db_path: Optional[str] = None,
+                 workers: Optional[int] = None,
+                 lease_seconds: Optional[float] = None,
+                 max_attempts: int = 3,
+                 poll_interval: float = 1.0,
+                 retention_seconds: Optional[float] = None):
+        self.handler = handler
+        self.db_path = db_path or os.getenv(
+            'CV_JOB_DB_PATH', os.path.join(tempfile.gettempdir(), 'cv_parse_jobs.sqlite3'))
+        self.workers = workers if workers is not None else int(os.getenv('CV_JOB_WORKERS', 2))
+        self.lease_seconds = lease_seconds if lease_seconds is not None else float(os.getenv('CV_JOB_LEASE_SECONDS', 300))
+        self.max_attempts = max_attempts
+        self.poll_interval = poll_interval
+        self.retention_seconds = (retention_seconds if retention_seconds is not None
+                                  else float(os.getenv('CV_JOB_RETENTION_SECONDS', 86400)))
+
+        self._threads = []
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._start_lock = threading.Lock()
+        self._init_db()
+
+    # ==================== Public API ====================
+
+    def submit(self, filename: str, file_bytes: bytes) -> str:
+        """Persists a job and returns its id; workers pick it up asynchronously."""
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO parse_jobs (id, status, filename, payload, attempts, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, 0, ?, ?)",
+                (job_id, STATUS_QUEUED, filename, sqlite3.Binary(file_bytes), now, now)
+            )
+        logger.info(f"Queued CV parsing job {job_id} ({filename})")
+        self.start()
+        self._wakeup.set()
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Returns the job status (and result or error once finished), or None if unknown."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT id, status, filename, attempts, result_json, error, created_at, updated_at "
+                "FROM parse_jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        if not row:
+            return None
+        job = {
+            "job_id": row[0],
+            "status": row[1],
+            "filename": row[2],
+            "attempts": row[3],
+            "created_at": row[6],
+            "updated_at": row[7]
+        }
+        if row[4] is not None:
+            job["result"] = json.loads(row[4])
+        if row[5] is not None:
+            job["error"] = row[5]
+        return job
+
+    def start(self) -> None:
+        """Starts the worker threads once per process (no-op when already running)."""
+        with self._start_lock:
+            self._threads = [t for t in self._threads if t.is_alive()]
+            if self._threads or self.workers <= 0:
+                return
+            self._stop.clear()
+            for index in range(self.workers):
+                thread = threading.Thread(target=self._worker_loop, name=f"cv-parse-job-{index}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        self._wakeup.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def run_pending(self) -> int:
+        """Processes claimable jobs on the calling thread until none are left. Returns the count."""
+        processed = 0
+        while self._process_next():
+            processed += 1
+        return processed
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._connect() as conn:
+            rows = conn.execute("SELECT status, COUNT(*) FROM parse_jobs GROUP BY status").fetchall()
+        return {status: count for status, count in rows}
+
+    # ==================== Private Helper Methods ====================
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=10, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def _init_db(self) -> None:
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS parse_jobs ("
+                " id TEXT PRIMARY KEY,"
+                " status TEXT NOT NULL,"
+                " filename TEXT NOT NULL,"
+                " payload BLOB,"
+                " attempts INTEGER NOT NULL DEFAULT 0,"
+                " lease_expires_at REAL,"
+                " result_json TEXT,"
+                " error TEXT,"
+                " created_at REAL NOT NULL,"
+                " updated_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_parse_jobs_status ON parse_jobs (status, created_at)")
+
+    def _worker_loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                if self._process_next():
+                    continue
+            except Exception as e:
+                logger.error(f"CV parsing job worker error: {e}", exc_info=True)
+            self._wakeup.wait(self.poll_interval)
+            self._wakeup.clear()
+
+    def _process_next(self) -> bool:
+        job = self._claim()
+        if job is None:
+            return False
+        job_id, filename, payload = job
+        try:
+            result = self.handler(filename, bytes(payload))
+            self._finish(job_id, STATUS_SUCCEEDED, result_json=json.dumps(result, ensure_ascii=False, default=str))
+            logger.info(f"CV parsing job {job_id} succeeded")
+        except Exception as e:
+            logger.error(f"CV parsing job {job_id} failed: {e}", exc_info=True)
+            self._finish(job_id, STATUS_FAILED, error=str(e))
+        return True
+
+    def _claim(self):
+        """Atomically leases the oldest queued job, or a running job whose lease expired."""
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Jobs orphaned by a crashed worker too many times are given up on
+                conn.execute(
+                    "UPDATE parse_jobs SET status = ?, error = ?, payload = NULL, updated_at = ? "
+                    "WHERE status = ? AND lease_expires_at < ? AND attempts >= ?",
+                    (STATUS_FAILED, "Worker lost the job too many times", now, STATUS_RUNNING, now, self.max_attempts)
+                )
+                row = conn.execute(
+                    "SELECT id, filename, payload FROM parse_jobs "
+                    "WHERE status = ? OR (status = ? AND lease_expires_at < ?) "
+                    "ORDER BY created_at LIMIT 1",
+                    (STATUS_QUEUED, STATUS_RUNNING, now)
+                ).fetchone()
+                if row:
+                    conn.execute(
+                        "UPDATE parse_jobs SET status = ?, attempts = attempts + 1, lease_expires_at = ?, updated_at = ? "
+                        "WHERE id = ?",
+                        (STATUS_RUNNING, now + self.lease_seconds, now, row[0])
+                    )
+                elif self.retention_seconds > 0:
+                    conn.execute(
+                        "DELETE FROM parse_jobs WHERE status IN (?, ?) AND updated_at < ?",
+                        (STATUS_SUCCEEDED, STATUS_FAILED, now - self.retention_seconds)
+                    )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        return row
+
+    def _finish(self, job_id: str, status: str, result_json: Optional[str] = None, error: Optional[str] = None) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE parse_jobs SET status = ?, result_json = ?, error = ?, payload = NULL, "
+                "lease_expires_at = NULL, updated_at = ? WHERE id = ?",
+                (status, result_json, error, time.time(), job_id)
+            )
@@ -0,0 +1,178 @@
+# backend/src/services/pdf_ocr.py
+"""
+OCR fallback for scanned PDF pages.
+
+Pages whose text layer is (nearly) empty are rasterised from the scan images
+embedded in the page, cleaned up with the same OpenCV preprocessing as the
+DISC survey OCR (`DISCExternalPipeline._preprocess_image_for_ocr`) and run
+through Tesseract on the shared PDF process pool; the images are pulled out
+of the PDF by the caller, so a job carries one page's scans, never the whole
+document. A per-document time budget
+bounds the work: pages not finished in time are reported as skipped instead
+of holding the worker.
+"""
+
+import os
+import time
+import logging
+from concurrent.futures import wait, FIRST_COMPLETED
+from typing import Dict, Any, List, Optional
+
+from .service_registry import lazy_import
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+pytesseract = lazy_import('pytesseract')
+
+# Embedded images smaller than this are logos/icons, not page scans
+MIN_SCAN_IMAGE_BYTES = 2048
+
+
+def is_textless(text: str, min_chars: int) -> bool:
+    """True when a page's text layer is too thin to be the real content."""
+    return len((text or "").strip()) < min_chars
+
+
+def _page_scan_images(page) -> List[bytes]:
+    """Encoded scan images of a page, largest first (PyPDF2 decodes them to PNG/JPEG bytes)."""
+    try:
+        images = [image.data for image in page.images]
+    except Exception as e:
+        logger.warning(f"Could not read images of PDF page: {e}")
+        return []
+    images = [data for data in images if len(data) >= MIN_SCAN_IMAGE_BYTES]
+    return sorted(images, key=len, reverse=True)
+
+
+def _ocr_page(page_number: int, images: List[bytes], lang: str, config: str, deadline: float) -> Dict[str, Any]:
+    """
+    Worker entry point: OCRs the scan images of one page. The caller pulls the
+    images out of the PDF, so only they cross to the worker. `deadline` is a
+    time.time() timestamp, so pages that start late get only what is left.
+    """
+    started = time.perf_counter()
+    result = {"page": page_number, "text": "", "images": len(images), "error": None}
+    if time.time() >= deadline:
+        result["error"] = "timeout"
+        result["elapsed_ms"] = 0.0
+        return result
+    try:
+        texts = []
+        if images:
+            from .disc_pipeline import DISCExternalPipeline
+            preprocessor = DISCExternalPipeline()
+        for image_bytes in images:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                result["error"] = "timeout"
+                break
+            image = preprocessor._preprocess_image_for_ocr(image_bytes)
+            texts.append(_image_to_string(image, lang, config, remaining))
+        result["text"] = "\n".join(text.strip() for text in texts if text and text.strip())
+    except RuntimeError as e:
+        # pytesseract raises RuntimeError when its timeout kills tesseract
+        result["error"] = "timeout" if "timeout" in str(e).lower() else str(e)
+    except Exception as e:
+        result["error"] = str(e)
+    result["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 3)
+    return result
+
+
+def _image_to_string(image, lang: str, config: str, timeout: float) -> str:
+    try:
+        return pytesseract.image_to_string(image, lang=lang, config=config, timeout=timeout)
+    except pytesseract.TesseractError as e:
+        # Servers without the Vietnamese traineddata still get English OCR
+        if lang != 'eng' and 'language' in str(e).lower():
+            logger.warning(f"Tesseract language '{lang}' unavailable, retrying with 'eng'")
+            return pytesseract.image_to_string(image, lang='eng', config=config, timeout=timeout)
+        raise
+
+
+class ScannedPageOcr:
+    """
+    OCRs selected PDF pages within a per-document time budget.
+
+    With `max_workers` > 1 pages run on the shared PDF process pool;
+    otherwise they run inline on the calling thread.
+    """
+
+    def __init__(self,
+                 time_budget: Optional[float] = None,
+                 max_workers: Optional[int] = None,
+                 lang: Optional[str] = None,
+                 config: Optional[str] = None):
+        self.time_budget = time_budget if time_budget is not None else float(os.getenv('PDF_OCR_TIME_BUDGET_SECONDS', 20))
+        self.max_workers = (max_workers if max_workers is not None
+                            else int(os.getenv('PDF_WORKERS', min(4, os.cpu_count() or 1))))
+        self.lang = lang or os.getenv('PDF_OCR_LANG', 'vie+eng')
+        self.config = config if config is not None else os.getenv('PDF_OCR_CONFIG', '--oem 3 --psm 3')
+
+    def ocr_pages(self, reader, pages: List[int]) -> Dict[str, Any]:
+        """
+        OCRs the given 1-based page numbers of an open PyPDF2 reader. Each
+        page's scan images are extracted here and only those bytes go to the
+        pool, so the cost of a job does not grow with the document.
+
+        Returns {"pages": {page: {"text", "images", "error", "elapsed_ms"}},
+        "skipped": [pages not attempted or cut off by the budget],
+        "elapsed_ms": total}.
+        """
+        started = time.perf_counter()
+        deadline = time.time() + self.time_budget
+        if self.max_workers > 1 and len(pages) > 1:
+            results, skipped = self._ocr_parallel(reader, pages, deadline)
+        else:
+            results, skipped = self._ocr_inline(reader, pages, deadline)
+        return {
+            "pages": results,
+            "skipped": sorted(skipped),
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 3)
+        }
+
+    # ==================== Private Helper Methods ====================
+
+    def _ocr_inline(self, reader, pages, deadline):
+        results = {}
+        skipped = []
+        for page in pages:
+            if time.time() >= deadline:
+                skipped.append(page)
+                continue
+            images = _page_scan_images(reader.pages[page - 1])
+            results[page] = _ocr_page(page, images, self.lang, self.config, deadline)
+        return results, skipped
+
+    def _ocr_parallel(self, reader, pages, deadline):
+        from .pdf_text_extractor import _get_process_pool
+
+        pool = _get_process_pool(self.max_workers)
+        results = {}
+        futures = {}
+        for page in pages:
+            if time.time() >= deadline:
+                break
+            images = _page_scan_images(reader.pages[page - 1])
+            if images:
+                futures[pool.submit(_ocr_page, page, images, self.lang, self.config, deadline)] = page
+            else:
+                results[page] = _ocr_page(page, images, self.lang, self.config, deadline)
+
+        pending = set(futures)
+        while pending:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[futures[future]] = future.result()
+
+        # Queued pages are dropped; running ones stop at their own tesseract timeout
+        for future in pending:
+            future.cancel()
+        skipped = [page for page in pages if page not in results]
+        if skipped:
+            logger.warning(f"OCR time budget of {self.time_budget}s exhausted; skipped pages {sorted(skipped)}")
+        return results, skipped
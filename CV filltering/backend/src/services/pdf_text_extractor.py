@@ -0,0 +1,263 @@
+# backend/src/services/pdf_text_extractor.py
+"""
+Streaming PDF text extraction engine.
+
+Pages are processed as a stream: small documents are read sequentially on the
+calling thread, large documents are split into page ranges and spread across a
+shared process pool. Output is joined once at the end, extraction stops early
+when the page or character budget is reached, and every page reports its own
+extraction time. Pages without a usable text layer (scans) are OCR'd through
+`pdf_ocr.ScannedPageOcr` and merged back in page order.
+"""
+
+import io
+import os
+import time
+import logging
+import threading
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Iterator, Optional, Tuple, Union, BinaryIO
+
+from .service_registry import lazy_import
+from .pdf_ocr import ScannedPageOcr, is_textless
+
+PyPDF2 = lazy_import('PyPDF2')
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+PdfSource = Union[str, bytes, BinaryIO]
+
+_pool = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def _get_process_pool(max_workers: int) -> ProcessPoolExecutor:
+    """
+    Returns the per-process shared pool, created lazily on first use. It is
+    created from a request thread, so workers come from a forkserver (spawn
+    where unavailable) rather than a fork of the threaded process.
+    """
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != max_workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False, cancel_futures=True)
+            method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+            _pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context(method))
+            _pool_workers = max_workers
+        return _pool
+
+
+def _open_reader(source: PdfSource) -> "PyPDF2.PdfReader":
+    if isinstance(source, (bytes, bytearray)):
+        return PyPDF2.PdfReader(io.BytesIO(source))
+    if hasattr(source, "read"):
+        source.seek(0)
+    return PyPDF2.PdfReader(source)
+
+
+def _extract_page(page) -> str:
+    return page.extract_text() or ""
+
+
+def _chunk_args(source: PdfSource, reader: "PyPDF2.PdfReader", start: int, stop: int) -> Tuple[Union[str, bytes], int, int, int]:
+    """
+    `_extract_page_range` arguments for pages [start, stop): a document on disk
+    is passed by path, anything else as a PDF of just those pages (and the
+    resources they use), so no chunk ships or re-parses the whole document.
+    """
+    if isinstance(source, str):
+        return source, start, stop, start + 1
+    writer = PyPDF2.PdfWriter()
+    for index in range(start, stop):
+        writer.add_page(reader.pages[index])
+    out = io.BytesIO()
+    writer.write(out)
+    return out.getvalue(), 0, stop - start, start + 1
+
+
+def _extract_page_range(source: Union[str, bytes], start: int, stop: int, first_page: int) -> List[Dict[str, Any]]:
+    """Worker entry point: extracts pages [start, stop) of `source`, numbering them from `first_page`."""
+    reader = _open_reader(source)
+    pages = []
+    for index in range(start, stop):
+        started = time.perf_counter()
+        text = _extract_page(reader.pages[index])
+        pages.append({
+            "page": first_page + index - start,
+            "text": text,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 3)
+        })
+    return pages
+
+
+class PdfTextExtractor:
+    """
+    Extracts text from a PDF page by page with page/character budgets.
+
+    A budget of 0 means unlimited. Documents with at least
+    `parallel_min_pages` pages are extracted in chunks of `chunk_size`
+    pages on a process pool with `max_workers` workers. Pages with fewer
+    than `ocr_min_chars` characters of text are OCR'd when `ocr` is set.
+    """
+
+    def __init__(self,
+                 max_pages: Optional[int] = None,
+                 max_chars: Optional[int] = None,
+                 parallel_min_pages: Optional[int] = None,
+                 max_workers: Optional[int] = None,
+                 chunk_size: Optional[int] = None,
+                 ocr: Optional[ScannedPageOcr] = None,
+                 ocr_min_chars: Optional[int] = None):
+        self.max_pages = max_pages if max_pages is not None else int(os.getenv('PDF_MAX_PAGES', 0))
+        self.max_chars = max_chars if max_chars is not None else int(os.getenv('PDF_MAX_CHARS', 0))
+        self.parallel_min_pages = (parallel_min_pages if parallel_min_pages is not None
+                                   else int(os.getenv('PDF_PARALLEL_MIN_PAGES', 16)))
+        self.max_workers = (max_workers if max_workers is not None
+                            else int(os.getenv('PDF_WORKERS', min(4, os.cpu_count() or 1))))
+        self.chunk_size = max(1, chunk_size if chunk_size is not None else int(os.getenv('PDF_PAGE_CHUNK', 4)))
+        self.ocr_min_chars = ocr_min_chars if ocr_min_chars is not None else int(os.getenv('PDF_OCR_MIN_TEXT_CHARS', 20))
+        if ocr is None and os.getenv('PDF_OCR_ENABLED', 'true').lower() in ('1', 'true', 'yes'):
+            ocr = ScannedPageOcr(max_workers=self.max_workers)
+        self.ocr = ocr
+
+    def extract(self, source: PdfSource) -> Dict[str, Any]:
+        """
+        Extracts the document text.
+
+        Returns a dict with the joined `text`, `page_count`, `pages_processed`,
+        `truncated` (and `truncated_reason`), `parallel`, total `elapsed_ms`,
+        `page_timings` as a list of {"page", "elapsed_ms", "chars", "source"}
+        where source is "text", "ocr" or "empty", and `ocr` with the OCR'd and
+        budget-skipped page numbers (None when no page needed OCR).
+        """
+        started = time.perf_counter()
+        reader = _open_reader(source)
+        page_count = len(reader.pages)
+        page_limit = min(page_count, self.max_pages) if self.max_pages > 0 else page_count
+        parallel = self._should_parallelise(page_limit)
+
+        collected = []
+        text_chars = 0
+        truncated_reason = "max_pages" if page_limit < page_count else None
+
+        pages = self._iter_parallel(source, reader, page_limit) if parallel else self._iter_sequential(reader, page_limit)
+        try:
+            for page in pages:
+                collected.append(page)
+                text_chars += len(page["text"])
+                if self.max_chars > 0 and text_chars > self.max_chars:
+                    break
+        finally:
+            pages.close()
+
+        ocr_summary = self._ocr_textless_pages(reader, collected)
+
+        parts = []
+        page_timings = []
+        total_chars = 0
+        for page in collected:
+            text = page["text"]
+            if self.max_chars > 0 and total_chars + len(text) > self.max_chars:
+                text = text[:self.max_chars - total_chars]
+                truncated_reason = "max_chars"
+            if text:
+                parts.append(text)
+            total_chars += len(text)
+            page_timings.append({
+                "page": page["page"],
+                "elapsed_ms": page["elapsed_ms"],
+                "chars": len(text),
+                "source": page.get("source") or ("text" if text else "empty")
+            })
+            if truncated_reason == "max_chars":
+                break
+
+        return {
+            "text": "\n".join(parts),
+            "page_count": page_count,
+            "pages_processed": len(page_timings),
+            "truncated": truncated_reason is not None,
+            "truncated_reason": truncated_reason,
+            "parallel": parallel,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 3),
+            "page_timings": page_timings,
+            "ocr": ocr_summary
+        }
+
+    def iter_pages(self, source: PdfSource) -> Iterator[Dict[str, Any]]:
+        """Yields {"page", "text", "elapsed_ms"} per page in document order, honouring max_pages only."""
+        reader = _open_reader(source)
+        page_count = len(reader.pages)
+        page_limit = min(page_count, self.max_pages) if self.max_pages > 0 else page_count
+        if self._should_parallelise(page_limit):
+            return self._iter_parallel(source, reader, page_limit)
+        return self._iter_sequential(reader, page_limit)
+
+    def _ocr_textless_pages(self, reader: "PyPDF2.PdfReader", pages: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """OCRs pages whose text layer is too thin and merges the text in place."""
+        if self.ocr is None:
+            return None
+        textless = [page["page"] for page in pages if is_textless(page["text"], self.ocr_min_chars)]
+        if not textless:
+            return None
+
+        outcome = self.ocr.ocr_pages(reader, textless)
+        by_number = {page["page"]: page for page in pages}
+        ocr_pages = []
+        for number, result in outcome["pages"].items():
+            if result["text"]:
+                page = by_number[number]
+                # Keep whatever thin text layer there was (e.g. a page number) after the OCR text
+                page["text"] = "\n".join(part for part in (result["text"], page["text"].strip()) if part)
+                page["elapsed_ms"] = round(page["elapsed_ms"] + result["elapsed_ms"], 3)
+                page["source"] = "ocr"
+                ocr_pages.append(number)
+        errors = {number: result["error"] for number, result in outcome["pages"].items() if result["error"]}
+        return {
+            "pages": sorted(ocr_pages),
+            "skipped": outcome["skipped"],
+            "errors": errors,
+            "elapsed_ms": outcome["elapsed_ms"]
+        }
+
+    def _should_parallelise(self, page_count: int) -> bool:
+        return self.max_workers > 1 and self.parallel_min_pages > 0 and page_count >= self.parallel_min_pages
+
+    def _iter_sequential(self, reader: "PyPDF2.PdfReader", page_limit: int) -> Iterator[Dict[str, Any]]:
+        for index in range(page_limit):
+            started = time.perf_counter()
+            text = _extract_page(reader.pages[index])
+            yield {
+                "page": index + 1,
+                "text": text,
+                "elapsed_ms": round((time.perf_counter() - started) * 1000, 3)
+            }
+
+    def _iter_parallel(self, source: PdfSource, reader: "PyPDF2.PdfReader", page_limit: int) -> Iterator[Dict[str, Any]]:
+        """
+        Keeps at most two chunks per worker in flight and yields results in
+        page order; chunks not yet started are cancelled if the consumer stops.
+        Each chunk carries only its own pages (see _chunk_args).
+        """
+        pool = _get_process_pool(self.max_workers)
+        ranges = deque(
+            (start, min(start + self.chunk_size, page_limit))
+            for start in range(0, page_limit, self.chunk_size)
+        )
+        window = deque()
+        try:
+            while ranges or window:
+                while ranges and len(window) < self.max_workers * 2:
+                    start, stop = ranges.popleft()
+                    window.append(pool.submit(_extract_page_range, *_chunk_args(source, reader, start, stop)))
+                for page in window.popleft().result():
+                    yield page
+        finally:
+            for future in window:
+                future.cancel()
@@ -0,0 +1,185 @@
+# backend/src/services/rule_based_extractor.py
+"""
+Rule-based CV extractor used when Gemini is unavailable or out of quota.
+
+All patterns are compiled once at import time. Contact details and date
+ranges come from a single `finditer` over one alternation regex; names and
+education entries come from one pass over the lines; skills come from the
+Aho–Corasick skill matcher. The output has the same shape as the Gemini
+parser's personalInfo / education / experience / skills.
+"""
+
+import re
+import logging
+from typing import Dict, Any, List, Optional
+
+from .skill_matcher import SkillMatcher, get_skill_matcher
+
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+_MONTH = r'(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?'
+_DATE = (
+    r'(?<![\w/])(?:(?:' + _MONTH + r'|(?:tháng|th|t)\s*\.?\s*(?:0?[1-9]|1[0-2])\s*[/,]?)\s*(?:19|20)\d{2}'
+    r'|(?:0?[1-9]|1[0-2])\s*[/.-]\s*(?:19|20)\d{2}'
+    r'|(?:19|20)\d{2})'
+)
+_PRESENT = r'(?:present|now|current|today|nay|hiện\s+tại|hiện\s+nay)'
+
+TOKEN_PATTERN = re.compile(
+    r'(?P<email>[\w.+-]+@[\w-]+(?:\.[\w-]+)+)'
+    r'|(?P<date_range>' + _DATE + r'\s*(?:-|–|—|~|to|until|đến|tới)\s*(?:' + _DATE + r'|' + _PRESENT + r'))'
+    r'|(?P<phone_vn>(?<![\w+])(?:(?:\+|00)84[\s.-]?(?:\(0\)[\s.-]?)?|\(\+84\)[\s.-]?|0)(?:\d[\s.-]?){8,9}\d(?!\d))'
+    r'|(?P<phone_intl>(?<![\w+])(?:\+|00)(?!84)[1-9]\d{0,2}[\s.-]?(?:\(\d{1,4}\)[\s.-]?)?(?:\d[\s.-]?){5,12}\d(?!\d))',
+    re.IGNORECASE
+)
+
+YEAR_PATTERN = re.compile(r'(?<!\d)(?:19|20)\d{2}(?!\d)')
+NAME_LABEL_PATTERN = re.compile(r'^\s*(?:họ\s+và\s+tên|họ\s+tên|full\s*name|name|tên)\s*[:：\-]\s*(?P<name>.+?)\s*$', re.IGNORECASE)
+NAME_WORD_PATTERN = re.compile(r"^[^\W\d_][^\W\d_'.-]*(?:[.'-][^\W\d_]+)*\.?$")
+DEGREE_PATTERN = re.compile(
+    r'\b(?:bachelor(?:\'s)?|master(?:\'s)?|ph\.?\s?d|doctor(?:ate)?|mba|b\.?\s?sc|m\.?\s?sc|b\.?\s?eng|m\.?\s?eng'
+    r'|associate\s+degree|diploma|cử\s+nhân|thạc\s+sĩ|tiến\s+sĩ|cao\s+đẳng|trung\s+cấp|bằng\s+\w+)\b',
+    re.IGNORECASE
+)
+# Also a job title ("Kỹ sư phần mềm"), so only read as a degree next to an institution
+ENGINEER_DEGREE_PATTERN = re.compile(r'\b(?:kỹ\s+sư|kĩ\s+sư|engineer(?:ing)?)\b', re.IGNORECASE)
+INSTITUTION_PATTERN = re.compile(
+    r'\b(?:university|college|institute|academy|school|polytechnic|đại\s+học|học\s+viện|trường|viện)\b',
+    re.IGNORECASE
+)
+FIELD_SEPARATOR_PATTERN = re.compile(r'\s*(?:\||•|·|;|,|\s[-–—]\s|\bat\b|\btại\b)\s*', re.IGNORECASE)
+FIELD_STRIP_CHARS = ' -–—():|'
+HEADING_WORDS = {
+    'curriculum', 'vitae', 'resume', 'résumé', 'cv', 'profile', 'hồ', 'sơ', 'sơ yếu', 'lý', 'lịch',
+    'contact', 'liên', 'hệ', 'summary', 'objective', 'mục', 'tiêu', 'experience', 'education', 'skills'
+}
+
+MAX_NAME_SCAN_LINES = 8
+
+
+class RuleBasedCvExtractor:
+    """Extracts structured CV data with precompiled rules and the skill matcher."""
+
+    def __init__(self, skill_matcher: Optional[SkillMatcher] = None):
+        self._skill_matcher = skill_matcher
+
+    @property
+    def skill_matcher(self) -> SkillMatcher:
+        # Built on first use so importing the parser does not load the dictionary
+        if self._skill_matcher is None:
+            self._skill_matcher = get_skill_matcher()
+        return self._skill_matcher
+
+    def extract(self, text: str) -> Dict[str, Any]:
+        """Returns {"personalInfo", "education", "experience", "skills"} for the CV text."""
+        text = text or ""
+        emails, phones, ranges = [], [], []
+        for match in TOKEN_PATTERN.finditer(text):
+            kind = match.lastgroup
+            if kind == 'email':
+                emails.append(match.group())
+            elif kind == 'date_range':
+                ranges.append(match)
+            else:
+                phones.append(self._normalize_phone(match.group()))
+
+        lines = text.splitlines()
+        return {
+            "personalInfo": {
+                "name": self._extract_name(lines) or "N/A",
+                "email": emails[0] if emails else "N/A",
+                "phone": phones[0] if phones else "N/A"
+            },
+            "education": self._extract_education(lines),
+            "experience": self._extract_experience(text, ranges),
+            "skills": self.skill_matcher.match(text)
+        }
+
+    # ==================== Private Helper Methods ====================
+
+    @staticmethod
+    def _normalize_phone(raw: str) -> str:
+        """Keeps digits and a leading +, e.g. '+84 912.345.678' -> '+84912345678'."""
+        raw = raw.replace('(0)', '')
+        digits = re.sub(r'\D', '', raw)
+        if raw.lstrip('(').startswith('+'):
+            return '+' + digits
+        if digits.startswith('00'):
+            return '+' + digits[2:]
+        return digits
+
+    def _extract_name(self, lines: List[str]) -> Optional[str]:
+        for line in lines:
+            labelled = NAME_LABEL_PATTERN.match(line)
+            if labelled:
+                return self._format_name(labelled.group('name'))
+
+        scanned = 0
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            scanned += 1
+            if scanned > MAX_NAME_SCAN_LINES:
+                break
+            words = line.split()
+            if not 2 <= len(words) <= 5:
+                continue
+            if any(word.lower() in HEADING_WORDS for word in words):
+                continue
+            if all(NAME_WORD_PATTERN.match(word) and word[0].isupper() for word in words):
+                return self._format_name(line)
+        return None
+
+    @staticmethod
+    def _format_name(name: str) -> str:
+        name = ' '.join(name.split())
+        return name.title() if name.isupper() else name
+
+    def _extract_education(self, lines: List[str]) -> List[Dict[str, str]]:
+        entries = []
+        for line in lines:
+            if not self._is_education_line(line):
+                continue
+            fields = [field for field in FIELD_SEPARATOR_PATTERN.split(YEAR_PATTERN.sub(' ', line)) if field.strip(FIELD_STRIP_CHARS)]
+            degree = (self._field_containing(fields, DEGREE_PATTERN)
+                      or self._field_containing(fields, ENGINEER_DEGREE_PATTERN))
+            institution = self._field_containing(fields, INSTITUTION_PATTERN)
+            years = YEAR_PATTERN.findall(line)
+            entries.append({
+                "degree": degree or "N/A",
+                "institution": institution or "N/A",
+                "year": years[-1] if years else "N/A"
+            })
+        return entries
+
+    def _extract_experience(self, text: str, ranges) -> List[Dict[str, str]]:
+        entries = []
+        for match in ranges:
+            line_start = text.rfind('\n', 0, match.start()) + 1
+            line_end = text.find('\n', match.end())
+            line_end = len(text) if line_end == -1 else line_end
+            line = text[line_start:match.start()] + ' ' + text[match.end():line_end]
+            if self._is_education_line(line):
+                continue
+            fields = [field.strip(FIELD_STRIP_CHARS) for field in FIELD_SEPARATOR_PATTERN.split(line.strip())]
+            fields = [field for field in fields if field]
+            entries.append({
+                "title": fields[0] if fields else "N/A",
+                "company": fields[1] if len(fields) > 1 else "N/A",
+                "duration": ' '.join(match.group().split())
+            })
+        return entries
+
+    @staticmethod
+    def _is_education_line(line: str) -> bool:
+        return bool(INSTITUTION_PATTERN.search(line) or DEGREE_PATTERN.search(line))
+
+    @staticmethod
+    def _field_containing(fields: List[str], pattern) -> Optional[str]:
+        for field in fields:
+            if pattern.search(field):
+                return field.strip(FIELD_STRIP_CHARS)
+        return None
@@ -0,0 +1,161 @@
+# backend/src/services/service_registry.py
+"""
+Lazy service registry.
+
+Keeps backend cold start cheap: heavy third-party modules (cv2, numpy,
+pytesseract, google.generativeai, supabase, ...) are bound as `lazy_import`
+proxies that import on first attribute access, and services are registered
+as factories that run on first `get_service()` call, once per worker
+process. A process that inherited built services through fork() rebuilds
+them instead of sharing thread/process pools with its parent.
+"""
+
+import os
+import time
+import logging
+import importlib
+import threading
+from typing import Dict, Any, Callable, Optional
+
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class LazyModule:
+    """
+    Stand-in for a module that is imported on first attribute access.
+    Module-level names bound to it stay patchable in tests like a real import.
+    """
+
+    def __init__(self, name: str):
+        self.__dict__['_name'] = name
+        self.__dict__['_module'] = None
+
+    def _load(self):
+        module = self.__dict__['_module']
+        if module is None:
+            start = time.perf_counter()
+            module = importlib.import_module(self.__dict__['_name'])
+            self.__dict__['_module'] = module
+            logger.info(f"Lazy import of {self.__dict__['_name']} took {(time.perf_counter() - start) * 1000:.0f} ms")
+        return module
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr: str, value) -> None:
+        setattr(self._load(), attr, value)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.__dict__['_module'] is not None else "not loaded"
+        return f"<lazy module '{self.__dict__['_name']}' ({state})>"
+
+
+def lazy_import(name: str) -> LazyModule:
+    """`cv2 = lazy_import('cv2')` defers `import cv2` until `cv2.<attr>` is first used."""
+    return LazyModule(name)
+
+
+class ServiceRegistry:
+    """Builds each registered service on first use, once per process."""
+
+    def __init__(self):
+        self._factories: Dict[str, Callable[[], Any]] = {}
+        self._instances: Dict[str, Any] = {}
+        self._build_ms: Dict[str, float] = {}
+        self._pid = os.getpid()
+        self._lock = threading.RLock()
+
+    def register(self, name: str, factory: Callable[[], Any]) -> None:
+        with self._lock:
+            self._factories[name] = factory
+            self._instances.pop(name, None)
+
+    def get(self, name: str) -> Any:
+        self._reset_after_fork()
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+        with self._lock:
+            instance = self._instances.get(name)
+            if instance is None:
+                if name not in self._factories:
+                    raise KeyError(f"Unknown service: {name}")
+                start = time.perf_counter()
+                instance = self._factories[name]()
+                self._build_ms[name] = round((time.perf_counter() - start) * 1000, 2)
+                self._instances[name] = instance
+                logger.info(f"Service '{name}' built in {self._build_ms[name]} ms (pid {self._pid})")
+            return instance
+
+    def is_loaded(self, name: str) -> bool:
+        self._reset_after_fork()
+        return name in self._instances
+
+    def reset(self, name: Optional[str] = None) -> None:
+        """Drops built instances (all, or one) so the next get() rebuilds them."""
+        with self._lock:
+            if name is None:
+                self._instances.clear()
+                self._build_ms.clear()
+            else:
+                self._instances.pop(name, None)
+                self._build_ms.pop(name, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        self._reset_after_fork()
+        with self._lock:
+            return {
+                "pid": self._pid,
+                "registered": sorted(self._factories),
+                "loaded": dict(self._build_ms)
+            }
+
+    # ==================== Private Helper Methods ====================
+
+    def _reset_after_fork(self) -> None:
+        pid = os.getpid()
+        if pid != self._pid:
+            self._lock = threading.RLock()
+            self._pid = pid
+            self._instances = {}
+            self._build_ms = {}
+
+
+# ==================== Default services ====================
+
+def _build_cv_parser():
+    from .cv_parsing_service import CvParsingService
+    return CvParsingService()
+
+
+def _build_disc_pipeline():
+    from .disc_pipeline import DISCExternalPipeline
+    return DISCExternalPipeline()
+
+
+def _build_numerology():
+    from .numerology_service import NumerologyService
+    return NumerologyService()
+
+
+def _build_job_ranking():
+    from .job_ranking_service import JobRankingService
+    return JobRankingService()
+
+
+_registry = ServiceRegistry()
+_registry.register('cv_parser', _build_cv_parser)
+_registry.register('disc_pipeline', _build_disc_pipeline)
+_registry.register('numerology', _build_numerology)
+_registry.register('job_ranking', _build_job_ranking)
+
+
+def get_registry() -> ServiceRegistry:
+    return _registry
+
+
+def get_service(name: str) -> Any:
+    """Returns the per-process instance of a registered service, building it on first use."""
+    return _registry.get(name)
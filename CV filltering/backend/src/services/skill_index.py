@@ -0,0 +1,272 @@
+# backend/src/services/skill_index.py
+"""
+Inverted skill index for candidate search.
+
+Maps normalised skill terms (aliases folded to the dictionary's canonical
+name, case/diacritics/whitespace folded) to the set of candidate ids whose
+latest CV lists the skill. DatabaseService adds each CV analysis as it is
+saved; `rebuild()` reloads everything from `cv_analyses`, which
+`ensure_loaded()` repeats every SKILL_INDEX_REFRESH_SECONDS to pick up CVs
+saved by other worker processes. AND queries
+intersect posting lists smallest first, OR queries union them and rank by
+the number of matched skills; `suggest()` completes a skill prefix for
+type-ahead.
+"""
+
+import os
+import time
+import heapq
+import bisect
+import logging
+import threading
+from typing import Dict, Any, List, Optional, Set, Iterable, Tuple
+
+from .skill_matcher import get_skill_matcher, normalize_skill
+
+# Distinct skill spellings whose (key, canonical name) is memoised
+TERM_CACHE_SIZE = 50000
+
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class SkillIndex:
+    """Skill term -> candidate ids, plus the reverse map for incremental updates."""
+
+    def __init__(self, skill_matcher=None, refresh_seconds: Optional[float] = None):
+        self._skill_matcher = skill_matcher
+        self.refresh_seconds = (refresh_seconds if refresh_seconds is not None
+                                else float(os.getenv('SKILL_INDEX_REFRESH_SECONDS', 300)))
+        self._postings: Dict[str, Set[str]] = {}
+        self._candidate_terms: Dict[str, Set[str]] = {}
+        self._display: Dict[str, str] = {}
+        self._sorted_terms: Optional[List[str]] = None
+        self._built_at: Optional[float] = None
+        self._loaded_at = 0.0
+        self._term_cache: Dict[str, Tuple[str, str]] = {}
+        self._lock = threading.RLock()
+        self._load_lock = threading.Lock()
+
+    @property
+    def skill_matcher(self):
+        if self._skill_matcher is None:
+            self._skill_matcher = get_skill_matcher()
+        return self._skill_matcher
+
+    def term(self, skill: str) -> str:
+        """Index key of a skill as written in a CV or a query."""
+        return self._lookup(skill)[0]
+
+    # ==================== Public API ====================
+
+    def add(self, candidate_id: str, skills: Iterable[Any]) -> None:
+        """Indexes (or re-indexes) a candidate with the skills of their latest CV."""
+        if not candidate_id:
+            return
+        display = {}
+        for skill in skills or []:
+            if isinstance(skill, str) and skill.strip():
+                key, name = self._lookup(skill)
+                if key:
+                    display.setdefault(key, name)
+        with self._lock:
+            self._remove_locked(candidate_id)
+            for key, name in display.items():
+                if key not in self._postings:
+                    self._postings[key] = set()
+                    self._display.setdefault(key, name)
+                    self._sorted_terms = None
+                self._postings[key].add(candidate_id)
+            if display:
+                self._candidate_terms[candidate_id] = set(display)
+
+    def remove(self, candidate_id: str) -> None:
+        with self._lock:
+            self._remove_locked(candidate_id)
+
+    def rebuild(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """Replaces the index with `cv_analyses` rows ({candidate_id, skills}) read oldest first."""
+        fresh = SkillIndex(self.skill_matcher)
+        fresh._term_cache = self._term_cache
+        for row in rows:
+            fresh.add(row.get('candidate_id'), row.get('skills') or [])
+        with self._lock:
+            self._postings = fresh._postings
+            self._candidate_terms = fresh._candidate_terms
+            self._display = fresh._display
+            self._sorted_terms = None
+            self._built_at = time.time()
+            self._loaded_at = time.monotonic()
+        logger.info(f"Skill index rebuilt: {len(self._candidate_terms)} candidates, {len(self._postings)} skills")
+        return len(self._candidate_terms)
+
+    def load(self, db_service) -> int:
+        """Rebuilds the index from the `cv_analyses` table."""
+        return self.rebuild(db_service.fetch_rows('cv_analyses', 'candidate_id,skills', order_by='created_at'))
+
+    def is_built(self) -> bool:
+        return self._built_at is not None
+
+    def is_stale(self) -> bool:
+        """Never built, or loaded more than refresh_seconds ago (0 disables the refresh)."""
+        if self._built_at is None:
+            return True
+        return self.refresh_seconds > 0 and time.monotonic() - self._loaded_at > self.refresh_seconds
+
+    def ensure_loaded(self, db_service) -> bool:
+        """
+        Loads the index on first use and reloads it once stale. Concurrent first
+        callers wait for a single build; during a refresh they keep reading the
+        current index, which a failed refresh leaves in place until the next
+        interval. True if this call (re)loaded the index.
+        """
+        if not self.is_stale():
+            return False
+        if not self._load_lock.acquire(blocking=not self.is_built()):
+            return False
+        try:
+            if not self.is_stale():
+                return False
+            try:
+                self.load(db_service)
+            except Exception as e:
+                if not self.is_built():
+                    raise
+                self._loaded_at = time.monotonic()
+                logger.warning(f"Skill index refresh failed, keeping the current index: {e}")
+                return False
+            return True
+        finally:
+            self._load_lock.release()
+
+    def search(self, skills: List[str], mode: str = "and", limit: int = 50, offset: int = 0) -> Dict[str, Any]:
+        """
+        Candidates having all (mode "and") or any (mode "or") of `skills`.
+        OR results are ordered by matched-skill count, then id; AND results by id.
+        """
+        started = time.perf_counter()
+        keys = []
+        for skill in skills:
+            key = self.term(skill)
+            if key and key not in keys:
+                keys.append(key)
+
+        with self._lock:
+            lists = [self._postings.get(key, set()) for key in keys]
+            if not keys:
+                levels = []
+            elif mode == "or":
+                # at_least[j]: candidates matching more than j of the skills so far;
+                # set algebra keeps the per-candidate work inside C
+                at_least: List[Set[str]] = []
+                for postings in lists:
+                    at_least.append(set())
+                    for j in range(len(at_least) - 1, 0, -1):
+                        at_least[j] |= at_least[j - 1] & postings
+                    at_least[0] |= postings
+                levels = [at_least[j] - at_least[j + 1] if j + 1 < len(at_least) else at_least[j]
+                          for j in range(len(at_least) - 1, -1, -1)]
+            else:
+                # Smallest posting list first keeps every intersection step small
+                ordered = sorted(lists, key=len)
+                matched = set(ordered[0])
+                for postings in ordered[1:]:
+                    if not matched:
+                        break
+                    matched &= postings
+                levels = [matched]
+            total = sum(len(level) for level in levels)
+            page = self._page(levels, offset, limit)
+            candidates = [
+                {"candidate_id": candidate_id,
+                 "matched_skills": [self._display.get(key, key) for key, postings in zip(keys, lists)
+                                    if candidate_id in postings]}
+                for candidate_id in page
+            ]
+            query = [self._display.get(key, key) for key in keys]
+
+        return {
+            "query": query,
+            "mode": "or" if mode == "or" else "and",
+            "total": total,
+            "candidates": candidates,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 3)
+        }
+
+    def suggest(self, prefix: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Indexed skills starting with `prefix`, most common first."""
+        key = normalize_skill(prefix)
+        if not key:
+            return []
+        with self._lock:
+            if self._sorted_terms is None:
+                self._sorted_terms = sorted(self._postings)
+            terms = self._sorted_terms
+            start = bisect.bisect_left(terms, key)
+            end = bisect.bisect_left(terms, key + '￿', lo=start)
+            found = [(self._display.get(term, term), len(self._postings[term])) for term in terms[start:end]]
+        found.sort(key=lambda item: (-item[1], item[0]))
+        return [{"skill": name, "candidates": count} for name, count in found[:limit]]
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "candidates": len(self._candidate_terms),
+                "skills": len(self._postings),
+                "postings": sum(len(postings) for postings in self._postings.values()),
+                "built_at": self._built_at
+            }
+
+    # ==================== Private Helper Methods ====================
+
+    def _lookup(self, skill: str) -> Tuple[str, str]:
+        """(index key, canonical display name) of a skill spelling, memoised."""
+        cached = self._term_cache.get(skill)
+        if cached is None:
+            name = self.skill_matcher.canonicalize(skill)
+            cached = (normalize_skill(name), name)
+            if len(self._term_cache) >= TERM_CACHE_SIZE:
+                self._term_cache.clear()
+            self._term_cache[skill] = cached
+        return cached
+
+    @staticmethod
+    def _page(levels: List[Set[str]], offset: int, limit: int) -> List[str]:
+        """Ids at [offset, offset + limit) of the levels in order, each level sorted by id."""
+        page: List[str] = []
+        for level in levels:
+            if offset >= len(level):
+                offset -= len(level)
+                continue
+            wanted = offset + limit - len(page)
+            ids = heapq.nsmallest(wanted, level) if wanted < len(level) else sorted(level)
+            page.extend(ids[offset:])
+            offset = 0
+            if len(page) >= limit:
+                break
+        return page[:limit]
+
+    def _remove_locked(self, candidate_id: str) -> None:
+        for key in self._candidate_terms.pop(candidate_id, ()):
+            postings = self._postings.get(key)
+            if postings is None:
+                continue
+            postings.discard(candidate_id)
+            if not postings:
+                del self._postings[key]
+                self._display.pop(key, None)
+                self._sorted_terms = None
+
+
+_skill_index = None
+_skill_index_lock = threading.Lock()
+
+
+def get_skill_index() -> SkillIndex:
+    """Process-wide skill index."""
+    global _skill_index
+    with _skill_index_lock:
+        if _skill_index is None:
+            _skill_index = SkillIndex()
+        return _skill_index
@@ -0,0 +1,213 @@
+# backend/src/services/skill_matcher.py
+"""
+Multi-pattern skill matcher.
+
+Builds an Aho–Corasick automaton over every canonical skill name and alias in
+the skills dictionary, so a CV is scanned once in time linear in its length
+no matter how many terms the dictionary holds. Matching is case- and
+diacritic-insensitive ("Tiếng Anh" == "tieng anh"), respects word boundaries
+and resolves overlaps leftmost-longest ("C++" wins over "C").
+"""
+
+import os
+import re
+import logging
+import threading
+import unicodedata
+from collections import deque
+from typing import Dict, List, Optional, Tuple, Iterable
+
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_DICTIONARY_PATH = os.path.join(os.path.dirname(__file__), 'data', 'skills_dictionary.txt')
+
+# Terms this short are too ambiguous to match case-insensitively ("Go", "R", "AI")
+CASE_SENSITIVE_MAX_LENGTH = 2
+
+_FOLD_CACHE: Dict[str, str] = {}
+
+
+def _fold_char(ch: str) -> str:
+    """Folds one character to one character: lowercase, accents stripped, đ -> d."""
+    folded = _FOLD_CACHE.get(ch)
+    if folded is None:
+        base = unicodedata.normalize('NFD', ch)[0].lower()[:1] or ch
+        folded = 'd' if base == 'đ' else base
+        _FOLD_CACHE[ch] = folded
+    return folded
+
+
+def fold_text(text: str) -> str:
+    """
+    Length-preserving case/diacritic fold, so match offsets in the folded
+    text are valid offsets into the original text.
+    """
+    return ''.join([_fold_char(ch) for ch in text])
+
+
+def normalize_skill(skill: str) -> str:
+    """Comparison key of a skill: 'Node.JS ' -> 'node.js', 'Machine Learning' -> 'machinelearning'."""
+    return re.sub(r'\s+', '', fold_text(skill or ''))
+
+
+def load_skill_dictionary(path: str) -> List[Tuple[str, List[str]]]:
+    """
+    Reads `Canonical|alias|alias` lines (blank lines and # comments skipped).
+    Returns (canonical, terms) pairs where terms include the canonical name.
+    """
+    entries = []
+    with open(path, encoding='utf-8') as handle:
+        for line in handle:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            terms = [term.strip() for term in line.split('|') if term.strip()]
+            canonical = terms[0].lstrip('=')
+            entries.append((canonical, terms))
+    return entries
+
+
+class SkillMatcher:
+    """Aho–Corasick automaton over a skills dictionary."""
+
+    def __init__(self, entries: Iterable[Tuple[str, List[str]]]):
+        self.skills: List[str] = []
+        # Per pattern: (skill index, length, exact-case term or None)
+        self._patterns: List[Tuple[int, int, Optional[str]]] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+
+        for canonical, terms in entries:
+            skill_index = len(self.skills)
+            self.skills.append(canonical)
+            for term in terms:
+                self._add_pattern(skill_index, term)
+        self._build_failure_links()
+
+    @property
+    def term_count(self) -> int:
+        return len(self._patterns)
+
+    # ==================== Public API ====================
+
+    def find_all(self, text: str) -> List[Tuple[int, int, str]]:
+        """
+        Returns non-overlapping (start, end, canonical skill) spans in text
+        order, preferring the leftmost and then the longest match.
+        """
+        if not text:
+            return []
+        folded = fold_text(text)
+        goto, fail, output, patterns = self._goto, self._fail, self._output, self._patterns
+
+        candidates = []
+        state = 0
+        for position, ch in enumerate(folded):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for pattern_id in output[state]:
+                skill_index, length, exact = patterns[pattern_id]
+                start = position - length + 1
+                end = position + 1
+                if not self._at_boundary(folded, start, end):
+                    continue
+                if exact is not None and text[start:end] != exact:
+                    continue
+                candidates.append((start, -length, skill_index))
+
+        spans = []
+        covered_until = 0
+        for start, negative_length, skill_index in sorted(candidates):
+            if start < covered_until:
+                continue
+            end = start - negative_length
+            spans.append((start, end, self.skills[skill_index]))
+            covered_until = end
+        return spans
+
+    def match(self, text: str) -> List[str]:
+        """Canonical skill names found in `text`, deduplicated, in order of first appearance."""
+        seen = set()
+        found = []
+        for _, _, skill in self.find_all(text):
+            if skill not in seen:
+                seen.add(skill)
+                found.append(skill)
+        return found
+
+    def canonicalize(self, skill: str) -> str:
+        """
+        The canonical name when the whole of `skill` is one dictionary term
+        ("ReactJS" -> "React", "js" -> "JavaScript"); otherwise `skill` trimmed.
+        """
+        skill = (skill or '').strip()
+        spans = self.find_all(skill)
+        if len(spans) == 1 and spans[0][0] == 0 and spans[0][1] == len(skill):
+            return spans[0][2]
+        return skill
+
+    # ==================== Private Helper Methods ====================
+
+    def _add_pattern(self, skill_index: int, term: str) -> None:
+        exact = term.startswith('=')
+        term = term.lstrip('=')
+        if not term:
+            return
+        if len(term) <= CASE_SENSITIVE_MAX_LENGTH:
+            exact = True
+        folded = fold_text(term)
+
+        state = 0
+        for ch in folded:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][ch] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+
+        self._output[state].append(len(self._patterns))
+        self._patterns.append((skill_index, len(folded), term if exact else None))
+
+    def _build_failure_links(self) -> None:
+        """Breadth-first failure links; outputs are merged along them so lookups are O(1) per state."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    @staticmethod
+    def _at_boundary(folded: str, start: int, end: int) -> bool:
+        if start > 0 and folded[start - 1].isalnum() and folded[start].isalnum():
+            return False
+        if end < len(folded) and folded[end].isalnum() and folded[end - 1].isalnum():
+            return False
+        return True
+
+
+_matcher = None
+_matcher_lock = threading.Lock()
+
+
+def get_skill_matcher() -> SkillMatcher:
+    """Process-wide matcher built once from SKILLS_DICTIONARY_PATH (or the bundled dictionary)."""
+    global _matcher
+    with _matcher_lock:
+        if _matcher is None:
+            path = os.getenv('SKILLS_DICTIONARY_PATH') or DEFAULT_DICTIONARY_PATH
+            _matcher = SkillMatcher(load_skill_dictionary(path))
+            logger.info(f"Skill matcher built: {len(_matcher.skills)} skills, {_matcher.term_count} terms from {path}")
+        return _matcher
@@ -0,0 +1,172 @@
+# backend/src/services/stage_timing.py
+"""
+Per-stage timing for the request path.
+
+`stage("cv.extract_text")` is a context manager (and `timed(...)` the
+decorator form) that measures one stage. Every measurement feeds a
+process-wide latency histogram per stage name; stages that run inside a
+request started with `begin_request()` are also collected for that request
+and rendered as a `Server-Timing` header by `server_timing_header()`.
+Stages running on worker threads of a request still feed the histograms.
+"""
+
+import os
+import time
+import bisect
+import logging
+import threading
+import functools
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Any, List, Optional, Tuple
+
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Upper bounds (ms) of the histogram buckets; a final +Inf bucket is implicit
+DEFAULT_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+_request_stages: ContextVar[Optional[List[Tuple[str, float]]]] = ContextVar('request_stages', default=None)
+
+
+class StageHistogram:
+    """Fixed-bucket latency histogram of one stage."""
+
+    def __init__(self, buckets_ms=DEFAULT_BUCKETS_MS):
+        self.buckets_ms = tuple(buckets_ms)
+        self.counts = [0] * (len(self.buckets_ms) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, elapsed_ms: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets_ms, elapsed_ms)] += 1
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-quantile (max for the +Inf bucket)."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                return float(self.buckets_ms[index]) if index < len(self.buckets_ms) else round(self.max_ms, 3)
+        return round(self.max_ms, 3)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else None,
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": self.quantile(0.5),
+            "p95_ms": self.quantile(0.95),
+            "p99_ms": self.quantile(0.99),
+            "buckets": {
+                **{f"le_{bound}": count for bound, count in zip(self.buckets_ms, self.counts)},
+                "le_inf": self.counts[-1]
+            }
+        }
+
+
+class StageTimings:
+    """Process-wide latency histograms keyed by stage name."""
+
+    def __init__(self, enabled: Optional[bool] = None, buckets_ms=DEFAULT_BUCKETS_MS):
+        self.enabled = (enabled if enabled is not None
+                        else os.getenv('STAGE_TIMING_ENABLED', 'true').lower() in ('1', 'true', 'yes'))
+        self.buckets_ms = tuple(buckets_ms)
+        self._histograms: Dict[str, StageHistogram] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, elapsed_ms: float) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = StageHistogram(self.buckets_ms)
+            histogram.observe(elapsed_ms)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "pid": os.getpid(),
+                "stages": {name: histogram.snapshot() for name, histogram in sorted(self._histograms.items())}
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+
+_stage_timings = None
+_stage_timings_lock = threading.Lock()
+
+
+def get_stage_timings() -> StageTimings:
+    """Process-wide stage histograms."""
+    global _stage_timings
+    if _stage_timings is None:
+        with _stage_timings_lock:
+            if _stage_timings is None:
+                _stage_timings = StageTimings()
+    return _stage_timings
+
+
+# ==================== Public API ====================
+
+@contextmanager
+def stage(name: str):
+    """Times the enclosed block as stage `name` (also when it raises)."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        get_stage_timings().record(name, elapsed_ms)
+        stages = _request_stages.get()
+        if stages is not None:
+            stages.append((name, elapsed_ms))
+
+
+def timed(name: str):
+    """Decorator form of `stage()`."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with stage(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def begin_request() -> None:
+    """Starts collecting the stages of the current request (context)."""
+    _request_stages.set([])
+
+
+def end_request() -> List[Tuple[str, float]]:
+    """Stops collecting and returns the current request's (stage, elapsed_ms) in completion order."""
+    stages = _request_stages.get() or []
+    _request_stages.set(None)
+    return stages
+
+
+def server_timing_header(stages: List[Tuple[str, float]], total_ms: Optional[float] = None) -> str:
+    """
+    Renders stages as a Server-Timing value ("cv.parse;dur=12.3, ...").
+    Repeated stages are summed into one entry, in first-seen order.
+    """
+    merged: Dict[str, float] = {}
+    for name, elapsed_ms in stages:
+        merged[name] = merged.get(name, 0.0) + elapsed_ms
+    entries = [f"{name};dur={elapsed_ms:.1f}" for name, elapsed_ms in merged.items()]
+    if total_ms is not None:
+        entries.append(f"total;dur={total_ms:.1f}")
+    return ", ".join(entries)
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Latency benchmark: BM25 top-N CVs for a job description.
+
+Builds synthetic parsed CVs (bilingual experience text + skills) and ranks
+them for a job description with
+  - scan  : scores every CV in Python from its term counts, then sorts
+  - index : CvTextIndex.top_n (NumPy over the query terms' postings + argpartition)
+Index build time is reported separately; CVs are added incrementally as saved.
+
+Run from the "CV filltering" directory:
+    python tools/bench_cv_text_index.py [--docs 1000 10000 100000] [--n 20]
+"""
+
+import os
+import sys
+import math
+import time
+import random
+import argparse
+from collections import Counter
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from src.services.cv_text_index import CvTextIndex, tokenize, document_text
+
+SKILLS = ['Python', 'SQL', 'Machine Learning', 'Pandas', 'Tableau', 'JavaScript', 'React', 'Node.js',
+          'PostgreSQL', 'AWS', 'Docker', 'Kubernetes', 'Java', 'C#', 'Go', 'Figma', 'Excel', 'Power BI']
+PHRASES = ['Phát triển hệ thống backend', 'Xây dựng dashboard báo cáo', 'Quản lý dự án phần mềm',
+           'Designed REST APIs', 'Led a team of engineers', 'Built data pipelines', 'Tối ưu hiệu năng cơ sở dữ liệu',
+           'Phân tích dữ liệu khách hàng', 'Maintained CI/CD pipelines', 'Triển khai ứng dụng trên cloud']
+TITLES = ['Backend Developer', 'Data Analyst', 'Data Scientist', 'Frontend Developer', 'DevOps Engineer',
+          'Kỹ sư phần mềm', 'Chuyên viên phân tích', 'Project Manager']
+JD = """Senior Data Scientist. Yêu cầu: Python, SQL, Machine Learning, Pandas.
+Kinh nghiệm xây dựng data pipelines, phân tích dữ liệu khách hàng và triển khai mô hình trên cloud (AWS, Docker)."""
+
+
+def synthetic_cvs(n, seed=13):
+    rng = random.Random(seed)
+    return [{
+        "skills": rng.sample(SKILLS, rng.randint(2, 8)),
+        "experience": [{"title": rng.choice(TITLES), "description": '. '.join(rng.sample(PHRASES, 3))}
+                       for _ in range(rng.randint(1, 4))],
+        "education": [{"degree": "Cử nhân Công nghệ thông tin"}]
+    } for _ in range(n)]
+
+
+def scan(docs, jd, n, k1, b):
+    query = Counter(tokenize(jd))
+    avg = sum(sum(d.values()) for d in docs) / len(docs)
+    df = Counter(term for d in docs for term in d if term in query)
+    scores = []
+    for i, d in enumerate(docs):
+        length = sum(d.values())
+        score = 0.0
+        for term, qtf in query.items():
+            tf = d.get(term)
+            if tf:
+                idf = math.log(1 + (len(docs) - df[term] + 0.5) / (df[term] + 0.5))
+                score += qtf * idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * length / avg))
+        if score:
+            scores.append((-score, i))
+    scores.sort()
+    return [i for _, i in scores[:n]]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--docs', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--n', type=int, default=20)
+    args = parser.parse_args()
+
+    for n_docs in args.docs:
+        cvs = synthetic_cvs(n_docs)
+        index = CvTextIndex()
+        start = time.perf_counter()
+        for i, cv in enumerate(cvs):
+            index.add(f"C{i}", cv)
+        build = time.perf_counter() - start
+
+        counts = [Counter(tokenize(document_text(cv))) for cv in cvs]
+        start = time.perf_counter()
+        expected = scan(counts, JD, args.n, index.k1, index.b)
+        scan_ms = (time.perf_counter() - start) * 1000
+
+        index.top_n(JD, args.n)  # warm-up
+        start = time.perf_counter()
+        result = index.top_n(JD, args.n)
+        index_ms = (time.perf_counter() - start) * 1000
+
+        same = [m["candidate_id"] for m in result["matches"]] == [f"C{i}" for i in expected]
+        print(f"{n_docs:>7} CVs: scan {scan_ms:>9.1f} ms | index {index_ms:>7.2f} ms ({scan_ms / index_ms:>6.0f}x) | "
+              f"incremental build {build * 1000:>8.1f} ms | same top-{args.n}: {same}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
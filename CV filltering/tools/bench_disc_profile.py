@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Microbenchmark: DISC profile generation, computed vs precomputed table.
+
+Times generate_disc_profile for
+  - computed : max + branch chain + sort per call (the pre-table implementation)
+  - table    : DISCExternalPipeline.generate_disc_profile (O(1) table lookup for
+               integer scores, memoised sort for fractional ones)
+on integer score sets and on fractional ones (a small set of distinct values,
+as manual input produces), and the ranking lookup on its own.
+
+Run from the "CV filltering" directory:
+    python tools/bench_disc_profile.py [--calls 200000]
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from src.services.disc_pipeline import DISCExternalPipeline, disc_ranking_code, _sorted_ranking_code
+
+
+def computed_profile(scores):
+    """generate_disc_profile before the lookup table."""
+    d_score = scores["d_score"]
+    i_score = scores["i_score"]
+    s_score = scores["s_score"]
+    c_score = scores["c_score"]
+
+    max_score = max(d_score, i_score, s_score, c_score)
+    if d_score == max_score:
+        primary_style = "Dominance"
+        description = "Quyết đoán, thích thách thức, hướng kết quả"
+    elif i_score == max_score:
+        primary_style = "Influence"
+        description = "Giao tiếp tốt, lạc quan, thích tương tác xã hội"
+    elif s_score == max_score:
+        primary_style = "Steadiness"
+        description = "Ổn định, kiên nhẫn, làm việc nhóm tốt"
+    else:
+        primary_style = "Compliance"
+        description = "Cẩn thận, chính xác, tuân thủ quy trình"
+
+    scores_sorted = sorted([
+        ("D", d_score), ("I", i_score), ("S", s_score), ("C", c_score)
+    ], key=lambda x: x[1], reverse=True)
+    secondary_style = scores_sorted[1][0] if len(scores_sorted) > 1 else None
+
+    return {
+        "primary_style": primary_style,
+        "secondary_style": secondary_style,
+        "description": description,
+        "detailed_scores": {
+            "dominance": d_score,
+            "influence": i_score,
+            "steadiness": s_score,
+            "compliance": c_score
+        },
+        "style_ranking": [style[0] for style in scores_sorted]
+    }
+
+
+def score_sets(n, values, seed=23):
+    rng = random.Random(seed)
+    keys = ('d_score', 'i_score', 's_score', 'c_score')
+    return [{key: rng.choice(values) for key in keys} for _ in range(n)]
+
+
+def timed(func, items):
+    start = time.perf_counter()
+    for item in items:
+        func(item)
+    return (time.perf_counter() - start) * 1e9 / len(items)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--calls', type=int, default=200000)
+    args = parser.parse_args()
+
+    pipeline = DISCExternalPipeline()
+    cases = {
+        "integer": score_sets(args.calls, [float(v) for v in range(1, 11)]),
+        "fractional": score_sets(args.calls, [1.5, 3.0, 4.5, 6.0, 7.5, 9.0, 9.5]),
+    }
+    for label, items in cases.items():
+        same = all(pipeline.generate_disc_profile(item) == computed_profile(item) for item in items[:20000])
+        computed = timed(computed_profile, items)
+        table = timed(pipeline.generate_disc_profile, items)
+        print(f"{label:>10} profile: computed {computed:>6.0f} ns | table {table:>6.0f} ns "
+              f"({computed / table:>4.1f}x) | identical: {same}")
+
+        tuples = [tuple(item.values()) for item in items]
+        sort_ns = timed(lambda t: _sorted_ranking_code(*t), tuples)
+        lookup_ns = timed(lambda t: disc_ranking_code(*t), tuples)
+        print(f"{label:>10} ranking: sort     {sort_ns:>6.0f} ns | lookup {lookup_ns:>6.0f} ns ({sort_ns / lookup_ns:>4.1f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Throughput benchmark: streaming DocxTextExtractor vs python-docx.
+
+Generates CV-like DOCX files (paragraphs, an experience table and an
+embedded image of configurable size) and compares
+  - python-docx : docx.Document(...) + doc.paragraphs (the previous code path)
+  - streaming   : DocxTextExtractor.extract(...)
+reporting docs/s, MB/s of input, peak traced memory and how much text each
+path recovers (python-docx paragraphs miss table content).
+
+Run from the "CV filltering" directory:
+    python tools/bench_docx_extractor.py [--repeat 20] [--image-kb 2048]
+"""
+
+import io
+import os
+import sys
+import time
+import argparse
+import tracemalloc
+
+import docx
+from docx.shared import Inches
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from src.services.docx_text_extractor import DocxTextExtractor
+
+
+def build_cv(paragraphs, table_rows, image_kb):
+    document = docx.Document()
+    document.add_paragraph("NGUYỄN VĂN AN")
+    document.add_paragraph("Email: an.nguyen@example.com | SĐT: 0912 345 678")
+    if image_kb:
+        document.add_picture(io.BytesIO(_png(image_kb)), width=Inches(1))
+    document.add_paragraph("KINH NGHIỆM LÀM VIỆC")
+    table = document.add_table(rows=table_rows, cols=3)
+    for r in range(table_rows):
+        table.cell(r, 0).text = f"{2010 + r % 12} - {2011 + r % 12}"
+        table.cell(r, 1).text = f"Công ty {r}"
+        table.cell(r, 2).text = "Backend Developer: Python, Django, PostgreSQL"
+    for i in range(paragraphs):
+        document.add_paragraph(f"Dự án {i}: xây dựng hệ thống xử lý đơn hàng, tối ưu truy vấn và triển khai Docker.")
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def _png(size_kb):
+    """An uncompressible PNG of roughly `size_kb` so the archive carries real media weight."""
+    import zlib
+    import struct
+    width = 256
+    height = max(1, size_kb * 1024 // (width * 3))
+    raw = b''.join(b'\x00' + os.urandom(width * 3) for _ in range(height))
+
+    def chunk(kind, data):
+        return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data) & 0xffffffff)
+
+    header = struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)
+    return b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', header) + chunk(b'IDAT', zlib.compress(raw, 1)) + chunk(b'IEND', b'')
+
+
+def python_docx_text(data):
+    document = docx.Document(io.BytesIO(data))
+    return "\n".join(p.text for p in document.paragraphs)
+
+
+def run(label, fn, data, repeat):
+    fn(data)  # warm-up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        text = fn(data)
+    elapsed = (time.perf_counter() - start) / repeat
+
+    tracemalloc.start()
+    fn(data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    mb = len(data) / (1024 * 1024)
+    print(f"  {label:<12} {elapsed * 1000:>8.2f} ms/doc {1 / elapsed:>8.1f} docs/s "
+          f"{mb / elapsed:>8.1f} MB/s  peak {peak / 1024:>8.0f} KB  text {len(text):>7} chars")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--image-kb', type=int, default=2048, help='size of the embedded image')
+    args = parser.parse_args()
+
+    extractor = DocxTextExtractor()
+    streaming = lambda data: extractor.extract(data)["text"]
+
+    for paragraphs, rows in ((20, 5), (200, 40), (2000, 200)):
+        data = build_cv(paragraphs, rows, args.image_kb)
+        print(f"{paragraphs} paragraphs, {rows} table rows, {len(data) / 1024:.0f} KB docx:")
+        run("python-docx", python_docx_text, data, args.repeat)
+        run("streaming", streaming, data, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Throughput benchmark: vectorised shortlist ranking vs a per-candidate loop.
+
+Builds synthetic candidates (DISC scores, numerology numbers, CV skills and
+experience) and ranks them for a catalogue job with
+  - loop       : scores each candidate in Python, like jobMatchingService.ts
+                 does in the browser, then sorts everything
+  - vectorised : JobRankingService.shortlist (NumPy pass + heap top-k)
+Feature building is timed separately; it is cached between requests.
+
+Run from the "CV filltering" directory:
+    python tools/bench_job_ranking.py [--candidates 1000 10000 100000] [--k 20]
+"""
+
+import os
+import sys
+import math
+import time
+import random
+import argparse
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from src.services.job_ranking_service import (
+    JobRankingService, CandidateFeatures, DEFAULT_WEIGHTS, LEVEL_MULTIPLIERS, NUMEROLOGY_TRAITS,
+    PARTIAL_SKILL_CREDIT, estimate_experience_years, normalize_skill
+)
+
+SKILLS = ['Python', 'SQL', 'Machine Learning', 'Pandas', 'Scikit-learn', 'Tableau', 'JavaScript', 'React',
+          'Node.js', 'PostgreSQL', 'AWS', 'Docker', 'Kubernetes', 'Java', 'Communication', 'Leadership']
+
+
+def synthetic_rows(n, seed=7):
+    rng = random.Random(seed)
+    candidates = [{"candidate_id": f"C{i}", "name": f"Candidate {i}", "email": f"c{i}@example.com"} for i in range(n)]
+    discs = [{"candidate_id": f"C{i}", **{key: rng.randint(1, 10) for key in ('d_score', 'i_score', 's_score', 'c_score')}}
+             for i in range(n) if rng.random() < 0.8]
+    numerologies = [{"candidate_id": f"C{i}", "life_path_number": rng.choice(list(NUMEROLOGY_TRAITS)),
+                     "birth_number": rng.randint(1, 9)} for i in range(n) if rng.random() < 0.6]
+    cvs = [{"candidate_id": f"C{i}", "skills": rng.sample(SKILLS, rng.randint(0, 8)),
+            "experience": [{"duration": f"{2024 - rng.randint(1, 12)} - nay"}]} for i in range(n)]
+    return candidates, discs, numerologies, cvs
+
+
+def loop_score(job, disc, numerology, cv):
+    """Per-candidate scoring, one Python call per candidate."""
+    requirements = job['requirements']
+    ideal = job['ideal_personality']
+
+    if disc:
+        user = [disc[key] * 10 for key in ('d_score', 'i_score', 's_score', 'c_score')]
+        target = [ideal['disc_profile'][key] for key in ('d', 'i', 's', 'c')]
+        distance = math.sqrt(sum((a - b) ** 2 for a, b in zip(user, target)))
+        personality = max(0, 100 - distance / 200 * 100)
+    else:
+        personality = 50
+
+    def skill_match(user_skills, required):
+        if not required:
+            return 100
+        if not user_skills:
+            return 0
+        matched = 0
+        for skill in required:
+            if skill in user_skills:
+                matched += 1
+            elif any(skill in u or u in skill for u in user_skills):
+                matched += PARTIAL_SKILL_CREDIT
+        return matched / len(required) * 100
+
+    if cv:
+        user_skills = {normalize_skill(s) for s in cv['skills']}
+        technical = skill_match(user_skills, [normalize_skill(s) for s in requirements['technical_skills']])
+        soft = skill_match(user_skills, [normalize_skill(s) for s in requirements['soft_skills']])
+        skills = technical * 0.7 + soft * 0.3
+        years = estimate_experience_years(cv['experience'])
+        adjusted = requirements['experience_years'] * LEVEL_MULTIPLIERS.get(job['level'], 1.0)
+        experience = max(75, 100 - (years - adjusted) * 2) if years >= adjusted else years / adjusted * 100
+    else:
+        skills, experience = 40, 50
+
+    if numerology:
+        traits = set(NUMEROLOGY_TRAITS.get(numerology['life_path_number'], []) +
+                     NUMEROLOGY_TRAITS.get(numerology['birth_number'], []))
+        wanted = [t.lower() for t in ideal['numerology_traits']]
+        hits = sum(1 for t in traits if any(t.lower() in w or w in t.lower() for w in wanted))
+        numerology_score = min(100, hits / len(wanted) * 100)
+    else:
+        numerology_score = 70
+
+    w = DEFAULT_WEIGHTS
+    return (personality * w['personality'] + skills * w['skills'] + experience * w['experience'] +
+            75 * w['cultural'] + numerology_score * w['numerology'])
+
+
+def run_loop(job, rows, k):
+    candidates, discs, numerologies, cvs = rows
+    discs = {r['candidate_id']: r for r in discs}
+    numerologies = {r['candidate_id']: r for r in numerologies}
+    cvs = {r['candidate_id']: r for r in cvs}
+    scored = [(loop_score(job, discs.get(c['candidate_id']), numerologies.get(c['candidate_id']),
+                          cvs.get(c['candidate_id'])), c['candidate_id']) for c in candidates]
+    scored.sort(key=lambda item: -item[0])
+    return [candidate_id for _, candidate_id in scored[:k]]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--candidates', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--k', type=int, default=20)
+    parser.add_argument('--job', default='job-003')
+    args = parser.parse_args()
+
+    service = JobRankingService(db_service=object())
+    job = service.get_job(args.job)
+
+    for n in args.candidates:
+        rows = synthetic_rows(n)
+        start = time.perf_counter()
+        features = CandidateFeatures(*rows)
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        expected = run_loop(job, rows, args.k)
+        loop = time.perf_counter() - start
+
+        service.shortlist(job, args.k, features=features)  # warm-up
+        start = time.perf_counter()
+        result = service.shortlist(job, args.k, features=features)
+        vectorised = time.perf_counter() - start
+
+        same = [c['candidate_id'] for c in result['shortlist']] == expected
+        print(f"{n:>7} candidates: loop {loop * 1000:>9.1f} ms | vectorised {vectorised * 1000:>7.1f} ms "
+              f"({loop / vectorised:>5.1f}x) | feature build {build * 1000:>8.1f} ms (cached) | same top-{args.k}: {same}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
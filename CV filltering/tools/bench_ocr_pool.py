@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Throughput benchmark: DISC survey OCR, subprocess per image vs warm engine pool.
+
+OCRs preprocessed survey images with
+  - subprocess : pytesseract.image_to_string per image (temp file + tesseract
+                 fork + language data load every call), from --threads threads
+  - pool       : OcrEnginePool.image_to_string (warm engines in --workers
+                 processes; tesserocr when installed, else pytesseract in the worker)
+and reports images per second. Images are synthetic survey sheets unless
+--images points at real scans. Needs the tesseract binary (and optionally tesserocr).
+
+Run from the "CV filltering" directory:
+    python tools/bench_ocr_pool.py [--count 40] [--workers 2] [--threads 4] [--images scan1.png ...]
+"""
+
+import os
+import sys
+import time
+import shutil
+import random
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import cv2
+import numpy as np
+import pytesseract
+
+from src.services.disc_pipeline import DISCExternalPipeline
+from src.services.ocr_engine_pool import OcrEnginePool
+
+
+def synthetic_survey(seed):
+    """PNG bytes of a survey-like sheet: a title, candidate id and one score line per style."""
+    rng = random.Random(seed)
+    image = np.full((900, 1240, 3), 255, dtype=np.uint8)
+    lines = ["DISC SURVEY", f"Candidate ID: CAND-{seed:04d}"]
+    lines += [f"{style}: {rng.randint(1, 10)}" for style in ("D", "I", "S", "C")]
+    for row, text in enumerate(lines):
+        cv2.putText(image, text, (80, 120 + row * 120), cv2.FONT_HERSHEY_SIMPLEX, 2.0, (0, 0, 0), 4, cv2.LINE_AA)
+    # A little sensor noise, so preprocessing has something to clean up
+    noise = np.random.default_rng(seed).integers(0, 40, image.shape, dtype=np.uint8)
+    ok, encoded = cv2.imencode('.png', cv2.subtract(image, noise))
+    return encoded.tobytes()
+
+
+def run(func, images, threads):
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        texts = list(executor.map(func, images))
+    return texts, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=40)
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--threads', type=int, default=4)
+    parser.add_argument('--images', nargs='*', default=None)
+    args = parser.parse_args()
+
+    if not shutil.which(pytesseract.pytesseract.tesseract_cmd):
+        print("tesseract binary not found; install tesseract-ocr to run this benchmark")
+        return 1
+
+    pipeline = DISCExternalPipeline()
+    if args.images:
+        encoded = [open(path, 'rb').read() for path in args.images]
+        encoded = [encoded[i % len(encoded)] for i in range(args.count)]
+    else:
+        encoded = [synthetic_survey(i) for i in range(args.count)]
+    images = [pipeline._preprocess_image_for_ocr(data) for data in encoded]
+
+    expected, subprocess_s = run(lambda image: pytesseract.image_to_string(image, config=pipeline.ocr_config),
+                                 images, args.threads)
+
+    pool = OcrEnginePool(size=args.workers, config=pipeline.ocr_config)
+    try:
+        start = time.perf_counter()
+        pool.image_to_string(images[0])  # start-up: spawn workers, load engines
+        warmup_s = time.perf_counter() - start
+        texts, pool_s = run(pool.image_to_string, images, args.threads)
+        stats = pool.get_stats()
+    finally:
+        pool.close()
+
+    same = sum(a.strip() == b.strip() for a, b in zip(texts, expected))
+    print(f"{len(images)} images, {args.threads} threads")
+    print(f"  subprocess : {len(images) / subprocess_s:>7.1f} images/s")
+    print(f"  pool       : {len(images) / pool_s:>7.1f} images/s ({subprocess_s / pool_s:.1f}x) "
+          f"| engine {stats['engine']} x{args.workers}, start-up {warmup_s * 1000:.0f} ms "
+          f"| identical text: {same}/{len(images)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
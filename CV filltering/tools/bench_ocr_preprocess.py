@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Latency/accuracy benchmark: DISC survey OCR preprocessing, legacy vs resolution-aware.
+
+Preprocesses each image with
+  - legacy : full-resolution decode, Otsu threshold, median blur
+             (DISC_OCR_TARGET_DPI=0, DISC_OCR_PREPROCESS_STEPS=denoise)
+  - tuned  : the configured pipeline (reduced decode, perspective correction /
+             DPI normalisation, deskew, Otsu, median blur)
+and reports the preprocessing time, the megapixels handed to Tesseract, the
+skew left in the output and, for synthetic pages with known content, the ink
+overlap (IoU) with the upright page. With the tesseract binary installed it
+also OCRs both outputs and reports OCR time and character accuracy against
+the page text.
+
+Images: every decodable image in tests/ (no known text, so latency only),
+--images paths, and synthetic survey pages: flat scans at 150 and 600 DPI, a
+rotated scan and phone photos at 12 and 22 megapixels.
+
+Run from the "CV filltering" directory:
+    python tools/bench_ocr_preprocess.py [--repeat 3] [--images scan1.jpg ...]
+"""
+
+import os
+import sys
+import glob
+import time
+import shutil
+import difflib
+import argparse
+import statistics
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import cv2
+import numpy as np
+import pytesseract
+
+from src.services.disc_pipeline import DISCExternalPipeline, skew_angle
+
+SAMPLES_DIR = os.path.join(os.path.dirname(__file__), '..', 'tests')
+PAGE_TEXT = ["DISC SURVEY", "Candidate ID: CAND-0001", "D: 8", "I: 4", "S: 7", "C: 2", "Signed: Nguyen Van An"]
+
+
+def survey_page():
+    """A4 survey page at 150 DPI (1240 x 1754)."""
+    page = np.full((1754, 1240), 255, dtype=np.uint8)
+    for row, text in enumerate(PAGE_TEXT):
+        cv2.putText(page, text, (100, 200 + row * 150), cv2.FONT_HERSHEY_SIMPLEX, 2.0, 0, 4, cv2.LINE_AA)
+    return page
+
+
+def rotated(image, degrees):
+    height, width = image.shape
+    rotation = cv2.getRotationMatrix2D((width / 2, height / 2), degrees, 1.0)
+    return cv2.warpAffine(image, rotation, (width, height), borderValue=255)
+
+
+def phone_photo(page, megapixels, seed=1):
+    """The page shot at an angle on a dark table, scaled to a camera resolution, with sensor noise."""
+    height, width = page.shape
+    canvas = np.full((height + 400, width + 400), 90, np.uint8)
+    canvas[200:200 + height, 200:200 + width] = page
+    flat = np.float32([[200, 200], [200 + width, 200], [200 + width, 200 + height], [200, 200 + height]])
+    tilted = np.float32([[260, 180], [180 + width, 240], [230 + width, 150 + height], [150, 230 + height]])
+    image = cv2.warpPerspective(canvas, cv2.getPerspectiveTransform(flat, tilted), canvas.shape[::-1], borderValue=90)
+    zoom = (megapixels * 1e6 / image.size) ** 0.5
+    image = cv2.resize(image, None, fx=zoom, fy=zoom, interpolation=cv2.INTER_CUBIC)
+    noise = np.random.default_rng(seed).normal(0, 6, image.shape)
+    return np.clip(image + noise, 0, 255).astype(np.uint8)
+
+
+def jpeg(image):
+    return cv2.imencode('.jpg', image, [cv2.IMWRITE_JPEG_QUALITY, 90])[1].tobytes()
+
+
+def _ink_box(ink):
+    ys, xs = np.nonzero(ink)
+    return ink[ys.min():ys.max() + 1, xs.min():xs.max() + 1]
+
+
+def ink_iou(binary, page):
+    """Overlap of the ink with the upright page's ink, each cropped to its bounding box (1.0: same layout)."""
+    ink = binary < 128
+    if not ink.any():
+        return 0.0
+    ink = _ink_box(ink)
+    expected = _ink_box(page < 128).astype(np.uint8)
+    expected = cv2.resize(expected, ink.shape[::-1], interpolation=cv2.INTER_NEAREST).astype(bool)
+    return np.count_nonzero(ink & expected) / np.count_nonzero(ink | expected)
+
+
+def text_accuracy(text):
+    """Character similarity (0..1) of the OCR text to PAGE_TEXT, ignoring blank lines."""
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    return difflib.SequenceMatcher(None, "\n".join(lines), "\n".join(PAGE_TEXT)).ratio()
+
+
+def samples(extra_paths):
+    """(name, encoded bytes, upright page or None) for every benchmark image."""
+    found = []
+    for path in sorted(glob.glob(os.path.join(SAMPLES_DIR, '*'))) + list(extra_paths or []):
+        with open(path, 'rb') as handle:
+            data = handle.read()
+        if cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_GRAYSCALE) is None:
+            if path.lower().endswith(('.png', '.jpg', '.jpeg', '.tif', '.tiff', '.bmp')):
+                print(f"skipped {os.path.relpath(path)}: not a decodable image")
+            continue
+        found.append((os.path.basename(path), data, None))
+
+    page = survey_page()
+    found += [
+        ("scan 150 DPI", jpeg(page), page),
+        ("scan 600 DPI", jpeg(cv2.resize(page, None, fx=4, fy=4, interpolation=cv2.INTER_CUBIC)), page),
+        ("scan rotated 4 deg", jpeg(rotated(page, 4)), page),
+        ("photo 12 MP", jpeg(phone_photo(page, 12)), page),
+        ("photo 22 MP", jpeg(phone_photo(page, 22)), page),
+    ]
+    return found
+
+
+def run(pipeline, data, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        binary = pipeline._preprocess_image_for_ocr(data)
+        times.append(time.perf_counter() - start)
+    return binary, statistics.median(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--images', nargs='*', default=None)
+    args = parser.parse_args()
+
+    legacy = DISCExternalPipeline()
+    legacy.ocr_target_dpi = 0
+    legacy.ocr_preprocess_steps = ['denoise']
+    tuned = DISCExternalPipeline()
+    has_tesseract = bool(shutil.which(pytesseract.pytesseract.tesseract_cmd))
+    if not has_tesseract:
+        print("tesseract binary not found: OCR time and text accuracy are not measured")
+
+    images = samples(args.images)
+    print(f"{'image':<20} {'mode':<7} {'preprocess':>11} {'to OCR':>8} {'skew':>6} {'ink IoU':>8}"
+          + (f" {'OCR':>9} {'text acc':>9}" if has_tesseract else ""))
+    for name, data, page in images:
+        for mode, pipeline in (("legacy", legacy), ("tuned", tuned)):
+            binary, preprocess_ms = run(pipeline, data, args.repeat)
+            row = (f"{name:<20} {mode:<7} {preprocess_ms:>8.0f} ms {binary.size / 1e6:>5.1f} MP "
+                   f"{skew_angle(binary):>6.1f} {ink_iou(binary, page) if page is not None else float('nan'):>8.2f}")
+            if has_tesseract:
+                start = time.perf_counter()
+                text = pytesseract.image_to_string(binary, config=pipeline.ocr_config)
+                ocr_ms = (time.perf_counter() - start) * 1000
+                accuracy = text_accuracy(text) if page is not None else float('nan')
+                row += f" {ocr_ms:>6.0f} ms {accuracy:>9.2f}"
+            print(row)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark for the rule-based CV extractor and the Aho–Corasick skill matcher.
+
+Compares, on synthetic CVs of growing size:
+  - legacy      : backend/services/cv_parsing_service.py `_extract_skills`
+                  (8 hardcoded keywords, one `in` scan each)
+  - naive       : the same `in` scan applied to every term in the dictionary
+  - aho-corasick: SkillMatcher over the same dictionary (one pass over the text)
+and times the full RuleBasedCvExtractor.extract() per CV.
+
+Run from the "CV filltering" directory:
+    python tools/bench_rule_based_extractor.py [--terms 5000] [--repeat 20]
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from src.services.skill_matcher import (
+    SkillMatcher, load_skill_dictionary, fold_text, DEFAULT_DICTIONARY_PATH
+)
+from src.services.rule_based_extractor import RuleBasedCvExtractor
+
+CV_HEADER = """NGUYỄN VĂN AN
+Email: an.nguyen@example.com | SĐT: 0912 345 678
+KINH NGHIỆM LÀM VIỆC
+01/2020 - Present: Senior Backend Developer - FPT Software
+Jun 2017 – Dec 2019 | Software Engineer | Tiki Corporation
+HỌC VẤN
+Cử nhân Công nghệ thông tin - Đại học Bách Khoa Hà Nội (2011 - 2015)
+"""
+FILLER = (
+    "Phát triển và vận hành hệ thống xử lý đơn hàng với Python, Django, PostgreSQL và Redis; "
+    "thiết kế REST API, viết unit test với pytest, triển khai Docker và Kubernetes trên AWS. "
+    "Led a team of five engineers, mentoring juniors and reviewing code daily. "
+)
+
+
+def legacy_extract_skills(text):
+    """Verbatim copy of the legacy keyword scan (avoids importing the legacy module's AI setup)."""
+    skills_keywords = ['python', 'javascript', 'java', 'react', 'node', 'sql', 'html', 'css']
+    found_skills = []
+    text_lower = text.lower()
+    for skill in skills_keywords:
+        if skill in text_lower:
+            found_skills.append(skill.title())
+    return found_skills if found_skills else ["Skills analysis requires manual review"]
+
+
+def fold_entries(entries):
+    return [(canonical, [fold_text(term.lstrip('=')) for term in terms]) for canonical, terms in entries]
+
+
+def naive_extract_skills(text, folded_entries):
+    """One `in` scan per dictionary term (terms folded up front, so only the scan is timed)."""
+    folded = fold_text(text)
+    return [canonical for canonical, terms in folded_entries if any(term in folded for term in terms)]
+
+
+def synthetic_entries(entries, target_terms):
+    """Pads the bundled dictionary with generated terms up to `target_terms`."""
+    rng = random.Random(42)
+    padded = list(entries)
+    count = sum(len(terms) for _, terms in padded)
+    while count < target_terms:
+        name = ''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(rng.randint(5, 12)))
+        padded.append((f"Skill {name}", [f"skill {name}", f"{name} framework"]))
+        count += 2
+    return padded
+
+
+def build_cv(size_bytes):
+    text = CV_HEADER
+    while len(text.encode('utf-8')) < size_bytes:
+        text += FILLER
+    return text
+
+
+def timed(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--terms', type=int, default=5000, help='dictionary size to pad to (default 5000)')
+    parser.add_argument('--repeat', type=int, default=20, help='iterations per measurement')
+    args = parser.parse_args()
+
+    bundled = load_skill_dictionary(DEFAULT_DICTIONARY_PATH)
+    entries = synthetic_entries(bundled, args.terms)
+
+    start = time.perf_counter()
+    matcher = SkillMatcher(entries)
+    build_ms = (time.perf_counter() - start) * 1000
+    extractor = RuleBasedCvExtractor(skill_matcher=matcher)
+    folded_entries = fold_entries(entries)
+
+    print(f"Dictionary: {len(bundled)} bundled skills, padded to {matcher.term_count} terms "
+          f"(automaton built in {build_ms:.1f} ms)")
+    print(f"{'CV size':>9} | {'legacy 8 kw':>11} | {'naive scan':>11} | {'aho-corasick':>12} | {'extract()':>10} | skills")
+    print('-' * 80)
+    for size in (2_000, 8_000, 32_000, 128_000):
+        text = build_cv(size)
+        legacy_ms = timed(lambda: legacy_extract_skills(text), args.repeat)
+        naive_ms = timed(lambda: naive_extract_skills(text, folded_entries), max(1, args.repeat // 4))
+        ac_ms = timed(lambda: matcher.match(text), args.repeat)
+        extract_ms = timed(lambda: extractor.extract(text), args.repeat)
+        found = len(matcher.match(text))
+        print(f"{size // 1000:>7}KB | {legacy_ms:>9.3f}ms | {naive_ms:>9.2f}ms | {ac_ms:>10.2f}ms | "
+              f"{extract_ms:>8.2f}ms | {found} (legacy: {len(legacy_extract_skills(text))})")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Latency benchmark: skill search via the inverted index vs a scan of all CVs.
+
+Builds synthetic cv_analyses rows and answers AND / OR skill queries with
+  - scan  : normalises every candidate's skills and filters, per query
+  - index : SkillIndex.search (posting-list intersection / union)
+Index build time is reported separately; it happens once per process.
+
+Run from the "CV filltering" directory:
+    python tools/bench_skill_index.py [--candidates 1000 10000 100000] [--queries 50]
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from src.services.skill_index import SkillIndex
+
+SKILLS = ['Python', 'SQL', 'Machine Learning', 'Pandas', 'Scikit-learn', 'Tableau', 'JavaScript', 'React',
+          'Node.js', 'PostgreSQL', 'AWS', 'Docker', 'Kubernetes', 'Java', 'Communication', 'Leadership',
+          'Go', 'Rust', 'Kotlin', 'Swift', 'Figma', 'Excel', 'Power BI', 'Spark']
+
+
+def synthetic_rows(n, seed=11):
+    rng = random.Random(seed)
+    return [{"candidate_id": f"C{i}", "skills": rng.sample(SKILLS, rng.randint(1, 8))} for i in range(n)]
+
+
+def scan(index, rows, query, mode):
+    wanted = [index.term(skill) for skill in query]
+    hits = []
+    for row in rows:
+        terms = {index.term(skill) for skill in row["skills"]}
+        matched = [term for term in wanted if term in terms]
+        if matched and (mode == "or" or len(matched) == len(wanted)):
+            hits.append(row["candidate_id"])
+    return hits
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--candidates', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--queries', type=int, default=50)
+    args = parser.parse_args()
+
+    rng = random.Random(5)
+    for n in args.candidates:
+        rows = synthetic_rows(n)
+        index = SkillIndex()
+        start = time.perf_counter()
+        index.rebuild(rows)
+        build = time.perf_counter() - start
+
+        queries = [(rng.sample(SKILLS, rng.randint(1, 3)), rng.choice(["and", "or"])) for _ in range(args.queries)]
+        scan_queries = queries[:max(1, args.queries // 10)]  # the scan is slow, time a subset
+
+        start = time.perf_counter()
+        expected = [sorted(scan(index, rows, query, mode)) for query, mode in scan_queries]
+        scan_ms = (time.perf_counter() - start) * 1000 / len(scan_queries)
+
+        start = time.perf_counter()
+        for query, mode in queries:
+            index.search(query, mode=mode, limit=50)
+        index_ms = (time.perf_counter() - start) * 1000 / len(queries)
+
+        same = all(sorted(c["candidate_id"] for c in index.search(query, mode=mode, limit=n)["candidates"]) == hits
+                   for (query, mode), hits in zip(scan_queries, expected))
+        print(f"{n:>7} candidates: scan {scan_ms:>9.2f} ms/query | index {index_ms:>7.3f} ms/query "
+              f"({scan_ms / index_ms:>6.0f}x) | build {build * 1000:>8.1f} ms | same results: {same}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
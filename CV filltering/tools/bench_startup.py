@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Cold-start benchmark for the backend.
+
+Starts a fresh interpreter, imports the Flask app and serves the first
+GET /health through the test client, reporting import time, time to first
+/health and which heavy dependencies got loaded along the way. Exits with
+status 1 when time-to-first-/health exceeds the budget or a heavy module
+was imported at startup.
+
+Run from the "CV filltering" directory:
+    python tools/bench_startup.py [--budget 1.5] [--runs 3] [--json]
+"""
+
+import os
+import sys
+import json
+import argparse
+import subprocess
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+# Must not be imported before the first request that needs them
+HEAVY_MODULES = ['cv2', 'numpy', 'pandas', 'pytesseract', 'google.generativeai', 'supabase', 'docx', 'PyPDF2', 'openpyxl']
+
+PROBE = """
+import sys, time, json, logging
+logging.disable(logging.CRITICAL)
+start = time.perf_counter()
+from src.app import app
+imported = time.perf_counter()
+response = app.test_client().get('/health')
+served = time.perf_counter()
+print(json.dumps({
+    "import_seconds": imported - start,
+    "first_health_seconds": served - start,
+    "status_code": response.status_code,
+    "heavy_modules_loaded": [m for m in %r if m in sys.modules],
+}))
+""" % (HEAVY_MODULES,)
+
+
+def measure_once():
+    env = dict(os.environ)
+    env.pop('GEMINI_API_KEY', None)
+    env.pop('SUPABASE_URL', None)
+    output = subprocess.run(
+        [sys.executable, '-c', PROBE], cwd=BACKEND_DIR, env=env,
+        capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def measure(runs):
+    """Best of `runs` cold starts (the minimum is the least noisy estimate)."""
+    samples = [measure_once() for _ in range(runs)]
+    best = min(samples, key=lambda s: s["first_health_seconds"])
+    best["runs"] = runs
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--budget', type=float, default=float(os.getenv('STARTUP_BUDGET_SECONDS', 1.5)),
+                        help='max seconds to first /health (default STARTUP_BUDGET_SECONDS or 1.5)')
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--json', action='store_true', help='print the measurement as JSON')
+    args = parser.parse_args()
+
+    result = measure(args.runs)
+    result["budget_seconds"] = args.budget
+    ok = result["first_health_seconds"] <= args.budget and not result["heavy_modules_loaded"]
+
+    if args.json:
+        print(json.dumps(result))
+    else:
+        print(f"import src.app        : {result['import_seconds'] * 1000:.0f} ms")
+        print(f"first GET /health     : {result['first_health_seconds'] * 1000:.0f} ms "
+              f"(budget {args.budget * 1000:.0f} ms, status {result['status_code']})")
+        print(f"heavy modules loaded  : {result['heavy_modules_loaded'] or 'none'}")
+        print("OK" if ok else "FAILED")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())